@@ -0,0 +1,114 @@
+"""Compares the JSON decoders on the bulk endpoints
+
+Decode time is measured on the response body alone, request time through the
+adapter against the local stand-in server, once per decoder configured. The
+bulk endpoints themselves validate the response bytes with pydantic, the decoder
+applies to direct adapter calls and endpoints returning decoded JSON.
+
+    python -m benchmarks.bench_decode
+    python -m benchmarks.bench_decode --planets 5000 --tickers 2000
+"""
+import argparse
+import gc
+import os
+import tempfile
+import time
+from typing import Callable, List
+
+from fio_wrapper import FIO
+from fio_wrapper.decoder import available_decoders, get_decoder
+
+from benchmarks.standin import StandInServer, serve
+
+BULK_ROUTES: List[str] = [
+    "Material.all",
+    "Exchange.full",
+    "Planet.full",
+    "Building.all",
+    "Recipe.all",
+]
+
+
+def best(func: Callable[[], any], repeat: int) -> float:
+    """Measures the best wall time of func
+
+    Args:
+        func (Callable[[], any]): Benchmarked call
+        repeat (int): Number of timed runs
+
+    Returns:
+        float: Best time in milliseconds
+    """
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    return min(timings) * 1e3
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--planets", type=int, default=1000)
+    parser.add_argument("--tickers", type=int, default=1000)
+    parser.add_argument("--recipes", type=int, default=1500)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    decoders = available_decoders()
+    print(f"decoders: {', '.join(decoders)}, times in ms, best of {args.repeat}")
+
+    with tempfile.TemporaryDirectory() as directory, StandInServer() as server:
+        clients = {}
+        for name in decoders:
+            config = os.path.join(directory, f"{name}.yml")
+            with open(config, "w") as config_file:
+                config_file.write(f"fio:\n  json_decoder: {name}\n")
+
+            clients[name] = FIO(
+                api_key="benchmark", base_url=server.base_url, config=config
+            )
+
+        routes = {
+            route.name: route
+            for route in serve(
+                server,
+                clients[decoders[0]],
+                planets=args.planets,
+                tickers=args.tickers,
+                recipes=args.recipes,
+            )
+        }
+
+        print(f"\n{'route':<16}{'MB':>7}" + "".join(f"{name:>10}" for name in decoders))
+        for name in BULK_ROUTES:
+            route = routes[name]
+            decode = {
+                decoder: best(lambda: get_decoder(decoder)(route.body), args.repeat)
+                for decoder in decoders
+            }
+            call = {
+                decoder: best(
+                    lambda: clients[decoder].adapter.get(route.url), args.repeat
+                )
+                for decoder in decoders
+            }
+
+            print(
+                f"{name:<16}{len(route.body) / 1e6:>7.1f}"
+                + "".join(f"{decode[decoder]:>10.2f}" for decoder in decoders)
+                + "  decode"
+            )
+            print(
+                f"{'':<23}"
+                + "".join(f"{call[decoder]:>10.2f}" for decoder in decoders)
+                + "  adapter.get"
+            )
+
+
+if __name__ == "__main__":
+    main()
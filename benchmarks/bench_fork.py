@@ -0,0 +1,107 @@
+"""Compares worker memory and refetches of forked workers with a warm parent
+
+The parent fetches Planet.full and Exchange.full into the memory cache and the
+bulk store, then forks workers like a pre-fork server. Every worker runs a
+garbage collection, requests both bulk responses again and reports its private
+memory, i.e. what it does not share with the parent. Requires Linux.
+
+    python -m benchmarks.bench_fork --workers 4 --planets 2000
+"""
+import argparse
+import gc
+import os
+import tempfile
+from typing import Dict, List
+
+from fio_wrapper import FIO, prefork
+
+from benchmarks.standin import StandInServer, serve
+
+MODES: List[str] = ["cold", "warm", "warm, prefork"]
+
+
+def private_mb() -> float:
+    """Gets the private memory of this process
+
+    Returns:
+        float: Private clean and dirty memory in MB
+    """
+    private = 0
+    with open("/proc/self/smaps_rollup") as smaps:
+        for line in smaps:
+            if line.startswith(("Private_Clean:", "Private_Dirty:")):
+                private += int(line.split()[1])
+
+    return private / 1e3
+
+
+def work(fio: FIO) -> None:
+    gc.collect()
+    for url in [fio.urls.planet_full_url(), fio.urls.exchange_get_full_url()]:
+        fio.adapter.get(url, raw=True)
+
+
+def run(mode: str, args: argparse.Namespace) -> None:
+    with StandInServer() as server, tempfile.TemporaryDirectory() as directory:
+        config = os.path.join(directory, "config.yml")
+        with open(config, "w") as config_file:
+            config_file.write(
+                "cache:\n  enabled: true\n  default_expire: 3600\n"
+                "bulk:\n  enabled: true\n  max_age: 3600\n"
+            )
+
+        fio = FIO(base_url=server.base_url, config=config)
+        serve(server, fio, planets=args.planets, tickers=args.planets)
+
+        if mode != "cold":
+            fio.Planet.full()
+            fio.Exchange.full()
+        if mode == "warm, prefork":
+            prefork()
+
+        fetched = sum(server.hits.values())
+        pipes: Dict[int, int] = {}
+        for _ in range(args.workers):
+            read, write = os.pipe()
+            pid = os.fork()
+            if pid == 0:
+                # never return into the parent's server and cleanup
+                try:
+                    os.close(read)
+                    work(fio)
+                    os.write(write, f"{private_mb():.1f}".encode())
+                finally:
+                    os._exit(0)
+
+            os.close(write)
+            pipes[pid] = read
+
+        private: List[float] = []
+        for pid, read in pipes.items():
+            with os.fdopen(read) as result:
+                private.append(float(result.read()))
+            os.waitpid(pid, 0)
+
+        gc.unfreeze()
+        print(
+            f"{mode:<16}{sum(private) / len(private):>14.1f}"
+            f"{sum(private):>12.1f}{sum(server.hits.values()) - fetched:>12}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--planets", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"{args.workers} workers, {args.planets} planets and tickers")
+    print(f"{'parent':<16}{'MB / worker':>14}{'MB total':>12}{'refetches':>12}")
+    for mode in MODES:
+        run(mode, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Compares the validating path of bulk endpoints with the garbage collector paused
+
+    python -m benchmarks.bench_gc_pause --planets 5000 --tickers 2000 --recipes 1500
+    python -m benchmarks.bench_gc_pause --heap 5000
+"""
+import argparse
+import gc
+import time
+from typing import Callable
+
+from fio_wrapper import ExchangeTickerFullList, PlanetFullList, RecipeList
+from fio_wrapper.gc_pause import validate_json
+
+from benchmarks.payloads import (
+    encode,
+    exchange_ticker_full_list,
+    planet_full_list,
+    recipe_list,
+)
+
+
+def best(func: Callable[[], any], repeat: int) -> float:
+    """Measures the best wall time of func
+
+    Args:
+        func (Callable[[], any]): Benchmarked call
+        repeat (int): Number of timed runs
+
+    Returns:
+        float: Best time in seconds
+    """
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    return min(timings)
+
+
+def compare(name: str, model: any, body: bytes, repeat: int) -> None:
+    validating = best(lambda: validate_json(model, body), repeat)
+    paused = best(lambda: validate_json(model, body, pause_gc=True), repeat)
+
+    print(
+        f"{name:<24}{len(body) / 1e6:>8.1f} MB"
+        f"{validating * 1e3:>14.1f}{paused * 1e3:>12.1f}"
+        f"{validating / paused:>10.2f}x"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--planets", type=int, default=5000)
+    parser.add_argument("--tickers", type=int, default=2000)
+    parser.add_argument("--recipes", type=int, default=1500)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--heap", type=int, default=0, help="planets kept alive during the runs"
+    )
+    args = parser.parse_args()
+
+    # objects kept alive by the application, collections traverse all of them
+    heap = planet_full_list(args.heap, seed=1)
+
+    print(f"{'model':<24}{'body':>11}{'validating':>14}{'paused':>12}{'speedup':>11}")
+    print(f"{'':<24}{'':>11}{'[ms]':>14}{'[ms]':>12}")
+    compare(
+        "PlanetFullList",
+        PlanetFullList,
+        encode(planet_full_list(args.planets)),
+        args.repeat,
+    )
+    compare(
+        "ExchangeTickerFullList",
+        ExchangeTickerFullList,
+        encode(exchange_ticker_full_list(args.tickers)),
+        args.repeat,
+    )
+    compare("RecipeList", RecipeList, encode(recipe_list(args.recipes)), args.repeat)
+
+    del heap
+
+
+if __name__ == "__main__":
+    main()
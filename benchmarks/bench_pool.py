@@ -0,0 +1,105 @@
+"""Compares connection reuse of pool configurations under concurrent callers
+
+Every opened connection is a TCP (and against FIO a TLS) handshake. With more
+callers than pooled connections, urllib3 discards the surplus connections after
+each request and opens new ones for the next.
+
+    python -m benchmarks.bench_pool --workers 32 --calls 50
+"""
+import argparse
+import logging
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+from fio_wrapper import FIO
+from fio_wrapper.models.material_models import MaterialTicker
+
+from benchmarks.payloads import encode, synthesize
+from benchmarks.standin import StandInServer
+
+CONFIGURATIONS = {
+    "default": "    maxsize: 10\n",
+    "sized": "    maxsize: {workers}\n",
+    "blocking": "    block: true\n",
+    "no keep-alive": "    keep_alive: false\n",
+}
+
+
+class PoolFullCounter(logging.Handler):
+    """Counts urllib3 warnings about discarded connections"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.count = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if "Connection pool is full" in record.getMessage():
+            self.count += 1
+
+
+def run(name: str, pool: str, args: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        config = os.path.join(directory, "config.yml")
+        with open(config, "w") as config_file:
+            config_file.write(
+                "fio:\n  coalesce: false\n  pool:\n" + pool.format(workers=args.workers)
+            )
+
+        with StandInServer() as server:
+            fio = FIO(base_url=server.base_url, config=config)
+            server.add(
+                "GET",
+                fio.urls.material_get_url("DW"),
+                encode(synthesize(MaterialTicker)),
+            )
+
+            counter = PoolFullCounter()
+            logging.getLogger("urllib3.connectionpool").addHandler(counter)
+            latencies: List[float] = []
+
+            def call() -> None:
+                start = time.perf_counter()
+                fio.Material.get("DW")
+                latencies.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=args.workers) as executor:
+                for future in [
+                    executor.submit(call) for _ in range(args.workers * args.calls)
+                ]:
+                    future.result()
+            wall = time.perf_counter() - start
+
+            logging.getLogger("urllib3.connectionpool").removeHandler(counter)
+            latencies.sort()
+
+            print(
+                f"{name:<16}{server.connections:>13}{counter.count:>12}"
+                f"{len(latencies) / wall:>10.0f}"
+                f"{latencies[len(latencies) // 2] * 1e3:>9.2f}"
+                f"{latencies[int(len(latencies) * 0.99)] * 1e3:>9.2f}"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--workers", type=int, default=32)
+    parser.add_argument("--calls", type=int, default=50, help="calls per worker")
+    args = parser.parse_args()
+
+    print(f"{args.workers} workers, {args.workers * args.calls} calls of Material.get")
+    print(
+        f"{'pool':<16}{'connections':>13}{'discarded':>12}"
+        f"{'req/s':>10}{'p50':>9}{'p99':>9}"
+    )
+    for name, pool in CONFIGURATIONS.items():
+        run(name, pool, args)
+
+
+if __name__ == "__main__":
+    main()
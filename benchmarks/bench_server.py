@@ -0,0 +1,319 @@
+"""Benchmarks every endpoint against a local stand-in FIO server
+
+Each mode runs in a separate process, so its peak RSS is not inflated by the
+modes before. Timings are taken from the wrappers instrumentation hooks.
+
+    python -m benchmarks.bench_server
+    python -m benchmarks.bench_server --modes warm-concurrent --routes Planet.full
+    python -m benchmarks.bench_server --save-baseline
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from fio_wrapper import FIO
+
+from benchmarks.standin import Route, StandInServer, serve
+
+MODES: List[str] = [
+    "cold-sequential",
+    "cold-concurrent",
+    "warm-sequential",
+    "warm-concurrent",
+]
+BASELINE: str = os.path.join(os.path.dirname(__file__), "baselines", "server.json")
+
+# differences below these are noise, whatever the relative change
+LATENCY_FLOOR_MS: float = 1.0
+RSS_FLOOR_MB: float = 5.0
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Gets the peak resident set size of this process
+
+    Returns:
+        Optional[float]: Peak RSS in MB, None where not available
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak / 1e6 if sys.platform == "darwin" else peak / 1e3
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def measure(
+    fio: FIO, route: Route, events: List, cold: bool, workers: int, iterations: int
+) -> Dict[str, float]:
+    """Calls route repeatedly and summarizes its events
+
+    Cache hits and calls sharing an in-flight request are reported as fractions
+    of all calls.
+
+    Args:
+        fio (FIO): Wrapper using the stand-in server
+        route (Route): Benchmarked call
+        events (List): List the instrumentation hook appends to
+        cold (bool): Clear the cache before every call
+        workers (int): Concurrent callers, 1 calls sequentially
+        iterations (int): Number of calls
+
+    Returns:
+        Dict[str, float]: Throughput, latencies and time split in milliseconds
+    """
+    cache = getattr(fio.adapter._session, "cache", None)
+
+    def call() -> None:
+        if cold:
+            cache.clear()
+        route.call(fio)
+
+    # connection setup and first use of the models are not measured
+    route.call(fio)
+    events.clear()
+
+    start = time.perf_counter()
+    if workers == 1:
+        for _ in range(iterations):
+            call()
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for future in [executor.submit(call) for _ in range(iterations)]:
+                future.result()
+    wall = time.perf_counter() - start
+
+    latencies = [event.total_time * 1e3 for event in events]
+
+    def mean(attribute: str) -> float:
+        return sum(getattr(event, attribute) for event in events) * 1e3 / len(events)
+
+    return {
+        "rps": iterations / wall,
+        "p50": percentile(latencies, 0.5),
+        "p99": percentile(latencies, 0.99),
+        "network": mean("network_time"),
+        "decode": mean("decode_time"),
+        "validation": mean("validation_time"),
+        "cache_hits": sum(1 for event in events if event.cache_hit) / len(events),
+        "coalesced": sum(1 for event in events if event.coalesced) / len(events),
+    }
+
+
+def run_mode(mode: str, args: argparse.Namespace) -> Dict:
+    """Benchmarks all selected routes in one mode
+
+    Args:
+        mode (str): Mode, e.g. "cold-sequential"
+        args (argparse.Namespace): Command line arguments
+
+    Returns:
+        Dict: Peak RSS and per route results
+    """
+    cache, access = mode.split("-")
+
+    with tempfile.TemporaryDirectory() as directory:
+        config = os.path.join(directory, "config.yml")
+        with open(config, "w") as config_file:
+            config_file.write("cache:\n  enabled: true\n  backend: memory\n")
+
+        with StandInServer() as server:
+            fio = FIO(api_key="benchmark", base_url=server.base_url, config=config)
+            routes = serve(
+                server,
+                fio,
+                planets=args.planets,
+                tickers=args.tickers,
+                recipes=args.recipes,
+            )
+
+            events = []
+            fio.adapter.add_hook(events.append)
+
+            results = {}
+            for route in routes:
+                if args.routes and route.name not in args.routes:
+                    continue
+
+                results[route.name] = measure(
+                    fio,
+                    route,
+                    events,
+                    cold=cache == "cold",
+                    workers=args.workers if access == "concurrent" else 1,
+                    iterations=args.iterations,
+                )
+
+    return {"peak_rss_mb": peak_rss_mb(), "routes": results}
+
+
+def run_child(mode: str, args: argparse.Namespace) -> Dict:
+    command = [
+        sys.executable,
+        "-m",
+        "benchmarks.bench_server",
+        "--child",
+        mode,
+        "--iterations",
+        str(args.iterations),
+        "--workers",
+        str(args.workers),
+        "--planets",
+        str(args.planets),
+        "--tickers",
+        str(args.tickers),
+        "--recipes",
+        str(args.recipes),
+    ]
+    if args.routes:
+        command += ["--routes", *args.routes]
+
+    output = subprocess.run(command, check=True, capture_output=True, text=True)
+    return json.loads(output.stdout)
+
+
+def report(mode: str, result: Dict) -> None:
+    print(f"\n{mode} (peak RSS {result['peak_rss_mb'] or 0:.0f} MB)")
+    print(
+        f"{'route':<32}{'req/s':>9}{'p50':>9}{'p99':>9}"
+        f"{'network':>9}{'decode':>9}{'valid.':>9}{'hits':>7}{'shared':>8}"
+    )
+    for name, route in result["routes"].items():
+        print(
+            f"{name:<32}{route['rps']:>9.1f}{route['p50']:>9.2f}{route['p99']:>9.2f}"
+            f"{route['network']:>9.2f}{route['decode']:>9.2f}"
+            f"{route['validation']:>9.2f}{route['cache_hits']:>7.0%}"
+            f"{route['coalesced']:>8.0%}"
+        )
+
+
+def regressions(results: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """Compares results against the baseline
+
+    A latency regresses if it grows by more than tolerance and more than
+    LATENCY_FLOOR_MS, throughput if the time per request does.
+
+    Args:
+        results (Dict): Results per mode
+        baseline (Dict): Baseline results per mode
+        tolerance (float): Allowed relative slowdown, e.g. 0.3
+
+    Returns:
+        List[str]: Regression descriptions
+    """
+    found = []
+
+    def worse(current: float, previous: float, floor: float) -> bool:
+        return current > previous * (1 + tolerance) and current - previous > floor
+
+    for mode, result in results.items():
+        previous_mode = baseline["modes"].get(mode)
+        if previous_mode is None:
+            continue
+
+        if (
+            result["peak_rss_mb"] is not None
+            and previous_mode["peak_rss_mb"] is not None
+            and worse(result["peak_rss_mb"], previous_mode["peak_rss_mb"], RSS_FLOOR_MB)
+        ):
+            found.append(
+                f"{mode}: peak RSS {previous_mode['peak_rss_mb']:.0f} MB"
+                f" -> {result['peak_rss_mb']:.0f} MB"
+            )
+
+        for name, route in result["routes"].items():
+            previous = previous_mode["routes"].get(name)
+            if previous is None:
+                continue
+
+            for metric in ("p50", "p99"):
+                if worse(route[metric], previous[metric], LATENCY_FLOOR_MS):
+                    found.append(
+                        f"{mode} {name}: {metric} {previous[metric]:.2f} ms"
+                        f" -> {route[metric]:.2f} ms"
+                    )
+
+            if worse(1e3 / route["rps"], 1e3 / previous["rps"], LATENCY_FLOOR_MS):
+                found.append(
+                    f"{mode} {name}: {previous['rps']:.1f} req/s"
+                    f" -> {route['rps']:.1f} req/s"
+                )
+
+    return found
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=MODES)
+    parser.add_argument("--routes", nargs="+", help="e.g. Planet.full Exchange.get")
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--planets", type=int, default=1000)
+    parser.add_argument("--tickers", type=int, default=1000)
+    parser.add_argument("--recipes", type=int, default=1500)
+    parser.add_argument("--tolerance", type=float, default=0.3)
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--child", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_mode(args.child, args)))
+        return
+
+    settings = {
+        "iterations": args.iterations,
+        "workers": args.workers,
+        "planets": args.planets,
+        "tickers": args.tickers,
+        "recipes": args.recipes,
+    }
+
+    results = {}
+    for mode in args.modes:
+        results[mode] = run_child(mode, args)
+        report(mode, results[mode])
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, "w") as baseline_file:
+            json.dump({"settings": settings, "modes": results}, baseline_file, indent=2)
+        print(f"\nBaseline saved to {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print("\nNo baseline, run with --save-baseline to create one")
+        return
+
+    with open(args.baseline) as baseline_file:
+        baseline = json.load(baseline_file)
+
+    if baseline["settings"] != settings:
+        print(f"\nBaseline settings differ, not compared: {baseline['settings']}")
+        return
+
+    found = regressions(results, baseline, args.tolerance)
+    if found:
+        print(f"\n{len(found)} regression(s) against {args.baseline}:")
+        print("\n".join(found))
+        sys.exit(1)
+
+    print(f"\nNo regressions against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""Measures the import time of fio_wrapper and the construction time of FIO
+
+Imports are timed in a fresh interpreter each. Uncached rows parse base.yml on
+every construction, as before parsed files were kept per process, with the pure
+Python and, if available, the libyaml loader.
+
+    python -m benchmarks.bench_startup --count 200
+"""
+import argparse
+import gc
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable, Dict
+
+import yaml
+
+from fio_wrapper import FIO, AsyncFIO, Config, URLs
+from fio_wrapper import config as config_module
+
+
+def per_call(func: Callable[[], any], count: int, repeat: int) -> float:
+    """Measures the best mean wall time of func
+
+    Args:
+        func (Callable[[], any]): Benchmarked call
+        count (int): Calls per timed run
+        repeat (int): Number of timed runs
+
+    Returns:
+        float: Best mean time per call in microseconds
+    """
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        for _ in range(count):
+            func()
+        timings.append((time.perf_counter() - start) / count)
+
+    return min(timings) * 1e6
+
+
+def import_time(statement: str, repeat: int) -> float:
+    """Measures the best import time of statement in fresh interpreters
+
+    Args:
+        statement (str): Import statement
+        repeat (int): Number of interpreters
+
+    Returns:
+        float: Best import time in milliseconds
+    """
+    code = (
+        "import time\n"
+        "start = time.perf_counter()\n"
+        f"{statement}\n"
+        "print(time.perf_counter() - start)"
+    )
+    timings = [
+        float(subprocess.check_output([sys.executable, "-c", code]))
+        for _ in range(repeat)
+    ]
+
+    return min(timings) * 1e3
+
+
+def uncached(loader: any, func: Callable[[], any]) -> Callable[[], any]:
+    """Runs func with a YAML loader and without parsed files kept
+
+    Args:
+        loader (any): PyYAML loader class
+        func (Callable[[], any]): Benchmarked call
+
+    Returns:
+        Callable[[], any]: Wrapped call
+    """
+
+    def run() -> any:
+        config_module._parsed.clear()
+        config_module.YAML_LOADER, previous = loader, config_module.YAML_LOADER
+        try:
+            return func()
+        finally:
+            config_module.YAML_LOADER = previous
+
+    return run
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--count", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        user_config = os.path.join(directory, "config.yml")
+        with open(user_config, "w") as config_file:
+            config_file.write("fio:\n  timeout: 5\n  retry:\n    attempts: 1\n")
+
+        config = Config()
+        loaders: Dict[str, any] = {"SafeLoader": yaml.SafeLoader}
+        if hasattr(yaml, "CSafeLoader"):
+            loaders["CSafeLoader"] = yaml.CSafeLoader
+
+        cases: Dict[str, Callable[[], any]] = {}
+        for name, loader in loaders.items():
+            cases[f"Config() uncached, {name}"] = uncached(loader, Config)
+            cases[f"FIO() uncached, {name}"] = uncached(loader, FIO)
+
+        cases.update(
+            {
+                "Config()": Config,
+                "Config(user_config)": lambda: Config(user_config=user_config),
+                "URLs(config)": lambda: URLs(config),
+                "FIO()": FIO,
+                "FIO(config)": lambda: FIO(config=user_config),
+                "AsyncFIO()": AsyncFIO,
+            }
+        )
+
+        print(f"loader: {config_module.YAML_LOADER.__name__}, best of {args.repeat}")
+        print(f"\n{'import':<46}{'ms':>10}")
+        for statement in [
+            "import fio_wrapper",
+            "from fio_wrapper import FIO; FIO()",
+            "from fio_wrapper import FIO; FIO().Material",
+            "from fio_wrapper import *",
+        ]:
+            print(f"{statement:<46}{import_time(statement, args.repeat):>10.1f}")
+
+        print(f"\n{'construction':<46}{'us':>10}")
+        for name, func in cases.items():
+            print(f"{name:<46}{per_call(func, args.count, args.repeat):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Measures how one FIO instance shared by many threads scales
+
+Every thread calls Material.get for rotating tickers against the stand-in
+server and checks that it received the material it asked for. Uncached runs
+send every call, cached runs are served from the memory cache after the first
+round. The pool is sized to the largest thread count.
+
+    python -m benchmarks.bench_threads --threads 1 2 4 8 16 32 64 --calls 50
+"""
+import argparse
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+from fio_wrapper import FIO
+from fio_wrapper.models.material_models import MaterialTicker
+
+from benchmarks.payloads import encode, synthesize
+from benchmarks.standin import StandInServer
+
+TICKERS = [f"M{index}" for index in range(50)]
+
+
+def run(fio: FIO, threads: int, calls: int) -> None:
+    latencies: List[float] = []
+    errors: List[str] = []
+
+    def call(number: int) -> None:
+        ticker = TICKERS[number % len(TICKERS)]
+        start = time.perf_counter()
+        material = fio.Material.get(ticker)
+        latencies.append(time.perf_counter() - start)
+
+        if material.Ticker != ticker:
+            errors.append(ticker)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        for future in [executor.submit(call, n) for n in range(threads * calls)]:
+            future.result()
+    wall = time.perf_counter() - start
+
+    latencies.sort()
+    print(
+        f"{threads:>8}{len(latencies) / wall:>10.0f}"
+        f"{latencies[len(latencies) // 2] * 1e3:>9.2f}"
+        f"{latencies[int(len(latencies) * 0.99)] * 1e3:>9.2f}"
+        f"{len(errors):>8}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--threads", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32, 64]
+    )
+    parser.add_argument("--calls", type=int, default=50, help="calls per thread")
+    args = parser.parse_args()
+
+    with StandInServer() as server, tempfile.TemporaryDirectory() as directory:
+        for cache in [False, True]:
+            config = os.path.join(directory, "config.yml")
+            with open(config, "w") as config_file:
+                config_file.write(
+                    f"fio:\n  pool:\n    maxsize: {max(args.threads)}\n"
+                    f"cache:\n  enabled: {str(cache).lower()}\n"
+                    "  default_expire: 3600\n"
+                )
+
+            fio = FIO(base_url=server.base_url, config=config)
+            for ticker in TICKERS:
+                material = synthesize(MaterialTicker)
+                material["Ticker"] = ticker
+                server.add("GET", fio.urls.material_get_url(ticker), encode(material))
+
+            # warms the cache and the endpoint
+            for ticker in TICKERS:
+                fio.Material.get(ticker)
+
+            print(f"\n{'cached' if cache else 'uncached'}, one shared FIO")
+            print(f"{'threads':>8}{'calls/s':>10}{'p50':>9}{'p99':>9}{'errors':>8}")
+            for threads in args.threads:
+                run(fio, threads, args.calls)
+
+
+if __name__ == "__main__":
+    main()
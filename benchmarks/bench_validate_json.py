@@ -0,0 +1,88 @@
+"""Compares decoding to Python objects before validation against validating the
+response bytes directly
+
+    python -m benchmarks.bench_validate_json --planets 5000 --tickers 2000
+"""
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+from typing import Callable, Tuple
+
+from fio_wrapper import ExchangeTickerFullList, PlanetFullList
+
+from benchmarks.payloads import encode, exchange_ticker_full_list, planet_full_list
+
+
+def measure(func: Callable[[], any], repeat: int) -> Tuple[float, int]:
+    """Measures the best wall time and the peak allocation of func
+
+    Args:
+        func (Callable[[], any]): Benchmarked call
+        repeat (int): Number of timed runs
+
+    Returns:
+        Tuple[float, int]: Best time in seconds, peak allocated bytes
+    """
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return min(timings), peak
+
+
+def compare(name: str, model: any, body: bytes, repeat: int) -> None:
+    python_time, python_peak = measure(
+        lambda: model.model_validate(json.loads(body)), repeat
+    )
+    json_time, json_peak = measure(lambda: model.model_validate_json(body), repeat)
+
+    print(f"{name} ({len(body) / 1e6:.1f} MB body)")
+    print(f"  {'path':<28}{'time [ms]':>12}{'peak [MB]':>12}")
+    print(
+        f"  {'json.loads + model_validate':<28}"
+        f"{python_time * 1e3:>12.1f}{python_peak / 1e6:>12.1f}"
+    )
+    print(
+        f"  {'model_validate_json':<28}"
+        f"{json_time * 1e3:>12.1f}{json_peak / 1e6:>12.1f}"
+    )
+    print(
+        f"  speedup {python_time / json_time:.2f}x, "
+        f"peak allocation {json_peak / python_peak:.0%}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--planets", type=int, default=5000)
+    parser.add_argument("--tickers", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    compare(
+        "PlanetFullList",
+        PlanetFullList,
+        encode(planet_full_list(args.planets)),
+        args.repeat,
+    )
+    compare(
+        "ExchangeTickerFullList",
+        ExchangeTickerFullList,
+        encode(exchange_ticker_full_list(args.tickers)),
+        args.repeat,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,356 @@
+"""Synthetic FIO payloads of realistic shape and size for benchmarks
+"""
+import json
+import random
+import typing
+from datetime import datetime, timedelta
+from typing import Dict, List, Type, Union
+
+from annotated_types import MaxLen, MinLen
+from pydantic import AwareDatetime, BaseModel, NaiveDatetime, RootModel
+
+WORKFORCES = ["PIONEER", "SETTLER", "TECHNICIAN", "ENGINEER", "SCIENTIST"]
+CATEGORIES = [
+    "AGRICULTURE",
+    "CHEMISTRY",
+    "CONSTRUCTION",
+    "ELECTRONICS",
+    "FOOD_INDUSTRIES",
+    "FUEL_REFINING",
+    "MANUFACTURING",
+    "METALLURGY",
+    "RESOURCE_EXTRACTION",
+]
+EXCHANGES = ["AI1", "CI1", "CI2", "IC1", "NC1", "NC2"]
+
+
+def _id(rng: random.Random) -> str:
+    return "%032x" % rng.getrandbits(128)
+
+
+def _ticker(index: int) -> str:
+    letters = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    return letters[index // 676 % 26] + letters[index // 26 % 26] + letters[index % 26]
+
+
+def planet_full(index: int, rng: random.Random) -> Dict:
+    """Creates a /planet/allplanets/full item
+
+    Args:
+        index (int): Planet index
+        rng (random.Random): Random source
+
+    Returns:
+        Dict: Planet
+    """
+    epoch = 1740000000000 + index * 1000
+    return {
+        "Resources": [
+            {
+                "MaterialId": _id(rng),
+                "ResourceType": rng.choice(["GASEOUS", "LIQUID", "MINERAL"]),
+                "Factor": rng.random(),
+            }
+            for _ in range(rng.randint(1, 5))
+        ],
+        "BuildRequirements": [
+            {
+                "MaterialName": "material%d" % i,
+                "MaterialId": _id(rng),
+                "MaterialTicker": _ticker(i),
+                "MaterialCategory": _id(rng),
+                "MaterialAmount": rng.randint(1, 100),
+                "MaterialWeight": rng.random(),
+                "MaterialVolume": rng.random(),
+            }
+            for i in range(rng.randint(4, 8))
+        ],
+        "ProductionFees": [
+            {
+                "Category": category,
+                "WorkforceLevel": workforce,
+                "FeeAmount": rng.randint(0, 2000),
+                "FeeCurrency": "CIS",
+            }
+            for category in CATEGORIES
+            for workforce in WORKFORCES
+        ],
+        "COGCPrograms": [
+            {
+                "ProgramType": "ADVERTISING_MANUFACTURING",
+                "StartEpochMs": epoch + i * 604800000,
+                "EndEpochMs": epoch + (i + 1) * 604800000,
+            }
+            for i in range(10)
+        ],
+        "COGCVotes": [
+            {
+                "CompanyName": "Company %d" % i,
+                "CompanyCode": _ticker(i),
+                "Influence": rng.random() * 5000,
+                "VoteType": "ADVERTISING_MANUFACTURING",
+                "VoteTimeEpochMs": epoch + i,
+            }
+            for i in range(rng.randint(0, 5))
+        ],
+        "PlanetNaturalId": "%s-%03d%s" % (_ticker(index // 10), index % 1000, "a"),
+        "PlanetName": "Planet %d" % index,
+        "PlanetId": _id(rng),
+        "Namer": None,
+        "NamingDataEpochMs": 0,
+        "Nameable": True,
+        "SystemId": _id(rng),
+        "Gravity": rng.uniform(0.1, 3.0),
+        "MagneticField": rng.random(),
+        "Mass": rng.random() * 1e24,
+        "MassEarth": rng.random() * 5,
+        "OrbitSemiMajorAxis": rng.randint(10**10, 10**12),
+        "OrbitEccentricity": rng.random(),
+        "OrbitInclination": rng.random(),
+        "OrbitRightAscension": 0,
+        "OrbitPeriapsis": 0,
+        "OrbitIndex": rng.randint(0, 9),
+        "Pressure": rng.uniform(0.0, 3.0),
+        "Radiation": rng.random(),
+        "Radius": rng.uniform(1000, 10000),
+        "Sunlight": rng.random() * 2,
+        "Surface": rng.random() < 0.7,
+        "Temperature": rng.uniform(-100, 150),
+        "Fertility": rng.choice([-1.0, rng.uniform(-1, 1)]),
+        "HasLocalMarket": rng.random() < 0.3,
+        "HasChamberOfCommerce": rng.random() < 0.3,
+        "HasWarehouse": rng.random() < 0.3,
+        "HasAdministrationCenter": rng.random() < 0.3,
+        "HasShipyard": rng.random() < 0.1,
+        "FactionCode": None,
+        "FactionName": None,
+        "GovernorId": None,
+        "GovernorUserName": None,
+        "GovernorCorporationId": None,
+        "GovernorCorporationName": None,
+        "GovernorCorporationCode": None,
+        "CurrencyName": None,
+        "CurrencyCode": None,
+        "CollectorId": None,
+        "CollectorName": None,
+        "CollectorCode": None,
+        "BaseLocalMarketFee": 0,
+        "LocalMarketFeeFactor": 3,
+        "WarehouseFee": 0,
+        "PopulationId": _id(rng),
+        "COGCProgramStatus": None,
+        "PlanetTier": rng.randint(0, 4),
+        "UserNameSubmitted": "BENCHMARK",
+        "Timestamp": "2024-04-27T09:08:14.774522",
+    }
+
+
+def exchange_ticker_full(index: int, rng: random.Random) -> Dict:
+    """Creates a /exchange/full item
+
+    Args:
+        index (int): Ticker index
+        rng (random.Random): Random source
+
+    Returns:
+        Dict: Exchange ticker
+    """
+
+    def order(cost: float) -> Dict:
+        return {
+            "OrderId": _id(rng),
+            "CompanyId": _id(rng),
+            "CompanyName": "Company",
+            "CompanyCode": "COMP",
+            "ItemCount": rng.choice([None, rng.randint(1, 5000)]),
+            "ItemCost": cost,
+        }
+
+    price = rng.uniform(10, 10000)
+    return {
+        "BuyingOrders": [order(price * rng.uniform(0.5, 1)) for _ in range(8)],
+        "SellingOrders": [order(price * rng.uniform(1, 1.5)) for _ in range(8)],
+        "CXDataModelId": _id(rng),
+        "MaterialName": "material%d" % index,
+        "MaterialTicker": _ticker(index // len(EXCHANGES)),
+        "MaterialId": _id(rng),
+        "ExchangeName": "Commodity Exchange",
+        "ExchangeCode": EXCHANGES[index % len(EXCHANGES)],
+        "Currency": "NCC",
+        "Previous": None,
+        "Price": price,
+        "PriceTimeEpochMs": 1698497241809,
+        "High": price * 1.1,
+        "AllTimeHigh": price * 2,
+        "Low": price * 0.9,
+        "AllTimeLow": price * 0.1,
+        "Ask": price * 1.01,
+        "AskCount": rng.randint(0, 5000),
+        "Bid": price * 0.99,
+        "BidCount": rng.randint(0, 5000),
+        "Supply": rng.randint(0, 50000),
+        "Demand": rng.randint(0, 50000),
+        "Traded": rng.randint(0, 5000),
+        "VolumeAmount": price * 1000,
+        "PriceAverage": price,
+        "NarrowPriceBandLow": price * 0.5,
+        "NarrowPriceBandHigh": price * 1.5,
+        "WidePriceBandLow": price * 0.1,
+        "WidePriceBandHigh": price * 2.5,
+        "MMBuy": None,
+        "MMSell": None,
+        "UserNameSubmitted": "BENCHMARK",
+        "Timestamp": "2023-10-30T13:20:08.590949",
+    }
+
+
+def recipe(index: int, rng: random.Random) -> Dict:
+    """Creates a /recipes/allrecipes item
+
+    Args:
+        index (int): Recipe index
+        rng (random.Random): Random source
+
+    Returns:
+        Dict: Recipe
+    """
+    inputs = [
+        {"Ticker": _ticker(rng.randrange(400)), "Amount": rng.randint(1, 20)}
+        for _ in range(rng.randint(0, 4))
+    ]
+    outputs = [
+        {"Ticker": _ticker(rng.randrange(400)), "Amount": rng.randint(1, 20)}
+        for _ in range(rng.randint(1, 2))
+    ]
+    building = _ticker(index // 8)
+
+    return {
+        "Inputs": inputs,
+        "Outputs": outputs,
+        "BuildingTicker": building,
+        "RecipeName": "recipe%d" % index,
+        "StandardRecipeName": "%s:recipe%d" % (building, index),
+        "TimeMs": rng.randint(1, 100) * 3600000,
+    }
+
+
+def planet_full_list(count: int = 5000, seed: int = 0) -> List[Dict]:
+    """Creates a /planet/allplanets/full response
+
+    Args:
+        count (int, optional): Number of planets. Defaults to 5000.
+        seed (int, optional): Random seed. Defaults to 0.
+
+    Returns:
+        List[Dict]: Planets
+    """
+    rng = random.Random(seed)
+    return [planet_full(i, rng) for i in range(count)]
+
+
+def exchange_ticker_full_list(count: int = 2000, seed: int = 0) -> List[Dict]:
+    """Creates a /exchange/full response
+
+    Args:
+        count (int, optional): Number of exchange tickers. Defaults to 2000.
+        seed (int, optional): Random seed. Defaults to 0.
+
+    Returns:
+        List[Dict]: Exchange tickers
+    """
+    rng = random.Random(seed)
+    return [exchange_ticker_full(i, rng) for i in range(count)]
+
+
+def recipe_list(count: int = 1500, seed: int = 0) -> List[Dict]:
+    """Creates a /recipes/allrecipes response
+
+    Args:
+        count (int, optional): Number of recipes. Defaults to 1500.
+        seed (int, optional): Random seed. Defaults to 0.
+
+    Returns:
+        List[Dict]: Recipes
+    """
+    rng = random.Random(seed)
+    return [recipe(i, rng) for i in range(count)]
+
+
+def _string(metadata: List[any], rng: random.Random) -> str:
+    min_length = next((m.min_length for m in metadata if isinstance(m, MinLen)), 0)
+    max_length = next((m.max_length for m in metadata if isinstance(m, MaxLen)), None)
+
+    # ids are hex strings, tickers short upper case strings
+    if min_length >= 32:
+        return "".join(_id(rng) for _ in range(min_length // 32 + 1))[:min_length]
+    if max_length is not None:
+        return _ticker(rng.randrange(17576))[:max_length]
+
+    return "%s%d" % (_ticker(rng.randrange(17576)), rng.randrange(1000))
+
+
+def _value(annotation: any, metadata: List[any], rng: random.Random, items: int) -> any:
+    origin = typing.get_origin(annotation)
+
+    if origin is Union:
+        argument = next(a for a in typing.get_args(annotation) if a is not type(None))
+        return _value(argument, metadata, rng, items)
+    if origin in (list, List):
+        argument = typing.get_args(annotation)[0]
+        return [_value(argument, metadata, rng, items) for _ in range(items)]
+
+    if isinstance(annotation, type) and issubclass(annotation, RootModel):
+        return _value(annotation.model_fields["root"].annotation, [], rng, items)
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return {
+            field.alias or name: _value(field.annotation, field.metadata, rng, items)
+            for name, field in annotation.model_fields.items()
+        }
+
+    if annotation is AwareDatetime:
+        return "2024-04-27T09:08:14.774522Z"
+    if annotation is NaiveDatetime:
+        return "2024-04-27T09:08:14.774522"
+    if annotation is datetime:
+        return 1740000000000 + rng.randrange(10**9)
+    if annotation is timedelta:
+        return rng.randrange(86400)
+    if annotation is bool:
+        return rng.random() < 0.5
+    if annotation is int:
+        return rng.randint(0, 5000)
+    if annotation is float:
+        return rng.uniform(0, 5000)
+    if annotation is str:
+        return _string(metadata, rng)
+
+    raise TypeError(f"Unsupported annotation: {annotation!r}")
+
+
+def synthesize(model: Type[BaseModel], items: int = 3, seed: int = 0) -> any:
+    """Creates a payload for any model from its field types
+
+    Used for routes without a dedicated generator. Ids and tickers satisfy the
+    length constraints of their fields.
+
+    Args:
+        model (Type[BaseModel]): Response model, e.g. SiteList
+        items (int, optional): Length of every list. Defaults to 3.
+        seed (int, optional): Random seed. Defaults to 0.
+
+    Returns:
+        any: Payload
+    """
+    return _value(model, [], random.Random(seed), items)
+
+
+def encode(data: any) -> bytes:
+    """Encodes a payload as FIO response body
+
+    Args:
+        data (any): Payload
+
+    Returns:
+        bytes: JSON body
+    """
+    return json.dumps(data).encode("utf-8")
@@ -0,0 +1,413 @@
+"""Local stand-in FIO server answering every route of fio_urls with fixed payloads
+"""
+import random
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+from urllib.parse import urlsplit
+
+from fio_wrapper import FIO
+from fio_wrapper.models.building_models import BuildingTicker, BuildingTickerList
+from fio_wrapper.models.exchange_models import ExchangeTickerList, OrderList
+from fio_wrapper.models.group_models import (
+    BurnList,
+    GroupHub,
+    GroupList,
+    Group as GroupModel,
+    GroupMembershipList,
+)
+from fio_wrapper.models.localmarket_models import (
+    LocalMarketAdList,
+    LocalMarketAds,
+    LocalMarketShippingAdList,
+)
+from fio_wrapper.models.material_models import MaterialTicker, MaterialTickerList
+from fio_wrapper.models.planet_models import PlanetList, PlanetSiteList
+from fio_wrapper.models.recipe_models import MaterialRecipeList
+from fio_wrapper.models.sites_models import Site, SiteList, WarehouseList
+from fio_wrapper.models.storage_models import StorageList, Storage as StorageModel
+
+from benchmarks.payloads import (
+    encode,
+    exchange_ticker_full,
+    exchange_ticker_full_list,
+    planet_full,
+    planet_full_list,
+    recipe_list,
+    synthesize,
+)
+
+
+class Route(NamedTuple):
+    """Benchmarked endpoint call and the response served for it
+
+    Attributes:
+        name (str): Endpoint, e.g. "Planet.get"
+        method (str): HTTP method
+        url (str): Requested URL
+        body (bytes): Response body
+        call (Callable[[FIO], any]): Endpoint call
+    """
+
+    name: str
+    method: str
+    url: str
+    body: bytes
+    call: Callable[[FIO], any]
+
+
+class StandInServer:
+    """Threaded HTTP server on localhost serving fixed response bodies
+
+    Keeps connections alive, so benchmarks measure the wrapper rather than
+    connection setup. Unknown paths are answered with 404. Accepted connections
+    are counted in connections.
+    """
+
+    def __init__(self) -> None:
+        self._bodies: Dict[Tuple[str, str], bytes] = {}
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self.hits: Dict[Tuple[str, str], int] = {}
+        self.connections: int = 0
+        self._lock = threading.Lock()
+
+    @property
+    def base_url(self) -> str:
+        """Gets the URL of the running server
+
+        Returns:
+            str: Base URL, e.g. "http://127.0.0.1:51234"
+        """
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def add(self, method: str, url: str, body: bytes) -> None:
+        """Serves body for requests of method towards url
+
+        Args:
+            method (str): HTTP method
+            url (str): URL, only its path is matched
+            body (bytes): Response body
+        """
+        self._bodies[(method, urlsplit(url).path)] = body
+
+    def start(self) -> "StandInServer":
+        bodies = self._bodies
+        hits = self.hits
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # headers and body are separate writes, avoid delayed ACK stalls
+            disable_nagle_algorithm = True
+
+            def setup(self) -> None:
+                super().setup()
+                with stand_in._lock:
+                    stand_in.connections += 1
+
+            def _respond(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                if length:
+                    self.rfile.read(length)
+
+                key = (self.command, urlsplit(self.path).path)
+                body = bodies.get(key)
+                hits[key] = hits.get(key, 0) + 1
+
+                self.send_response(200 if body is not None else 404)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body or b"")))
+                self.end_headers()
+                self.wfile.write(body or b"")
+
+            do_GET = _respond
+            do_POST = _respond
+
+            def log_message(self, format: str, *args: any) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def __enter__(self) -> "StandInServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: any) -> None:
+        self.stop()
+
+
+def routes(
+    fio: FIO, planets: int = 1000, tickers: int = 1000, recipes: int = 1500
+) -> List[Route]:
+    """Creates a benchmarked call for every route of fio_urls
+
+    Bulk routes serve synthetic payloads of realistic shape and the given
+    sizes, all other routes payloads synthesized from their response model.
+
+    Args:
+        fio (FIO): Wrapper using the stand-in server as base url
+        planets (int, optional): Planets of /planet/allplanets/full. Defaults to 1000.
+        tickers (int, optional): Tickers of /exchange/full. Defaults to 1000.
+        recipes (int, optional): Recipes of /recipes/allrecipes. Defaults to 1500.
+
+    Returns:
+        List[Route]: Benchmarked calls
+    """
+    urls = fio.urls
+    rng = random.Random(0)
+    site_ids = encode(["%032x" % rng.getrandbits(128) for _ in range(5)])
+
+    def route(name, url, body, call, method="GET") -> Route:
+        return Route(name, method, url, body, call)
+
+    def model(model_class, items: int = 20) -> bytes:
+        return encode(synthesize(model_class, items=items))
+
+    return [
+        route(
+            "Building.get",
+            urls.building_get_url("HB1"),
+            encode(synthesize(BuildingTicker)),
+            lambda f: f.Building.get("HB1"),
+        ),
+        route(
+            "Building.all",
+            urls.building_get_all_url(),
+            model(BuildingTickerList, items=10),
+            lambda f: f.Building.all(),
+        ),
+        route(
+            "Exchange.get",
+            urls.exchange_get_url("DW.NC1"),
+            encode(exchange_ticker_full(0, rng)),
+            lambda f: f.Exchange.get("DW.NC1"),
+        ),
+        route(
+            "Exchange.all",
+            urls.exchange_get_all_url(),
+            model(ExchangeTickerList, items=tickers),
+            lambda f: f.Exchange.all(),
+        ),
+        route(
+            "Exchange.full",
+            urls.exchange_get_full_url(),
+            encode(exchange_ticker_full_list(tickers)),
+            lambda f: f.Exchange.full(),
+        ),
+        route(
+            "Exchange.get_orders",
+            urls.exchange_get_orders_companycode("SKYP"),
+            model(OrderList),
+            lambda f: f.Exchange.get_orders("SKYP"),
+        ),
+        route(
+            "Exchange.get_orders_exchange",
+            urls.exchange_get_orders_companycode_exchange("SKYP", "NC1"),
+            model(OrderList),
+            lambda f: f.Exchange.get_orders_exchange("SKYP", "NC1"),
+        ),
+        route(
+            "Material.get",
+            urls.material_get_url("DW"),
+            encode(synthesize(MaterialTicker)),
+            lambda f: f.Material.get("DW"),
+        ),
+        route(
+            "Material.all",
+            urls.material_allmaterials_url(),
+            model(MaterialTickerList, items=400),
+            lambda f: f.Material.all(),
+        ),
+        route(
+            "Material.category",
+            urls.material_get_category("fuels"),
+            model(MaterialTickerList),
+            lambda f: f.Material.category("fuels"),
+        ),
+        route(
+            "Recipe.get",
+            urls.recipe_get_url("DW"),
+            model(MaterialRecipeList, items=3),
+            lambda f: f.Recipe.get("DW"),
+        ),
+        route(
+            "Recipe.all",
+            urls.recipe_get_all_url(),
+            encode(recipe_list(recipes)),
+            lambda f: f.Recipe.all(),
+        ),
+        route(
+            "Planet.get",
+            urls.planet_get_url("KW-688c"),
+            encode(planet_full(0, rng)),
+            lambda f: f.Planet.get("KW-688c"),
+        ),
+        route(
+            "Planet.all",
+            urls.planet_all_url(),
+            model(PlanetList, items=planets),
+            lambda f: f.Planet.all(),
+        ),
+        route(
+            "Planet.full",
+            urls.planet_full_url(),
+            encode(planet_full_list(planets)),
+            lambda f: f.Planet.full(),
+        ),
+        route(
+            "Planet.sites",
+            urls.planet_sites_url("KW-688c"),
+            model(PlanetSiteList, items=200),
+            lambda f: f.Planet.sites("KW-688c"),
+        ),
+        route(
+            "Planet.search",
+            urls.planet_search_url(),
+            encode(planet_full_list(50, seed=1)),
+            lambda f: f.Planet.search(materials=["FEO"]),
+            method="POST",
+        ),
+        route(
+            "LocalMarket.planet",
+            urls.localmarket_planet_url("KW-688c"),
+            model(LocalMarketAds),
+            lambda f: f.LocalMarket.planet("KW-688c"),
+        ),
+        route(
+            "LocalMarket.planet_buy",
+            urls.localmarket_planet_type_url("KW-688c", "BUY"),
+            model(LocalMarketAdList),
+            lambda f: f.LocalMarket.planet_buy("KW-688c"),
+        ),
+        route(
+            "LocalMarket.planet_sell",
+            urls.localmarket_planet_type_url("KW-688c", "SELL"),
+            model(LocalMarketAdList),
+            lambda f: f.LocalMarket.planet_sell("KW-688c"),
+        ),
+        route(
+            "LocalMarket.planet_shipping",
+            urls.localmarket_planet_type_url("KW-688c", "SHIP"),
+            model(LocalMarketShippingAdList),
+            lambda f: f.LocalMarket.planet_shipping("KW-688c"),
+        ),
+        route(
+            "LocalMarket.shipping_from",
+            urls.localmarket_shipping_source_url("KW-688c"),
+            model(LocalMarketShippingAdList),
+            lambda f: f.LocalMarket.shipping_from("KW-688c"),
+        ),
+        route(
+            "LocalMarket.shipping_to",
+            urls.localmarket_shipping_destination_url("KW-688c"),
+            model(LocalMarketShippingAdList),
+            lambda f: f.LocalMarket.shipping_to("KW-688c"),
+        ),
+        route(
+            "LocalMarket.company",
+            urls.localmarket_company_url("SKYP"),
+            model(LocalMarketAds),
+            lambda f: f.LocalMarket.company("SKYP"),
+        ),
+        route(
+            "Sites.get",
+            urls.sites_get_url("foo"),
+            model(SiteList, items=5),
+            lambda f: f.Sites.get("foo"),
+        ),
+        route(
+            "Sites.get_planet",
+            urls.sites_planets_get_planet_url("foo", "KW-688c"),
+            encode(synthesize(Site, items=5)),
+            lambda f: f.Sites.get_planet("foo", "KW-688c"),
+        ),
+        route(
+            "Sites.planets",
+            urls.sites_planets_get_url("foo"),
+            site_ids,
+            lambda f: f.Sites.planets("foo"),
+        ),
+        route(
+            "Sites.warehouses",
+            urls.sites_warehouses_get("foo"),
+            model(WarehouseList, items=5),
+            lambda f: f.Sites.warehouses("foo"),
+        ),
+        route(
+            "Storage.get",
+            urls.storage_get_url("foo"),
+            model(StorageList, items=5),
+            lambda f: f.Storage.get("foo"),
+        ),
+        route(
+            "Storage.get_specific",
+            urls.storage_get_specific_url("foo", "KW-688c"),
+            encode(synthesize(StorageModel, items=20)),
+            lambda f: f.Storage.get_specific("foo", "KW-688c"),
+        ),
+        route(
+            "Storage.planets",
+            urls.storage_planets_get_url("foo"),
+            site_ids,
+            lambda f: f.Storage.planets("foo"),
+        ),
+        route(
+            "Group.all",
+            urls.group_all_url(),
+            model(GroupList),
+            lambda f: f.Group.all(),
+        ),
+        route(
+            "Group.get",
+            urls.group_get_url(1),
+            encode(synthesize(GroupModel, items=10)),
+            lambda f: f.Group.get(1),
+        ),
+        route(
+            "Group.memberships",
+            urls.group_memberships_url(),
+            model(GroupMembershipList),
+            lambda f: f.Group.memberships(),
+        ),
+        route(
+            "Group.hub",
+            urls.group_hub_url(),
+            encode(synthesize(GroupHub, items=5)),
+            lambda f: f.Group.hub(["foo", "moo"]),
+            method="POST",
+        ),
+        route(
+            "Group.burn",
+            urls.group_burn_url(1),
+            model(BurnList, items=5),
+            lambda f: f.Group.burn(1),
+        ),
+    ]
+
+
+def serve(server: StandInServer, fio: FIO, **sizes: int) -> List[Route]:
+    """Registers the routes of fio on server
+
+    Args:
+        server (StandInServer): Stand-in server
+        fio (FIO): Wrapper using the stand-in server as base url
+        **sizes (int): Bulk payload sizes passed to routes
+
+    Returns:
+        List[Route]: Benchmarked calls
+    """
+    benchmarked = routes(fio, **sizes)
+    for route in benchmarked:
+        server.add(route.method, route.url, route.body)
+
+    return benchmarked
@@ -1,15 +1,189 @@
 """Access FIO endpoints from Python
+
+Public names are imported from their module on first access, so importing the
+package does not load requests, pydantic or any endpoint and model module.
 """
-from .fio import *
-from .fio_adapter import *
-from .exceptions import *
-from .urls import *
-from .validators import *
-
-# models
-from .models.material_models import *
-from .models.exchange_models import *
-from .models.recipe_models import *
-from .models.building_models import *
-from .models.planet_models import *
-from .models.localmarket_models import *
+import importlib
+from typing import TYPE_CHECKING, Dict, List, Tuple
+
+# public names by defining module, relative to this package
+_MODULES: Dict[str, Tuple[str, ...]] = {
+    ".fio": ("FIO",),
+    ".fio_adapter": ("FIOAdapter",),
+    ".async_fio": ("AsyncFIO",),
+    ".async_fio_adapter": ("AsyncFIOAdapter",),
+    ".config": ("Config",),
+    ".urls": ("URLs",),
+    ".bulk": ("BulkStore",),
+    ".fork": ("prefork",),
+    ".decoder": ("get_decoder",),
+    ".instrumentation": (
+        "Hook",
+        "RequestEvent",
+        "current_event",
+        "emit",
+        "reset_event",
+        "set_event",
+    ),
+    ".ratelimit": ("RateLimiter",),
+    ".retry": ("RetryPolicy",),
+    ".singleflight": ("SingleFlight",),
+    ".stats": ("AdapterStats",),
+    ".streaming": ("JSONArrayParser", "iter_json_array"),
+    ".exceptions": (
+        "BuildingTickerNotFound",
+        "CompanyCodeInvalid",
+        "CompanyOrAdsNotFound",
+        "EndpointNotImplemented",
+        "ExchangeTickerInvalid",
+        "ExchangeTickerNotFound",
+        "InvalidAdType",
+        "MaterialCategoryNotFound",
+        "MaterialTickerInvalid",
+        "MaterialTickerNotFound",
+        "MissingDependency",
+        "NoAPIKeyProvided",
+        "NoSiteData",
+        "NoStorageData",
+        "NotAuthenticated",
+        "PlanetNotFound",
+        "PlanetOrAdsNotFound",
+        "PlanetSearchDistanceChecksInvalid",
+        "PlanetSearchInvalidRequest",
+        "PlanetSearchMaterialsInvalid",
+        "ProductionCycleError",
+        "RateLimitTimeout",
+        "RecipeNotFound",
+        "UnknownConfig",
+        "UnknownFIOResponse",
+    ),
+    ".validators": (
+        "validate_company_code",
+        "validate_exchange_code",
+        "validate_exchange_ticker",
+        "validate_localmarket_adtype",
+        "validate_planet_search_distance_checks",
+        "validate_planet_search_materials",
+        "validate_ticker",
+    ),
+    ".batch": ("BatchResult", "run_batch", "run_batch_async"),
+    ".material_index": ("MaterialIndex",),
+    ".production": (
+        "Bill",
+        "CYCLE_ITERATIONS",
+        "CYCLE_TOLERANCE",
+        "ProductionGraph",
+        "strongly_connected",
+    ),
+    # models
+    ".models.material_models": ("MaterialTicker", "MaterialTickerList"),
+    ".models.exchange_models": (
+        "ExchangeOrder",
+        "ExchangeTicker",
+        "ExchangeTickerFull",
+        "ExchangeTickerFullList",
+        "ExchangeTickerList",
+        "Order",
+        "OrderDefinition",
+        "OrderList",
+    ),
+    ".models.recipe_models": (
+        "MaterialRecipe",
+        "MaterialRecipeIO",
+        "MaterialRecipeList",
+        "Recipe",
+        "RecipeIO",
+        "RecipeList",
+    ),
+    ".models.building_models": (
+        "BuildingCost",
+        "BuildingRecipe",
+        "BuildingRecipeIO",
+        "BuildingTicker",
+        "BuildingTickerList",
+    ),
+    ".models.planet_models": (
+        "BuildingRequirement",
+        "COGCProgram",
+        "COGCVote",
+        "Planet",
+        "PlanetFull",
+        "PlanetFullList",
+        "PlanetList",
+        "PlanetResource",
+        "PlanetSite",
+        "PlanetSiteList",
+        "ProductionFee",
+    ),
+    ".models.localmarket_models": (
+        "Ad",
+        "AdBase",
+        "LocalMarketAdList",
+        "LocalMarketAds",
+        "LocalMarketShippingAdList",
+        "ShippingAd",
+    ),
+    ".models.lazy_models": ("Item", "LazyList"),
+}
+
+_EXPORTS: Dict[str, str] = {
+    name: module for module, names in _MODULES.items() for name in names
+}
+
+__all__: List[str] = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> any:
+    """Imports a public name or submodule on first access
+
+    Args:
+        name (str): Attribute name
+
+    Raises:
+        AttributeError: Neither a public name nor a submodule
+
+    Returns:
+        any: Public name or submodule
+    """
+    module = _EXPORTS.get(name)
+    if module is not None:
+        value = getattr(importlib.import_module(module, __name__), name)
+    else:
+        try:
+            value = importlib.import_module(f".{name}", __name__)
+        except ModuleNotFoundError as exc:
+            if exc.name != f"{__name__}.{name}":
+                raise
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}"
+            ) from None
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+if TYPE_CHECKING:
+    from .fio import *
+    from .fio_adapter import *
+    from .async_fio import *
+    from .async_fio_adapter import *
+    from .exceptions import *
+    from .urls import *
+    from .validators import *
+    from .batch import *
+    from .fork import *
+    from .material_index import *
+    from .production import *
+
+    # models
+    from .models.material_models import *
+    from .models.exchange_models import *
+    from .models.recipe_models import *
+    from .models.building_models import *
+    from .models.planet_models import *
+    from .models.localmarket_models import *
+    from .models.lazy_models import *
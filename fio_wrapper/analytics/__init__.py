@@ -0,0 +1,15 @@
+"""Vectorized analytics on FIO data, requires numpy
+"""
+import importlib.util
+
+from fio_wrapper.exceptions import MissingDependency
+
+if importlib.util.find_spec("numpy") is None:
+    raise MissingDependency(
+        "fio_wrapper.analytics requires numpy, install fio-wrapper[analytics]"
+    )
+
+from .columns import *
+from .planet_search import *
+from .order_book import *
+from .arbitrage import *
@@ -0,0 +1,259 @@
+"""Cross exchange arbitrage over the order books of all exchange tickers
+"""
+import math
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from fio_wrapper.analytics.order_book import OrderBooks
+
+
+class Opportunity(NamedTuple):
+    """Buying a material on one exchange and selling it on another
+
+    Prices are in the currency of their exchange, cost and profit in the
+    common unit of the exchange rates.
+    """
+
+    material_ticker: str
+    buy_exchange: str
+    sell_exchange: str
+    buy_currency: str
+    sell_currency: str
+    ask: float
+    bid: float
+    quantity: float
+    cost: float
+    profit: float
+    margin: float
+
+
+class Arbitrage:
+    """Ranked arbitrage opportunities as NumPy columns
+
+    Every row buys from the selling orders of one exchange and sells to the
+    buying orders of another exchange of the same material. Rows are sorted by
+    profit, highest first.
+
+    Attributes:
+        material_tickers (np.ndarray): Material ticker per row
+        buy_exchanges (np.ndarray): Exchange code bought from per row
+        sell_exchanges (np.ndarray): Exchange code sold to per row
+        buy_currencies (np.ndarray): Currency paid per row
+        sell_currencies (np.ndarray): Currency received per row
+        asks (np.ndarray): Best ask of the buying exchange per row
+        bids (np.ndarray): Best bid of the selling exchange per row
+        quantities (np.ndarray): Units traded until the books stop crossing, or the limit
+        costs (np.ndarray): Cost of buying the quantity, in the common unit
+        profits (np.ndarray): Revenue minus cost of the quantity, in the common unit
+        margins (np.ndarray): Profit relative to cost
+    """
+
+    def __init__(self, columns: Dict[str, np.ndarray]) -> None:
+        self.material_tickers: np.ndarray = columns["material_tickers"]
+        self.buy_exchanges: np.ndarray = columns["buy_exchanges"]
+        self.sell_exchanges: np.ndarray = columns["sell_exchanges"]
+        self.buy_currencies: np.ndarray = columns["buy_currencies"]
+        self.sell_currencies: np.ndarray = columns["sell_currencies"]
+        self.asks: np.ndarray = columns["asks"]
+        self.bids: np.ndarray = columns["bids"]
+        self.quantities: np.ndarray = columns["quantities"]
+        self.costs: np.ndarray = columns["costs"]
+        self.profits: np.ndarray = columns["profits"]
+        self.margins: np.ndarray = columns["margins"]
+
+    @classmethod
+    def scan(
+        cls,
+        books: OrderBooks,
+        rates: Optional[Dict[str, float]] = None,
+        limit: Optional[float] = None,
+        min_profit: float = 0.0,
+    ) -> "Arbitrage":
+        """Finds all arbitrage opportunities between the order books
+
+        Books are grouped by material and every pair of exchanges is compared
+        at once. A pair is traded level by level, as long as the converted ask
+        is below the converted bid, for all pairs together.
+
+        Args:
+            books (OrderBooks): Order books, e.g. from Exchange.full().to_order_books()
+            rates (Dict[str, float], optional): Value of one unit by currency (e.g., {"NCC": 1.0, "CIS": 0.8}). Defaults to None, comparing only exchanges of the same currency.
+            limit (float, optional): Most units traded per opportunity. Defaults to None, unlimited.
+            min_profit (float, optional): Least profit of an opportunity. Defaults to 0.0.
+
+        Returns:
+            Arbitrage: Opportunities, highest profit first
+        """
+        limit = math.inf if limit is None else limit
+        materials = np.asarray(
+            [ticker.split(".")[0] for ticker in books.tickers], dtype=str
+        )
+        exchanges = np.asarray(
+            [ticker.split(".")[1] for ticker in books.tickers], dtype=str
+        )
+        currencies = np.asarray(books.currencies, dtype=str)
+
+        # without rates, only exchanges of the same currency are compared
+        if rates is None:
+            rate = np.ones(len(books))
+            keys = np.char.add(np.char.add(materials, "."), currencies)
+        else:
+            rate = np.asarray(
+                [rates.get(currency, np.nan) for currency in books.currencies],
+                dtype=np.float64,
+            )
+            keys = materials
+
+        rows = np.flatnonzero(np.isfinite(rate))
+        left, right = cls._pairs(keys[rows])
+        left, right = rows[left], rows[right]
+
+        ask = books.asks.best()[left]
+        bid = books.bids.best()[right]
+        with np.errstate(invalid="ignore"):
+            crossing = ask * rate[left] < bid * rate[right]
+        left, right = left[crossing], right[crossing]
+
+        quantity, cost, profit = cls._cross(books, rate, left, right, limit)
+
+        keep = profit > min_profit
+        ranked = np.flatnonzero(keep)[np.argsort(-profit[keep], kind="stable")]
+        left, right = left[ranked], right[ranked]
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            margin = profit[ranked] / cost[ranked]
+
+        return cls(
+            {
+                "material_tickers": materials[left],
+                "buy_exchanges": exchanges[left],
+                "sell_exchanges": exchanges[right],
+                "buy_currencies": currencies[left],
+                "sell_currencies": currencies[right],
+                "asks": books.asks.best()[left],
+                "bids": books.bids.best()[right],
+                "quantities": quantity[ranked],
+                "costs": cost[ranked],
+                "profits": profit[ranked],
+                "margins": margin,
+            }
+        )
+
+    @staticmethod
+    def _pairs(keys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Gets all ordered pairs of distinct rows with equal keys
+
+        Args:
+            keys (np.ndarray): Group key per row
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Left and right row per pair
+        """
+        groups, group = np.unique(keys, return_inverse=True)
+        group = group.reshape(-1)
+        order = np.argsort(group, kind="stable")
+        counts = np.bincount(group, minlength=len(groups))
+        starts = np.cumsum(counts) - counts
+
+        # every row paired with each row of its group
+        size = counts[group[order]]
+        left = np.repeat(order, size)
+        offset = np.arange(len(left)) - np.repeat(np.cumsum(size) - size, size)
+        right = order[starts[group[left]] + offset]
+
+        distinct = left != right
+        return left[distinct], right[distinct]
+
+    @staticmethod
+    def _cross(
+        books: OrderBooks,
+        rate: np.ndarray,
+        left: np.ndarray,
+        right: np.ndarray,
+        limit: float,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Trades the asks of left against the bids of right while they cross
+
+        Args:
+            books (OrderBooks): Order books
+            rate (np.ndarray): Exchange rate per book
+            left (np.ndarray): Book bought from per pair
+            right (np.ndarray): Book sold to per pair
+            limit (float): Most units traded per pair
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: Quantity, cost and profit per pair
+        """
+        asks, bids = books.asks, books.bids
+        ask_level, ask_end = asks.offsets[left], asks.offsets[left + 1]
+        bid_level, bid_end = bids.offsets[right], bids.offsets[right + 1]
+        ask_rate, bid_rate = rate[left], rate[right]
+
+        quantity = np.zeros(len(left))
+        cost = np.zeros(len(left))
+        profit = np.zeros(len(left))
+        active = np.flatnonzero(
+            (ask_level < ask_end) & (bid_level < bid_end) & (limit > 0)
+        )
+
+        while len(active) > 0:
+            ask, bid = ask_level[active], bid_level[active]
+            ask_price = asks.prices[ask] * ask_rate[active]
+            bid_price = bids.prices[bid] * bid_rate[active]
+
+            crossing = ask_price < bid_price
+            active, ask, bid = active[crossing], ask[crossing], bid[crossing]
+            ask_price, bid_price = ask_price[crossing], bid_price[crossing]
+
+            ask_total, bid_total = asks.cumulative[ask], bids.cumulative[bid]
+            reached = np.minimum(np.minimum(ask_total, bid_total), limit)
+            traded = reached - quantity[active]
+
+            quantity[active] = reached
+            cost[active] += traded * ask_price
+            profit[active] += traded * (bid_price - ask_price)
+
+            # next level of every side used up
+            ask_level[active] += ask_total <= reached
+            bid_level[active] += bid_total <= reached
+
+            active = active[
+                (ask_level[active] < ask_end[active])
+                & (bid_level[active] < bid_end[active])
+                & (reached < limit)
+            ]
+
+        return quantity, cost, profit
+
+    def __len__(self) -> int:
+        return len(self.profits)
+
+    def __getitem__(self, row: int) -> Opportunity:
+        return Opportunity(
+            material_ticker=str(self.material_tickers[row]),
+            buy_exchange=str(self.buy_exchanges[row]),
+            sell_exchange=str(self.sell_exchanges[row]),
+            buy_currency=str(self.buy_currencies[row]),
+            sell_currency=str(self.sell_currencies[row]),
+            ask=float(self.asks[row]),
+            bid=float(self.bids[row]),
+            quantity=float(self.quantities[row]),
+            cost=float(self.costs[row]),
+            profit=float(self.profits[row]),
+            margin=float(self.margins[row]),
+        )
+
+    def __iter__(self) -> Iterator[Opportunity]:
+        return (self[row] for row in range(len(self)))
+
+    def top(self, count: int) -> List[Opportunity]:
+        """Gets the most profitable opportunities
+
+        Args:
+            count (int): Number of opportunities
+
+        Returns:
+            List[Opportunity]: Opportunities, highest profit first
+        """
+        return [self[row] for row in range(min(count, len(self)))]
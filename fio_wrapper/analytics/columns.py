@@ -0,0 +1,200 @@
+"""Columnar NumPy representation of exchange tickers
+"""
+from operator import attrgetter
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+# numeric fields of ExchangeTicker
+TICKER_FLOAT_FIELDS: List[str] = ["MMBuy", "MMSell", "PriceAverage", "Ask", "Bid"]
+TICKER_INT_FIELDS: List[str] = ["AskCount", "BidCount", "Supply", "Demand"]
+
+# additional numeric fields of ExchangeTickerFull
+FULL_FLOAT_FIELDS: List[str] = [
+    "Price",
+    "High",
+    "AllTimeHigh",
+    "Low",
+    "AllTimeLow",
+    "VolumeAmount",
+    "NarrowPriceBandLow",
+    "NarrowPriceBandHigh",
+    "WidePriceBandLow",
+    "WidePriceBandHigh",
+]
+FULL_INT_FIELDS: List[str] = ["Traded"]
+
+
+def _encode(values: List[str]) -> Tuple[List[str], np.ndarray]:
+    """Dictionary encodes strings
+
+    Args:
+        values (List[str]): Strings
+
+    Returns:
+        Tuple[List[str], np.ndarray]: Sorted distinct strings, int32 codes into them
+    """
+    if len(values) == 0:
+        return [], np.zeros(0, dtype=np.int32)
+
+    categories, codes = np.unique(np.asarray(values, dtype=str), return_inverse=True)
+    return categories.tolist(), codes.astype(np.int32).reshape(-1)
+
+
+class ExchangeColumns:
+    """Exchange tickers as contiguous NumPy columns
+
+    Numeric fields are stored as float64 or int64 arrays. Missing values are
+    flagged in a boolean mask per field, True meaning missing as in
+    numpy.ma, and filled with NaN or 0 in the value array. Material tickers and
+    exchange codes are dictionary encoded.
+
+    Attributes:
+        values (Dict[str, np.ndarray]): Values by field name
+        masks (Dict[str, np.ndarray]): Missing value masks by field name
+        ticker_categories (List[str]): Distinct material tickers, sorted
+        ticker_codes (np.ndarray): int32 index into ticker_categories per row
+        exchange_categories (List[str]): Distinct exchange codes, sorted
+        exchange_codes (np.ndarray): int32 index into exchange_categories per row
+    """
+
+    def __init__(
+        self,
+        values: Dict[str, np.ndarray],
+        masks: Dict[str, np.ndarray],
+        ticker_categories: List[str],
+        ticker_codes: np.ndarray,
+        exchange_categories: List[str],
+        exchange_codes: np.ndarray,
+    ) -> None:
+        self.values = values
+        self.masks = masks
+        self.ticker_categories = ticker_categories
+        self.ticker_codes = ticker_codes
+        self.exchange_categories = exchange_categories
+        self.exchange_codes = exchange_codes
+
+    @classmethod
+    def from_tickers(
+        cls, tickers: Iterable[any], full: bool = False
+    ) -> "ExchangeColumns":
+        """Creates the columns of exchange tickers
+
+        Args:
+            tickers (Iterable[any]): ExchangeTicker or ExchangeTickerFull items
+            full (bool, optional): Include the ExchangeTickerFull fields. Defaults to False.
+
+        Returns:
+            ExchangeColumns: Columns
+        """
+        float_fields = TICKER_FLOAT_FIELDS + (FULL_FLOAT_FIELDS if full else [])
+        int_fields = TICKER_INT_FIELDS + (FULL_INT_FIELDS if full else [])
+        fields = ["MaterialTicker", "ExchangeCode"] + float_fields + int_fields
+
+        # one attribute pass over all tickers, then column wise conversion
+        getter = attrgetter(*fields)
+        rows = [getter(ticker) for ticker in tickers]
+        table = np.empty((len(rows), len(fields)), dtype=object)
+        if len(rows) > 0:
+            table[:] = rows
+
+        values: Dict[str, np.ndarray] = {}
+        masks: Dict[str, np.ndarray] = {}
+
+        for index, name in enumerate(fields[2:], start=2):
+            column = table[:, index]
+            mask = np.equal(column, None)
+            dtype, fill = (
+                (np.float64, np.nan) if name in float_fields else (np.int64, 0)
+            )
+
+            values[name] = np.ascontiguousarray(
+                np.where(mask, fill, column).astype(dtype)
+            )
+            masks[name] = mask.astype(bool)
+
+        ticker_categories, ticker_codes = _encode(table[:, 0].tolist())
+        exchange_categories, exchange_codes = _encode(table[:, 1].tolist())
+
+        return cls(
+            values=values,
+            masks=masks,
+            ticker_categories=ticker_categories,
+            ticker_codes=ticker_codes,
+            exchange_categories=exchange_categories,
+            exchange_codes=exchange_codes,
+        )
+
+    def __len__(self) -> int:
+        return len(self.ticker_codes)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.values
+
+    def __getitem__(self, name: str) -> np.ma.MaskedArray:
+        """Gets a numeric field as masked array
+
+        Args:
+            name (str): Field name, e.g. "Ask"
+
+        Raises:
+            KeyError: Field is not a numeric column
+
+        Returns:
+            np.ma.MaskedArray: Values masked where missing
+        """
+        return np.ma.MaskedArray(self.values[name], mask=self.masks[name])
+
+    @property
+    def fields(self) -> List[str]:
+        """Gets the numeric field names
+
+        Returns:
+            List[str]: Field names
+        """
+        return list(self.values)
+
+    @property
+    def ticker_labels(self) -> np.ndarray:
+        """Decodes the material ticker column
+
+        Returns:
+            np.ndarray: Material ticker per row
+        """
+        return np.asarray(self.ticker_categories, dtype=str)[self.ticker_codes]
+
+    @property
+    def exchange_labels(self) -> np.ndarray:
+        """Decodes the exchange code column
+
+        Returns:
+            np.ndarray: Exchange code per row
+        """
+        return np.asarray(self.exchange_categories, dtype=str)[self.exchange_codes]
+
+    def row(self, material_ticker: str, exchange_code: str) -> int:
+        """Gets the row of an exchange ticker
+
+        Args:
+            material_ticker (str): Material ticker (e.g. "DW")
+            exchange_code (str): Exchange code (e.g. "NC1")
+
+        Raises:
+            KeyError: Exchange ticker not contained
+
+        Returns:
+            int: Row index
+        """
+        try:
+            ticker = self.ticker_categories.index(material_ticker)
+            exchange = self.exchange_categories.index(exchange_code)
+        except ValueError as exc:
+            raise KeyError(f"{material_ticker}.{exchange_code}") from exc
+
+        rows = np.flatnonzero(
+            (self.ticker_codes == ticker) & (self.exchange_codes == exchange)
+        )
+        if len(rows) == 0:
+            raise KeyError(f"{material_ticker}.{exchange_code}")
+
+        return int(rows[0])
@@ -0,0 +1,600 @@
+"""Price sorted, array backed order books of exchange tickers
+"""
+import math
+from operator import attrgetter
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from fio_wrapper.exceptions import ExchangeTickerNotFound
+from fio_wrapper.models.exchange_models import (
+    ExchangeTickerFull,
+    ExchangeTickerFullList,
+)
+
+# quantity of market maker orders, ItemCount is None
+UNLIMITED: float = math.inf
+
+
+def _segmented_cumsum(
+    values: np.ndarray, starts: np.ndarray, segments: np.ndarray
+) -> np.ndarray:
+    """Cumulative sum restarting at every segment
+
+    Args:
+        values (np.ndarray): Values, grouped by segment
+        starts (np.ndarray): Index of the first value per segment
+        segments (np.ndarray): Segment per value
+
+    Returns:
+        np.ndarray: Cumulative sum within the segment per value
+    """
+    total = np.cumsum(values)
+    first = starts[segments]
+    return total - (total[first] - values[first])
+
+
+def _levels(
+    orders: List[List[any]], ascending: bool
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Sorts and aggregates the orders of several books into price levels
+
+    Args:
+        orders (List[List[any]]): ExchangeOrder lists per book, None if missing
+        ascending (bool): Lowest price first (asks), else highest first (bids)
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]: Prices, quantities, cumulative quantities, cumulative costs and offsets of the books into the levels
+    """
+    flat = [order for book_orders in orders for order in book_orders or []]
+    book = np.repeat(
+        np.arange(len(orders), dtype=np.intp),
+        [len(book_orders or []) for book_orders in orders],
+    )
+    price = np.fromiter(map(attrgetter("ItemCost"), flat), np.float64, len(flat))
+    quantity = np.fromiter(
+        (
+            UNLIMITED if count is None else count
+            for count in map(attrgetter("ItemCount"), flat)
+        ),
+        np.float64,
+        len(flat),
+    )
+
+    # sort by book, best price first, and merge orders of equal price
+    order = np.lexsort((price if ascending else -price, book))
+    book, price, quantity = book[order], price[order], quantity[order]
+
+    if len(book) > 0:
+        new = np.empty(len(book), dtype=bool)
+        new[0] = True
+        new[1:] = (book[1:] != book[:-1]) | (price[1:] != price[:-1])
+        first = np.flatnonzero(new)
+        quantity = np.add.reduceat(quantity, first)
+        book, price = book[first], price[first]
+
+    offsets = np.searchsorted(book, np.arange(len(orders) + 1)).astype(np.intp)
+
+    # market maker levels are unlimited, nothing behind them can be reached
+    unlimited = np.isinf(quantity)
+    finite = np.where(unlimited, 0.0, quantity)
+    cumulative = _segmented_cumsum(finite, offsets, book)
+    cost = _segmented_cumsum(finite * price, offsets, book)
+
+    reached = _segmented_cumsum(unlimited.astype(np.int64), offsets, book) > 0
+    cumulative[reached] = UNLIMITED
+    cost[reached] = UNLIMITED
+
+    return price, quantity, cumulative, cost, offsets
+
+
+def _fill(
+    prices: np.ndarray,
+    cumulative: np.ndarray,
+    cost: np.ndarray,
+    quantity: np.ndarray,
+    level: np.ndarray,
+    filled: np.ndarray,
+    start: Union[int, np.ndarray] = 0,
+) -> np.ndarray:
+    """Computes the cost of quantities ending on known levels
+
+    Args:
+        prices (np.ndarray): Level prices
+        cumulative (np.ndarray): Cumulative quantity per level
+        cost (np.ndarray): Cumulative cost per level
+        quantity (np.ndarray): Quantities
+        level (np.ndarray): Level completing each quantity
+        filled (np.ndarray): Quantity can be filled, level is valid
+        start (Union[int, np.ndarray], optional): First level of the book of each quantity. Defaults to 0.
+
+    Returns:
+        np.ndarray: Cost per quantity, NaN if it exceeds the depth
+    """
+    if len(prices) == 0:
+        return np.full(np.shape(quantity), np.nan)
+
+    level = np.where(filled, level, 0)
+    before = level - 1
+    has_before = filled & (before >= start)
+    before = np.where(has_before, before, 0)
+
+    previous = np.where(has_before, cumulative[before], 0.0)
+    spent = np.where(has_before, cost[before], 0.0)
+
+    with np.errstate(invalid="ignore"):
+        return np.where(filled, spent + (quantity - previous) * prices[level], np.nan)
+
+
+class BookSide:
+    """One side of an order book, price levels sorted best first
+
+    Orders of equal price are merged into one level. Market maker orders
+    without ItemCount have an unlimited quantity, the cumulative quantity and
+    cost are infinite from their level on.
+
+    Attributes:
+        prices (np.ndarray): Price per level, ascending for asks, descending for bids
+        quantities (np.ndarray): Quantity per level
+        cumulative (np.ndarray): Quantity of the level and all better levels
+        cost (np.ndarray): Cost of buying or selling the level and all better levels
+        ascending (bool): Levels sorted by ascending price
+    """
+
+    def __init__(
+        self,
+        prices: np.ndarray,
+        quantities: np.ndarray,
+        cumulative: np.ndarray,
+        cost: np.ndarray,
+        ascending: bool,
+    ) -> None:
+        self.prices = prices
+        self.quantities = quantities
+        self.cumulative = cumulative
+        self.cost = cost
+        self.ascending = ascending
+
+        # ascending search keys and depth before each level for depth()
+        self._keys = prices if ascending else -prices
+        self._depth = np.concatenate(([0.0], cumulative))
+
+    @classmethod
+    def from_orders(cls, orders: Optional[List[any]], ascending: bool) -> "BookSide":
+        """Creates the side of a list of orders
+
+        Args:
+            orders (List[ExchangeOrder], optional): Orders in any order
+            ascending (bool): Asks if True, else bids
+
+        Returns:
+            BookSide: Book side
+        """
+        prices, quantities, cumulative, cost, _ = _levels([orders], ascending)
+        return cls(prices, quantities, cumulative, cost, ascending)
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    @property
+    def best(self) -> Optional[float]:
+        """Gets the best price
+
+        Returns:
+            Optional[float]: Lowest ask or highest bid, None if empty
+        """
+        return float(self.prices[0]) if len(self.prices) else None
+
+    def depth(self, price: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """Gets the quantity available at a price or better
+
+        Args:
+            price (Union[float, np.ndarray]): Limit price(s)
+
+        Returns:
+            Union[float, np.ndarray]: Quantity at asks up to or bids down to the price, inf with a market maker
+        """
+        price = np.asarray(price, dtype=np.float64)
+        levels = np.searchsorted(
+            self._keys, price if self.ascending else -price, side="right"
+        )
+        return self._depth[levels][()]
+
+    def total(self, quantity: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """Gets the cost of filling a quantity, best levels first
+
+        Args:
+            quantity (Union[float, np.ndarray]): Quantity or quantities
+
+        Returns:
+            Union[float, np.ndarray]: Total cost, NaN if the quantity exceeds the depth
+        """
+        quantity = np.asarray(quantity, dtype=np.float64)
+        level = np.searchsorted(self.cumulative, quantity, side="left")
+
+        return _fill(
+            self.prices,
+            self.cumulative,
+            self.cost,
+            quantity,
+            level,
+            level < len(self.prices),
+        )[()]
+
+    def vwap(self, quantity: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """Gets the volume weighted average price of filling a quantity
+
+        Args:
+            quantity (Union[float, np.ndarray]): Quantity or quantities
+
+        Returns:
+            Union[float, np.ndarray]: Average price, NaN if the quantity exceeds the depth
+        """
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return (self.total(quantity) / np.asarray(quantity, dtype=np.float64))[()]
+
+    def slippage(self, quantity: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """Gets the relative price impact of filling a quantity
+
+        Args:
+            quantity (Union[float, np.ndarray]): Quantity or quantities
+
+        Returns:
+            Union[float, np.ndarray]: VWAP relative to the best price, positive when worse, NaN if the quantity exceeds the depth
+        """
+        best = self.prices[0] if len(self.prices) else np.nan
+        impact = self.vwap(quantity) / best - 1.0
+        return (impact if self.ascending else -impact)[()]
+
+
+class OrderBook:
+    """Order book of an exchange ticker
+
+    Attributes:
+        material_ticker (str): Material ticker
+        exchange_code (str): Exchange code
+        currency (str): Currency of all prices
+        bids (BookSide): Buying orders, highest price first
+        asks (BookSide): Selling orders, lowest price first
+    """
+
+    def __init__(
+        self,
+        material_ticker: str,
+        exchange_code: str,
+        currency: str,
+        bids: BookSide,
+        asks: BookSide,
+    ) -> None:
+        self.material_ticker = material_ticker
+        self.exchange_code = exchange_code
+        self.currency = currency
+        self.bids = bids
+        self.asks = asks
+
+    @classmethod
+    def from_ticker(cls, ticker: ExchangeTickerFull) -> "OrderBook":
+        """Creates the order book of an exchange ticker
+
+        Args:
+            ticker (ExchangeTickerFull): Exchange ticker, e.g. from Exchange.get()
+
+        Returns:
+            OrderBook: Order book
+        """
+        return cls(
+            material_ticker=ticker.MaterialTicker,
+            exchange_code=ticker.ExchangeCode,
+            currency=ticker.Currency,
+            bids=BookSide.from_orders(ticker.BuyingOrders, ascending=False),
+            asks=BookSide.from_orders(ticker.SellingOrders, ascending=True),
+        )
+
+    @property
+    def ticker(self) -> str:
+        """Gets the exchange ticker
+
+        Returns:
+            str: Exchange ticker (e.g., "DW.AI1")
+        """
+        return f"{self.material_ticker}.{self.exchange_code}"
+
+    @property
+    def best_bid(self) -> Optional[float]:
+        """Gets the highest buying price
+
+        Returns:
+            Optional[float]: Price, None without buying orders
+        """
+        return self.bids.best
+
+    @property
+    def best_ask(self) -> Optional[float]:
+        """Gets the lowest selling price
+
+        Returns:
+            Optional[float]: Price, None without selling orders
+        """
+        return self.asks.best
+
+    @property
+    def spread(self) -> Optional[float]:
+        """Gets the difference of best ask and best bid
+
+        Returns:
+            Optional[float]: Spread, None if a side is empty
+        """
+        if self.best_bid is None or self.best_ask is None:
+            return None
+
+        return self.best_ask - self.best_bid
+
+
+class BookSides:
+    """One side of many order books as flat level arrays
+
+    The levels of book i are levels[offsets[i]:offsets[i + 1]], sorted as in
+    BookSide. All methods compute one value per book in a few vectorized
+    passes over all levels.
+
+    Attributes:
+        prices (np.ndarray): Price per level
+        quantities (np.ndarray): Quantity per level
+        cumulative (np.ndarray): Cumulative quantity per level within its book
+        cost (np.ndarray): Cumulative cost per level within its book
+        offsets (np.ndarray): First level per book, followed by the number of levels
+        ascending (bool): Levels sorted by ascending price
+    """
+
+    def __init__(
+        self,
+        prices: np.ndarray,
+        quantities: np.ndarray,
+        cumulative: np.ndarray,
+        cost: np.ndarray,
+        offsets: np.ndarray,
+        ascending: bool,
+    ) -> None:
+        self.prices = prices
+        self.quantities = quantities
+        self.cumulative = cumulative
+        self.cost = cost
+        self.offsets = offsets
+        self.ascending = ascending
+        self.books = np.repeat(
+            np.arange(len(offsets) - 1, dtype=np.intp), np.diff(offsets)
+        )
+
+    @classmethod
+    def from_orders(
+        cls, orders: List[Optional[List[any]]], ascending: bool
+    ) -> "BookSides":
+        """Creates the sides of many order lists
+
+        Args:
+            orders (List[Optional[List[ExchangeOrder]]]): Orders per book
+            ascending (bool): Asks if True, else bids
+
+        Returns:
+            BookSides: Book sides
+        """
+        return cls(*_levels(orders, ascending), ascending=ascending)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def side(self, book: int) -> BookSide:
+        """Gets the side of one book, sharing the level arrays
+
+        Args:
+            book (int): Book index
+
+        Returns:
+            BookSide: Book side
+        """
+        levels = slice(self.offsets[book], self.offsets[book + 1])
+        return BookSide(
+            self.prices[levels],
+            self.quantities[levels],
+            self.cumulative[levels],
+            self.cost[levels],
+            self.ascending,
+        )
+
+    def _count(self, mask: np.ndarray) -> np.ndarray:
+        return np.bincount(self.books, weights=mask, minlength=len(self)).astype(
+            np.intp
+        )
+
+    def best(self) -> np.ndarray:
+        """Gets the best price per book
+
+        Returns:
+            np.ndarray: Lowest ask or highest bid, NaN if empty
+        """
+        start, end = self.offsets[:-1], self.offsets[1:]
+        if self.prices.size == 0:
+            return np.full(len(start), np.nan)
+
+        empty = start == end
+        return np.where(empty, np.nan, self.prices[np.where(empty, 0, start)])
+
+    def depth(self, price: Union[float, np.ndarray]) -> np.ndarray:
+        """Gets the quantity available at a price or better per book
+
+        Args:
+            price (Union[float, np.ndarray]): Limit price, or one per book
+
+        Returns:
+            np.ndarray: Quantity, inf with a market maker
+        """
+        price = np.broadcast_to(np.asarray(price, dtype=np.float64), len(self))
+        limit = price[self.books]
+        better = self.prices <= limit if self.ascending else self.prices >= limit
+
+        if self.prices.size == 0:
+            return np.zeros(len(self))
+
+        level = self.offsets[:-1] + self._count(better) - 1
+        reached = level >= self.offsets[:-1]
+        return np.where(reached, self.cumulative[np.where(reached, level, 0)], 0.0)
+
+    def total(self, quantity: Union[float, np.ndarray]) -> np.ndarray:
+        """Gets the cost of filling a quantity per book
+
+        Args:
+            quantity (Union[float, np.ndarray]): Quantity, or one per book
+
+        Returns:
+            np.ndarray: Total cost, NaN if the quantity exceeds the depth
+        """
+        quantity = np.broadcast_to(np.asarray(quantity, dtype=np.float64), len(self))
+        filled = self._count(self.cumulative < quantity[self.books])
+
+        return _fill(
+            self.prices,
+            self.cumulative,
+            self.cost,
+            quantity,
+            self.offsets[:-1] + filled,
+            self.offsets[:-1] + filled < self.offsets[1:],
+            self.offsets[:-1],
+        )
+
+    def vwap(self, quantity: Union[float, np.ndarray]) -> np.ndarray:
+        """Gets the volume weighted average price of a quantity per book
+
+        Args:
+            quantity (Union[float, np.ndarray]): Quantity, or one per book
+
+        Returns:
+            np.ndarray: Average price, NaN if the quantity exceeds the depth
+        """
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return self.total(quantity) / np.asarray(quantity, dtype=np.float64)
+
+    def slippage(self, quantity: Union[float, np.ndarray]) -> np.ndarray:
+        """Gets the relative price impact of a quantity per book
+
+        Args:
+            quantity (Union[float, np.ndarray]): Quantity, or one per book
+
+        Returns:
+            np.ndarray: VWAP relative to the best price, positive when worse
+        """
+        impact = self.vwap(quantity) / self.best() - 1.0
+        return impact if self.ascending else -impact
+
+
+class OrderBooks:
+    """Order books of many exchange tickers
+
+    Both sides of all books are built in one pass and stored as flat arrays,
+    see BookSides. Single books share these arrays.
+
+    Attributes:
+        tickers (List[str]): Exchange ticker per book (e.g., "DW.AI1")
+        currencies (List[str]): Currency per book
+        bids (BookSides): Buying orders of all books
+        asks (BookSides): Selling orders of all books
+    """
+
+    def __init__(
+        self,
+        tickers: List[str],
+        currencies: List[str],
+        bids: BookSides,
+        asks: BookSides,
+    ) -> None:
+        self.tickers = tickers
+        self.currencies = currencies
+        self.bids = bids
+        self.asks = asks
+        self._rows: Dict[str, int] = {
+            ticker.casefold(): row for row, ticker in enumerate(tickers)
+        }
+
+    @classmethod
+    def from_tickers(cls, tickers: Iterable[ExchangeTickerFull]) -> "OrderBooks":
+        """Creates the order books of exchange tickers
+
+        Args:
+            tickers (Iterable[ExchangeTickerFull]): Exchange tickers, e.g. from Exchange.full()
+
+        Returns:
+            OrderBooks: Order books
+        """
+        tickers = list(tickers)
+        return cls(
+            tickers=[f"{t.MaterialTicker}.{t.ExchangeCode}" for t in tickers],
+            currencies=[t.Currency for t in tickers],
+            bids=BookSides.from_orders([t.BuyingOrders for t in tickers], False),
+            asks=BookSides.from_orders([t.SellingOrders for t in tickers], True),
+        )
+
+    @classmethod
+    def from_list(cls, tickers: ExchangeTickerFullList) -> "OrderBooks":
+        """Creates the order books of an exchange ticker list
+
+        Args:
+            tickers (ExchangeTickerFullList): Exchange tickers, e.g. from Exchange.full()
+
+        Returns:
+            OrderBooks: Order books
+        """
+        return cls.from_tickers(tickers.root)
+
+    def __len__(self) -> int:
+        return len(self.tickers)
+
+    def __contains__(self, ticker: str) -> bool:
+        return ticker.casefold() in self._rows
+
+    def __iter__(self) -> Iterator[OrderBook]:
+        return (self.book(row) for row in range(len(self)))
+
+    def __getitem__(self, ticker: str) -> OrderBook:
+        return self.book(self.row(ticker))
+
+    def row(self, ticker: str) -> int:
+        """Gets the row of an exchange ticker
+
+        Args:
+            ticker (str): Exchange ticker (e.g., "DW.AI1"), case-insensitive
+
+        Raises:
+            ExchangeTickerNotFound: Exchange ticker not contained
+
+        Returns:
+            int: Row index
+        """
+        try:
+            return self._rows[ticker.casefold()]
+        except KeyError:
+            raise ExchangeTickerNotFound("Exchangeticker not found") from None
+
+    def book(self, row: int) -> OrderBook:
+        """Gets the order book of a row
+
+        Args:
+            row (int): Row index
+
+        Returns:
+            OrderBook: Order book
+        """
+        material_ticker, exchange_code = self.tickers[row].split(".")
+        return OrderBook(
+            material_ticker=material_ticker,
+            exchange_code=exchange_code,
+            currency=self.currencies[row],
+            bids=self.bids.side(row),
+            asks=self.asks.side(row),
+        )
+
+    def spreads(self) -> np.ndarray:
+        """Gets the spread of every book
+
+        Returns:
+            np.ndarray: Best ask minus best bid, NaN if a side is empty
+        """
+        return self.asks.best() - self.bids.best()
@@ -0,0 +1,265 @@
+"""Local evaluation of planet search criteria over all planets
+"""
+from operator import attrgetter
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from fio_wrapper.material_index import MaterialIndex
+from fio_wrapper.models.planet_models import PlanetFull, PlanetFullList
+
+# environment bounds requiring additional building materials, as used by FIO
+GRAVITY_LOW: float = 0.25
+GRAVITY_HIGH: float = 2.5
+PRESSURE_LOW: float = 0.25
+PRESSURE_HIGH: float = 2.0
+TEMPERATURE_LOW: float = -25.0
+TEMPERATURE_HIGH: float = 75.0
+
+# fertility of planets unable to grow crops
+INFERTILE: float = -1.0
+
+# infrastructure flags of PlanetFull
+FACILITIES: List[str] = [
+    "HasLocalMarket",
+    "HasChamberOfCommerce",
+    "HasWarehouse",
+    "HasAdministrationCenter",
+    "HasShipyard",
+]
+
+
+class PlanetSearch:
+    """Planet search over a full planet list, evaluated with NumPy
+
+    Accepts the criteria of Planet.search() with any number of materials.
+    Every criterion is a vectorized comparison across all planets, no request
+    is sent. Distance checks need the jump graph of FIO and are not supported.
+
+    Attributes:
+        planets (List[PlanetFull]): Planets by row
+        materials (MaterialIndex): Material tickers resolved to MaterialId
+        values (Dict[str, np.ndarray]): Gravity, Pressure, Temperature and Fertility as float64 per row
+        flags (Dict[str, np.ndarray]): Surface and infrastructure flags as bool per row
+        factors (np.ndarray): Resource factor per row and material column, 0 if not present
+        material_columns (Dict[str, int]): Column in factors by MaterialId
+    """
+
+    def __init__(self, planets: Iterable[PlanetFull], materials: MaterialIndex) -> None:
+        """Builds the search columns
+
+        Args:
+            planets (Iterable[PlanetFull]): Planets, e.g. from Planet.full()
+            materials (MaterialIndex): Index of all materials, e.g. from Material.all().index()
+        """
+        self.planets: List[PlanetFull] = list(planets)
+        self.materials: MaterialIndex = materials
+        count = len(self.planets)
+
+        numeric = ["Gravity", "Pressure", "Temperature", "Fertility"]
+        flags = ["Surface"] + FACILITIES
+
+        table = np.array(
+            [attrgetter(*numeric)(planet) for planet in self.planets],
+            dtype=np.float64,
+        ).reshape(count, len(numeric))
+        self.values: Dict[str, np.ndarray] = {
+            name: np.ascontiguousarray(table[:, column])
+            for column, name in enumerate(numeric)
+        }
+
+        table = np.array(
+            [attrgetter(*flags)(planet) for planet in self.planets], dtype=bool
+        ).reshape(count, len(flags))
+        self.flags: Dict[str, np.ndarray] = {
+            name: np.ascontiguousarray(table[:, column])
+            for column, name in enumerate(flags)
+        }
+
+        # sparse resources into a dense planet x material matrix
+        rows, material_ids, factors = [], [], []
+        for row, planet in enumerate(self.planets):
+            for resource in planet.Resources:
+                rows.append(row)
+                material_ids.append(resource.MaterialId)
+                factors.append(resource.Factor)
+
+        self.material_columns: Dict[str, int] = {
+            material_id: column
+            for column, material_id in enumerate(sorted(set(material_ids)))
+        }
+        self.factors: np.ndarray = np.zeros(
+            (count, len(self.material_columns)), dtype=np.float64
+        )
+        self.factors[
+            np.asarray(rows, dtype=np.intp),
+            np.asarray([self.material_columns[m] for m in material_ids], dtype=np.intp),
+        ] = factors
+
+    @classmethod
+    def from_planets(
+        cls, planets: PlanetFullList, materials: MaterialIndex
+    ) -> "PlanetSearch":
+        """Creates the search of a planet list
+
+        Args:
+            planets (PlanetFullList): Planets, e.g. from Planet.full()
+            materials (MaterialIndex): Index of all materials
+
+        Returns:
+            PlanetSearch: Search
+        """
+        return cls(planets.root, materials)
+
+    def __len__(self) -> int:
+        return len(self.planets)
+
+    def factor(self, material_ticker: str) -> np.ndarray:
+        """Gets the resource factor of a material on every planet
+
+        Args:
+            material_ticker (str): Material ticker (e.g. "FEO")
+
+        Raises:
+            MaterialTickerNotFound: Material ticker not in the material index
+
+        Returns:
+            np.ndarray: Factor per row, 0 where the material is not present
+        """
+        column = self.material_columns.get(self.materials.material_id(material_ticker))
+        if column is None:
+            return np.zeros(len(self.planets), dtype=np.float64)
+
+        return self.factors[:, column]
+
+    def mask(
+        self,
+        materials: Optional[List[str]] = None,
+        include_rocky: bool = False,
+        include_gaseous: bool = False,
+        include_low_gravity: bool = False,
+        include_high_gravity: bool = False,
+        include_low_pressure: bool = False,
+        include_high_pressure: bool = False,
+        include_low_temperature: bool = False,
+        include_high_temperature: bool = False,
+        must_be_fertile: bool = False,
+        must_have_localmarket: bool = False,
+        must_have_cogc: bool = False,
+        must_have_war: bool = False,
+        must_have_adm: bool = False,
+        must_have_shy: bool = False,
+    ) -> np.ndarray:
+        """Evaluates search criteria on all planets
+
+        Arguments are those of Planet.search(), see search().
+
+        Raises:
+            MaterialTickerNotFound: Material ticker not in the material index
+
+        Returns:
+            np.ndarray: True per row matching all criteria
+        """
+        surface = self.flags["Surface"]
+        gravity = self.values["Gravity"]
+        pressure = self.values["Pressure"]
+        temperature = self.values["Temperature"]
+
+        # rocky and gaseous planets are excluded unless included
+        matches = (surface & include_rocky) | (~surface & include_gaseous)
+
+        if not include_low_gravity:
+            matches &= gravity >= GRAVITY_LOW
+        if not include_high_gravity:
+            matches &= gravity <= GRAVITY_HIGH
+        if not include_low_pressure:
+            matches &= pressure >= PRESSURE_LOW
+        if not include_high_pressure:
+            matches &= pressure <= PRESSURE_HIGH
+        if not include_low_temperature:
+            matches &= temperature >= TEMPERATURE_LOW
+        if not include_high_temperature:
+            matches &= temperature <= TEMPERATURE_HIGH
+        if must_be_fertile:
+            matches &= self.values["Fertility"] > INFERTILE
+
+        required = [
+            must_have_localmarket,
+            must_have_cogc,
+            must_have_war,
+            must_have_adm,
+            must_have_shy,
+        ]
+        for flag, must_have in zip(FACILITIES, required):
+            if must_have:
+                matches &= self.flags[flag]
+
+        for material_ticker in materials or []:
+            matches &= self.factor(material_ticker) > 0
+
+        return matches
+
+    def search(
+        self,
+        materials: Optional[List[str]] = None,
+        include_rocky: bool = False,
+        include_gaseous: bool = False,
+        include_low_gravity: bool = False,
+        include_high_gravity: bool = False,
+        include_low_pressure: bool = False,
+        include_high_pressure: bool = False,
+        include_low_temperature: bool = False,
+        include_high_temperature: bool = False,
+        must_be_fertile: bool = False,
+        must_have_localmarket: bool = False,
+        must_have_cogc: bool = False,
+        must_have_war: bool = False,
+        must_have_adm: bool = False,
+        must_have_shy: bool = False,
+    ) -> PlanetFullList:
+        """Finds all planets matching the search parameters
+
+        Args:
+            materials (List[str], optional): Materials all present on the planet, e.g. ["FEO", "LST"]. Any number.
+            include_rocky (bool, optional): Planet can be Rocky.
+            include_gaseous (bool, optional): Planet can be Gaseous.
+            include_low_gravity (bool, optional): Planet can be low gravity.
+            include_high_gravity (bool, optional): Planet can be high gravity.
+            include_low_pressure (bool, optional): Planet can be low pressure.
+            include_high_pressure (bool, optional): Planet can be high pressure.
+            include_low_temperature (bool, optional): Planet can be low temperature.
+            include_high_temperature (bool, optional): Planet can be high temperature.
+            must_be_fertile (bool, optional): Planet must be Fertile.
+            must_have_localmarket (bool, optional): Planet must have a Local Market.
+            must_have_cogc (bool, optional): Planet must have a Chamber of Global Commerce.
+            must_have_war (bool, optional): Planet must have warehouses.
+            must_have_adm (bool, optional): Planet must have a Planetary Administration Center.
+            must_have_shy (bool, optional): Planet must have a Shipyard.
+
+        Raises:
+            MaterialTickerNotFound: Material ticker not in the material index
+
+        Returns:
+            PlanetFullList: Matching planets in the order of the planet list
+        """
+        matches = self.mask(
+            materials=materials,
+            include_rocky=include_rocky,
+            include_gaseous=include_gaseous,
+            include_low_gravity=include_low_gravity,
+            include_high_gravity=include_high_gravity,
+            include_low_pressure=include_low_pressure,
+            include_high_pressure=include_high_pressure,
+            include_low_temperature=include_low_temperature,
+            include_high_temperature=include_high_temperature,
+            must_be_fertile=must_be_fertile,
+            must_have_localmarket=must_have_localmarket,
+            must_have_cogc=must_have_cogc,
+            must_have_war=must_have_war,
+            must_have_adm=must_have_adm,
+            must_have_shy=must_have_shy,
+        )
+
+        return PlanetFullList.model_construct(
+            root=[self.planets[row] for row in np.flatnonzero(matches)]
+        )
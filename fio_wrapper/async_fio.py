@@ -0,0 +1,145 @@
+"""AsyncFIO class to access game data through FIO REST API endpoints using asyncio
+"""
+import importlib
+import threading
+from typing import Dict, Optional
+from fio_wrapper.config import Config
+from fio_wrapper.async_fio_adapter import AsyncFIOAdapter
+from fio_wrapper.exceptions import EndpointNotImplemented
+from fio_wrapper.urls import URLs
+
+# endpoint modules by attribute, imported on first access of the attribute
+ENDPOINTS_V1: Dict[str, str] = {
+    "Building": "fio_wrapper.endpoints.endpoints_v1_async.building",
+    "Exchange": "fio_wrapper.endpoints.endpoints_v1_async.exchange",
+    "Group": "fio_wrapper.endpoints.endpoints_v1_async.group",
+    "LocalMarket": "fio_wrapper.endpoints.endpoints_v1_async.localmarket",
+    "Material": "fio_wrapper.endpoints.endpoints_v1_async.material",
+    "Planet": "fio_wrapper.endpoints.endpoints_v1_async.planet",
+    "Recipe": "fio_wrapper.endpoints.endpoints_v1_async.recipe",
+    "Sites": "fio_wrapper.endpoints.endpoints_v1_async.sites",
+    "Storage": "fio_wrapper.endpoints.endpoints_v1_async.storage",
+}
+
+_endpoint_lock = threading.Lock()
+
+
+class AsyncFIO:
+    """Asynchronous FIO API wrapper class
+
+    All endpoint methods are coroutines and must be awaited. Use the wrapper as
+    an async context manager or call `aclose()` to release its connections.
+
+    Attributes:
+        Building (Building): Building information
+        Exchange (Exchange): Exchange information
+        Group (Group): Group information
+        LocalMarket (LocalMarket): LocalMarket information
+        Material (Material): Material information
+        Planet (Planet): Planet information
+        Recipe (Recipe): Recipe information
+        Sites (Sites): Sites information
+        Storage (Storage): Storage information
+
+        config (Config): FIO Configuration
+        adapter (AsyncFIOAdapter): Asynchronous FIO Adapter
+        urls (URLs): FIO URLs
+    """
+
+    def __init__(
+        self,
+        version: Optional[str] = None,
+        application: Optional[str] = None,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        timeout: Optional[float] = None,
+        ssl_verify: Optional[bool] = True,
+        config: Optional[str] = None,
+        pause_gc: Optional[bool] = None,
+    ) -> None:
+        """Initializes the asynchronous FIO wrapper
+
+        Args:
+            version (str, optional): FIO API version. Defaults to None.
+            application (str, optional): Application name. Defaults to None.
+            api_key (str, optional): FIO API-Key. Defaults to None.
+            base_url (str, optional): FIO base url. Defaults to None.
+            timeout (float, optional): Request timeout. Defaults to None.
+            ssl_verify (bool, optional): Verify https connection. Defaults to True.
+            config: (str, optional): User specified configuration file. Defaults to None.
+            pause_gc (bool, optional): Pause the garbage collector of the whole process while building bulk responses. Defaults to None.
+
+        Raises:
+            EndpointNotImplemented: FIO version not supported
+            MissingDependency: httpx is not installed
+        """
+
+        self.config = Config(
+            api_key=api_key,
+            version=version,
+            application=application,
+            base_url=base_url,
+            timeout=timeout,
+            ssl_verify=ssl_verify,
+            user_config=config,
+            pause_gc=pause_gc,
+        )
+
+        # Check version availability
+        if self.config.version not in self.config.versions:
+            raise EndpointNotImplemented("FIO version not supported")
+
+        # create adapter
+        self.adapter = AsyncFIOAdapter(header=self.get_header(), config=self.config)
+
+        # create urls
+        self.urls: URLs = URLs(self.config)
+
+    def __getattr__(self, name: str) -> any:
+        """Creates a version 1.0.0 endpoint on first access
+
+        Endpoint modules, and the models they validate with, are only imported
+        once an endpoint is used.
+
+        Args:
+            name (str): Endpoint attribute, e.g. "Material"
+
+        Raises:
+            AttributeError: Not an endpoint of the configured version
+
+        Returns:
+            any: Endpoint sharing the adapter and urls
+        """
+        config = self.__dict__.get("config")
+        if name not in ENDPOINTS_V1 or config is None or config.version != "1.0.0":
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+
+        with _endpoint_lock:
+            if name not in self.__dict__:
+                module = importlib.import_module(ENDPOINTS_V1[name])
+                self.__dict__[name] = getattr(module, name)(self.adapter, self.urls)
+
+        return self.__dict__[name]
+
+    async def __aenter__(self) -> "AsyncFIO":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Closes the adapters connections"""
+        await self.adapter.aclose()
+
+    def get_header(self) -> Dict[str, str]:
+        """Creates the header to be included in calls towards FIO
+
+        Returns:
+            Dict[str, str]: Contains "Authorization" and "X-FIO-Application"
+        """
+        return {
+            "Authorization": self.config.api_key,
+            "X-FIO-Application": self.config.application,
+        }
@@ -0,0 +1,463 @@
+"""Asynchronous request adapter performing actual API calls towards FIO endpoints
+"""
+import asyncio
+import functools
+import logging
+import ssl
+import time
+from typing import AsyncIterator
+from typing import Awaitable
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+import importlib.util
+
+from fio_wrapper.config import Config
+from fio_wrapper.bulk import BulkStore
+from fio_wrapper.decoder import get_decoder
+from fio_wrapper.exceptions import MissingDependency, UnknownFIOResponse
+from fio_wrapper.instrumentation import (
+    Hook,
+    RequestEvent,
+    current_event,
+    emit,
+    reset_event,
+    set_event,
+)
+from fio_wrapper.ratelimit import RateLimiter
+from fio_wrapper.retry import RetryPolicy
+from fio_wrapper.stats import AdapterStats
+from fio_wrapper.streaming import JSONArrayParser
+
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=None)
+def _ssl_context() -> ssl.SSLContext:
+    """Gets the verifying SSL context shared by all clients
+
+    Loading the CA bundle takes milliseconds, httpx would load it per client.
+
+    Returns:
+        ssl.SSLContext: Default httpx SSL context
+    """
+    import httpx
+
+    return httpx.create_ssl_context()
+
+
+def _tls_error(exc: BaseException) -> bool:
+    """Checks whether a connection error was caused by TLS, e.g. a certificate
+
+    httpx raises ConnectError for TLS failures as well, chained to the
+    ssl.SSLError raised while connecting.
+
+    Args:
+        exc (BaseException): Connection error
+
+    Returns:
+        bool: TLS error, true or false
+    """
+    while exc is not None:
+        if isinstance(exc, ssl.SSLError):
+            return True
+        exc = exc.__cause__ or exc.__context__
+
+    return False
+
+
+class AsyncFIOAdapter:
+    """Asynchronous FIO Adapter based on httpx.AsyncClient"""
+
+    def __init__(self, config: Config, header: Dict[str, str]):
+        """Initializes the asynchronous FIO adapter
+
+        Args:
+            config (Config): Wrapper configuration.
+            header (Dict[str, str]): FIO Header.
+
+        Raises:
+            MissingDependency: httpx is not installed
+        """
+        if importlib.util.find_spec("httpx") is None:
+            raise MissingDependency(
+                "AsyncFIO requires httpx, install fio-wrapper[async]"
+            )
+
+        import httpx
+
+        self.config = config
+        self.header = header
+        self.ssl_verify = self.config.ssl_verify
+        self.timeout = self.config.timeout
+
+        if self.config.cache:
+            logger.warning("Caching is not supported by the asynchronous adapter")
+
+        # httpx waits for a free connection once max_connections are open
+        self._client = httpx.AsyncClient(
+            verify=_ssl_context() if self.ssl_verify else False,
+            limits=httpx.Limits(
+                max_connections=(
+                    self.config.pool_maxsize if self.config.pool_block else None
+                ),
+                max_keepalive_connections=(
+                    self.config.pool_maxsize if self.config.keep_alive else 0
+                ),
+            ),
+        )
+
+        # orjson or msgspec, if installed, decode large bulk responses faster
+        self._decode = get_decoder(self.config.json_decoder)
+
+        # instrumentation hooks receiving a RequestEvent per call
+        self._hooks: List[Hook] = []
+
+        # transient failures of GET requests are retried within a budget
+        self.stats = AdapterStats()
+        self._retry = RetryPolicy.from_config(self.config, self.stats)
+
+        # single item endpoints answered from recently fetched bulk results
+        self.bulk = BulkStore(self.config.bulk_max_age) if self.config.bulk else None
+
+        # buckets shared per API key and host by all adapters of the process
+        self._rate_limiter = (
+            RateLimiter(self.config, self.header.get("Authorization"))
+            if self.config.rate_limit
+            else None
+        )
+
+    def add_hook(self, hook: Hook) -> None:
+        """Registers an instrumentation hook
+
+        The hook is called with a RequestEvent after every endpoint call and every
+        direct adapter request. Exceptions raised by hooks are logged and ignored.
+
+        Args:
+            hook (Hook): Callable receiving a RequestEvent
+        """
+        self._hooks.append(hook)
+
+    def remove_hook(self, hook: Hook) -> None:
+        """Removes a registered instrumentation hook
+
+        Args:
+            hook (Hook): Registered hook
+
+        Raises:
+            ValueError: Hook not registered
+        """
+        self._hooks.remove(hook)
+
+    async def aclose(self) -> None:
+        """Closes the underlying client and its connections"""
+        await self._client.aclose()
+
+    async def _instrument(
+        self, call: Callable[[], Awaitable[Tuple[int, any]]]
+    ) -> Tuple[int, any]:
+        """Reports a direct adapter call to the instrumentation hooks
+
+        Args:
+            call (Callable[[], Awaitable[Tuple[int, any]]]): Request to perform
+
+        Returns:
+            Tuple[int, any]: Result of the call
+        """
+        # endpoint calls are instrumented by the endpoint decorator
+        if current_event() is not None or len(self._hooks) == 0:
+            return await call()
+
+        event = RequestEvent()
+        token = set_event(event)
+        start = time.perf_counter()
+
+        try:
+            return await call()
+        except BaseException as exc:
+            event.error = exc
+            raise
+        finally:
+            event.total_time = time.perf_counter() - start
+            reset_event(token)
+            emit(self._hooks, event)
+
+    async def _do(
+        self,
+        http_method: str,
+        endpoint: str,
+        params: Dict = None,
+        data: Dict = None,
+        err_codes: Optional[List[int]] = None,
+        timeout: Optional[float] = None,
+        raw: bool = False,
+    ) -> Tuple[int, any]:
+        import httpx
+
+        event = current_event()
+        retry = http_method.upper() == "GET"
+        attempt = 0
+        self._retry.budget.deposit()
+
+        try:
+            while True:
+                logger.debug(
+                    "Calling (%s) %s with params: %s | data: %s",
+                    http_method,
+                    endpoint,
+                    params,
+                    data,
+                )
+
+                await self._throttle(endpoint, timeout, event)
+                self.stats.increment("requests")
+                request_start = time.perf_counter()
+
+                try:
+                    response = await self._client.request(
+                        method=http_method.upper(),
+                        url=endpoint,
+                        headers={k: v for k, v in self.header.items() if v is not None},
+                        params=params,
+                        json=data,
+                        timeout=timeout if timeout is not None else self.timeout,
+                    )
+                except (httpx.ConnectError, httpx.ConnectTimeout) as exc:
+                    if event is not None:
+                        event.network_time += time.perf_counter() - request_start
+                        event.requests += 1
+
+                    # certificate errors are not transient
+                    if not retry or _tls_error(exc):
+                        raise
+
+                    delay = self._retry.delay(attempt)
+                    if delay is None:
+                        raise
+
+                    await self._backoff(endpoint, delay, exc, event)
+                    attempt += 1
+                    continue
+
+                if event is not None:
+                    event.network_time += time.perf_counter() - request_start
+                    event.requests += 1
+                    event.method = http_method.upper()
+                    event.url = endpoint
+                    event.status = response.status_code
+                    event.bytes_received += len(response.content)
+
+                if retry and self._retry.retryable_status(
+                    response.status_code, err_codes
+                ):
+                    delay = self._retry.delay(
+                        attempt, response.headers.get("Retry-After")
+                    )
+                    if delay is not None:
+                        await self._backoff(
+                            endpoint, delay, response.status_code, event
+                        )
+                        attempt += 1
+                        continue
+
+                break
+
+            # successful FIO response
+            if response.status_code == 200:
+                if raw:
+                    return 200, response.content
+
+                decode_start = time.perf_counter()
+                try:
+                    decoded = self._decode(response.content)
+                except ValueError as exc:
+                    raise UnknownFIOResponse() from exc
+
+                if event is not None:
+                    event.decode_time += time.perf_counter() - decode_start
+
+                return 200, decoded
+            # FIO response in provided codes to catch in endpoint
+            elif isinstance(err_codes, List) and response.status_code in err_codes:
+                return response.status_code, None
+            # other FIO response, not accounted for
+            else:
+                raise UnknownFIOResponse()
+
+        except (httpx.TimeoutException, httpx.TooManyRedirects):
+            raise
+        except httpx.HTTPError as e:
+            raise SystemExit(e)
+
+    async def _throttle(
+        self, endpoint: str, timeout: Optional[float], event: Optional[RequestEvent]
+    ) -> None:
+        """Waits for the rate limiter, if enabled
+
+        Args:
+            endpoint (str): URL
+            timeout (float, optional): Request timeout, limits the wait
+            event (RequestEvent, optional): Event of the call in progress
+
+        Raises:
+            RateLimitTimeout: Waited longer than allowed
+        """
+        if self._rate_limiter is None:
+            return
+
+        waited = await self._rate_limiter.acquire_async(
+            endpoint, timeout if timeout is not None else self.timeout
+        )
+
+        if waited > 0:
+            self.stats.increment("rate_limited")
+            if event is not None:
+                event.wait_time += waited
+
+    async def _backoff(
+        self,
+        endpoint: str,
+        delay: float,
+        reason: any,
+        event: Optional[RequestEvent],
+    ) -> None:
+        """Waits before retrying a failed request
+
+        Args:
+            endpoint (str): URL
+            delay (float): Seconds to wait
+            reason (any): Failure, status code or exception
+            event (RequestEvent, optional): Event of the call in progress
+        """
+        logger.info("Retrying %s in %.2f seconds after %s", endpoint, delay, reason)
+        await asyncio.sleep(delay)
+
+        if event is not None:
+            event.retries += 1
+            event.wait_time += delay
+
+    async def get(
+        self,
+        endpoint: str,
+        params: Dict = None,
+        err_codes: Optional[List[int]] = None,
+        timeout: Optional[float] = None,
+        raw: bool = False,
+    ) -> Tuple[int, any]:
+        """Performs a GET request towards endpoint
+
+        Args:
+            endpoint (str): URL
+            params (Dict, optional): GET parameters. Defaults to None.
+            err_codes (List[int], optional): List of error codes to handle in calling function. Defaults to None.
+            timeout (float, optional): Request timeout in seconds. Defaults to None.
+            raw (bool, optional): Return the undecoded response body. Defaults to False.
+
+        Returns:
+            Tuple[int, any]: Request status code and request data, response body bytes if raw
+        """
+        return await self._instrument(
+            lambda: self._do(
+                http_method="GET",
+                endpoint=endpoint,
+                params=params,
+                err_codes=err_codes,
+                timeout=timeout,
+                raw=raw,
+            )
+        )
+
+    async def post(
+        self,
+        endpoint: str,
+        params: Dict = None,
+        data: Dict = None,
+        err_codes: Optional[List[int]] = None,
+        timeout: Optional[float] = None,
+        raw: bool = False,
+    ) -> Tuple[int, any]:
+        """Performs a POST request towards endpoint
+
+        Args:
+            endpoint (str): URL
+            params (Dict, optional): POST parameters. Defaults to None.
+            data (Dict, optional): POST data. Defaults to None.
+            err_codes (List[int], optional): List of error codes to handle in calling function. Defaults to None.
+            timeout (float): Request timeout in seconds. Defaults to None.
+            raw (bool, optional): Return the undecoded response body. Defaults to False.
+
+        Returns:
+            Tuple[int, any]: Request status code and request data, response body bytes if raw
+        """
+        return await self._instrument(
+            lambda: self._do(
+                http_method="POST",
+                endpoint=endpoint,
+                params=params,
+                data=data,
+                err_codes=err_codes,
+                timeout=timeout,
+                raw=raw,
+            )
+        )
+
+    async def stream(
+        self,
+        endpoint: str,
+        params: Dict = None,
+        timeout: Optional[float] = None,
+        chunk_size: int = 65536,
+    ) -> AsyncIterator[any]:
+        """Performs a streamed GET request towards an endpoint returning a JSON array
+
+        The response body is parsed incrementally while it is received, yielding
+        one decoded array element at a time.
+
+        Args:
+            endpoint (str): URL
+            params (Dict, optional): GET parameters. Defaults to None.
+            timeout (float, optional): Request timeout in seconds. Defaults to None.
+            chunk_size (int, optional): Bytes read per chunk. Defaults to 65536.
+
+        Raises:
+            UnknownFIOResponse: FIO returned a non 200 response
+
+        Yields:
+            AsyncIterator[any]: Decoded array elements
+        """
+        import httpx
+
+        try:
+            logger.debug("Streaming (GET) %s with params: %s", endpoint, params)
+
+            await self._throttle(endpoint, timeout, None)
+            self.stats.increment("requests")
+
+            async with self._client.stream(
+                method="GET",
+                url=endpoint,
+                headers={k: v for k, v in self.header.items() if v is not None},
+                params=params,
+                timeout=timeout if timeout is not None else self.timeout,
+            ) as response:
+                if response.status_code != 200:
+                    raise UnknownFIOResponse()
+
+                parser = JSONArrayParser()
+
+                async for chunk in response.aiter_bytes(chunk_size=chunk_size):
+                    for item in parser.feed(chunk):
+                        yield item
+
+                    if parser.finished:
+                        return
+
+                for item in parser.close():
+                    yield item
+
+        except (httpx.TimeoutException, httpx.TooManyRedirects):
+            raise
+        except httpx.HTTPError as e:
+            raise SystemExit(e)
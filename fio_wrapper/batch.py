@@ -0,0 +1,136 @@
+"""Concurrent batch execution of per-item endpoint calls
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable, Dict, Iterable, Iterator
+
+
+class BatchResult:
+    """Results of a batch call, keyed by the requested input
+
+    As a container it holds every requested input: len(), in and iteration
+    cover successful and failed inputs alike, iteration yields successful
+    inputs first. Use results or errors to look at one of them only.
+
+    Attributes:
+        results (Dict[str, any]): Successful results by input
+        errors (Dict[str, BaseException]): Raised exceptions by input
+    """
+
+    def __init__(self) -> None:
+        self.results: Dict[str, any] = {}
+        self.errors: Dict[str, BaseException] = {}
+
+    def __len__(self) -> int:
+        return len(self.results) + len(self.errors)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.results or key in self.errors
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self.results
+        yield from self.errors
+
+    def __getitem__(self, key: str) -> any:
+        """Gets the result of key or raises its error
+
+        Args:
+            key (str): Requested input
+
+        Raises:
+            KeyError: Key was not part of the batch
+            BaseException: Exception raised while processing key
+
+        Returns:
+            any: Result of key
+        """
+        if key in self.errors:
+            raise self.errors[key]
+
+        return self.results[key]
+
+    @property
+    def ok(self) -> bool:
+        """Checks if all items succeeded
+
+        Returns:
+            bool: No item raised an exception
+        """
+        return len(self.errors) == 0
+
+
+def run_batch(
+    func: Callable[[str], any], keys: Iterable[str], max_workers: int
+) -> BatchResult:
+    """Runs func for every key on a bounded thread pool
+
+    Duplicate keys are requested once. Exceptions raised for a key are collected
+    in the result instead of aborting the batch.
+
+    Args:
+        func (Callable[[str], any]): Single item call
+        keys (Iterable[str]): Inputs to call func with
+        max_workers (int): Maximum number of concurrent calls
+
+    Returns:
+        BatchResult: Results and errors keyed by input
+    """
+    unique_keys = list(dict.fromkeys(keys))
+    batch = BatchResult()
+
+    if len(unique_keys) == 0:
+        return batch
+
+    def call(key: str):
+        try:
+            return key, func(key), None
+        except (Exception, SystemExit) as exc:
+            return key, None, exc
+
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(max_workers, len(unique_keys))),
+        thread_name_prefix="fio_wrapper_batch",
+    ) as executor:
+        for key, result, error in executor.map(call, unique_keys):
+            if error is None:
+                batch.results[key] = result
+            else:
+                batch.errors[key] = error
+
+    return batch
+
+
+async def run_batch_async(
+    func: Callable[[str], Awaitable[any]], keys: Iterable[str], max_concurrency: int
+) -> BatchResult:
+    """Awaits func for every key with bounded concurrency
+
+    Duplicate keys are requested once. Exceptions raised for a key are collected
+    in the result instead of aborting the batch.
+
+    Args:
+        func (Callable[[str], Awaitable[any]]): Single item coroutine
+        keys (Iterable[str]): Inputs to call func with
+        max_concurrency (int): Maximum number of concurrent calls
+
+    Returns:
+        BatchResult: Results and errors keyed by input
+    """
+    unique_keys = list(dict.fromkeys(keys))
+    batch = BatchResult()
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def call(key: str):
+        async with semaphore:
+            try:
+                return key, await func(key), None
+            except (Exception, SystemExit) as exc:
+                return key, None, exc
+
+    for key, result, error in await asyncio.gather(*[call(k) for k in unique_keys]):
+        if error is None:
+            batch.results[key] = result
+        else:
+            batch.errors[key] = error
+
+    return batch
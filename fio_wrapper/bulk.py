@@ -0,0 +1,114 @@
+"""Bulk datasets held in memory to answer single item lookups locally
+"""
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+
+def _material_index(items: Iterable[any]) -> any:
+    """Builds a MaterialIndex, importing the material models only when needed
+
+    Args:
+        items (Iterable[any]): MaterialTicker items
+
+    Returns:
+        any: MaterialIndex over the items
+    """
+    from fio_wrapper.material_index import MaterialIndex
+
+    return MaterialIndex(items)
+
+
+# datasets with a dedicated index, looked up by casefolded key through get()
+BULK_INDEXES: Dict[str, Callable[[Iterable[any]], any]] = {
+    "materials": _material_index,
+}
+
+# item keys of all other datasets, matched case-insensitively
+BULK_KEYS: Dict[str, Callable[[any], List[str]]] = {
+    "exchange": lambda ticker: [f"{ticker.MaterialTicker}.{ticker.ExchangeCode}"],
+    "planets": lambda planet: [
+        planet.PlanetId,
+        planet.PlanetNaturalId,
+        planet.PlanetName,
+    ],
+    "buildings": lambda building: [building.Ticker],
+}
+
+
+class BulkStore:
+    """Latest bulk responses and an index over their items
+
+    Bulk endpoints put their validated result, single item endpoints look items
+    up while the result is younger than max_age. Items are shared with the bulk
+    result and must not be mutated.
+    """
+
+    def __init__(self, max_age: float) -> None:
+        """Initializes the store
+
+        Args:
+            max_age (float): Seconds a bulk result answers lookups
+        """
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._datasets: Dict[str, Tuple[float, any]] = {}
+
+    def put(self, dataset: str, items: Iterable[any]) -> None:
+        """Stores a bulk result, replacing the previous one
+
+        Args:
+            dataset (str): Dataset name, e.g. "materials"
+            items (Iterable[any]): Validated items
+        """
+        if dataset in BULK_INDEXES:
+            index = BULK_INDEXES[dataset](items)
+        else:
+            keys = BULK_KEYS[dataset]
+            index = {}
+            for item in items:
+                for key in keys(item):
+                    if key is not None:
+                        index.setdefault(key.casefold(), item)
+
+        with self._lock:
+            self._datasets[dataset] = (time.monotonic(), index)
+
+    def index(self, dataset: str) -> Optional[any]:
+        """Gets the index of a fresh dataset
+
+        An expired dataset is dropped, so it does not stay in memory until the
+        next bulk call.
+
+        Args:
+            dataset (str): Dataset name, e.g. "materials"
+
+        Returns:
+            Optional[any]: MaterialIndex or items by casefolded key, None if not held or expired
+        """
+        with self._lock:
+            stored = self._datasets.get(dataset)
+            if stored is None:
+                return None
+
+            if time.monotonic() - stored[0] > self.max_age:
+                del self._datasets[dataset]
+                return None
+
+        return stored[1]
+
+    def clear(self, dataset: Optional[str] = None) -> None:
+        """Drops stored datasets
+
+        Args:
+            dataset (str, optional): Dataset name. Defaults to None, dropping all.
+        """
+        with self._lock:
+            if dataset is None:
+                self._datasets.clear()
+            else:
+                self._datasets.pop(dataset, None)
+
+    def after_fork(self) -> None:
+        """Replaces the lock, which a thread of the parent process may hold"""
+        self._lock = threading.Lock()
@@ -1,14 +1,71 @@
 import os
 import logging
+import marshal
+import threading
 import yaml
 import importlib.util
 from typing import Optional
 from typing import List
 from typing import Dict
+from typing import Tuple
 from fio_wrapper.exceptions import UnknownConfig
 
 logger = logging.getLogger(__name__)
 
+CACHE_BACKENDS: List[str] = ["memory", "sqlite", "filesystem"]
+
+# lists of user configuration files replacing the default instead of extending it
+REPLACED_LISTS: List[Tuple[str, str]] = [("retry", "statuses")]
+
+# libyaml based loader if PyYAML was built with it, pure Python otherwise
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# parsed files by path: modification time, size and marshalled data
+_parsed: Dict[str, Tuple[int, int, bytes]] = {}
+_parsed_lock = threading.Lock()
+
+
+def after_fork() -> None:
+    """Replaces the lock of parsed files, which a thread of the parent process may hold"""
+    global _parsed_lock
+
+    _parsed_lock = threading.Lock()
+
+
+def load_yaml(path: str) -> any:
+    """Loads a YAML file, parsed once per process
+
+    The parsed data is kept marshalled, every call returns a new copy that can
+    be modified. Files are parsed again when their modification time or size
+    changed.
+
+    Args:
+        path (str): YAML file
+
+    Returns:
+        any: Parsed data
+    """
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+
+    parsed = _parsed.get(path)
+    if parsed is not None and parsed[:2] == (stat.st_mtime_ns, stat.st_size):
+        return marshal.loads(parsed[2])
+
+    with open(path, "r") as file:
+        data = yaml.load(file, Loader=YAML_LOADER)
+
+    try:
+        blob = marshal.dumps(data)
+    except ValueError:
+        # e.g. timestamps, parsed on every call
+        return data
+
+    with _parsed_lock:
+        _parsed[path] = (stat.st_mtime_ns, stat.st_size, blob)
+
+    return marshal.loads(blob)
+
 
 class Config:
     """FIO Wrapper configuration class
@@ -20,6 +77,7 @@ class Config:
         _base_url (str, optional): FIO base url
         _timeout (float, optional): FIO generic timeout
         _ssl_verify (bool, optional): Request ssl verification
+        _pause_gc (bool, optional): Pause the garbage collector of the whole process while building bulk responses
 
         data (ConfigParser): Configuration Parser
 
@@ -80,6 +138,7 @@ class Config:
         timeout: Optional[float] = 10.0,
         ssl_verify: Optional[bool] = True,
         user_config: Optional[str] = None,
+        pause_gc: Optional[bool] = None,
     ) -> None:
         """Initializes the configuration
 
@@ -91,6 +150,7 @@ class Config:
             timeout (Optional[float]): FIO generic timeout. Defaults to 10.0.
             ssl_verify (Optional[bool]): Request ssl verification. Defaults to True.
             user_config (Optional[str]): User configuration file. Defaults to None.
+            pause_gc (Optional[bool]): Pause the garbage collector of the whole process while building bulk responses. Defaults to None.
         """
         # FIO instantiation overwrites
         self._api_key = api_key
@@ -99,21 +159,27 @@ class Config:
         self._base_url = base_url
         self._timeout = timeout
         self._ssl_verify = ssl_verify
+        self._pause_gc = pause_gc
 
         # initialize data
         self._base_file = os.path.join(os.path.dirname(__file__), "base.yml")
 
-        # base configuration
-        with open(self._base_file, "r") as base_file:
-            self.data = yaml.safe_load(base_file)
+        # base configuration, a copy of the parsed file
+        self.data = load_yaml(self._base_file)
 
         # user config, if provided
         if user_config is not None:
-            with open(user_config, "r") as user_file:
-                user = yaml.safe_load(user_file)
+            user = load_yaml(user_config)
+
+            # self.data = self.dict_merge(self.data, user)
+            self.data = self.data_merge(self.data, user)
 
-                # self.data = self.dict_merge(self.data, user)
-                self.data = self.data_merge(self.data, user)
+            for section, key in REPLACED_LISTS:
+                value = (user.get(section) or {}).get(key)
+                if value is not None:
+                    self.data[section][key] = (
+                        list(value) if isinstance(value, list) else [value]
+                    )
 
     @property
     def versions(self) -> List[str]:
@@ -203,6 +269,126 @@ class Config:
 
         return self.data["fio"]["ssl_verify"]
 
+    @property
+    def batch_workers(self) -> int:
+        """Gets the maximum number of concurrent calls of batch getters
+
+        Returns:
+            int: Number of worker threads
+        """
+        return self.data["fio"]["batch_workers"]
+
+    @property
+    def coalesce(self) -> bool:
+        """Gets the coalescing status of identical in-flight GET requests
+
+        Returns:
+            bool: Coalescing used, true or false
+        """
+        return self.data["fio"].get("coalesce", True)
+
+    @property
+    def pause_gc(self) -> bool:
+        """Gets whether bulk responses are built with the garbage collector paused
+
+        Returns:
+            bool: Garbage collector paused, true or false
+        """
+        if self._pause_gc is not None:
+            return self._pause_gc
+
+        return self.data["fio"].get("pause_gc", False)
+
+    @property
+    def json_decoder(self) -> str:
+        """Gets the JSON decoder of response bodies
+
+        Returns:
+            str: "auto", "orjson", "msgspec" or "json"
+        """
+        return self.data["fio"].get("json_decoder", "auto")
+
+    @property
+    def pool_connections(self) -> int:
+        """Gets the number of connection pools kept, one per host
+
+        Returns:
+            int: Number of pools
+        """
+        return self.data["fio"].get("pool", {}).get("connections", 10)
+
+    @property
+    def pool_maxsize(self) -> int:
+        """Gets the number of connections kept per pool
+
+        Returns:
+            int: Number of connections
+        """
+        return self.data["fio"].get("pool", {}).get("maxsize", 10)
+
+    @property
+    def pool_block(self) -> bool:
+        """Gets the blocking status of exhausted connection pools
+
+        Returns:
+            bool: Requests wait for a free connection instead of opening another, true or false
+        """
+        return self.data["fio"].get("pool", {}).get("block", False)
+
+    @property
+    def keep_alive(self) -> bool:
+        """Gets the reuse status of connections
+
+        Returns:
+            bool: Connections kept open between requests, true or false
+        """
+        return self.data["fio"].get("pool", {}).get("keep_alive", True)
+
+    @property
+    def rate_limit(self) -> bool:
+        """Gets the status of the client-side rate limiter
+
+        Returns:
+            bool: Rate limiter used, true or false
+        """
+        return self.data["fio"].get("rate_limit", {}).get("enabled", False)
+
+    @property
+    def rate_limit_rate(self) -> float:
+        """Gets the requests per second allowed per API key and host
+
+        Returns:
+            float: Requests per second
+        """
+        return self.data["fio"].get("rate_limit", {}).get("rate", 10)
+
+    @property
+    def rate_limit_burst(self) -> int:
+        """Gets the requests allowed in a burst per API key and host
+
+        Returns:
+            int: Number of requests
+        """
+        return self.data["fio"].get("rate_limit", {}).get("burst", 20)
+
+    @property
+    def rate_limit_max_wait(self) -> Optional[float]:
+        """Gets the maximum wait for the rate limiter
+
+        Returns:
+            Optional[float]: Seconds, None limits the wait by the request timeout
+        """
+        return self.data["fio"].get("rate_limit", {}).get("max_wait")
+
+    @property
+    def rate_limit_routes(self) -> Dict[str, Dict[str, float]]:
+        """Gets the routes limited by their own bucket
+
+        Returns:
+            Dict[str, Dict[str, float]]: Rate and burst by URL path suffix
+        """
+        return self.data["fio"].get("rate_limit", {}).get("routes") or {}
+
     @property
     def cache(self) -> bool:
         """Gets the cache usage status
@@ -221,6 +407,104 @@ class Config:
         """
         return self.data["cache"]["default_expire"]
 
+    @property
+    def cache_backend(self) -> str:
+        """Gets the requests-cache backend
+
+        Raises:
+            UnknownConfig: Backend is not supported
+
+        Returns:
+            str: Backend name, one of "memory", "sqlite" or "filesystem"
+        """
+        backend = self.data["cache"].get("backend", "memory")
+
+        if backend not in CACHE_BACKENDS:
+            raise UnknownConfig(f"Unsupported cache backend: {backend}")
+
+        return backend
+
+    @property
+    def cache_path(self) -> str:
+        """Gets the cache location of persistent backends
+
+        Returns:
+            str: SQLite database file or filesystem cache directory
+        """
+        return os.path.expanduser(self.data["cache"].get("path", "fio_wrapper"))
+
+    @property
+    def bulk(self) -> bool:
+        """Gets the status of single item lookups in held bulk results
+
+        Returns:
+            bool: Bulk results answer single item endpoints, true or false
+        """
+        return self.data.get("bulk", {}).get("enabled", False)
+
+    @property
+    def bulk_max_age(self) -> float:
+        """Gets the age up to which a bulk result answers single item lookups
+
+        Returns:
+            float: Seconds
+        """
+        return self.data.get("bulk", {}).get("max_age", 300)
+
+    @property
+    def retry_attempts(self) -> int:
+        """Gets the number of retries of failed GET requests
+
+        Returns:
+            int: Retries per request, 0 disables retries
+        """
+        return self.data.get("retry", {}).get("attempts", 3)
+
+    @property
+    def retry_backoff(self) -> float:
+        """Gets the base delay between retries
+
+        Returns:
+            float: Seconds, doubled with every retry
+        """
+        return self.data.get("retry", {}).get("backoff", 0.5)
+
+    @property
+    def retry_max_backoff(self) -> float:
+        """Gets the maximum delay between retries
+
+        Returns:
+            float: Seconds
+        """
+        return self.data.get("retry", {}).get("max_backoff", 30)
+
+    @property
+    def retry_statuses(self) -> List[int]:
+        """Gets the HTTP status codes of retried responses
+
+        Returns:
+            List[int]: Status codes
+        """
+        return self.data.get("retry", {}).get("statuses", [429, 500, 502, 503, 504])
+
+    @property
+    def retry_budget_ratio(self) -> float:
+        """Gets the retries allowed per request by the retry budget
+
+        Returns:
+            float: Ratio of retries to requests
+        """
+        return self.data.get("retry", {}).get("budget_ratio", 0.1)
+
+    @property
+    def retry_budget_reserve(self) -> int:
+        """Gets the retries the retry budget allows in a burst
+
+        Returns:
+            int: Number of retries
+        """
+        return self.data.get("retry", {}).get("budget_reserve", 10)
+
     def get(self, section: str, option: str) -> str:
         """Gets a configuration element
 
@@ -240,6 +524,20 @@ class Config:
         except KeyError as exc:
             raise UnknownConfig() from exc
 
+    def url_table(self) -> Dict[str, str]:
+        """Gets the url configuration elements of the FIO version
+
+        Raises:
+            UnknownConfig: Version has no url configuration
+
+        Returns:
+            Dict[str, str]: URL configuration parameters by option
+        """
+        try:
+            return self.data["fio_urls"][self.version]
+        except KeyError as exc:
+            raise UnknownConfig() from exc
+
     def get_url(self, option: str) -> str:
         """Gets a url configuration element
 
@@ -0,0 +1,92 @@
+"""JSON decoders turning response bodies into Python objects
+"""
+import importlib.util
+import json
+import logging
+from typing import Callable, Dict, List
+
+from fio_wrapper.exceptions import MissingDependency, UnknownConfig
+
+logger = logging.getLogger(__name__)
+
+# decoders raise ValueError on invalid JSON
+Decoder = Callable[[bytes], any]
+
+# tried in this order by the "auto" decoder
+DECODERS: List[str] = ["orjson", "msgspec", "json"]
+
+
+def _orjson() -> Decoder:
+    import orjson
+
+    return orjson.loads
+
+
+def _msgspec() -> Decoder:
+    import msgspec
+
+    decoder = msgspec.json.Decoder()
+
+    def decode(body: bytes) -> any:
+        try:
+            return decoder.decode(body)
+        except msgspec.DecodeError as exc:
+            raise ValueError(str(exc)) from exc
+
+    return decode
+
+
+def _json() -> Decoder:
+    return json.loads
+
+
+_FACTORIES: Dict[str, Callable[[], Decoder]] = {
+    "orjson": _orjson,
+    "msgspec": _msgspec,
+    "json": _json,
+}
+
+
+def available_decoders() -> List[str]:
+    """Gets the decoders usable in this environment
+
+    Returns:
+        List[str]: Decoder names, fastest first
+    """
+    return [name for name in DECODERS if _installed(name)]
+
+
+def _installed(name: str) -> bool:
+    return name == "json" or importlib.util.find_spec(name) is not None
+
+
+def get_decoder(name: str = "auto") -> Decoder:
+    """Gets a JSON decoder by name
+
+    "auto" uses the fastest installed library and falls back to the standard
+    library json module.
+
+    Args:
+        name (str, optional): "auto", "orjson", "msgspec" or "json". Defaults to "auto".
+
+    Raises:
+        UnknownConfig: Unknown decoder name
+        MissingDependency: Library of the decoder is not installed
+
+    Returns:
+        Decoder: Callable decoding response body bytes
+    """
+    if name == "auto":
+        # stop at the first installed library, looking up missing ones is slow
+        name = next(name for name in DECODERS if _installed(name))
+    elif name not in _FACTORIES:
+        raise UnknownConfig(
+            f"Unknown JSON decoder '{name}', use one of: auto, {', '.join(DECODERS)}"
+        )
+    elif not _installed(name):
+        raise MissingDependency(
+            f"JSON decoder '{name}' requires {name} to be installed"
+        )
+
+    logger.debug("Using %s JSON decoder", name)
+    return _FACTORIES[name]()
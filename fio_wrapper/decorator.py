@@ -1,7 +1,32 @@
+import inspect
+import time
 from functools import wraps
+from typing import Dict, Optional
 
 from fio_wrapper.exceptions import NoAPIKeyProvided
+from fio_wrapper.instrumentation import (
+    RequestEvent,
+    current_event,
+    emit,
+    reset_event,
+    set_event,
+)
 from fio_wrapper.fio_adapter import FIOAdapter
+from fio_wrapper.async_fio_adapter import AsyncFIOAdapter
+
+
+def _check_apikey(self) -> None:
+    # can only decorate endpoint functions
+    if self.adapter is None or not isinstance(
+        self.adapter, (FIOAdapter, AsyncFIOAdapter)
+    ):
+        raise SystemExit("apikey_required decorator can only be used on endpoints")
+
+    # requires API Key set in adapter
+    if self.adapter.header is None or self.adapter.header["Authorization"] is None:
+        raise NoAPIKeyProvided(
+            "FIO API Key not provided. This endpoint requires an API key."
+        )
 
 
 def apikey_required(func) -> any:
@@ -18,18 +43,129 @@ def apikey_required(func) -> any:
         method: Executed endpoint method
     """
 
-    @wraps(func)
-    def wrapper_apikey_required(self, *args, **kwargs):
-        # can only decorate endpoint functions
-        if self.adapter is None or not isinstance(self.adapter, FIOAdapter):
-            raise SystemExit("apikey_required decorator can only be used on endpoints")
+    if inspect.iscoroutinefunction(func):
+
+        @wraps(func)
+        async def async_wrapper_apikey_required(self, *args, **kwargs):
+            _check_apikey(self)
+            return await func(self, *args, **kwargs)
 
-        # requires API Key set in adapter
-        if self.adapter.header is None or self.adapter.header["Authorization"] is None:
-            raise NoAPIKeyProvided(
-                "FIO API Key not provided. This endpoint requires an API key."
-            )
+        return async_wrapper_apikey_required
 
+    @wraps(func)
+    def wrapper_apikey_required(self, *args, **kwargs):
+        _check_apikey(self)
         return func(self, *args, **kwargs)
 
     return wrapper_apikey_required
+
+
+def _url_template(url: Optional[str], arguments: Dict[str, any]) -> Optional[str]:
+    """Replaces URL path segments equal to call arguments by their name
+
+    Args:
+        url (str, optional): Requested URL
+        arguments (Dict[str, any]): Endpoint call arguments
+
+    Returns:
+        Optional[str]: URL template, e.g. "https://rest.fnar.net/planet/{planet}"
+    """
+    if url is None:
+        return None
+
+    names = {
+        str(value): name
+        for name, value in arguments.items()
+        if isinstance(value, (str, int)) and not isinstance(value, bool)
+    }
+    scheme, _, path = url.partition("://")
+    segments = path.split("/")
+
+    # first segment is the host
+    for index in range(1, len(segments)):
+        name = names.get(segments[index])
+        if name is not None:
+            segments[index] = "{" + name + "}"
+
+    return scheme + "://" + "/".join(segments)
+
+
+def _instrumenting(self) -> bool:
+    # nested endpoint calls are part of the outer event
+    return bool(getattr(self.adapter, "_hooks", None)) and current_event() is None
+
+
+def _start_event(self, func, args, kwargs) -> RequestEvent:
+    event = RequestEvent(endpoint=f"{type(self).__name__}.{func.__name__}")
+    event._arguments = inspect.signature(func).bind_partial(self, *args, **kwargs)
+    return event
+
+
+def _finish_event(self, event: RequestEvent, start: float) -> None:
+    event.total_time = time.perf_counter() - start
+    event.validation_time = max(
+        0.0,
+        event.total_time - event.network_time - event.decode_time - event.wait_time,
+    )
+    event.url_template = _url_template(event.url, event._arguments.arguments)
+    del event._arguments
+
+    emit(self.adapter._hooks, event)
+
+
+def instrumented(func) -> any:
+    """Wraps endpoint and reports a RequestEvent to the adapters hooks
+
+    The time of the endpoint call not spent on the network, decoding JSON or
+    waiting is reported as validation time. Without registered hooks, or when
+    called from within another instrumented endpoint, the endpoint is called
+    directly.
+
+    Args:
+        func (method): Wrapped endpoint method
+
+    Returns:
+        method: Executed endpoint method
+    """
+
+    if inspect.iscoroutinefunction(func):
+
+        @wraps(func)
+        async def async_wrapper_instrumented(self, *args, **kwargs):
+            if not _instrumenting(self):
+                return await func(self, *args, **kwargs)
+
+            event = _start_event(self, func, args, kwargs)
+            token = set_event(event)
+            start = time.perf_counter()
+
+            try:
+                return await func(self, *args, **kwargs)
+            except BaseException as exc:
+                event.error = exc
+                raise
+            finally:
+                reset_event(token)
+                _finish_event(self, event, start)
+
+        return async_wrapper_instrumented
+
+    @wraps(func)
+    def wrapper_instrumented(self, *args, **kwargs):
+        if not _instrumenting(self):
+            return func(self, *args, **kwargs)
+
+        event = _start_event(self, func, args, kwargs)
+        token = set_event(event)
+        start = time.perf_counter()
+
+        try:
+            return func(self, *args, **kwargs)
+        except BaseException as exc:
+            event.error = exc
+            raise
+        finally:
+            reset_event(token)
+            _finish_event(self, event, start)
+
+    return wrapper_instrumented
@@ -0,0 +1,37 @@
+from typing import Awaitable, Callable, Iterable, Optional
+from fio_wrapper.async_fio_adapter import AsyncFIOAdapter
+from fio_wrapper.batch import BatchResult, run_batch_async
+from fio_wrapper.urls import URLs
+from fio_wrapper.endpoints.abstracts.abstract_base_endpoint import (
+    AbstractBaseEndpoint,
+)
+
+
+class AbstractAsyncEndpoint(AbstractBaseEndpoint):
+    def __init__(self, adapter: AsyncFIOAdapter, urls: URLs) -> None:
+        self.adapter: AsyncFIOAdapter = adapter
+        self.urls: URLs = urls
+
+    async def _get_many(
+        self,
+        func: Callable[[str], Awaitable[any]],
+        keys: Iterable[str],
+        max_workers: Optional[int] = None,
+    ) -> BatchResult:
+        """Awaits a single item endpoint for all keys concurrently
+
+        Args:
+            func (Callable[[str], Awaitable[any]]): Single item endpoint coroutine
+            keys (Iterable[str]): Inputs to call the endpoint with
+            max_workers (int, optional): Maximum concurrent calls. Defaults to None, using configuration.
+
+        Returns:
+            BatchResult: Results and errors keyed by input
+        """
+        return await run_batch_async(
+            func=func,
+            keys=keys,
+            max_concurrency=max_workers
+            if max_workers is not None
+            else self.adapter.config.batch_workers,
+        )
@@ -0,0 +1,80 @@
+from typing import Optional
+
+
+class AbstractBaseEndpoint:
+    """Helpers shared by the sync and async endpoints
+
+    Subclasses set adapter, a FIOAdapter or AsyncFIOAdapter.
+    """
+
+    def _pause_gc(self, pause_gc: Optional[bool] = None) -> bool:
+        """Resolves whether a call pauses the garbage collector
+
+        Args:
+            pause_gc (bool, optional): Per call setting. Defaults to None, using configuration.
+
+        Returns:
+            bool: Garbage collector paused
+        """
+        if pause_gc is not None:
+            return pause_gc
+
+        return self.adapter.config.pause_gc
+
+    def _bulk_put(self, dataset: str, result: any) -> any:
+        """Stores a bulk result for single item lookups, if enabled
+
+        Args:
+            dataset (str): Dataset name, e.g. "materials"
+            result (any): Validated bulk result
+
+        Returns:
+            any: result
+        """
+        store = getattr(self.adapter, "bulk", None)
+        if store is not None:
+            store.put(dataset, result.root)
+
+        return result
+
+    def _bulk_index(self, dataset: str) -> Optional[any]:
+        """Gets the index of a fresh bulk result, if enabled
+
+        Every index returned is counted as a bulk hit.
+
+        Args:
+            dataset (str): Dataset name, e.g. "materials"
+
+        Returns:
+            Optional[any]: Index, None if the dataset is not held or expired
+        """
+        store = getattr(self.adapter, "bulk", None)
+        index = store.index(dataset) if store is not None else None
+        if index is not None:
+            self.adapter.stats.increment("bulk_hits")
+
+        return index
+
+    def _bulk_get(self, dataset: str, key: str, not_found: Exception) -> Optional[any]:
+        """Looks an item up in a fresh bulk result, if enabled
+
+        Args:
+            dataset (str): Dataset name, e.g. "materials"
+            key (str): Item key, e.g. a material ticker
+            not_found (Exception): Raised if the dataset is held but has no such item
+
+        Raises:
+            Exception: not_found
+
+        Returns:
+            Optional[any]: Item, None if the dataset is not held or expired
+        """
+        index = self._bulk_index(dataset)
+        if index is None:
+            return None
+
+        item = index.get(key.casefold())
+        if item is None:
+            raise not_found
+
+        return item
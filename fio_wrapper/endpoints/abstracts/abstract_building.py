@@ -1,9 +1,22 @@
-from typing import Optional
+from typing import List, Optional
 
 
 class AbstractBuilding:
     def get(self, building_ticker: str, timeout: Optional[float] = None):
         raise NotImplementedError()
 
-    def allbuildings(self, timeout: Optional[float] = None):
+    def allbuildings(
+        self,
+        timeout: Optional[float] = None,
+        pause_gc: Optional[bool] = None,
+        lazy: bool = False,
+    ):
+        raise NotImplementedError()
+
+    def get_many(
+        self,
+        building_tickers: List[str],
+        timeout: Optional[float] = None,
+        max_workers: Optional[int] = None,
+    ):
         raise NotImplementedError()
@@ -1,8 +1,37 @@
+from typing import Callable, Iterable, Optional
+from fio_wrapper.batch import BatchResult, run_batch
 from fio_wrapper.fio_adapter import FIOAdapter
 from fio_wrapper.urls import URLs
+from fio_wrapper.endpoints.abstracts.abstract_base_endpoint import (
+    AbstractBaseEndpoint,
+)
 
 
-class AbstractEndpoint:
+class AbstractEndpoint(AbstractBaseEndpoint):
     def __init__(self, adapter: FIOAdapter, urls: URLs) -> None:
         self.adapter: FIOAdapter = adapter
         self.urls: URLs = urls
+
+    def _get_many(
+        self,
+        func: Callable[[str], any],
+        keys: Iterable[str],
+        max_workers: Optional[int] = None,
+    ) -> BatchResult:
+        """Calls a single item endpoint for all keys concurrently
+
+        Args:
+            func (Callable[[str], any]): Single item endpoint call
+            keys (Iterable[str]): Inputs to call the endpoint with
+            max_workers (int, optional): Maximum concurrent calls. Defaults to None, using configuration.
+
+        Returns:
+            BatchResult: Results and errors keyed by input
+        """
+        return run_batch(
+            func=func,
+            keys=keys,
+            max_workers=max_workers
+            if max_workers is not None
+            else self.adapter.config.batch_workers,
+        )
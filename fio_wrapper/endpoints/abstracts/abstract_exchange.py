@@ -1,14 +1,22 @@
-from typing import Optional
+from typing import List, Optional
 
 
 class AbstractExchange:
     def get(self, exchange_ticker: str, timeout: Optional[float] = None):
         raise NotImplementedError()
 
-    def all(self, timeout: Optional[float] = None):
+    def all(self, timeout: Optional[float] = None, pause_gc: Optional[bool] = None):
         raise NotImplementedError()
 
-    def get_full(self, timeout: Optional[float] = None):
+    def get_full(
+        self,
+        timeout: Optional[float] = None,
+        pause_gc: Optional[bool] = None,
+        lazy: bool = False,
+    ):
+        raise NotImplementedError()
+
+    def iter_full(self, timeout: Optional[float] = None):
         raise NotImplementedError()
 
     def get_orders(self, company_code: str, timeout: Optional[float] = None):
@@ -18,3 +26,11 @@ class AbstractExchange:
         self, company_code: str, exchange_code: str, timeout: Optional[float] = None
     ):
         raise NotImplementedError()
+
+    def get_many(
+        self,
+        exchange_tickers: List[str],
+        timeout: Optional[float] = None,
+        max_workers: Optional[int] = None,
+    ):
+        raise NotImplementedError()
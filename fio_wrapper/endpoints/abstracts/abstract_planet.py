@@ -5,10 +5,18 @@ class AbstractPlanet:
     def get(self, planet: str, timeout: Optional[float] = None):
         raise NotImplementedError()
 
-    def all(self, timeout: Optional[float] = None):
+    def all(self, timeout: Optional[float] = None, pause_gc: Optional[bool] = None):
         raise NotImplementedError()
 
-    def full(self, timeout: Optional[float] = None):
+    def full(
+        self,
+        timeout: Optional[float] = None,
+        pause_gc: Optional[bool] = None,
+        lazy: bool = False,
+    ):
+        raise NotImplementedError()
+
+    def iter_full(self, timeout: Optional[float] = None):
         raise NotImplementedError()
 
     def sites(self, planet: str, timeout: Optional[float] = None):
@@ -35,3 +43,19 @@ class AbstractPlanet:
         timeout: Optional[float] = None,
     ):
         raise NotImplementedError()
+
+    def get_many(
+        self,
+        planets: List[str],
+        timeout: Optional[float] = None,
+        max_workers: Optional[int] = None,
+    ):
+        raise NotImplementedError()
+
+    def sites_many(
+        self,
+        planets: List[str],
+        timeout: Optional[float] = None,
+        max_workers: Optional[int] = None,
+    ):
+        raise NotImplementedError()
@@ -1,9 +1,22 @@
-from typing import Optional
+from typing import List, Optional
 
 
 class AbstractRecipe:
     def get(self, material_ticker: str, timeout: Optional[float] = None):
         raise NotImplementedError()
 
-    def all(self, timeout: Optional[float] = None):
+    def all(
+        self,
+        timeout: Optional[float] = None,
+        pause_gc: Optional[bool] = None,
+        lazy: bool = False,
+    ):
+        raise NotImplementedError()
+
+    def get_many(
+        self,
+        material_tickers: List[str],
+        timeout: Optional[float] = None,
+        max_workers: Optional[int] = None,
+    ):
         raise NotImplementedError()
@@ -1,14 +1,19 @@
 """Access building information from FIO.
 """
-from typing import Optional
+from typing import List, Optional, Union
+from fio_wrapper.decorator import instrumented
 from fio_wrapper.endpoints.abstracts.abstract_building import AbstractBuilding
 from fio_wrapper.endpoints.abstracts.abstract_endpoint import AbstractEndpoint
+from fio_wrapper.batch import BatchResult
 from fio_wrapper.exceptions import BuildingTickerNotFound
 from fio_wrapper.models.building_models import BuildingTicker, BuildingTickerList
+from fio_wrapper.gc_pause import validate_json
+from fio_wrapper.models.lazy_models import LazyList
 
 
 class Building(AbstractBuilding, AbstractEndpoint):
     # /building/{BuildingTicker}
+    @instrumented
     def get(
         self, building_ticker: str, timeout: Optional[float] = None
     ) -> BuildingTicker:
@@ -24,29 +29,75 @@ class Building(AbstractBuilding, AbstractEndpoint):
         Returns:
             BuildingTicker: Building
         """
+        building = self._bulk_get(
+            "buildings",
+            building_ticker,
+            BuildingTickerNotFound("Buildingticker not found"),
+        )
+        if building is not None:
+            return building
+
         (status, data) = self.adapter.get(
             endpoint=self.urls.building_get_url(building_ticker=building_ticker),
             err_codes=[204],
             timeout=timeout,
+            raw=True,
         )
 
         if status == 200:
-            return BuildingTicker.model_validate(data)
+            return BuildingTicker.model_validate_json(data)
         elif status == 204:
             raise BuildingTickerNotFound("Buildingticker not found")
 
     # /building/allbuildings
-    def all(self, timeout: Optional[float] = None) -> BuildingTickerList:
+    @instrumented
+    def all(
+        self,
+        timeout: Optional[float] = None,
+        pause_gc: Optional[bool] = None,
+        lazy: bool = False,
+    ) -> Union[BuildingTickerList, LazyList]:
         """Gets all buildings from FIO
 
         Args:
             timeout (float, optional): Request timeout in seconds. Defaults to None.
+            pause_gc (bool, optional): Build with the garbage collector of the whole process paused. Defaults to None, using configuration.
+            lazy (bool, optional): Validate items on first access. Defaults to False.
 
         Returns:
-            BuildingTickerList: List of Buildings as List[BuildingTicker]
+            Union[BuildingTickerList, LazyList]: List of Buildings as List[BuildingTicker]
         """
         (_, data) = self.adapter.get(
-            endpoint=self.urls.building_get_all_url(), timeout=timeout
+            endpoint=self.urls.building_get_all_url(), timeout=timeout, raw=not lazy
+        )
+
+        if lazy:
+            return LazyList(BuildingTickerList, data)
+
+        return self._bulk_put(
+            "buildings",
+            validate_json(BuildingTickerList, data, pause_gc=self._pause_gc(pause_gc)),
         )
 
-        return BuildingTickerList.model_validate(data)
+    # /building/{BuildingTicker}, batched
+    def get_many(
+        self,
+        building_tickers: List[str],
+        timeout: Optional[float] = None,
+        max_workers: Optional[int] = None,
+    ) -> BatchResult:
+        """Gets multiple buildings from FIO concurrently
+
+        Args:
+            building_tickers (List[str]): Building Tickers (e.g., ["CHP", "PP1"])
+            timeout (float, optional): Request timeout in seconds. Defaults to None.
+            max_workers (int, optional): Maximum concurrent requests. Defaults to None, using configuration.
+
+        Returns:
+            BatchResult: BuildingTicker by input, errors (e.g., BuildingTickerNotFound) by input
+        """
+        return self._get_many(
+            func=lambda building_ticker: self.get(building_ticker, timeout=timeout),
+            keys=building_tickers,
+            max_workers=max_workers,
+        )
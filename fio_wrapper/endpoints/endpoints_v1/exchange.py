@@ -1,18 +1,20 @@
 """Access exchange information from FIO.
 """
-from typing import Optional
+from typing import Iterator, List, Optional, Union
+from fio_wrapper.decorator import instrumented
 from fio_wrapper.endpoints.abstracts.abstract_endpoint import AbstractEndpoint
 from fio_wrapper.endpoints.abstracts.abstract_exchange import AbstractExchange
-from fio_wrapper.exceptions import ExchangeTickerInvalid
+from fio_wrapper.batch import BatchResult
 from fio_wrapper.exceptions import ExchangeTickerNotFound
-from fio_wrapper.exceptions import MaterialTickerInvalid
 from fio_wrapper.models.exchange_models import ExchangeTickerFull
 from fio_wrapper.models.exchange_models import ExchangeTickerFullList
 from fio_wrapper.models.exchange_models import ExchangeTickerList
 from fio_wrapper.models.exchange_models import OrderList
 from fio_wrapper.validators import validate_company_code
 from fio_wrapper.validators import validate_exchange_code
-from fio_wrapper.validators import validate_ticker
+from fio_wrapper.validators import validate_exchange_ticker
+from fio_wrapper.gc_pause import validate_json
+from fio_wrapper.models.lazy_models import LazyList
 
 
 class Exchange(AbstractExchange, AbstractEndpoint):
@@ -28,33 +30,10 @@ class Exchange(AbstractExchange, AbstractEndpoint):
             ExchangeTickerInvalid: Exchange ticker must be of form MaterialTicker.ExchangeCode
             ExchangeTickerInvalid: Material ticker part of Exchange ticker invalid
         """
-        if exchange_ticker is None:
-            raise ExchangeTickerInvalid("Exchange ticker can't be None type")
-
-        # min length: 5, max length: 7
-        if len(exchange_ticker) < 5 or len(exchange_ticker) > 7:
-            raise ExchangeTickerInvalid(
-                "Exchange ticker to short or long. Must be 5 to 7 characters"
-            )
-
-        # must contain .
-        if "." not in exchange_ticker:
-            raise ExchangeTickerInvalid(
-                "Exchange ticker must be of form MaterialTicker.ExchangeCode"
-            )
-
-        splitted = exchange_ticker.split(".")
-
-        # validate Material part
-        try:
-            validate_ticker(material_ticker=splitted[0])
-        except MaterialTickerInvalid as e:
-            raise ExchangeTickerInvalid() from e
-
-        # validate Exchange code
-        validate_exchange_code(exchange_code=splitted[1])
+        validate_exchange_ticker(exchange_ticker=exchange_ticker)
 
     # /exchange/{ExchangeTicker}
+    @instrumented
     def get(
         self, exchange_ticker: str, timeout: Optional[float] = None
     ) -> ExchangeTickerFull:
@@ -72,50 +51,102 @@ class Exchange(AbstractExchange, AbstractEndpoint):
         """
         self._validate_exchangeticker(exchange_ticker=exchange_ticker)
 
+        ticker = self._bulk_get(
+            "exchange",
+            exchange_ticker,
+            ExchangeTickerNotFound("Exchangeticker not found"),
+        )
+        if ticker is not None:
+            return ticker
+
         (status, data) = self.adapter.get(
             endpoint=self.urls.exchange_get_url(exchange_ticker=exchange_ticker),
             err_codes=[204],
             timeout=timeout,
+            raw=True,
         )
 
         if status == 200:
-            return ExchangeTickerFull.model_validate(data)
+            return ExchangeTickerFull.model_validate_json(data)
         elif status == 204:
             raise ExchangeTickerNotFound("Exchangeticker not found")
 
     # /exchange/all
-    def all(self, timeout: Optional[float] = None) -> ExchangeTickerList:
+    @instrumented
+    def all(
+        self, timeout: Optional[float] = None, pause_gc: Optional[bool] = None
+    ) -> ExchangeTickerList:
         """Gets all simple exchange ticker from FIO
 
         Args:
             timeout (float, optional): Request timeout in seconds. Defaults to None.
+            pause_gc (bool, optional): Build with the garbage collector of the whole process paused. Defaults to None, using configuration.
 
         Returns:
             ExchangeTickerList: Exchange ticker
         """
         (_, data) = self.adapter.get(
-            endpoint=self.urls.exchange_get_all_url(), timeout=timeout
+            endpoint=self.urls.exchange_get_all_url(), timeout=timeout, raw=True
         )
 
-        return ExchangeTickerList.model_validate(data)
+        return validate_json(
+            ExchangeTickerList, data, pause_gc=self._pause_gc(pause_gc)
+        )
 
     # /exchange/full
-    def full(self, timeout: Optional[float] = None) -> ExchangeTickerFullList:
+    @instrumented
+    def full(
+        self,
+        timeout: Optional[float] = None,
+        pause_gc: Optional[bool] = None,
+        lazy: bool = False,
+    ) -> Union[ExchangeTickerFullList, LazyList]:
         """Gets a complete list of all exchange information from FIO
 
         Args:
             timeout (float, optional): Request timeout in seconds. Defaults to None.
+            pause_gc (bool, optional): Build with the garbage collector of the whole process paused. Defaults to None, using configuration.
+            lazy (bool, optional): Validate items on first access. Defaults to False.
 
         Returns:
-            ExchangeTickerFullList: Exchange ticker full
+            Union[ExchangeTickerFullList, LazyList]: Exchange ticker full
         """
         (_, data) = self.adapter.get(
-            endpoint=self.urls.exchange_get_full_url(), timeout=timeout
+            endpoint=self.urls.exchange_get_full_url(), timeout=timeout, raw=not lazy
         )
 
-        return ExchangeTickerFullList.model_validate(data)
+        if lazy:
+            return LazyList(ExchangeTickerFullList, data)
+
+        return self._bulk_put(
+            "exchange",
+            validate_json(
+                ExchangeTickerFullList, data, pause_gc=self._pause_gc(pause_gc)
+            ),
+        )
+
+    # /exchange/full, streamed
+    def iter_full(
+        self, timeout: Optional[float] = None
+    ) -> Iterator[ExchangeTickerFull]:
+        """Iterates the complete exchange information from FIO
+
+        The response is parsed incrementally, only one exchange ticker is held in
+        memory at a time.
+
+        Args:
+            timeout (float, optional): Request timeout in seconds. Defaults to None.
+
+        Yields:
+            Iterator[ExchangeTickerFull]: Exchange ticker full
+        """
+        for item in self.adapter.stream(
+            endpoint=self.urls.exchange_get_full_url(), timeout=timeout
+        ):
+            yield ExchangeTickerFull.model_validate(item)
 
     # /exchange/orders/{CompanyCode}
+    @instrumented
     def get_orders(
         self, company_code: str, timeout: Optional[float] = None
     ) -> OrderList:
@@ -136,11 +167,13 @@ class Exchange(AbstractExchange, AbstractEndpoint):
                 company_code=company_code
             ),
             timeout=timeout,
+            raw=True,
         )
 
-        return OrderList.model_validate(data)
+        return OrderList.model_validate_json(data)
 
     # /exchange/orders/{CompanyCode}/{ExchangeCode}
+    @instrumented
     def get_orders_exchange(
         self, company_code: str, exchange_code: str, timeout: Optional[float] = None
     ) -> OrderList:
@@ -162,6 +195,30 @@ class Exchange(AbstractExchange, AbstractEndpoint):
                 company_code=company_code, exchange_code=exchange_code
             ),
             timeout=timeout,
+            raw=True,
         )
 
-        return OrderList.model_validate(data)
+        return OrderList.model_validate_json(data)
+
+    # /exchange/{ExchangeTicker}, batched
+    def get_many(
+        self,
+        exchange_tickers: List[str],
+        timeout: Optional[float] = None,
+        max_workers: Optional[int] = None,
+    ) -> BatchResult:
+        """Gets multiple exchange tickers from FIO concurrently
+
+        Args:
+            exchange_tickers (List[str]): Exchange Tickers (e.g., ["DW.AI1", "RAT.NC1"])
+            timeout (float, optional): Request timeout in seconds. Defaults to None.
+            max_workers (int, optional): Maximum concurrent requests. Defaults to None, using configuration.
+
+        Returns:
+            BatchResult: ExchangeTickerFull by input, errors (e.g., ExchangeTickerNotFound) by input
+        """
+        return self._get_many(
+            func=lambda exchange_ticker: self.get(exchange_ticker, timeout=timeout),
+            keys=exchange_tickers,
+            max_workers=max_workers,
+        )
@@ -1,5 +1,5 @@
 from typing import List, Optional
-from fio_wrapper.decorator import apikey_required
+from fio_wrapper.decorator import apikey_required, instrumented
 from fio_wrapper.endpoints.abstracts.abstract_endpoint import AbstractEndpoint
 from fio_wrapper.endpoints.abstracts.abstract_group import AbstractGroup
 from fio_wrapper.models.group_models import (
@@ -12,6 +12,7 @@ from fio_wrapper.models.group_models import (
 
 
 class Group(AbstractGroup, AbstractEndpoint):
+    @instrumented
     @apikey_required
     def all(self, timeout: Optional[float] = None) -> GroupList:
         """Gets all groups from FIO
@@ -29,12 +30,13 @@ class Group(AbstractGroup, AbstractEndpoint):
             GroupList: List of Groups
         """
         (status, data) = self.adapter.get(
-            endpoint=self.urls.group_all_url(), timeout=timeout
+            endpoint=self.urls.group_all_url(), timeout=timeout, raw=True
         )
 
         if status == 200:
-            return GroupList.model_validate(data)
+            return GroupList.model_validate_json(data)
 
+    @instrumented
     @apikey_required
     def get(self, groupid: int, timeout: Optional[float] = None) -> GroupModel:
         """Gets group information for specified GroupID from FIO
@@ -53,12 +55,13 @@ class Group(AbstractGroup, AbstractEndpoint):
             GroupModel: GroupModel
         """
         (status, data) = self.adapter.get(
-            endpoint=self.urls.group_get_url(groupid=groupid), timeout=timeout
+            endpoint=self.urls.group_get_url(groupid=groupid), timeout=timeout, raw=True
         )
 
         if status == 200:
-            return GroupModel.model_validate(data)
+            return GroupModel.model_validate_json(data)
 
+    @instrumented
     @apikey_required
     def memberships(self, timeout: Optional[float] = None) -> GroupMembershipList:
         """Gets all groups the FIO API Key is member of
@@ -76,12 +79,13 @@ class Group(AbstractGroup, AbstractEndpoint):
             GroupMembershipList: List of Group Memberships
         """
         (status, data) = self.adapter.get(
-            endpoint=self.urls.group_memberships_url(), timeout=timeout
+            endpoint=self.urls.group_memberships_url(), timeout=timeout, raw=True
         )
 
         if status == 200:
-            return GroupMembershipList.model_validate(data)
+            return GroupMembershipList.model_validate_json(data)
 
+    @instrumented
     @apikey_required
     def hub(self, members: List[str], timeout: Optional[float] = None) -> GroupHub:
         """Gets the groups Hub information from FIO
@@ -100,12 +104,13 @@ class Group(AbstractGroup, AbstractEndpoint):
             GroupHub: GroupHub data from FIO
         """
         (status, data) = self.adapter.post(
-            endpoint=self.urls.group_hub_url(), data=members, timeout=timeout
+            endpoint=self.urls.group_hub_url(), data=members, timeout=timeout, raw=True
         )
 
         if status == 200:
-            return GroupHub.model_validate(data)
+            return GroupHub.model_validate_json(data)
 
+    @instrumented
     @apikey_required
     def burn(self, groupid: int, timeout: Optional[float] = None) -> BurnList:
         """Gets the groups Burn information from FIO
@@ -124,8 +129,10 @@ class Group(AbstractGroup, AbstractEndpoint):
             BurnList: List of Burn data
         """
         (status, data) = self.adapter.get(
-            endpoint=self.urls.group_burn_url(groupid=groupid), timeout=timeout
+            endpoint=self.urls.group_burn_url(groupid=groupid),
+            timeout=timeout,
+            raw=True,
         )
 
         if status == 200:
-            return BurnList.model_validate(data)
+            return BurnList.model_validate_json(data)
@@ -1,6 +1,7 @@
 """Access local market information from FIO.
 """
 from typing import Tuple, Optional
+from fio_wrapper.decorator import instrumented
 from fio_wrapper.endpoints.abstracts.abstract_endpoint import AbstractEndpoint
 from fio_wrapper.endpoints.abstracts.abstract_localmarket import AbstractLocalMarket
 from fio_wrapper.exceptions import (
@@ -19,6 +20,7 @@ from fio_wrapper.validators import validate_localmarket_adtype
 
 class LocalMarket(AbstractLocalMarket, AbstractEndpoint):
     # /localmarket/planet/{Planet}
+    @instrumented
     def planet(self, planet: str, timeout: Optional[float] = None) -> LocalMarketAds:
         """Gets local market ads for planet
 
@@ -36,10 +38,11 @@ class LocalMarket(AbstractLocalMarket, AbstractEndpoint):
             endpoint=self.urls.localmarket_planet_url(planet),
             err_codes=[204],
             timeout=timeout,
+            raw=True,
         )
 
         if status == 200:
-            return LocalMarketAds.model_validate(data)
+            return LocalMarketAds.model_validate_json(data)
         elif status == 204:
             raise PlanetNotFound("Planet not found")
 
@@ -54,9 +57,11 @@ class LocalMarket(AbstractLocalMarket, AbstractEndpoint):
             ),
             err_codes=[204],
             timeout=timeout,
+            raw=True,
         )
 
     # /localmarket/planet/{Planet}/{Type}
+    @instrumented
     def planet_buy(
         self, planet: str, timeout: Optional[float] = None
     ) -> LocalMarketAdList:
@@ -75,10 +80,11 @@ class LocalMarket(AbstractLocalMarket, AbstractEndpoint):
         (status, data) = self._planet_type(planet=planet, adtype="BUY", timeout=timeout)
 
         if status == 200:
-            return LocalMarketAdList.model_validate(data)
+            return LocalMarketAdList.model_validate_json(data)
         elif status == 204:
             raise PlanetOrAdsNotFound("Planet not found or no ads on planet")
 
+    @instrumented
     def planet_sell(
         self, planet: str, timeout: Optional[float] = None
     ) -> LocalMarketAdList:
@@ -99,10 +105,11 @@ class LocalMarket(AbstractLocalMarket, AbstractEndpoint):
         )
 
         if status == 200:
-            return LocalMarketAdList.model_validate(data)
+            return LocalMarketAdList.model_validate_json(data)
         elif status == 204:
             raise PlanetOrAdsNotFound("Planet not found or no ads on planet")
 
+    @instrumented
     def planet_shipping(
         self, planet: str, timeout: Optional[float] = None
     ) -> LocalMarketShippingAdList:
@@ -123,11 +130,12 @@ class LocalMarket(AbstractLocalMarket, AbstractEndpoint):
         )
 
         if status == 200:
-            return LocalMarketShippingAdList.model_validate(data)
+            return LocalMarketShippingAdList.model_validate_json(data)
         elif status == 204:
             raise PlanetOrAdsNotFound("Planet not found or no ads on planet")
 
     # /localmarket/shipping/source/{SourcePlanet}
+    @instrumented
     def shipping_from(
         self, planet: str, timeout: Optional[float] = None
     ) -> LocalMarketShippingAdList:
@@ -147,14 +155,16 @@ class LocalMarket(AbstractLocalMarket, AbstractEndpoint):
             endpoint=self.urls.localmarket_shipping_source_url(planet=planet),
             err_codes=[204],
             timeout=timeout,
+            raw=True,
         )
 
         if status == 200:
-            return LocalMarketShippingAdList.model_validate(data)
+            return LocalMarketShippingAdList.model_validate_json(data)
         elif status == 204:
             raise PlanetOrAdsNotFound("Planet not found or no ads on planet")
 
     # /localmarket/shipping/destination/{DestinationPlanet}
+    @instrumented
     def shipping_to(
         self, planet: str, timeout: Optional[float] = None
     ) -> LocalMarketShippingAdList:
@@ -174,14 +184,16 @@ class LocalMarket(AbstractLocalMarket, AbstractEndpoint):
             endpoint=self.urls.localmarket_shipping_destination_url(planet=planet),
             err_codes=[204],
             timeout=timeout,
+            raw=True,
         )
 
         if status == 200:
-            return LocalMarketShippingAdList.model_validate(data)
+            return LocalMarketShippingAdList.model_validate_json(data)
         elif status == 204:
             raise PlanetOrAdsNotFound("Planet not found or no ads on planet")
 
     # /localmarket/company/{Company}
+    @instrumented
     def company(
         self, companycode: str, timeout: Optional[float] = None
     ) -> LocalMarketAds:
@@ -201,9 +213,10 @@ class LocalMarket(AbstractLocalMarket, AbstractEndpoint):
             endpoint=self.urls.localmarket_company_url(companycode=companycode),
             err_codes=[204],
             timeout=timeout,
+            raw=True,
         )
 
         if status == 200:
-            return LocalMarketAds.model_validate(data)
+            return LocalMarketAds.model_validate_json(data)
         elif status == 204:
             raise CompanyOrAdsNotFound("Company not found or no ads from company")
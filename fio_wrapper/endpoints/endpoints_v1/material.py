@@ -1,11 +1,15 @@
 """Access material information from FIO.
 """
-from typing import Optional
+from typing import Iterator, List, Optional, Union
+from fio_wrapper.decorator import instrumented
 from fio_wrapper.endpoints.abstracts.abstract_endpoint import AbstractEndpoint
 from fio_wrapper.endpoints.abstracts.abstract_material import AbstractMaterial
+from fio_wrapper.batch import BatchResult
 from fio_wrapper.validators import validate_ticker
 from fio_wrapper.models.material_models import MaterialTicker, MaterialTickerList
 from fio_wrapper.exceptions import MaterialTickerNotFound, MaterialCategoryNotFound
+from fio_wrapper.gc_pause import validate_json
+from fio_wrapper.models.lazy_models import LazyList
 
 
 class Material(AbstractMaterial, AbstractEndpoint):
@@ -24,6 +28,7 @@ class Material(AbstractMaterial, AbstractEndpoint):
         """
         validate_ticker(material_ticker=material_ticker)
 
+    @instrumented
     def get(
         self, material_ticker: str, timeout: Optional[float] = None
     ) -> MaterialTicker:
@@ -42,31 +47,75 @@ class Material(AbstractMaterial, AbstractEndpoint):
 
         self._validate_ticker(material_ticker=material_ticker)
 
+        material = self._bulk_get(
+            "materials",
+            material_ticker,
+            MaterialTickerNotFound("Materialticker not found"),
+        )
+        if material is not None:
+            return material
+
         (status, data) = self.adapter.get(
             endpoint=self.urls.material_get_url(material_ticker=material_ticker),
             err_codes=[204],
             timeout=timeout,
+            raw=True,
         )
 
         if status == 200:
-            return MaterialTicker.model_validate(data)
+            return MaterialTicker.model_validate_json(data)
         elif status == 204:
             raise MaterialTickerNotFound("Materialticker not found")
 
-    def all(self, timeout: Optional[float] = None) -> MaterialTickerList:
+    @instrumented
+    def all(
+        self,
+        timeout: Optional[float] = None,
+        pause_gc: Optional[bool] = None,
+        lazy: bool = False,
+    ) -> Union[MaterialTickerList, LazyList]:
         """Gets all materials from FIO
 
         Args:
             timeout (float, optional): Request timeout in seconds. Defaults to None.
+            pause_gc (bool, optional): Build with the garbage collector of the whole process paused. Defaults to None, using configuration.
+            lazy (bool, optional): Validate items on first access. Defaults to False.
 
         Returns:
-            MaterialModelList: List of Materials as List[MaterialModel]
+            Union[MaterialTickerList, LazyList]: List of Materials as List[MaterialModel]
         """
         (_, data) = self.adapter.get(
-            endpoint=self.urls.material_allmaterials_url(), timeout=timeout
+            endpoint=self.urls.material_allmaterials_url(),
+            timeout=timeout,
+            raw=not lazy,
+        )
+        if lazy:
+            return LazyList(MaterialTickerList, data)
+
+        return self._bulk_put(
+            "materials",
+            validate_json(MaterialTickerList, data, pause_gc=self._pause_gc(pause_gc)),
         )
-        return MaterialTickerList.model_validate(data)
 
+    # /material/allmaterials, streamed
+    def iter_all(self, timeout: Optional[float] = None) -> Iterator[MaterialTicker]:
+        """Iterates all materials from FIO
+
+        The response is parsed incrementally, only one material is held in memory
+        at a time.
+
+        Args:
+            timeout (float, optional): Request timeout in seconds. Defaults to None.
+
+        Yields:
+            Iterator[MaterialTicker]: Material
+        """
+        for item in self.adapter.stream(
+            endpoint=self.urls.material_allmaterials_url(), timeout=timeout
+        ):
+            yield MaterialTicker.model_validate(item)
+
+    @instrumented
     def category(
         self, category_name: str, timeout: Optional[float] = None
     ) -> MaterialTickerList:
@@ -82,6 +131,10 @@ class Material(AbstractMaterial, AbstractEndpoint):
         Returns:
             MaterialModelList: List of Materials as List[MaterialModel]
         """
+        materials = self._bulk_index("materials")
+        if materials is not None:
+            return materials.category(category_name)
+
         (status, data) = self.adapter.get(
             endpoint=self.urls.material_get_category(category_name=category_name),
             err_codes=[204],
@@ -92,3 +145,26 @@ class Material(AbstractMaterial, AbstractEndpoint):
             return MaterialTickerList.model_validate(data)
         elif status == 204 or len(data) == 0:
             raise MaterialCategoryNotFound("Material category not found")
+
+    # /material/{MaterialTicker}, batched
+    def get_many(
+        self,
+        material_tickers: List[str],
+        timeout: Optional[float] = None,
+        max_workers: Optional[int] = None,
+    ) -> BatchResult:
+        """Gets multiple materials from FIO concurrently
+
+        Args:
+            material_tickers (List[str]): Material Tickers (e.g., ["DW", "RAT"])
+            timeout (float, optional): Request timeout in seconds. Defaults to None.
+            max_workers (int, optional): Maximum concurrent requests. Defaults to None, using configuration.
+
+        Returns:
+            BatchResult: MaterialTicker by input, errors (e.g., MaterialTickerNotFound) by input
+        """
+        return self._get_many(
+            func=lambda material_ticker: self.get(material_ticker, timeout=timeout),
+            keys=material_tickers,
+            max_workers=max_workers,
+        )
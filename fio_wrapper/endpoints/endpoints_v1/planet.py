@@ -1,8 +1,10 @@
 """Access planet information from FIO.
 """
-from typing import List, Optional
+from typing import Iterator, List, Optional, Union
+from fio_wrapper.decorator import instrumented
 from fio_wrapper.endpoints.abstracts.abstract_endpoint import AbstractEndpoint
 from fio_wrapper.endpoints.abstracts.abstract_planet import AbstractPlanet
+from fio_wrapper.batch import BatchResult
 from fio_wrapper.exceptions import (
     PlanetNotFound,
     PlanetSearchDistanceChecksInvalid,
@@ -19,12 +21,15 @@ from fio_wrapper.validators import (
     validate_planet_search_distance_checks,
     validate_planet_search_materials,
 )
+from fio_wrapper.gc_pause import validate_json
+from fio_wrapper.models.lazy_models import LazyList
 
 
 class Planet(AbstractPlanet, AbstractEndpoint):
     """Planet endpoint wrapper"""
 
     # /planet/{Planet}
+    @instrumented
     def get(self, planet: str, timeout: Optional[float] = None) -> PlanetFull:
         """Gets full planet data from FIO
 
@@ -38,50 +43,94 @@ class Planet(AbstractPlanet, AbstractEndpoint):
         Returns:
             PlanetFull: Full planet information
         """
+        planet_full = self._bulk_get(
+            "planets", planet, PlanetNotFound("Planet not found")
+        )
+        if planet_full is not None:
+            return planet_full
+
         (status, data) = self.adapter.get(
             endpoint=self.urls.planet_get_url(planet=planet),
             err_codes=[204],
             timeout=timeout,
+            raw=True,
         )
 
         if status == 200:
-            return PlanetFull.model_validate(data)
+            return PlanetFull.model_validate_json(data)
         elif status == 204:
             raise PlanetNotFound("Planet not found")
 
     # /planet/allplanets
-    def all(self, timeout: Optional[float] = None) -> PlanetList:
+    @instrumented
+    def all(
+        self, timeout: Optional[float] = None, pause_gc: Optional[bool] = None
+    ) -> PlanetList:
         """Gets a list of all Planets with minimal information from FIO
 
         Args:
             timeout (float, optional): Request timeout in seconds. Defaults to None.
+            pause_gc (bool, optional): Build with the garbage collector of the whole process paused. Defaults to None, using configuration.
 
         Returns:
             PlanetList: List of Planets as List[Planet]
         """
         (_, data) = self.adapter.get(
-            endpoint=self.urls.planet_all_url(), timeout=timeout
+            endpoint=self.urls.planet_all_url(), timeout=timeout, raw=True
         )
 
-        return PlanetList.model_validate(data)
+        return validate_json(PlanetList, data, pause_gc=self._pause_gc(pause_gc))
 
     # /planet/allplanets/full
-    def full(self, timeout: Optional[float] = None) -> PlanetFullList:
+    @instrumented
+    def full(
+        self,
+        timeout: Optional[float] = None,
+        pause_gc: Optional[bool] = None,
+        lazy: bool = False,
+    ) -> Union[PlanetFullList, LazyList]:
         """Gets a list of all planets from FIO with full planet information
 
         Args:
             timeout (float, optional): Request timeout in seconds. Defaults to None.
+            pause_gc (bool, optional): Build with the garbage collector of the whole process paused. Defaults to None, using configuration.
+            lazy (bool, optional): Validate items on first access. Defaults to False.
 
         Returns:
-            PlanetFullList: List of Planets with full information as List[PlanetFull]
+            Union[PlanetFullList, LazyList]: List of Planets with full information as List[PlanetFull]
         """
         (_, data) = self.adapter.get(
-            endpoint=self.urls.planet_full_url(), timeout=timeout
+            endpoint=self.urls.planet_full_url(), timeout=timeout, raw=not lazy
+        )
+
+        if lazy:
+            return LazyList(PlanetFullList, data)
+
+        return self._bulk_put(
+            "planets",
+            validate_json(PlanetFullList, data, pause_gc=self._pause_gc(pause_gc)),
         )
 
-        return PlanetFullList.model_validate(data)
+    # /planet/allplanets/full, streamed
+    def iter_full(self, timeout: Optional[float] = None) -> Iterator[PlanetFull]:
+        """Iterates all planets from FIO with full planet information
+
+        The response is parsed incrementally, only one planet is held in memory
+        at a time.
+
+        Args:
+            timeout (float, optional): Request timeout in seconds. Defaults to None.
+
+        Yields:
+            Iterator[PlanetFull]: Planet with full information
+        """
+        for item in self.adapter.stream(
+            endpoint=self.urls.planet_full_url(), timeout=timeout
+        ):
+            yield PlanetFull.model_validate(item)
 
     # /planet/sites/{Planet}
+    @instrumented
     def sites(self, planet: str, timeout: Optional[float] = None) -> PlanetSiteList:
         """Gets a list of sites on the planet from FIO
 
@@ -99,14 +148,16 @@ class Planet(AbstractPlanet, AbstractEndpoint):
             endpoint=self.urls.planet_sites_url(planet=planet),
             err_codes=[204],
             timeout=timeout,
+            raw=True,
         )
 
         if status == 200:
-            return PlanetSiteList.model_validate(data)
+            return PlanetSiteList.model_validate_json(data)
         elif status == 204:
             raise PlanetNotFound("Planet not found")
 
     # /planet/search
+    @instrumented
     def search(
         self,
         materials: List[str] = None,
@@ -194,9 +245,56 @@ class Planet(AbstractPlanet, AbstractEndpoint):
             },
             err_codes=[400],
             timeout=timeout,
+            raw=True,
         )
 
         if status == 200:
-            return PlanetFullList.model_validate(data)
+            return PlanetFullList.model_validate_json(data)
         elif status == 400:
             raise PlanetSearchInvalidRequest("Failed to parse payload")
+
+    # /planet/{Planet}, batched
+    def get_many(
+        self,
+        planets: List[str],
+        timeout: Optional[float] = None,
+        max_workers: Optional[int] = None,
+    ) -> BatchResult:
+        """Gets full planet data for multiple planets from FIO concurrently
+
+        Args:
+            planets (List[str]): PlanetIds, PlanetNaturalIds or PlanetNames
+            timeout (float, optional): Request timeout in seconds. Defaults to None.
+            max_workers (int, optional): Maximum concurrent requests. Defaults to None, using configuration.
+
+        Returns:
+            BatchResult: PlanetFull by input, errors (e.g., PlanetNotFound) by input
+        """
+        return self._get_many(
+            func=lambda planet: self.get(planet, timeout=timeout),
+            keys=planets,
+            max_workers=max_workers,
+        )
+
+    # /planet/sites/{Planet}, batched
+    def sites_many(
+        self,
+        planets: List[str],
+        timeout: Optional[float] = None,
+        max_workers: Optional[int] = None,
+    ) -> BatchResult:
+        """Gets the sites of multiple planets from FIO concurrently
+
+        Args:
+            planets (List[str]): PlanetIds, PlanetNaturalIds or PlanetNames
+            timeout (float, optional): Request timeout in seconds. Defaults to None.
+            max_workers (int, optional): Maximum concurrent requests. Defaults to None, using configuration.
+
+        Returns:
+            BatchResult: PlanetSiteList by input, errors (e.g., PlanetNotFound) by input
+        """
+        return self._get_many(
+            func=lambda planet: self.sites(planet, timeout=timeout),
+            keys=planets,
+            max_workers=max_workers,
+        )
@@ -1,13 +1,18 @@
 """Access recipe information from FIO.
 """
-from typing import Optional
+from typing import List, Optional, Union
+from fio_wrapper.decorator import instrumented
 from fio_wrapper.endpoints.abstracts.abstract_endpoint import AbstractEndpoint
 from fio_wrapper.endpoints.abstracts.abstract_recipe import AbstractRecipe
+from fio_wrapper.batch import BatchResult
 from fio_wrapper.models.recipe_models import MaterialRecipeList, RecipeList
+from fio_wrapper.gc_pause import validate_json
+from fio_wrapper.models.lazy_models import LazyList
 
 
 class Recipe(AbstractRecipe, AbstractEndpoint):
     # /recipes/{Ticker}
+    @instrumented
     def get(
         self, material_ticker: str, timeout: Optional[float] = None
     ) -> MaterialRecipeList:
@@ -23,22 +28,57 @@ class Recipe(AbstractRecipe, AbstractEndpoint):
         (_, data) = self.adapter.get(
             endpoint=self.urls.recipe_get_url(material_ticker=material_ticker),
             timeout=timeout,
+            raw=True,
         )
 
-        return MaterialRecipeList.model_validate(data)
+        return MaterialRecipeList.model_validate_json(data)
 
     # /recipes/allrecipes
-    def all(self, timeout: Optional[float] = None) -> RecipeList:
+    @instrumented
+    def all(
+        self,
+        timeout: Optional[float] = None,
+        pause_gc: Optional[bool] = None,
+        lazy: bool = False,
+    ) -> Union[RecipeList, LazyList]:
         """Gets all recipes from FIO
 
         Args:
             timeout (float, optional): Request timeout in seconds. Defaults to None.
+            pause_gc (bool, optional): Build with the garbage collector of the whole process paused. Defaults to None, using configuration.
+            lazy (bool, optional): Validate items on first access. Defaults to False.
 
         Returns:
-            RecipeList: List of Recipes as List[RecipeList]
+            Union[RecipeList, LazyList]: List of Recipes as List[RecipeList]
         """
         (_, data) = self.adapter.get(
-            endpoint=self.urls.recipe_get_all_url(), timeout=timeout
+            endpoint=self.urls.recipe_get_all_url(), timeout=timeout, raw=not lazy
         )
 
-        return RecipeList.model_validate(data)
+        if lazy:
+            return LazyList(RecipeList, data)
+
+        return validate_json(RecipeList, data, pause_gc=self._pause_gc(pause_gc))
+
+    # /recipes/{Ticker}, batched
+    def get_many(
+        self,
+        material_tickers: List[str],
+        timeout: Optional[float] = None,
+        max_workers: Optional[int] = None,
+    ) -> BatchResult:
+        """Gets all recipes for multiple materials from FIO concurrently
+
+        Args:
+            material_tickers (List[str]): Material Tickers (e.g., ["FE", "AL"])
+            timeout (float, optional): Request timeout in seconds. Defaults to None.
+            max_workers (int, optional): Maximum concurrent requests. Defaults to None, using configuration.
+
+        Returns:
+            BatchResult: MaterialRecipeList by input, errors (e.g., UnknownFIOResponse) by input
+        """
+        return self._get_many(
+            func=lambda material_ticker: self.get(material_ticker, timeout=timeout),
+            keys=material_tickers,
+            max_workers=max_workers,
+        )
@@ -4,12 +4,13 @@
 from typing import List, Optional
 from fio_wrapper.endpoints.abstracts.abstract_endpoint import AbstractEndpoint
 from fio_wrapper.endpoints.abstracts.abstract_sites import AbstractSites
-from fio_wrapper.decorator import apikey_required
+from fio_wrapper.decorator import apikey_required, instrumented
 from fio_wrapper.exceptions import NoSiteData, NotAuthenticated
 from fio_wrapper.models.sites_models import Site, SiteList, WarehouseList
 
 
 class Sites(AbstractSites, AbstractEndpoint):
+    @instrumented
     @apikey_required
     def get(self, username: str, timeout: Optional[float] = None) -> SiteList:
         """Gets site data for given username from FIO
@@ -33,16 +34,18 @@ class Sites(AbstractSites, AbstractEndpoint):
             endpoint=self.urls.sites_get_url(username=username),
             err_codes=[204, 401],
             timeout=timeout,
+            raw=True,
         )
 
         if status == 200:
-            return SiteList.model_validate(data)
+            return SiteList.model_validate_json(data)
 
         elif status == 204:
             raise NoSiteData("Username has no site data")
         elif status == 401:
             raise NotAuthenticated("Not authenticated or no appropiate permissions")
 
+    @instrumented
     @apikey_required
     def get_planet(
         self, username: str, planet: str, timeout: Optional[float] = None
@@ -71,15 +74,17 @@ class Sites(AbstractSites, AbstractEndpoint):
             ),
             err_codes=[204, 401],
             timeout=timeout,
+            raw=True,
         )
 
         if status == 200:
-            return Site.model_validate(data)
+            return Site.model_validate_json(data)
         elif status == 204:
             raise NoSiteData("Username has no site data")
         elif status == 401:
             raise NotAuthenticated("Not authenticated or no appropiate permissions")
 
+    @instrumented
     @apikey_required
     def planets(self, username: str, timeout: Optional[float] = None) -> List[str]:
         """Gets a list of SiteIds from FIO for given username
@@ -105,12 +110,14 @@ class Sites(AbstractSites, AbstractEndpoint):
         )
 
         if status == 200:
-            return data
+            # a copy, coalesced calls share the decoded response
+            return list(data)
         elif status == 204:
             raise NoSiteData("Username has no site data")
         elif status == 401:
             raise NotAuthenticated("Not authenticated or no appropiate permissions")
 
+    @instrumented
     @apikey_required
     def warehouses(
         self, username: str, timeout: Optional[float] = None
@@ -135,10 +142,11 @@ class Sites(AbstractSites, AbstractEndpoint):
             endpoint=self.urls.sites_warehouses_get(username=username),
             err_codes=[204, 401],
             timeout=timeout,
+            raw=True,
         )
 
         if status == 200:
-            return WarehouseList.model_validate(data)
+            return WarehouseList.model_validate_json(data)
         elif status == 204:
             raise NoSiteData("Username has no warehouse site data")
         elif status == 401:
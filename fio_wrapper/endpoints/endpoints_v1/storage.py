@@ -1,5 +1,5 @@
 from typing import List, Optional
-from fio_wrapper.decorator import apikey_required
+from fio_wrapper.decorator import apikey_required, instrumented
 from fio_wrapper.endpoints.abstracts.abstract_endpoint import AbstractEndpoint
 from fio_wrapper.endpoints.abstracts.abstract_storage import AbstractStorage
 from fio_wrapper.exceptions import NoStorageData, NotAuthenticated
@@ -7,6 +7,7 @@ from fio_wrapper.models.storage_models import StorageList, Storage as StorageMod
 
 
 class Storage(AbstractStorage, AbstractEndpoint):
+    @instrumented
     @apikey_required
     def get(self, username: str, timeout: Optional[float] = None) -> StorageList:
         """Gets users storage data from FIO
@@ -29,16 +30,18 @@ class Storage(AbstractStorage, AbstractEndpoint):
             endpoint=self.urls.storage_get_url(username=username),
             err_codes=[204, 401],
             timeout=timeout,
+            raw=True,
         )
 
         if status == 200:
-            return StorageList.model_validate(data)
+            return StorageList.model_validate_json(data)
 
         elif status == 204:
             raise NoStorageData("Username has no storage data")
         elif status == 401:
             raise NotAuthenticated("Not authenticated or no appropiate permissions")
 
+    @instrumented
     @apikey_required
     def get_specific(
         self, username: str, specific: str, timeout: Optional[float] = None
@@ -66,16 +69,18 @@ class Storage(AbstractStorage, AbstractEndpoint):
             ),
             err_codes=[204, 401],
             timeout=timeout,
+            raw=True,
         )
 
         if status == 200:
-            return StorageModel.model_validate(data)
+            return StorageModel.model_validate_json(data)
 
         elif status == 204:
             raise NoStorageData("Username has no storage data")
         elif status == 401:
             raise NotAuthenticated("Not authenticated or no appropiate permissions")
 
+    @instrumented
     @apikey_required
     def planets(self, username: str, timeout: Optional[float] = None) -> List[str]:
         """Returns a list of storages from FIO
@@ -101,7 +106,8 @@ class Storage(AbstractStorage, AbstractEndpoint):
         )
 
         if status == 200:
-            return data
+            # a copy, coalesced calls share the decoded response
+            return list(data)
         elif status == 204:
             raise NoStorageData("Username has no storage data")
         elif status == 401:
@@ -0,0 +1,105 @@
+"""Asynchronously access building information from FIO.
+"""
+from typing import List, Optional, Union
+from fio_wrapper.decorator import instrumented
+from fio_wrapper.endpoints.abstracts.abstract_building import AbstractBuilding
+from fio_wrapper.batch import BatchResult
+from fio_wrapper.endpoints.abstracts.abstract_async_endpoint import (
+    AbstractAsyncEndpoint,
+)
+from fio_wrapper.exceptions import BuildingTickerNotFound
+from fio_wrapper.models.building_models import BuildingTicker, BuildingTickerList
+from fio_wrapper.gc_pause import validate_json
+from fio_wrapper.models.lazy_models import LazyList
+
+
+class Building(AbstractBuilding, AbstractAsyncEndpoint):
+    # /building/{BuildingTicker}
+    @instrumented
+    async def get(
+        self, building_ticker: str, timeout: Optional[float] = None
+    ) -> BuildingTicker:
+        """Gets a single building from FIO
+
+        Args:
+            building_ticker (str): Building Ticker (e.g., "CHP")
+            timeout (float, optional): Request timeout in seconds. Defaults to None.
+
+        Raises:
+            BuildingTickerNotFound: Building Ticker was not found
+
+        Returns:
+            BuildingTicker: Building
+        """
+        building = self._bulk_get(
+            "buildings",
+            building_ticker,
+            BuildingTickerNotFound("Buildingticker not found"),
+        )
+        if building is not None:
+            return building
+
+        (status, data) = await self.adapter.get(
+            endpoint=self.urls.building_get_url(building_ticker=building_ticker),
+            err_codes=[204],
+            timeout=timeout,
+            raw=True,
+        )
+
+        if status == 200:
+            return BuildingTicker.model_validate_json(data)
+        elif status == 204:
+            raise BuildingTickerNotFound("Buildingticker not found")
+
+    # /building/allbuildings
+    @instrumented
+    async def all(
+        self,
+        timeout: Optional[float] = None,
+        pause_gc: Optional[bool] = None,
+        lazy: bool = False,
+    ) -> Union[BuildingTickerList, LazyList]:
+        """Gets all buildings from FIO
+
+        Args:
+            timeout (float, optional): Request timeout in seconds. Defaults to None.
+            pause_gc (bool, optional): Build with the garbage collector of the whole process paused. Defaults to None, using configuration.
+            lazy (bool, optional): Validate items on first access. Defaults to False.
+
+        Returns:
+            Union[BuildingTickerList, LazyList]: List of Buildings as List[BuildingTicker]
+        """
+        (_, data) = await self.adapter.get(
+            endpoint=self.urls.building_get_all_url(), timeout=timeout, raw=not lazy
+        )
+
+        if lazy:
+            return LazyList(BuildingTickerList, data)
+
+        return self._bulk_put(
+            "buildings",
+            validate_json(BuildingTickerList, data, pause_gc=self._pause_gc(pause_gc)),
+        )
+
+    # /building/{BuildingTicker}, batched
+    async def get_many(
+        self,
+        building_tickers: List[str],
+        timeout: Optional[float] = None,
+        max_workers: Optional[int] = None,
+    ) -> BatchResult:
+        """Gets multiple buildings from FIO concurrently
+
+        Args:
+            building_tickers (List[str]): Building Tickers (e.g., ["CHP", "PP1"])
+            timeout (float, optional): Request timeout in seconds. Defaults to None.
+            max_workers (int, optional): Maximum concurrent requests. Defaults to None, using configuration.
+
+        Returns:
+            BatchResult: BuildingTicker by input, errors (e.g., BuildingTickerNotFound) by input
+        """
+        return await self._get_many(
+            func=lambda building_ticker: self.get(building_ticker, timeout=timeout),
+            keys=building_tickers,
+            max_workers=max_workers,
+        )
@@ -0,0 +1,226 @@
+"""Asynchronously access exchange information from FIO.
+"""
+from typing import AsyncIterator, List, Optional, Union
+from fio_wrapper.decorator import instrumented
+from fio_wrapper.endpoints.abstracts.abstract_async_endpoint import (
+    AbstractAsyncEndpoint,
+)
+from fio_wrapper.endpoints.abstracts.abstract_exchange import AbstractExchange
+from fio_wrapper.batch import BatchResult
+from fio_wrapper.exceptions import ExchangeTickerNotFound
+from fio_wrapper.models.exchange_models import ExchangeTickerFull
+from fio_wrapper.models.exchange_models import ExchangeTickerFullList
+from fio_wrapper.models.exchange_models import ExchangeTickerList
+from fio_wrapper.models.exchange_models import OrderList
+from fio_wrapper.validators import validate_company_code
+from fio_wrapper.validators import validate_exchange_code
+from fio_wrapper.validators import validate_exchange_ticker
+from fio_wrapper.gc_pause import validate_json
+from fio_wrapper.models.lazy_models import LazyList
+
+
+class Exchange(AbstractExchange, AbstractAsyncEndpoint):
+    def _validate_exchangeticker(self, exchange_ticker: str) -> None:
+        """Validates an exchange ticker
+
+        Args:
+            exchange_ticker (str): Exchange ticker
+
+        Raises:
+            ExchangeTickerInvalid: Exchange ticker can't be None type
+            ExchangeTickerInvalid: Exchange ticker too short or long. Must be 5 to 7 characters
+            ExchangeTickerInvalid: Exchange ticker must be of form MaterialTicker.ExchangeCode
+            ExchangeTickerInvalid: Material ticker part of Exchange ticker invalid
+        """
+        validate_exchange_ticker(exchange_ticker=exchange_ticker)
+
+    # /exchange/{ExchangeTicker}
+    @instrumented
+    async def get(
+        self, exchange_ticker: str, timeout: Optional[float] = None
+    ) -> ExchangeTickerFull:
+        """Gets a single exchange ticker from FIO
+
+        Args:
+            exchange_ticker (str): Exchange Ticker (e.g., "DW.AI1")
+            timeout (float, optional): Request timeout in seconds. Defaults to None.
+
+        Raises:
+            ExchangeTickerNotFound: Exchange ticker was not found
+
+        Returns:
+            ExchangeTicker: Exchange ticker
+        """
+        self._validate_exchangeticker(exchange_ticker=exchange_ticker)
+
+        ticker = self._bulk_get(
+            "exchange",
+            exchange_ticker,
+            ExchangeTickerNotFound("Exchangeticker not found"),
+        )
+        if ticker is not None:
+            return ticker
+
+        (status, data) = await self.adapter.get(
+            endpoint=self.urls.exchange_get_url(exchange_ticker=exchange_ticker),
+            err_codes=[204],
+            timeout=timeout,
+            raw=True,
+        )
+
+        if status == 200:
+            return ExchangeTickerFull.model_validate_json(data)
+        elif status == 204:
+            raise ExchangeTickerNotFound("Exchangeticker not found")
+
+    # /exchange/all
+    @instrumented
+    async def all(
+        self, timeout: Optional[float] = None, pause_gc: Optional[bool] = None
+    ) -> ExchangeTickerList:
+        """Gets all simple exchange ticker from FIO
+
+        Args:
+            timeout (float, optional): Request timeout in seconds. Defaults to None.
+            pause_gc (bool, optional): Build with the garbage collector of the whole process paused. Defaults to None, using configuration.
+
+        Returns:
+            ExchangeTickerList: Exchange ticker
+        """
+        (_, data) = await self.adapter.get(
+            endpoint=self.urls.exchange_get_all_url(), timeout=timeout, raw=True
+        )
+
+        return validate_json(
+            ExchangeTickerList, data, pause_gc=self._pause_gc(pause_gc)
+        )
+
+    # /exchange/full
+    @instrumented
+    async def full(
+        self,
+        timeout: Optional[float] = None,
+        pause_gc: Optional[bool] = None,
+        lazy: bool = False,
+    ) -> Union[ExchangeTickerFullList, LazyList]:
+        """Gets a complete list of all exchange information from FIO
+
+        Args:
+            timeout (float, optional): Request timeout in seconds. Defaults to None.
+            pause_gc (bool, optional): Build with the garbage collector of the whole process paused. Defaults to None, using configuration.
+            lazy (bool, optional): Validate items on first access. Defaults to False.
+
+        Returns:
+            Union[ExchangeTickerFullList, LazyList]: Exchange ticker full
+        """
+        (_, data) = await self.adapter.get(
+            endpoint=self.urls.exchange_get_full_url(), timeout=timeout, raw=not lazy
+        )
+
+        if lazy:
+            return LazyList(ExchangeTickerFullList, data)
+
+        return self._bulk_put(
+            "exchange",
+            validate_json(
+                ExchangeTickerFullList, data, pause_gc=self._pause_gc(pause_gc)
+            ),
+        )
+
+    # /exchange/full, streamed
+    async def iter_full(
+        self, timeout: Optional[float] = None
+    ) -> AsyncIterator[ExchangeTickerFull]:
+        """Iterates the complete exchange information from FIO
+
+        The response is parsed incrementally, only one exchange ticker is held in
+        memory at a time.
+
+        Args:
+            timeout (float, optional): Request timeout in seconds. Defaults to None.
+
+        Yields:
+            AsyncIterator[ExchangeTickerFull]: Exchange ticker full
+        """
+        async for item in self.adapter.stream(
+            endpoint=self.urls.exchange_get_full_url(), timeout=timeout
+        ):
+            yield ExchangeTickerFull.model_validate(item)
+
+    # /exchange/orders/{CompanyCode}
+    @instrumented
+    async def get_orders(
+        self, company_code: str, timeout: Optional[float] = None
+    ) -> OrderList:
+        """Gets a companies order data from FIO
+
+        Args:
+            company_code (str): Company code (1-4 characters)
+            timeout (float, optional): Request timeout in seconds. Defaults to None.
+
+        Returns:
+            OrderList: Orders
+        """
+        # 1 to 4 character company code
+        validate_company_code(company_code=company_code)
+
+        (_, data) = await self.adapter.get(
+            endpoint=self.urls.exchange_get_orders_companycode(
+                company_code=company_code
+            ),
+            timeout=timeout,
+            raw=True,
+        )
+
+        return OrderList.model_validate_json(data)
+
+    # /exchange/orders/{CompanyCode}/{ExchangeCode}
+    @instrumented
+    async def get_orders_exchange(
+        self, company_code: str, exchange_code: str, timeout: Optional[float] = None
+    ) -> OrderList:
+        """Gets a companies order data for a specific exchange from FIO
+
+        Args:
+            company_code (str): Company code (1-4 characters)
+            exchange_code (str): Exchange code (e.g., "AI1")
+            timeout (float, optional): Request timeout in seconds. Defaults to None.
+
+        Returns:
+            OrderList: Orders
+        """
+        validate_company_code(company_code=company_code)
+        validate_exchange_code(exchange_code=exchange_code)
+
+        (_, data) = await self.adapter.get(
+            endpoint=self.urls.exchange_get_orders_companycode_exchange(
+                company_code=company_code, exchange_code=exchange_code
+            ),
+            timeout=timeout,
+            raw=True,
+        )
+
+        return OrderList.model_validate_json(data)
+
+    # /exchange/{ExchangeTicker}, batched
+    async def get_many(
+        self,
+        exchange_tickers: List[str],
+        timeout: Optional[float] = None,
+        max_workers: Optional[int] = None,
+    ) -> BatchResult:
+        """Gets multiple exchange tickers from FIO concurrently
+
+        Args:
+            exchange_tickers (List[str]): Exchange Tickers (e.g., ["DW.AI1", "RAT.NC1"])
+            timeout (float, optional): Request timeout in seconds. Defaults to None.
+            max_workers (int, optional): Maximum concurrent requests. Defaults to None, using configuration.
+
+        Returns:
+            BatchResult: ExchangeTickerFull by input, errors (e.g., ExchangeTickerNotFound) by input
+        """
+        return await self._get_many(
+            func=lambda exchange_ticker: self.get(exchange_ticker, timeout=timeout),
+            keys=exchange_tickers,
+            max_workers=max_workers,
+        )
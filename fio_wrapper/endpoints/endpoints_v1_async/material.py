@@ -0,0 +1,174 @@
+"""Asynchronously access material information from FIO.
+"""
+from typing import AsyncIterator, List, Optional, Union
+from fio_wrapper.decorator import instrumented
+from fio_wrapper.endpoints.abstracts.abstract_async_endpoint import (
+    AbstractAsyncEndpoint,
+)
+from fio_wrapper.endpoints.abstracts.abstract_material import AbstractMaterial
+from fio_wrapper.batch import BatchResult
+from fio_wrapper.validators import validate_ticker
+from fio_wrapper.models.material_models import MaterialTicker, MaterialTickerList
+from fio_wrapper.exceptions import MaterialTickerNotFound, MaterialCategoryNotFound
+from fio_wrapper.gc_pause import validate_json
+from fio_wrapper.models.lazy_models import LazyList
+
+
+class Material(AbstractMaterial, AbstractAsyncEndpoint):
+    def _validate_ticker(self, material_ticker: str) -> None:
+        """Validates a material ticker
+
+        Args:
+            material_ticker (str): Material ticker
+            timeout (float, optional): Request timeout in seconds. Defaults to None.
+
+        Raises:
+            MaterialTickerInvalid: Material ticker can't be None type
+            MaterialTickerInvalid: Material ticker can't be longer than 3 characters
+            MaterialTickerInvalid: Material ticker can't be shorter than 1 character
+            MaterialTickerInvalid: Material ticker can't contain spaces
+        """
+        validate_ticker(material_ticker=material_ticker)
+
+    @instrumented
+    async def get(
+        self, material_ticker: str, timeout: Optional[float] = None
+    ) -> MaterialTicker:
+        """Gets a single material from FIO
+
+        Args:
+            material_ticker (str): Material Ticker (e.g., "DW")
+            timeout (float, optional): Request timeout in seconds. Defaults to None.
+
+        Raises:
+            MaterialTickerNotFound: Material Ticker was not found
+
+        Returns:
+            MaterialModel: Material
+        """
+
+        self._validate_ticker(material_ticker=material_ticker)
+
+        material = self._bulk_get(
+            "materials",
+            material_ticker,
+            MaterialTickerNotFound("Materialticker not found"),
+        )
+        if material is not None:
+            return material
+
+        (status, data) = await self.adapter.get(
+            endpoint=self.urls.material_get_url(material_ticker=material_ticker),
+            err_codes=[204],
+            timeout=timeout,
+            raw=True,
+        )
+
+        if status == 200:
+            return MaterialTicker.model_validate_json(data)
+        elif status == 204:
+            raise MaterialTickerNotFound("Materialticker not found")
+
+    @instrumented
+    async def all(
+        self,
+        timeout: Optional[float] = None,
+        pause_gc: Optional[bool] = None,
+        lazy: bool = False,
+    ) -> Union[MaterialTickerList, LazyList]:
+        """Gets all materials from FIO
+
+        Args:
+            timeout (float, optional): Request timeout in seconds. Defaults to None.
+            pause_gc (bool, optional): Build with the garbage collector of the whole process paused. Defaults to None, using configuration.
+            lazy (bool, optional): Validate items on first access. Defaults to False.
+
+        Returns:
+            Union[MaterialTickerList, LazyList]: List of Materials as List[MaterialModel]
+        """
+        (_, data) = await self.adapter.get(
+            endpoint=self.urls.material_allmaterials_url(),
+            timeout=timeout,
+            raw=not lazy,
+        )
+        if lazy:
+            return LazyList(MaterialTickerList, data)
+
+        return self._bulk_put(
+            "materials",
+            validate_json(MaterialTickerList, data, pause_gc=self._pause_gc(pause_gc)),
+        )
+
+    # /material/allmaterials, streamed
+    async def iter_all(
+        self, timeout: Optional[float] = None
+    ) -> AsyncIterator[MaterialTicker]:
+        """Iterates all materials from FIO
+
+        The response is parsed incrementally, only one material is held in memory
+        at a time.
+
+        Args:
+            timeout (float, optional): Request timeout in seconds. Defaults to None.
+
+        Yields:
+            AsyncIterator[MaterialTicker]: Material
+        """
+        async for item in self.adapter.stream(
+            endpoint=self.urls.material_allmaterials_url(), timeout=timeout
+        ):
+            yield MaterialTicker.model_validate(item)
+
+    @instrumented
+    async def category(
+        self, category_name: str, timeout: Optional[float] = None
+    ) -> MaterialTickerList:
+        """Gets all materials of specified category
+
+        Args:
+            category_name (str): Category name (e.g., "agricultural products")
+            timeout (float, optional): Request timeout in seconds. Defaults to None.
+
+        Raises:
+            MaterialCategoryNotFound: Category was not found
+
+        Returns:
+            MaterialModelList: List of Materials as List[MaterialModel]
+        """
+        materials = self._bulk_index("materials")
+        if materials is not None:
+            return materials.category(category_name)
+
+        (status, data) = await self.adapter.get(
+            endpoint=self.urls.material_get_category(category_name=category_name),
+            err_codes=[204],
+            timeout=timeout,
+        )
+
+        if status == 200 and len(data) > 0:
+            return MaterialTickerList.model_validate(data)
+        elif status == 204 or len(data) == 0:
+            raise MaterialCategoryNotFound("Material category not found")
+
+    # /material/{MaterialTicker}, batched
+    async def get_many(
+        self,
+        material_tickers: List[str],
+        timeout: Optional[float] = None,
+        max_workers: Optional[int] = None,
+    ) -> BatchResult:
+        """Gets multiple materials from FIO concurrently
+
+        Args:
+            material_tickers (List[str]): Material Tickers (e.g., ["DW", "RAT"])
+            timeout (float, optional): Request timeout in seconds. Defaults to None.
+            max_workers (int, optional): Maximum concurrent requests. Defaults to None, using configuration.
+
+        Returns:
+            BatchResult: MaterialTicker by input, errors (e.g., MaterialTickerNotFound) by input
+        """
+        return await self._get_many(
+            func=lambda material_ticker: self.get(material_ticker, timeout=timeout),
+            keys=material_tickers,
+            max_workers=max_workers,
+        )
@@ -0,0 +1,86 @@
+"""Asynchronously access recipe information from FIO.
+"""
+from typing import List, Optional, Union
+from fio_wrapper.decorator import instrumented
+from fio_wrapper.endpoints.abstracts.abstract_async_endpoint import (
+    AbstractAsyncEndpoint,
+)
+from fio_wrapper.endpoints.abstracts.abstract_recipe import AbstractRecipe
+from fio_wrapper.batch import BatchResult
+from fio_wrapper.models.recipe_models import MaterialRecipeList, RecipeList
+from fio_wrapper.gc_pause import validate_json
+from fio_wrapper.models.lazy_models import LazyList
+
+
+class Recipe(AbstractRecipe, AbstractAsyncEndpoint):
+    # /recipes/{Ticker}
+    @instrumented
+    async def get(
+        self, material_ticker: str, timeout: Optional[float] = None
+    ) -> MaterialRecipeList:
+        """Gets all recipes for given material from FIO
+
+        Args:
+            material_ticker (str): Material Ticker (e.g. "FE")
+            timeout (float, optional): Request timeout in seconds. Defaults to None.
+
+        Returns:
+            MaterialRecipeList: List of Recipes as List[MaterialRecipeList]
+        """
+        (_, data) = await self.adapter.get(
+            endpoint=self.urls.recipe_get_url(material_ticker=material_ticker),
+            timeout=timeout,
+            raw=True,
+        )
+
+        return MaterialRecipeList.model_validate_json(data)
+
+    # /recipes/allrecipes
+    @instrumented
+    async def all(
+        self,
+        timeout: Optional[float] = None,
+        pause_gc: Optional[bool] = None,
+        lazy: bool = False,
+    ) -> Union[RecipeList, LazyList]:
+        """Gets all recipes from FIO
+
+        Args:
+            timeout (float, optional): Request timeout in seconds. Defaults to None.
+            pause_gc (bool, optional): Build with the garbage collector of the whole process paused. Defaults to None, using configuration.
+            lazy (bool, optional): Validate items on first access. Defaults to False.
+
+        Returns:
+            Union[RecipeList, LazyList]: List of Recipes as List[RecipeList]
+        """
+        (_, data) = await self.adapter.get(
+            endpoint=self.urls.recipe_get_all_url(), timeout=timeout, raw=not lazy
+        )
+
+        if lazy:
+            return LazyList(RecipeList, data)
+
+        return validate_json(RecipeList, data, pause_gc=self._pause_gc(pause_gc))
+
+    # /recipes/{Ticker}, batched
+    async def get_many(
+        self,
+        material_tickers: List[str],
+        timeout: Optional[float] = None,
+        max_workers: Optional[int] = None,
+    ) -> BatchResult:
+        """Gets all recipes for multiple materials from FIO concurrently
+
+        Args:
+            material_tickers (List[str]): Material Tickers (e.g., ["FE", "AL"])
+            timeout (float, optional): Request timeout in seconds. Defaults to None.
+            max_workers (int, optional): Maximum concurrent requests. Defaults to None, using configuration.
+
+        Returns:
+            BatchResult: MaterialRecipeList by input, errors (e.g., UnknownFIOResponse) by input
+        """
+        return await self._get_many(
+            func=lambda material_ticker: self.get(material_ticker, timeout=timeout),
+            keys=material_tickers,
+            max_workers=max_workers,
+        )
@@ -21,6 +21,14 @@ class UnknownConfig(Exception):
     """Configuration not available"""
 
 
+class MissingDependency(Exception):
+    """Optional dependency required for this feature is not installed"""
+
+
+class RateLimitTimeout(Exception):
+    """Request waited longer than allowed for the client-side rate limiter"""
+
+
 # Material
 
 
@@ -58,6 +66,17 @@ class BuildingTickerNotFound(Exception):
     """Building ticker not found"""
 
 
+# Recipe
+
+
+class RecipeNotFound(Exception):
+    """Recipe not found"""
+
+
+class ProductionCycleError(Exception):
+    """Recipes of a production cycle consume at least what they produce"""
+
+
 # Planet
 
 
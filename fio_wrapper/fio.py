@@ -1,21 +1,28 @@
 """FIO class to access game data through FIO REST API endpoints
 """
+import importlib
+import threading
 from typing import Dict, Optional
 from fio_wrapper.config import Config
 from fio_wrapper.fio_adapter import FIOAdapter
 from fio_wrapper.exceptions import EndpointNotImplemented
-
-from fio_wrapper.endpoints.endpoints_v1 import building as building_v1
-from fio_wrapper.endpoints.endpoints_v1 import exchange as exchange_v1
-from fio_wrapper.endpoints.endpoints_v1 import localmarket as localmarket_v1
-from fio_wrapper.endpoints.endpoints_v1 import material as material_v1
-from fio_wrapper.endpoints.endpoints_v1 import planet as planet_v1
-from fio_wrapper.endpoints.endpoints_v1 import recipe as recipe_v1
-from fio_wrapper.endpoints.endpoints_v1 import sites as sites_v1
-from fio_wrapper.endpoints.endpoints_v1 import storage as storage_v1
-from fio_wrapper.endpoints.endpoints_v1 import group as group_v1
 from fio_wrapper.urls import URLs
 
+# endpoint modules by attribute, imported on first access of the attribute
+ENDPOINTS_V1: Dict[str, str] = {
+    "Building": "fio_wrapper.endpoints.endpoints_v1.building",
+    "Exchange": "fio_wrapper.endpoints.endpoints_v1.exchange",
+    "Group": "fio_wrapper.endpoints.endpoints_v1.group",
+    "LocalMarket": "fio_wrapper.endpoints.endpoints_v1.localmarket",
+    "Material": "fio_wrapper.endpoints.endpoints_v1.material",
+    "Planet": "fio_wrapper.endpoints.endpoints_v1.planet",
+    "Recipe": "fio_wrapper.endpoints.endpoints_v1.recipe",
+    "Sites": "fio_wrapper.endpoints.endpoints_v1.sites",
+    "Storage": "fio_wrapper.endpoints.endpoints_v1.storage",
+}
+
+_endpoint_lock = threading.Lock()
+
 
 class FIO:
     """FIO API wrapper class
@@ -45,6 +52,7 @@ class FIO:
         timeout: Optional[float] = None,
         ssl_verify: Optional[bool] = True,
         config: Optional[str] = None,
+        pause_gc: Optional[bool] = None,
     ) -> None:
         """Initializes the FIO wrapper
 
@@ -56,6 +64,7 @@ class FIO:
             timeout (float, optional): Request timeout. Defaults to None.
             ssl_verify (bool, optional): Verify https connection. Defaults to True.
             config: (str, optional): User specified configuration file. Defaults to None.
+            pause_gc (bool, optional): Pause the garbage collector of the whole process while building bulk responses. Defaults to None.
 
         Raises:
             EndpointNotImplemented: _description_
@@ -71,6 +80,7 @@ class FIO:
             timeout=timeout,
             ssl_verify=ssl_verify,
             user_config=config,
+            pause_gc=pause_gc,
         )
 
         # Check version availability
@@ -83,17 +93,33 @@ class FIO:
         # create urls
         self.urls: URLs = URLs(self.config)
 
-        # add version 1.0.0 endpoints
-        if self.config.version == "1.0.0":
-            self.Building = building_v1.Building(self.adapter, self.urls)
-            self.Exchange = exchange_v1.Exchange(self.adapter, self.urls)
-            self.Group = group_v1.Group(self.adapter, self.urls)
-            self.LocalMarket = localmarket_v1.LocalMarket(self.adapter, self.urls)
-            self.Material = material_v1.Material(self.adapter, self.urls)
-            self.Planet = planet_v1.Planet(self.adapter, self.urls)
-            self.Recipe = recipe_v1.Recipe(self.adapter, self.urls)
-            self.Sites = sites_v1.Sites(self.adapter, self.urls)
-            self.Storage = storage_v1.Storage(self.adapter, self.urls)
+    def __getattr__(self, name: str) -> any:
+        """Creates a version 1.0.0 endpoint on first access
+
+        Endpoint modules, and the models they validate with, are only imported
+        once an endpoint is used.
+
+        Args:
+            name (str): Endpoint attribute, e.g. "Material"
+
+        Raises:
+            AttributeError: Not an endpoint of the configured version
+
+        Returns:
+            any: Endpoint sharing the adapter and urls
+        """
+        config = self.__dict__.get("config")
+        if name not in ENDPOINTS_V1 or config is None or config.version != "1.0.0":
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+
+        with _endpoint_lock:
+            if name not in self.__dict__:
+                module = importlib.import_module(ENDPOINTS_V1[name])
+                self.__dict__[name] = getattr(module, name)(self.adapter, self.urls)
+
+        return self.__dict__[name]
 
     def get_header(self) -> Dict[str, str]:
         """Creates the header to be included in calls towards FIO
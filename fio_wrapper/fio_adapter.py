@@ -1,17 +1,39 @@
 """Request adapter performing actual API calls towards FIO endpoints
 """
 import logging
+import os
+import threading
+import time
+from typing import Callable
 from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Optional
 from typing import Tuple
 import importlib.util
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.packages.urllib3.exceptions import InsecureRequestWarning
 from fio_wrapper.config import Config
 
+from fio_wrapper.bulk import BulkStore
+from fio_wrapper.decoder import get_decoder
 from fio_wrapper.exceptions import UnknownFIOResponse
+from fio_wrapper import fork
+from fio_wrapper.instrumentation import (
+    Hook,
+    RequestEvent,
+    current_event,
+    emit,
+    reset_event,
+    set_event,
+)
+from fio_wrapper.ratelimit import RateLimiter
+from fio_wrapper.retry import RetryPolicy
+from fio_wrapper.singleflight import SingleFlight
+from fio_wrapper.stats import AdapterStats
+from fio_wrapper.streaming import iter_json_array
 
 logger = logging.getLogger(__name__)
 
@@ -35,23 +57,246 @@ class FIOAdapter:
         if not self.ssl_verify:
             requests.packages.urllib3.disable_warnings(category=InsecureRequestWarning)
 
-        # register a session based on requests.session or, if installed
-        # requests-cache session handler
+        # every thread sends through its own session, all sessions share one
+        # connection pool and, if requests-cache is installed, one cache
+        self._cache = self._create_cache()
+        self._pool = self._create_pool()
+        self._local = threading.local()
 
-        if self.config.cache and importlib.util.find_spec("requests_cache") is not None:
-            logger.debug("Using requests-cache Session")
+        # forked child processes recreate connections and sessions
+        self._pid = os.getpid()
+        fork.register(self)
+
+        # identical GET requests in flight at the same time share one call
+        self._singleflight = SingleFlight() if self.config.coalesce else None
+
+        # orjson or msgspec, if installed, decode large bulk responses faster
+        self._decode = get_decoder(self.config.json_decoder)
+
+        # instrumentation hooks receiving a RequestEvent per call
+        self._hooks: List[Hook] = []
+
+        # transient failures of GET requests are retried within a budget
+        self.stats = AdapterStats()
+        self._retry = RetryPolicy.from_config(self.config, self.stats)
+
+        # single item endpoints answered from recently fetched bulk results
+        self.bulk = BulkStore(self.config.bulk_max_age) if self.config.bulk else None
+
+        # buckets shared per API key and host by all adapters of the process
+        self._rate_limiter = (
+            RateLimiter(self.config, self.header.get("Authorization"))
+            if self.config.rate_limit
+            else None
+        )
+
+    def _create_cache(self) -> Optional[any]:
+        """Creates the cache backend shared by the sessions of all threads
+
+        Returns:
+            Optional[any]: requests-cache backend, None if caching is disabled or
+                requests-cache is not installed
+        """
+        if not self.config.cache or importlib.util.find_spec("requests_cache") is None:
+            return None
+
+        logger.debug("Using requests-cache with %s backend", self.config.cache_backend)
+        from requests_cache import init_backend
+
+        # the sqlite and filesystem backends lock themselves, memory needs it
+        if self.config.cache_backend == "memory":
+            from fio_wrapper.memory_cache import MemoryCache
+
+            return MemoryCache(cache_name=self.config.cache_path)
+
+        backend_options = {}
+        # allow concurrent readers across processes sharing the database
+        if self.config.cache_backend == "sqlite":
+            backend_options["wal"] = True
+
+        return init_backend(
+            self.config.cache_path, self.config.cache_backend, **backend_options
+        )
+
+    def _create_pool(self) -> HTTPAdapter:
+        """Creates the connection pools shared by the sessions of all threads
+
+        Returns:
+            HTTPAdapter: Connection pools sized by the configuration
+        """
+        logger.debug(
+            "Connection pools: %d of %d connections, block: %s, keep-alive: %s",
+            self.config.pool_connections,
+            self.config.pool_maxsize,
+            self.config.pool_block,
+            self.config.keep_alive,
+        )
+
+        return HTTPAdapter(
+            pool_connections=self.config.pool_connections,
+            pool_maxsize=self.config.pool_maxsize,
+            pool_block=self.config.pool_block,
+        )
+
+    def _create_session(self) -> requests.Session:
+        """Creates the session of the calling thread
+
+        Returns:
+            requests.Session: Plain or cached session using the shared pool
+        """
+        if self._cache is not None:
             from requests_cache import CachedSession
 
-            self._session = CachedSession(
-                cache_name="fio_wrapper",
-                backend="memory",
+            session = CachedSession(
+                backend=self._cache,
                 expire_after=self.config.cache_default_expire,
                 urls_expire_after=self.config.cache_url_expirations(),
                 cache_control=False,
             )
         else:
-            logger.debug("Using request Session")
-            self._session = requests.session()
+            session = requests.session()
+
+        session.mount("https://", self._pool)
+        session.mount("http://", self._pool)
+
+        if not self.config.keep_alive:
+            session.headers["Connection"] = "close"
+
+        return session
+
+    @property
+    def _session(self) -> requests.Session:
+        """Gets the session of the calling thread, created on first use
+
+        requests does not guarantee Session to be thread-safe. Sessions are
+        therefore kept per thread, sharing the thread-safe connection pool and
+        cache backend, so one adapter can be used by any number of threads.
+
+        Returns:
+            requests.Session: Session of the calling thread
+        """
+        if self._pid != os.getpid():
+            self.after_fork()
+
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = self._create_session()
+
+        return session
+
+    def close_connections(self) -> None:
+        """Closes all pooled connections
+
+        Sessions keep working, connections are opened again when needed.
+        """
+        self._pool.close()
+
+    def after_fork(self) -> None:
+        """Drops the state of the parent process in a forked child
+
+        Connections and sessions of the parent are replaced, as they would
+        share sockets with it, and calls in flight in the parent are forgotten.
+        Memory cache entries are kept, persistent backends are opened again.
+        Locks of the stats, retry budget and bulk store are replaced.
+        """
+        logger.debug("Resetting adapter in forked process %d", os.getpid())
+        self._pid = os.getpid()
+        self._pool = self._create_pool()
+        self._local = threading.local()
+        self.stats.after_fork()
+        self._retry.budget.after_fork()
+
+        if self._singleflight is not None:
+            self._singleflight = SingleFlight()
+
+        if self.bulk is not None:
+            self.bulk.after_fork()
+
+        if self._cache is not None:
+            if self.config.cache_backend == "memory":
+                self._cache.after_fork()
+            else:
+                self._cache = self._create_cache()
+
+    def add_hook(self, hook: Hook) -> None:
+        """Registers an instrumentation hook
+
+        The hook is called with a RequestEvent after every endpoint call and every
+        direct adapter request. Exceptions raised by hooks are logged and ignored.
+
+        Args:
+            hook (Hook): Callable receiving a RequestEvent
+        """
+        self._hooks.append(hook)
+
+    def remove_hook(self, hook: Hook) -> None:
+        """Removes a registered instrumentation hook
+
+        Args:
+            hook (Hook): Registered hook
+
+        Raises:
+            ValueError: Hook not registered
+        """
+        self._hooks.remove(hook)
+
+    def _request_key(
+        self,
+        endpoint: str,
+        params: Optional[Dict],
+        err_codes: Optional[List[int]],
+        raw: bool = False,
+    ) -> Tuple:
+        """Creates the coalescing key of a GET request
+
+        Args:
+            endpoint (str): URL
+            params (Dict, optional): GET parameters
+            err_codes (List[int], optional): List of error codes handled by caller
+            raw (bool, optional): Undecoded response body requested. Defaults to False.
+
+        Returns:
+            Tuple: URL, parameters, authorization, handled error codes and body type
+        """
+        return (
+            endpoint,
+            tuple(
+                sorted(
+                    (key, tuple(value) if isinstance(value, list) else value)
+                    for key, value in (params or {}).items()
+                )
+            ),
+            self.header.get("Authorization") if self.header else None,
+            tuple(sorted(err_codes)) if isinstance(err_codes, List) else None,
+            raw,
+        )
+
+    def _instrument(self, call: Callable[[], Tuple[int, any]]) -> Tuple[int, any]:
+        """Reports a direct adapter call to the instrumentation hooks
+
+        Args:
+            call (Callable[[], Tuple[int, any]]): Request to perform
+
+        Returns:
+            Tuple[int, any]: Result of the call
+        """
+        # endpoint calls are instrumented by the endpoint decorator
+        if current_event() is not None or len(self._hooks) == 0:
+            return call()
+
+        event = RequestEvent()
+        token = set_event(event)
+        start = time.perf_counter()
+
+        try:
+            return call()
+        except BaseException as exc:
+            event.error = exc
+            raise
+        finally:
+            event.total_time = time.perf_counter() - start
+            reset_event(token)
+            emit(self._hooks, event)
 
     def _do(
         self,
@@ -61,29 +306,91 @@ class FIOAdapter:
         data: Dict = None,
         err_codes: Optional[List[int]] = None,
         timeout: Optional[float] = None,
+        raw: bool = False,
     ) -> Tuple[int, any]:
+        event = current_event()
+        retry = http_method.upper() == "GET"
+        attempt = 0
+        self._retry.budget.deposit()
+
         try:
-            logger.debug(
-                "Calling (%s) %s with params: %s | data: %s",
-                http_method,
-                endpoint,
-                params,
-                data,
-            )
+            while True:
+                logger.debug(
+                    "Calling (%s) %s with params: %s | data: %s",
+                    http_method,
+                    endpoint,
+                    params,
+                    data,
+                )
 
-            response = self._session.request(
-                method=http_method,
-                url=endpoint,
-                verify=self.ssl_verify,
-                headers=self.header,
-                params=params,
-                json=data,
-                timeout=timeout if timeout is not None else self.timeout,
-            )
+                self._throttle(endpoint, timeout, event)
+                self.stats.increment("requests")
+                request_start = time.perf_counter()
+
+                try:
+                    response = self._session.request(
+                        method=http_method,
+                        url=endpoint,
+                        verify=self.ssl_verify,
+                        headers=self.header,
+                        params=params,
+                        json=data,
+                        timeout=timeout if timeout is not None else self.timeout,
+                    )
+                except requests.exceptions.ConnectionError as exc:
+                    if event is not None:
+                        event.network_time += time.perf_counter() - request_start
+                        event.requests += 1
+
+                    # certificate errors are not transient
+                    if not retry or isinstance(exc, requests.exceptions.SSLError):
+                        raise
+
+                    delay = self._retry.delay(attempt)
+                    if delay is None:
+                        raise
+
+                    self._backoff(endpoint, delay, exc, event)
+                    attempt += 1
+                    continue
+
+                if event is not None:
+                    event.network_time += time.perf_counter() - request_start
+                    event.requests += 1
+                    event.method = http_method
+                    event.url = endpoint
+                    event.status = response.status_code
+                    event.bytes_received += len(response.content)
+                    event.cache_hit = getattr(response, "from_cache", None)
+
+                if retry and self._retry.retryable_status(
+                    response.status_code, err_codes
+                ):
+                    delay = self._retry.delay(
+                        attempt, response.headers.get("Retry-After")
+                    )
+                    if delay is not None:
+                        self._backoff(endpoint, delay, response.status_code, event)
+                        attempt += 1
+                        continue
+
+                break
 
             # successful FIO response
             if response.status_code == 200:
-                return 200, response.json()
+                if raw:
+                    return 200, response.content
+
+                decode_start = time.perf_counter()
+                try:
+                    decoded = self._decode(response.content)
+                except ValueError as exc:
+                    raise UnknownFIOResponse() from exc
+
+                if event is not None:
+                    event.decode_time += time.perf_counter() - decode_start
+
+                return 200, decoded
             # FIO response in provided codes to catch in endpoint
             elif isinstance(err_codes, List) and response.status_code in err_codes:
                 return response.status_code, None
@@ -98,12 +405,60 @@ class FIOAdapter:
         except requests.exceptions.RequestException as e:
             raise SystemExit(e)
 
+    def _throttle(
+        self, endpoint: str, timeout: Optional[float], event: Optional[RequestEvent]
+    ) -> None:
+        """Waits for the rate limiter, if enabled
+
+        Args:
+            endpoint (str): URL
+            timeout (float, optional): Request timeout, limits the wait
+            event (RequestEvent, optional): Event of the call in progress
+
+        Raises:
+            RateLimitTimeout: Waited longer than allowed
+        """
+        if self._rate_limiter is None:
+            return
+
+        waited = self._rate_limiter.acquire(
+            endpoint, timeout if timeout is not None else self.timeout
+        )
+
+        if waited > 0:
+            self.stats.increment("rate_limited")
+            if event is not None:
+                event.wait_time += waited
+
+    def _backoff(
+        self,
+        endpoint: str,
+        delay: float,
+        reason: any,
+        event: Optional[RequestEvent],
+    ) -> None:
+        """Waits before retrying a failed request
+
+        Args:
+            endpoint (str): URL
+            delay (float): Seconds to wait
+            reason (any): Failure, status code or exception
+            event (RequestEvent, optional): Event of the call in progress
+        """
+        logger.info("Retrying %s in %.2f seconds after %s", endpoint, delay, reason)
+        time.sleep(delay)
+
+        if event is not None:
+            event.retries += 1
+            event.wait_time += delay
+
     def get(
         self,
         endpoint: str,
         params: Dict = None,
         err_codes: Optional[List[int]] = None,
         timeout: Optional[float] = None,
+        raw: bool = False,
     ) -> Tuple[int, any]:
         """Performs a GET request towards endpoint
 
@@ -112,17 +467,51 @@ class FIOAdapter:
             params (Dict, optional): GET parameters. Defaults to None.
             err_codes (List[int], optional): List of error codes to handle in calling function. Defaults to None.
             timeout (float, optional): Request timeout in seconds. Defaults to None.
+            raw (bool, optional): Return the undecoded response body. Defaults to False.
+
+        Note:
+            Concurrent calls with the same endpoint, params and authorization
+            share one request and its decoded data, unless coalescing is
+            disabled in the configuration.
 
         Returns:
-            Tuple[int, any]: Request status code and request data
-        """
-        return self._do(
-            http_method="GET",
-            endpoint=endpoint,
-            params=params,
-            err_codes=err_codes,
-            timeout=timeout,
-        )
+            Tuple[int, any]: Request status code and request data, response body bytes if raw
+        """
+
+        def do() -> Tuple[int, any]:
+            return self._do(
+                http_method="GET",
+                endpoint=endpoint,
+                params=params,
+                err_codes=err_codes,
+                timeout=timeout,
+                raw=raw,
+            )
+
+        if self._singleflight is None:
+            return self._instrument(do)
+
+        def coalesced() -> Tuple[int, any]:
+            executed = []
+
+            def do_once() -> Tuple[int, any]:
+                executed.append(True)
+                return do()
+
+            result = self._singleflight.do(
+                key=self._request_key(endpoint, params, err_codes, raw), func=do_once
+            )
+
+            event = current_event()
+            if event is not None and not executed:
+                event.coalesced = True
+                event.url = endpoint
+                event.method = "GET"
+                event.status = result[0]
+
+            return result
+
+        return self._instrument(coalesced)
 
     def post(
         self,
@@ -131,6 +520,7 @@ class FIOAdapter:
         data: Dict = None,
         err_codes: Optional[List[int]] = None,
         timeout: Optional[float] = None,
+        raw: bool = False,
     ) -> Tuple[int, any]:
         """Performs a POST request towards endpoint
 
@@ -140,15 +530,73 @@ class FIOAdapter:
             data (Dict, optional): POST data. Defaults to None.
             err_codes (List[int], optional): List of error codes to handle in calling function. Defaults to None.
             timeout (float): Request timeout in seconds. Defaults to None.
+            raw (bool, optional): Return the undecoded response body. Defaults to False.
 
         Returns:
-            Tuple[int, any]: Request status code and request data
-        """
-        return self._do(
-            http_method="POST",
-            endpoint=endpoint,
-            params=params,
-            data=data,
-            err_codes=err_codes,
-            timeout=timeout,
+            Tuple[int, any]: Request status code and request data, response body bytes if raw
+        """
+        return self._instrument(
+            lambda: self._do(
+                http_method="POST",
+                endpoint=endpoint,
+                params=params,
+                data=data,
+                err_codes=err_codes,
+                timeout=timeout,
+                raw=raw,
+            )
         )
+
+    def stream(
+        self,
+        endpoint: str,
+        params: Dict = None,
+        timeout: Optional[float] = None,
+        chunk_size: int = 65536,
+    ) -> Iterator[any]:
+        """Performs a streamed GET request towards an endpoint returning a JSON array
+
+        The response body is parsed incrementally while it is received, yielding
+        one decoded array element at a time. The request is sent once iteration
+        starts and the connection is released when iteration ends.
+
+        Args:
+            endpoint (str): URL
+            params (Dict, optional): GET parameters. Defaults to None.
+            timeout (float, optional): Request timeout in seconds. Defaults to None.
+            chunk_size (int, optional): Bytes read per chunk. Defaults to 65536.
+
+        Raises:
+            UnknownFIOResponse: FIO returned a non 200 response
+
+        Yields:
+            Iterator[any]: Decoded array elements
+        """
+        try:
+            logger.debug("Streaming (GET) %s with params: %s", endpoint, params)
+
+            self._throttle(endpoint, timeout, None)
+            self.stats.increment("requests")
+
+            response = self._session.request(
+                method="GET",
+                url=endpoint,
+                verify=self.ssl_verify,
+                headers=self.header,
+                params=params,
+                timeout=timeout if timeout is not None else self.timeout,
+                stream=True,
+            )
+
+            with response:
+                if response.status_code != 200:
+                    raise UnknownFIOResponse()
+
+                yield from iter_json_array(response.iter_content(chunk_size=chunk_size))
+
+        except requests.exceptions.Timeout as errt:
+            raise requests.exceptions.Timeout() from errt
+        except requests.exceptions.TooManyRedirects as errr:
+            raise requests.exceptions.TooManyRedirects from errr
+        except requests.exceptions.RequestException as e:
+            raise SystemExit(e)
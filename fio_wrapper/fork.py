@@ -0,0 +1,63 @@
+"""Fork safety of adapters in pre-fork servers such as gunicorn or uWSGI
+"""
+import gc
+import os
+import sys
+import weakref
+
+# adapters of this process, reset in the child after a fork
+_adapters: "weakref.WeakSet[any]" = weakref.WeakSet()
+
+# modules holding process wide locks or state, reset only if imported
+_MODULES = ("fio_wrapper.config", "fio_wrapper.gc_pause", "fio_wrapper.ratelimit")
+
+
+def register(adapter: any) -> None:
+    """Registers an adapter to be reset in forked child processes
+
+    Args:
+        adapter (any): Adapter providing after_fork()
+    """
+    _adapters.add(adapter)
+
+
+def after_fork_in_child() -> None:
+    """Resets all adapters and module state inherited from the parent process
+
+    Called by os.fork() in the child. Locks held by threads of the parent are
+    replaced and garbage collector pauses of the parent are ended. Adapters
+    also check the process id themselves, for forks bypassing Python's fork
+    hooks.
+    """
+    for name in _MODULES:
+        module = sys.modules.get(name)
+        if module is not None:
+            module.after_fork()
+
+    for adapter in list(_adapters):
+        adapter.after_fork()
+
+
+def prefork(freeze: bool = True) -> None:
+    """Prepares the adapters of this process to be forked into workers
+
+    Call it in the parent after warming the caches, right before the server
+    forks its workers. Pooled connections are closed, so no sockets are
+    inherited. With freeze, all objects alive, including cached responses, are
+    moved to the permanent generation of the garbage collector (gc.freeze).
+    Collections in the workers then do not write to their memory pages, and
+    the workers share the warm cache copy-on-write.
+
+    Args:
+        freeze (bool, optional): Freeze all objects alive. Defaults to True.
+    """
+    for adapter in list(_adapters):
+        adapter.close_connections()
+
+    if freeze:
+        gc.collect()
+        gc.freeze()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=after_fork_in_child)
@@ -0,0 +1,84 @@
+"""Building large responses with the garbage collector paused
+
+The cyclic garbage collector is a process wide switch: while a response is
+built, no thread of the process collects cyclic garbage. Validation itself is
+not affected, models are validated in full either way.
+"""
+import gc
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Type, TypeVar, Union
+
+from pydantic import BaseModel
+
+Model = TypeVar("Model", bound=BaseModel)
+
+_gc_lock = threading.Lock()
+_gc_pauses: int = 0
+_gc_was_enabled: bool = False
+
+
+@contextmanager
+def gc_paused() -> Iterator[None]:
+    """Pauses the cyclic garbage collector of the whole process
+
+    Building a bulk response allocates hundreds of thousands of objects. Every
+    allocation burst triggers a collection traversing all objects built so far,
+    which costs more than the validation itself. gc.disable() applies to every
+    thread of the process, other threads do not collect until the pause ends.
+    Pauses from multiple threads are counted, the collector is enabled again
+    once the last pause ends, if it was enabled before.
+    """
+    global _gc_pauses, _gc_was_enabled
+
+    with _gc_lock:
+        if _gc_pauses == 0:
+            _gc_was_enabled = gc.isenabled()
+            gc.disable()
+        _gc_pauses += 1
+
+    try:
+        yield
+    finally:
+        with _gc_lock:
+            # a fork inside the pause may have ended it already
+            if _gc_pauses > 0:
+                _gc_pauses -= 1
+                if _gc_pauses == 0 and _gc_was_enabled:
+                    gc.enable()
+
+
+def after_fork() -> None:
+    """Ends the pauses of the parent process in a forked child
+
+    Threads pausing the collector in the parent do not exist in the child, their
+    pauses would never end. The collector is enabled again if it was enabled
+    before the first pause.
+    """
+    global _gc_lock, _gc_pauses
+
+    _gc_lock = threading.Lock()
+    if _gc_pauses > 0:
+        _gc_pauses = 0
+        if _gc_was_enabled:
+            gc.enable()
+
+
+def validate_json(
+    model: Type[Model], data: Union[bytes, str], pause_gc: bool = False
+) -> Model:
+    """Creates model from a JSON response body
+
+    Args:
+        model (Type[Model]): Model class
+        data (Union[bytes, str]): JSON response body
+        pause_gc (bool, optional): Build with the garbage collector of the whole process paused. Defaults to False.
+
+    Returns:
+        Model: Model instance
+    """
+    if not pause_gc:
+        return model.model_validate_json(data)
+
+    with gc_paused():
+        return model.model_validate_json(data)
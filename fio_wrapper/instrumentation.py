@@ -0,0 +1,111 @@
+"""Per-request instrumentation events passed to adapter hooks
+"""
+import contextvars
+import logging
+from typing import Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class RequestEvent:
+    """Instrumentation of a single endpoint or adapter call
+
+    Times are in seconds. An endpoint call performing several requests sums their
+    sizes and times and keeps url and status of the last request.
+
+    Attributes:
+        endpoint (str): Endpoint method, e.g. "Group.hub", None for direct adapter calls
+        url_template (str): URL with call arguments replaced by their name, e.g. "https://rest.fnar.net/planet/{planet}"
+        url (str): Requested URL
+        method (str): HTTP method
+        status (int): HTTP status code
+        bytes_received (int): Size of the response body
+        cache_hit (bool): Response served from cache, None without cache
+        coalesced (bool): Response shared from an identical in-flight request
+        requests (int): Number of requests performed
+        retries (int): Number of requests repeated after a transient failure
+        network_time (float): Connecting, sending the request and receiving the response
+        decode_time (float): Decoding the JSON response into Python objects
+        wait_time (float): Waiting before retries and for the rate limiter
+        validation_time (float): Building and validating models, including JSON parsing of raw responses
+        total_time (float): Complete call
+        error (BaseException): Exception raised by the call
+    """
+
+    def __init__(self, endpoint: Optional[str] = None) -> None:
+        self.endpoint: Optional[str] = endpoint
+        self.url_template: Optional[str] = None
+        self.url: Optional[str] = None
+        self.method: Optional[str] = None
+        self.status: Optional[int] = None
+        self.bytes_received: int = 0
+        self.cache_hit: Optional[bool] = None
+        self.coalesced: bool = False
+        self.requests: int = 0
+        self.retries: int = 0
+        self.network_time: float = 0.0
+        self.decode_time: float = 0.0
+        self.wait_time: float = 0.0
+        self.validation_time: float = 0.0
+        self.total_time: float = 0.0
+        self.error: Optional[BaseException] = None
+
+    def __repr__(self) -> str:
+        return (
+            f"RequestEvent(endpoint={self.endpoint!r}, url={self.url!r}, "
+            f"status={self.status}, bytes={self.bytes_received}, "
+            f"cache_hit={self.cache_hit}, total={self.total_time:.4f}s)"
+        )
+
+
+Hook = Callable[[RequestEvent], None]
+
+_current_event: contextvars.ContextVar[Optional[RequestEvent]] = contextvars.ContextVar(
+    "fio_wrapper_request_event", default=None
+)
+
+
+def current_event() -> Optional[RequestEvent]:
+    """Gets the event of the endpoint call in progress
+
+    Returns:
+        Optional[RequestEvent]: Event, None outside of instrumented calls
+    """
+    return _current_event.get()
+
+
+def set_event(event: Optional[RequestEvent]) -> contextvars.Token:
+    """Sets the event of the endpoint call in progress
+
+    Args:
+        event (RequestEvent, optional): Event
+
+    Returns:
+        contextvars.Token: Token to reset the previous event
+    """
+    return _current_event.set(event)
+
+
+def reset_event(token: contextvars.Token) -> None:
+    """Restores the event before set_event
+
+    Args:
+        token (contextvars.Token): Token returned by set_event
+    """
+    _current_event.reset(token)
+
+
+def emit(hooks: List[Hook], event: RequestEvent) -> None:
+    """Passes event to all hooks
+
+    Exceptions raised by a hook are logged and do not affect the call.
+
+    Args:
+        hooks (List[Hook]): Registered hooks
+        event (RequestEvent): Completed event
+    """
+    for hook in list(hooks):
+        try:
+            hook(event)
+        except Exception:
+            logger.warning("Instrumentation hook %r failed", hook, exc_info=True)
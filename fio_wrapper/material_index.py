@@ -0,0 +1,211 @@
+"""In-memory index of materials by ticker, id, name and category
+"""
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from fio_wrapper.exceptions import MaterialCategoryNotFound, MaterialTickerNotFound
+from fio_wrapper.models.material_models import MaterialTicker, MaterialTickerList
+
+
+class MaterialIndex:
+    """Materials with constant time lookups
+
+    Tickers, names and categories are matched case-insensitively, material ids
+    exactly. Rows are ordered as the materials passed in, weights and volumes
+    are stored per row.
+
+    Attributes:
+        materials (List[MaterialTicker]): Materials by row
+        weights (array): Weight per row, float64
+        volumes (array): Volume per row, float64
+    """
+
+    def __init__(self, materials: Iterable[MaterialTicker]) -> None:
+        """Builds the index
+
+        Args:
+            materials (Iterable[MaterialTicker]): Materials, e.g. from Material.all()
+        """
+        self.materials: List[MaterialTicker] = list(materials)
+        self.weights: array = array("d", (m.Weight for m in self.materials))
+        self.volumes: array = array("d", (m.Volume for m in self.materials))
+
+        self._tickers: Dict[str, int] = {}
+        self._ids: Dict[str, int] = {}
+        self._names: Dict[str, int] = {}
+        self._categories: Dict[str, List[int]] = {}
+
+        for row, material in enumerate(self.materials):
+            self._tickers.setdefault(material.Ticker.casefold(), row)
+            self._ids.setdefault(material.MaterialId, row)
+            self._names.setdefault(material.Name.casefold(), row)
+            self._categories.setdefault(material.CategoryName.casefold(), []).append(
+                row
+            )
+
+    def __len__(self) -> int:
+        return len(self.materials)
+
+    def __iter__(self) -> Iterator[MaterialTicker]:
+        return iter(self.materials)
+
+    def __contains__(self, ticker: str) -> bool:
+        return ticker.casefold() in self._tickers
+
+    def row(self, ticker: str) -> int:
+        """Gets the row of a material
+
+        Args:
+            ticker (str): Material ticker (e.g., "DW")
+
+        Raises:
+            MaterialTickerNotFound: Material ticker not indexed
+
+        Returns:
+            int: Row in materials, weights and volumes
+        """
+        try:
+            return self._tickers[ticker.casefold()]
+        except KeyError:
+            raise MaterialTickerNotFound("Materialticker not found") from None
+
+    def get(self, ticker: str) -> Optional[MaterialTicker]:
+        """Gets a material by ticker
+
+        Args:
+            ticker (str): Material ticker (e.g., "DW")
+
+        Returns:
+            Optional[MaterialTicker]: Material, None if not indexed
+        """
+        row = self._tickers.get(ticker.casefold())
+        return None if row is None else self.materials[row]
+
+    def by_ticker(self, ticker: str) -> MaterialTicker:
+        """Gets a material by ticker
+
+        Args:
+            ticker (str): Material ticker (e.g., "DW")
+
+        Raises:
+            MaterialTickerNotFound: Material ticker not indexed
+
+        Returns:
+            MaterialTicker: Material
+        """
+        return self.materials[self.row(ticker)]
+
+    def by_id(self, material_id: str) -> MaterialTicker:
+        """Gets a material by id, e.g. of PlanetResource or Burn inventory
+
+        Args:
+            material_id (str): MaterialId
+
+        Raises:
+            MaterialTickerNotFound: Material id not indexed
+
+        Returns:
+            MaterialTicker: Material
+        """
+        try:
+            return self.materials[self._ids[material_id]]
+        except KeyError:
+            raise MaterialTickerNotFound("Material id not found") from None
+
+    def by_name(self, name: str) -> MaterialTicker:
+        """Gets a material by name
+
+        Args:
+            name (str): Material name (e.g., "drinkingWater")
+
+        Raises:
+            MaterialTickerNotFound: Material name not indexed
+
+        Returns:
+            MaterialTicker: Material
+        """
+        try:
+            return self.materials[self._names[name.casefold()]]
+        except KeyError:
+            raise MaterialTickerNotFound("Material name not found") from None
+
+    def ticker(self, material_id: str) -> str:
+        """Gets the ticker of a material id
+
+        Args:
+            material_id (str): MaterialId
+
+        Raises:
+            MaterialTickerNotFound: Material id not indexed
+
+        Returns:
+            str: Material ticker
+        """
+        return self.by_id(material_id).Ticker
+
+    def material_id(self, ticker: str) -> str:
+        """Gets the id of a material ticker
+
+        Args:
+            ticker (str): Material ticker (e.g., "DW")
+
+        Raises:
+            MaterialTickerNotFound: Material ticker not indexed
+
+        Returns:
+            str: MaterialId
+        """
+        return self.by_ticker(ticker).MaterialId
+
+    @property
+    def categories(self) -> List[str]:
+        """Gets the category names
+
+        Returns:
+            List[str]: Category names as provided by FIO, sorted
+        """
+        return sorted(
+            self.materials[rows[0]].CategoryName for rows in self._categories.values()
+        )
+
+    def category(self, category_name: str) -> MaterialTickerList:
+        """Gets all materials of a category
+
+        Args:
+            category_name (str): Category name (e.g., "agricultural products")
+
+        Raises:
+            MaterialCategoryNotFound: Category not indexed
+
+        Returns:
+            MaterialTickerList: Materials of the category
+        """
+        try:
+            rows = self._categories[category_name.casefold()]
+        except KeyError:
+            raise MaterialCategoryNotFound("Material category not found") from None
+
+        return MaterialTickerList.model_construct(
+            root=[self.materials[row] for row in rows]
+        )
+
+    def load(self, amounts: Dict[str, float]) -> Tuple[float, float]:
+        """Sums weight and volume of material amounts
+
+        Args:
+            amounts (Dict[str, float]): Amount by material ticker
+
+        Raises:
+            MaterialTickerNotFound: Material ticker not indexed
+
+        Returns:
+            Tuple[float, float]: Total weight and volume
+        """
+        weight = 0.0
+        volume = 0.0
+        for ticker, amount in amounts.items():
+            row = self.row(ticker)
+            weight += self.weights[row] * amount
+            volume += self.volumes[row] * amount
+
+        return weight, volume
@@ -0,0 +1,73 @@
+"""Thread-safe in-memory requests-cache backend shared by the sessions of an adapter
+
+Imported only if caching is enabled, requires requests-cache.
+"""
+import copy
+import threading
+from typing import Iterator
+
+from requests_cache import BaseCache, CachedResponse
+from requests_cache.backends.base import DictStorage
+from requests_cache.models.raw_response import CachedHTTPResponse
+
+
+class LockedDictStorage(DictStorage):
+    """Dictionary storage guarded by a lock
+
+    requests-cache's DictStorage hands out the stored response and rewinds its
+    body on every read, so threads reading the same response share one body
+    stream. Reads return a copy with its own body instead.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        self.lock = threading.RLock()
+        super().__init__(*args, **kwargs)
+
+    def __getitem__(self, key: str) -> any:
+        with self.lock:
+            item = self.data[key]
+
+        if isinstance(item, CachedResponse):
+            item = copy.copy(item)
+            item.raw = CachedHTTPResponse.from_cached_response(item)
+            item.cache_key = key
+
+        return item
+
+    def __setitem__(self, key: str, value: any) -> None:
+        with self.lock:
+            self.data[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        with self.lock:
+            del self.data[key]
+
+    def __contains__(self, key: object) -> bool:
+        with self.lock:
+            return key in self.data
+
+    def __iter__(self) -> Iterator[str]:
+        with self.lock:
+            return iter(list(self.data))
+
+    def __len__(self) -> int:
+        with self.lock:
+            return len(self.data)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.data.clear()
+
+
+class MemoryCache(BaseCache):
+    """In-memory cache backend safe to share between threads and sessions"""
+
+    def __init__(self, cache_name: str = "fio_wrapper", **kwargs) -> None:
+        super().__init__(cache_name=cache_name, **kwargs)
+        self.responses = LockedDictStorage()
+        self.redirects = LockedDictStorage()
+
+    def after_fork(self) -> None:
+        """Replaces the locks, which a thread of the parent process may hold"""
+        self.responses.lock = threading.RLock()
+        self.redirects.lock = threading.RLock()
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 from pydantic import BaseModel, RootModel, Field, NaiveDatetime
 
@@ -34,6 +34,19 @@ class ExchangeTickerList(RootModel):
     def __iter__(self):
         return iter(self.root)
 
+    def to_columns(self):
+        """Converts the exchange tickers into NumPy columns
+
+        Raises:
+            MissingDependency: numpy is not installed
+
+        Returns:
+            ExchangeColumns: Columnar exchange data
+        """
+        from fio_wrapper.analytics import ExchangeColumns
+
+        return ExchangeColumns.from_tickers(self.root, full=False)
+
 
 class ExchangeTickerFull(ExchangeTicker):
     BuyingOrders: Optional[List[ExchangeOrder]]
@@ -59,6 +72,19 @@ class ExchangeTickerFull(ExchangeTicker):
     UserNameSubmitted: str
     Timestamp: NaiveDatetime
 
+    def to_order_book(self):
+        """Converts the buying and selling orders into an order book
+
+        Raises:
+            MissingDependency: numpy is not installed
+
+        Returns:
+            OrderBook: Price sorted order book
+        """
+        from fio_wrapper.analytics import OrderBook
+
+        return OrderBook.from_ticker(self)
+
 
 class ExchangeTickerFullList(RootModel):
     root: List[ExchangeTickerFull]
@@ -66,6 +92,57 @@ class ExchangeTickerFullList(RootModel):
     def __iter__(self):
         return iter(self.root)
 
+    def to_columns(self):
+        """Converts the exchange tickers into NumPy columns
+
+        Raises:
+            MissingDependency: numpy is not installed
+
+        Returns:
+            ExchangeColumns: Columnar exchange data
+        """
+        from fio_wrapper.analytics import ExchangeColumns
+
+        return ExchangeColumns.from_tickers(self.root, full=True)
+
+    def to_order_books(self):
+        """Converts the orders of all exchange tickers into order books
+
+        Raises:
+            MissingDependency: numpy is not installed
+
+        Returns:
+            OrderBooks: Price sorted order books
+        """
+        from fio_wrapper.analytics import OrderBooks
+
+        return OrderBooks.from_list(self)
+
+    def to_arbitrage(
+        self,
+        rates: Optional[Dict[str, float]] = None,
+        limit: Optional[float] = None,
+        min_profit: float = 0.0,
+    ):
+        """Finds arbitrage opportunities between the exchanges of each material
+
+        Args:
+            rates (Dict[str, float], optional): Value of one unit by currency. Defaults to None, comparing only exchanges of the same currency.
+            limit (float, optional): Most units traded per opportunity. Defaults to None, unlimited.
+            min_profit (float, optional): Least profit of an opportunity. Defaults to 0.0.
+
+        Raises:
+            MissingDependency: numpy is not installed
+
+        Returns:
+            Arbitrage: Opportunities, highest profit first
+        """
+        from fio_wrapper.analytics import Arbitrage
+
+        return Arbitrage.scan(
+            self.to_order_books(), rates=rates, limit=limit, min_profit=min_profit
+        )
+
 
 # Order
 
@@ -0,0 +1,95 @@
+import typing
+from typing import Dict, Generic, Iterator, List, Optional, Type, TypeVar, Union
+from pydantic import BaseModel, RootModel
+
+Item = TypeVar("Item", bound=BaseModel)
+
+
+class LazyList(Generic[Item]):
+    """List result validating its items on first access
+
+    Keeps the decoded records of a list endpoint and validates a record into its
+    model only once it is indexed or iterated. Validated items are cached and
+    their records released. Invalid records raise pydantic's ValidationError on
+    access instead of when the response is received.
+
+    Attributes:
+        model (Type[RootModel]): List model, e.g. PlanetFullList
+        item_model (Type[BaseModel]): Item model, e.g. PlanetFull
+    """
+
+    def __init__(self, model: Type[RootModel], records: List[Dict]) -> None:
+        """Initializes the lazy list
+
+        Args:
+            model (Type[RootModel]): List model, e.g. PlanetFullList
+            records (List[Dict]): Decoded records
+        """
+        self.model: Type[RootModel] = model
+        self.item_model: Type[Item] = typing.get_args(
+            model.model_fields["root"].annotation
+        )[0]
+
+        # copied, coalesced requests share the decoded records
+        self._records: List[Optional[Dict]] = list(records)
+        self._items: List[Optional[Item]] = [None] * len(self._records)
+
+    def _item(self, index: int) -> Item:
+        item = self._items[index]
+
+        if item is None:
+            item = self.item_model.model_validate(self._records[index])
+            self._items[index] = item
+            self._records[index] = None
+
+        return item
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Item, List[Item]]:
+        if isinstance(index, slice):
+            return [self._item(i) for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("LazyList index out of range")
+
+        return self._item(index)
+
+    def __iter__(self) -> Iterator[Item]:
+        for index in range(len(self)):
+            yield self._item(index)
+
+    def __repr__(self) -> str:
+        return (
+            f"LazyList[{self.item_model.__name__}]"
+            f"({self.validated}/{len(self)} validated)"
+        )
+
+    @property
+    def validated(self) -> int:
+        """Gets the number of items validated so far
+
+        Returns:
+            int: Number of validated items
+        """
+        return sum(1 for item in self._items if item is not None)
+
+    @property
+    def root(self) -> List[Item]:
+        """Validates all items
+
+        Returns:
+            List[Item]: All items
+        """
+        return list(self)
+
+    def materialize(self) -> RootModel:
+        """Validates all items into the list model
+
+        Returns:
+            RootModel: List model, e.g. PlanetFullList
+        """
+        return self.model.model_construct(root=self.root)
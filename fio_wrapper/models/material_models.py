@@ -19,3 +19,13 @@ class MaterialTickerList(RootModel):
 
     def __iter__(self):
         return iter(self.root)
+
+    def index(self):
+        """Indexes the materials by ticker, id, name and category
+
+        Returns:
+            MaterialIndex: Material index
+        """
+        from fio_wrapper.material_index import MaterialIndex
+
+        return MaterialIndex(self.root)
@@ -115,6 +115,22 @@ class PlanetFullList(RootModel):
     def __iter__(self):
         return iter(self.root)
 
+    def to_search(self, materials):
+        """Creates a local search over the planets
+
+        Args:
+            materials (MaterialIndex): Index of all materials, resolving tickers to MaterialId
+
+        Raises:
+            MissingDependency: numpy is not installed
+
+        Returns:
+            PlanetSearch: Planet search
+        """
+        from fio_wrapper.analytics import PlanetSearch
+
+        return PlanetSearch.from_planets(self, materials)
+
 
 class PlanetSite(BaseModel):
     PlanetId: str = Field(min_length=32)
@@ -24,6 +24,21 @@ class RecipeList(RootModel):
     def __iter__(self):
         return iter(self.root)
 
+    def to_graph(self, buildings=None, choose=None, raw=None):
+        """Creates the production graph of the recipes
+
+        Args:
+            buildings (BuildingTickerList, optional): Buildings, e.g. from Building.all(). Defaults to None.
+            choose (Dict[str, str], optional): RecipeName or StandardRecipeName by material ticker. Defaults to None.
+            raw (Iterable[str], optional): Material tickers treated as raw. Defaults to None.
+
+        Returns:
+            ProductionGraph: Production graph
+        """
+        from fio_wrapper.production import ProductionGraph
+
+        return ProductionGraph(self.root, buildings=buildings, choose=choose, raw=raw)
+
 
 class MaterialRecipeIO(BaseModel):
     CommodityName: str
@@ -0,0 +1,376 @@
+"""Production graph of recipes with bill of materials explosion
+"""
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set
+
+from fio_wrapper.exceptions import (
+    BuildingTickerNotFound,
+    MaterialTickerNotFound,
+    ProductionCycleError,
+    RecipeNotFound,
+)
+from fio_wrapper.models.building_models import BuildingTicker
+from fio_wrapper.models.recipe_models import Recipe
+
+# fixed-point iterations solving a production cycle
+CYCLE_ITERATIONS: int = 1000
+CYCLE_TOLERANCE: float = 1e-9
+
+
+def strongly_connected(
+    nodes: Iterable[str], edges: Dict[str, List[str]]
+) -> List[List[str]]:
+    """Finds the strongly connected components of a graph
+
+    Iterative variant of Tarjan's algorithm. Components are returned after all
+    components reachable from them, for edges pointing from a material to its
+    inputs this is inputs first.
+
+    Args:
+        nodes (Iterable[str]): Nodes
+        edges (Dict[str, List[str]]): Successors by node
+
+    Returns:
+        List[List[str]]: Components
+    """
+    index: Dict[str, int] = {}
+    low: Dict[str, int] = {}
+    stack: List[str] = []
+    on_stack: Set[str] = set()
+    components: List[List[str]] = []
+
+    def visit(node: str) -> None:
+        index[node] = low[node] = len(index)
+        stack.append(node)
+        on_stack.add(node)
+        work.append((node, iter(edges.get(node, ()))))
+
+    for root in nodes:
+        if root in index:
+            continue
+
+        work = []
+        visit(root)
+
+        while work:
+            node, successors = work[-1]
+
+            for successor in successors:
+                if successor not in index:
+                    visit(successor)
+                    break
+                if successor in on_stack:
+                    low[node] = min(low[node], index[successor])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+
+                if low[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+
+    return components
+
+
+class Bill:
+    """Bill of materials of one unit of a material
+
+    Attributes:
+        inputs (Dict[str, float]): Raw material amount by ticker
+        time (Dict[str, float]): Building time in milliseconds by building ticker
+    """
+
+    def __init__(
+        self,
+        inputs: Optional[Dict[str, float]] = None,
+        time: Optional[Dict[str, float]] = None,
+    ) -> None:
+        self.inputs: Dict[str, float] = inputs if inputs is not None else {}
+        self.time: Dict[str, float] = time if time is not None else {}
+
+    def add(self, other: "Bill", factor: float) -> None:
+        """Adds factor times another bill
+
+        Args:
+            other (Bill): Bill to add
+            factor (float): Units of other
+        """
+        for ticker, amount in other.inputs.items():
+            self.inputs[ticker] = self.inputs.get(ticker, 0.0) + amount * factor
+        for building, time in other.time.items():
+            self.time[building] = self.time.get(building, 0.0) + time * factor
+
+    def distance(self, other: "Bill") -> float:
+        """Gets the largest difference of any amount or time
+
+        Args:
+            other (Bill): Bill to compare
+
+        Returns:
+            float: Largest absolute difference
+        """
+        return max(
+            [
+                abs(self.inputs.get(key, 0.0) - other.inputs.get(key, 0.0))
+                for key in self.inputs.keys() | other.inputs.keys()
+            ]
+            + [
+                abs(self.time.get(key, 0.0) - other.time.get(key, 0.0))
+                for key in self.time.keys() | other.time.keys()
+            ],
+            default=0.0,
+        )
+
+    def __repr__(self) -> str:
+        return f"Bill(inputs={self.inputs!r}, time={self.time!r})"
+
+
+class ProductionGraph:
+    """Recipes indexed by the materials they produce and consume
+
+    The bill of materials of every material is computed once, in a single pass
+    over the materials ordered inputs first. Each produced material uses one
+    recipe, the first producing it or the one chosen. A recipe with several
+    outputs is attributed entirely to the material its bill is computed for.
+
+    Materials are raw if no recipe produces them, if their recipe has no inputs
+    (extraction), or if declared raw, e.g. because they are bought. The bill of
+    a raw material is one unit of itself. Production cycles are solved by
+    fixed-point iteration.
+
+    Attributes:
+        recipes (List[Recipe]): All recipes
+        buildings (Dict[str, BuildingTicker]): Buildings by ticker
+        producers (Dict[str, List[Recipe]]): Recipes by output ticker
+        consumers (Dict[str, List[Recipe]]): Recipes by input ticker
+        chosen (Dict[str, Recipe]): Recipe used per produced material
+        raw (Set[str]): Materials declared raw
+    """
+
+    def __init__(
+        self,
+        recipes: Iterable[Recipe],
+        buildings: Optional[Iterable[BuildingTicker]] = None,
+        choose: Optional[Dict[str, str]] = None,
+        raw: Optional[Iterable[str]] = None,
+    ) -> None:
+        """Builds the graph
+
+        Args:
+            recipes (Iterable[Recipe]): Recipes, e.g. from Recipe.all()
+            buildings (Iterable[BuildingTicker], optional): Buildings, e.g. from Building.all(). Defaults to None.
+            choose (Dict[str, str], optional): RecipeName or StandardRecipeName by material ticker. Defaults to None.
+            raw (Iterable[str], optional): Material tickers treated as raw. Defaults to None.
+
+        Raises:
+            RecipeNotFound: Chosen recipe does not produce the material
+        """
+        self.recipes: List[Recipe] = list(recipes)
+        self.buildings: Dict[str, BuildingTicker] = {
+            building.Ticker: building for building in buildings or []
+        }
+        self.raw: Set[str] = set(raw or [])
+
+        self.producers: Dict[str, List[Recipe]] = defaultdict(list)
+        self.consumers: Dict[str, List[Recipe]] = defaultdict(list)
+        self._by_building: Dict[str, List[Recipe]] = defaultdict(list)
+
+        for recipe in self.recipes:
+            for output in recipe.Outputs:
+                self.producers[output.Ticker].append(recipe)
+            for recipe_input in recipe.Inputs:
+                self.consumers[recipe_input.Ticker].append(recipe)
+            self._by_building[recipe.BuildingTicker].append(recipe)
+
+        self.chosen: Dict[str, Recipe] = {
+            ticker: producers[0] for ticker, producers in self.producers.items()
+        }
+        for ticker, name in (choose or {}).items():
+            self.chosen[ticker] = self._find(ticker, name)
+
+        self._bills: Optional[Dict[str, Bill]] = None
+
+    def _find(self, ticker: str, name: str) -> Recipe:
+        for recipe in self.producers.get(ticker, []):
+            if name in (recipe.RecipeName, recipe.StandardRecipeName):
+                return recipe
+
+        raise RecipeNotFound(f"No recipe '{name}' producing {ticker}")
+
+    @property
+    def materials(self) -> Set[str]:
+        """Gets all materials produced or consumed
+
+        Returns:
+            Set[str]: Material tickers
+        """
+        return set(self.producers) | set(self.consumers) | self.raw
+
+    def building(self, building_ticker: str) -> BuildingTicker:
+        """Gets a building
+
+        Args:
+            building_ticker (str): Building ticker (e.g., "PP1")
+
+        Raises:
+            BuildingTickerNotFound: Building not passed to the graph
+
+        Returns:
+            BuildingTicker: Building
+        """
+        try:
+            return self.buildings[building_ticker]
+        except KeyError:
+            raise BuildingTickerNotFound("Buildingticker not found") from None
+
+    def recipes_of(self, building_ticker: str) -> List[Recipe]:
+        """Gets the recipes of a building
+
+        Args:
+            building_ticker (str): Building ticker (e.g., "PP1")
+
+        Returns:
+            List[Recipe]: Recipes, empty if none
+        """
+        return list(self._by_building.get(building_ticker, []))
+
+    def order(self) -> List[List[str]]:
+        """Orders all materials by their production over all recipes
+
+        Returns:
+            List[List[str]]: Groups of materials, inputs before outputs, a group with several materials is a production cycle
+        """
+        edges = {
+            ticker: [i.Ticker for recipe in producers for i in recipe.Inputs]
+            for ticker, producers in self.producers.items()
+        }
+        return strongly_connected(sorted(self.materials), edges)
+
+    def cycles(self) -> List[List[str]]:
+        """Finds all production cycles over all recipes
+
+        Returns:
+            List[List[str]]: Materials of every cycle
+        """
+        return [
+            group
+            for group in self.order()
+            if len(group) > 1
+            or any(
+                i.Ticker == group[0]
+                for recipe in self.producers.get(group[0], [])
+                for i in recipe.Inputs
+            )
+        ]
+
+    def is_raw(self, ticker: str) -> bool:
+        """Checks whether a material is raw
+
+        Args:
+            ticker (str): Material ticker
+
+        Returns:
+            bool: Not produced, extracted or declared raw
+        """
+        recipe = self.chosen.get(ticker)
+        return ticker in self.raw or recipe is None or len(recipe.Inputs) == 0
+
+    def _direct(self, ticker: str, bills: Dict[str, Bill]) -> Bill:
+        """Computes the bill of a material from the bills of its inputs
+
+        Args:
+            ticker (str): Material ticker
+            bills (Dict[str, Bill]): Bills computed so far
+
+        Returns:
+            Bill: Bill of one unit
+        """
+        if ticker in self.raw or ticker not in self.chosen:
+            return Bill({ticker: 1.0})
+
+        recipe = self.chosen[ticker]
+        runs = 1.0 / sum(o.Amount for o in recipe.Outputs if o.Ticker == ticker)
+        time = {recipe.BuildingTicker: recipe.TimeMs * runs}
+
+        if len(recipe.Inputs) == 0:
+            return Bill({ticker: 1.0}, time)
+
+        bill = Bill({}, time)
+        for recipe_input in recipe.Inputs:
+            bill.add(bills.get(recipe_input.Ticker, Bill()), recipe_input.Amount * runs)
+
+        return bill
+
+    def bills(self) -> Dict[str, Bill]:
+        """Computes the bill of materials of every material
+
+        Computed once and memoized for all further calls.
+
+        Raises:
+            ProductionCycleError: A production cycle consumes at least what it produces
+
+        Returns:
+            Dict[str, Bill]: Bill of one unit by material ticker
+        """
+        if self._bills is not None:
+            return self._bills
+
+        edges = {
+            ticker: [i.Ticker for i in recipe.Inputs]
+            for ticker, recipe in self.chosen.items()
+            if not self.is_raw(ticker)
+        }
+        bills: Dict[str, Bill] = {}
+
+        for group in strongly_connected(sorted(self.materials), edges):
+            ticker = group[0]
+            if len(group) == 1 and ticker not in edges.get(ticker, []):
+                bills[ticker] = self._direct(ticker, bills)
+                continue
+
+            # cyclic: iterate bills = direct(bills) until they settle
+            for member in group:
+                bills[member] = Bill()
+
+            for _ in range(CYCLE_ITERATIONS):
+                change = 0.0
+                for member in group:
+                    bill = self._direct(member, bills)
+                    change = max(change, bill.distance(bills[member]))
+                    bills[member] = bill
+
+                if change <= CYCLE_TOLERANCE:
+                    break
+            else:
+                raise ProductionCycleError(
+                    f"Production cycle of {', '.join(sorted(group))} does not converge"
+                )
+
+        self._bills = bills
+        return bills
+
+    def bill(self, ticker: str) -> Bill:
+        """Gets the bill of materials of a material
+
+        Args:
+            ticker (str): Material ticker (e.g., "RAT")
+
+        Raises:
+            MaterialTickerNotFound: Material not produced or consumed by any recipe
+            ProductionCycleError: A production cycle consumes at least what it produces
+
+        Returns:
+            Bill: Raw inputs and building time of one unit
+        """
+        try:
+            return self.bills()[ticker]
+        except KeyError:
+            raise MaterialTickerNotFound("Materialticker not found") from None
@@ -0,0 +1,276 @@
+"""Client-side rate limiting of requests towards FIO
+"""
+import threading
+import time
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+from fio_wrapper.config import Config
+from fio_wrapper.exceptions import RateLimitTimeout, UnknownConfig
+
+
+class TokenBucket:
+    """Thread-safe token bucket
+
+    Holds up to burst tokens and refills rate tokens per second. Every request
+    takes one token, requests finding the bucket empty wait for the next one.
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        """Initializes a full token bucket
+
+        Args:
+            rate (float): Tokens added per second
+            burst (int): Maximum number of tokens
+
+        Raises:
+            UnknownConfig: rate is not positive
+        """
+        if rate <= 0:
+            raise UnknownConfig(f"Rate limit rate must be positive, got {rate}")
+
+        self.rate = rate
+        self.burst = burst
+        self._tokens: float = float(burst)
+        self._updated: float = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _take(self) -> float:
+        """Takes a token if available
+
+        Returns:
+            float: 0 if a token was taken, otherwise seconds until the next token
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                float(self.burst), self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+
+            return (1 - self._tokens) / self.rate
+
+    def after_fork(self) -> None:
+        """Replaces the lock, which a thread of the parent process may hold"""
+        self._lock = threading.Lock()
+
+    def release(self) -> None:
+        """Gives a taken token back, e.g. if the request is not sent after all"""
+        with self._lock:
+            self._tokens = min(float(self.burst), self._tokens + 1)
+
+    def acquire(self, deadline: Optional[float] = None) -> float:
+        """Takes a token, waiting for it if necessary
+
+        Args:
+            deadline (float, optional): time.monotonic() by which the token must be taken, None waits indefinitely
+
+        Raises:
+            RateLimitTimeout: Token not available before deadline
+
+        Returns:
+            float: Seconds waited
+        """
+        waited = 0.0
+
+        while True:
+            wait = self._take()
+            if wait == 0:
+                return waited
+
+            if deadline is not None and time.monotonic() + wait > deadline:
+                raise RateLimitTimeout("Rate limit token not available in time")
+
+            time.sleep(wait)
+            waited += wait
+
+    async def acquire_async(self, deadline: Optional[float] = None) -> float:
+        """Takes a token, waiting for it without blocking the event loop
+
+        Args:
+            deadline (float, optional): time.monotonic() by which the token must be taken, None waits indefinitely
+
+        Raises:
+            RateLimitTimeout: Token not available before deadline
+
+        Returns:
+            float: Seconds waited
+        """
+        import asyncio
+
+        waited = 0.0
+
+        while True:
+            wait = self._take()
+            if wait == 0:
+                return waited
+
+            if deadline is not None and time.monotonic() + wait > deadline:
+                raise RateLimitTimeout("Rate limit token not available in time")
+
+            await asyncio.sleep(wait)
+            waited += wait
+
+
+# buckets shared by all adapters of the process
+_buckets: Dict[Tuple[str, str, str], TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def after_fork() -> None:
+    """Replaces the locks of the shared buckets in a forked child
+
+    Threads of the parent process may hold them while the process forks.
+    """
+    global _buckets_lock
+
+    _buckets_lock = threading.Lock()
+    for bucket in _buckets.values():
+        bucket.after_fork()
+
+
+def shared_bucket(
+    api_key: Optional[str], host: str, route: str, rate: float, burst: int
+) -> TokenBucket:
+    """Gets the process-wide bucket of an API key, host and route
+
+    The first caller creates the bucket, later callers share it regardless of
+    their rate and burst.
+
+    Args:
+        api_key (str, optional): FIO API key, None for anonymous requests
+        host (str): FIO host
+        route (str): Route of the bucket, "" for all other requests
+        rate (float): Tokens added per second
+        burst (int): Maximum number of tokens
+
+    Returns:
+        TokenBucket: Shared bucket
+    """
+    key = (api_key or "", host, route)
+
+    with _buckets_lock:
+        bucket = _buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(rate=rate, burst=burst)
+            _buckets[key] = bucket
+
+        return bucket
+
+
+class RateLimiter:
+    """Rate limiter of an adapter
+
+    Requests take a token from the bucket of their API key and host. Requests
+    towards a configured heavy route additionally take a token from the bucket
+    of that route. Buckets are shared by all adapters of the process using the
+    same API key and host.
+    """
+
+    def __init__(self, config: Config, api_key: Optional[str]) -> None:
+        """Initializes the rate limiter
+
+        Args:
+            config (Config): Wrapper configuration
+            api_key (str, optional): FIO API key of the adapter
+        """
+        self.config = config
+        self.api_key = api_key
+        self.max_wait = config.rate_limit_max_wait
+        self.routes = config.rate_limit_routes
+
+    def _buckets(self, endpoint: str) -> Tuple[TokenBucket, ...]:
+        url = urlsplit(endpoint)
+        buckets = []
+
+        for route, limits in self.routes.items():
+            if url.path.endswith(route):
+                buckets.append(
+                    shared_bucket(
+                        self.api_key,
+                        url.netloc,
+                        route,
+                        rate=limits["rate"],
+                        burst=limits["burst"],
+                    )
+                )
+                break
+
+        buckets.append(
+            shared_bucket(
+                self.api_key,
+                url.netloc,
+                "",
+                rate=self.config.rate_limit_rate,
+                burst=self.config.rate_limit_burst,
+            )
+        )
+        return tuple(buckets)
+
+    def _deadline(self, timeout: Optional[float]) -> Optional[float]:
+        wait = self.max_wait if self.max_wait is not None else timeout
+        return None if wait is None else time.monotonic() + wait
+
+    def acquire(self, endpoint: str, timeout: Optional[float] = None) -> float:
+        """Waits until a request towards endpoint may be sent
+
+        Args:
+            endpoint (str): URL
+            timeout (float, optional): Request timeout, limits the wait unless max_wait is configured
+
+        Raises:
+            RateLimitTimeout: Waited longer than max_wait or timeout
+
+        Returns:
+            float: Seconds waited
+        """
+        deadline = self._deadline(timeout)
+
+        waited = 0.0
+        taken = []
+        try:
+            for bucket in self._buckets(endpoint):
+                waited += bucket.acquire(deadline)
+                taken.append(bucket)
+        except BaseException:
+            # timed out or interrupted, the request is not sent
+            for bucket in taken:
+                bucket.release()
+            raise
+
+        return waited
+
+    async def acquire_async(
+        self, endpoint: str, timeout: Optional[float] = None
+    ) -> float:
+        """Waits until a request towards endpoint may be sent, without blocking the event loop
+
+        Args:
+            endpoint (str): URL
+            timeout (float, optional): Request timeout, limits the wait unless max_wait is configured
+
+        Raises:
+            RateLimitTimeout: Waited longer than max_wait or timeout
+
+        Returns:
+            float: Seconds waited
+        """
+        deadline = self._deadline(timeout)
+
+        waited = 0.0
+        taken = []
+        try:
+            for bucket in self._buckets(endpoint):
+                waited += await bucket.acquire_async(deadline)
+                taken.append(bucket)
+        except BaseException:
+            # timed out or cancelled, the request is not sent
+            for bucket in taken:
+                bucket.release()
+            raise
+
+        return waited
@@ -0,0 +1,207 @@
+"""Retries of idempotent requests with exponential backoff and a retry budget
+"""
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import List, Optional
+
+from fio_wrapper.config import Config
+from fio_wrapper.stats import AdapterStats
+
+
+class RetryBudget:
+    """Limits retries to a share of the requests sent
+
+    Every request deposits ratio into the budget, every retry withdraws one. The
+    balance never exceeds reserve, which is also the initial balance. During an
+    outage retries stop once the reserve is spent and then add at most ratio
+    times the requests to the load on FIO.
+    """
+
+    def __init__(self, ratio: float, reserve: int) -> None:
+        """Initializes the retry budget
+
+        Args:
+            ratio (float): Retries allowed per request, e.g. 0.1
+            reserve (int): Retries allowed before any request was sent
+        """
+        self.ratio = ratio
+        self.reserve = reserve
+        self._balance: float = float(reserve)
+        self._lock = threading.Lock()
+
+    @property
+    def balance(self) -> float:
+        """Gets the number of retries currently allowed
+
+        Returns:
+            float: Budget balance
+        """
+        with self._lock:
+            return self._balance
+
+    def deposit(self) -> None:
+        """Records a request"""
+        with self._lock:
+            self._balance = min(self._balance + self.ratio, float(self.reserve))
+
+    def withdraw(self) -> bool:
+        """Takes one retry from the budget
+
+        Returns:
+            bool: Retry allowed
+        """
+        with self._lock:
+            if self._balance < 1:
+                return False
+
+            self._balance -= 1
+            return True
+
+    def after_fork(self) -> None:
+        """Replaces the lock, which a thread of the parent process may hold"""
+        self._lock = threading.Lock()
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parses a Retry-After header
+
+    Args:
+        value (str, optional): Header value, seconds or HTTP date
+
+    Returns:
+        Optional[float]: Seconds to wait, None if missing or invalid
+    """
+    if value is None:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def full_jitter(attempt: int, backoff: float, max_backoff: float) -> float:
+    """Draws an exponential backoff delay with full jitter
+
+    Args:
+        attempt (int): Retries so far
+        backoff (float): Base delay in seconds
+        max_backoff (float): Maximum delay in seconds
+
+    Returns:
+        float: Random delay between zero and backoff * 2 ** attempt, capped at max_backoff
+    """
+    return random.uniform(0, min(max_backoff, backoff * 2**attempt))
+
+
+class RetryPolicy:
+    """Decides if and when a failed idempotent request is retried
+
+    Delays grow exponentially with full jitter, a random delay between zero and
+    backoff * 2 ** attempt, capped at max_backoff. A Retry-After header of the
+    response replaces the delay, a request asking for more than max_backoff is
+    not retried.
+    """
+
+    def __init__(
+        self,
+        attempts: int,
+        backoff: float,
+        max_backoff: float,
+        statuses: List[int],
+        budget: RetryBudget,
+        stats: AdapterStats,
+    ) -> None:
+        """Initializes the retry policy
+
+        Args:
+            attempts (int): Retries per request, 0 disables retries
+            backoff (float): Base delay in seconds
+            max_backoff (float): Maximum delay in seconds
+            statuses (List[int]): Retried HTTP status codes
+            budget (RetryBudget): Retry budget shared by all requests
+            stats (AdapterStats): Adapter stats counting retries
+        """
+        self.attempts = attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.statuses = statuses
+        self.budget = budget
+        self.stats = stats
+
+    @classmethod
+    def from_config(cls, config: Config, stats: AdapterStats) -> "RetryPolicy":
+        """Creates the retry policy of the configuration
+
+        Args:
+            config (Config): Wrapper configuration
+            stats (AdapterStats): Adapter stats counting retries
+
+        Returns:
+            RetryPolicy: Retry policy
+        """
+        return cls(
+            attempts=config.retry_attempts,
+            backoff=config.retry_backoff,
+            max_backoff=config.retry_max_backoff,
+            statuses=config.retry_statuses,
+            budget=RetryBudget(
+                ratio=config.retry_budget_ratio, reserve=config.retry_budget_reserve
+            ),
+            stats=stats,
+        )
+
+    def retryable_status(
+        self, status_code: int, err_codes: Optional[List[int]] = None
+    ) -> bool:
+        """Checks if a response status is a transient failure
+
+        Args:
+            status_code (int): HTTP status code
+            err_codes (List[int], optional): Codes handled by the caller, never retried
+
+        Returns:
+            bool: Status is retried
+        """
+        if isinstance(err_codes, List) and status_code in err_codes:
+            return False
+
+        return status_code in self.statuses
+
+    def delay(self, attempt: int, retry_after: Optional[str] = None) -> Optional[float]:
+        """Gets the delay before retrying a failed request
+
+        Args:
+            attempt (int): Retries of this request so far
+            retry_after (str, optional): Retry-After header of the response
+
+        Returns:
+            Optional[float]: Seconds to wait, None if the request is not retried
+        """
+        if attempt >= self.attempts:
+            if self.attempts > 0:
+                self.stats.increment("retries_exhausted")
+            return None
+
+        wait = parse_retry_after(retry_after)
+        if wait is not None and wait > self.max_backoff:
+            self.stats.increment("retries_exhausted")
+            return None
+
+        if not self.budget.withdraw():
+            self.stats.increment("retries_denied")
+            return None
+
+        self.stats.increment("retries")
+
+        if wait is None:
+            wait = full_jitter(attempt, self.backoff, self.max_backoff)
+
+        return wait
@@ -0,0 +1,79 @@
+"""Coalescing of identical in-flight calls
+"""
+import threading
+from typing import Callable, Dict, Hashable
+
+
+class _Call:
+    """In-flight call shared by its leader and all waiting callers"""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.waiters: int = 0
+        self.result: any = None
+        self.error: BaseException = None
+
+
+class SingleFlight:
+    """Executes only one call per key at a time
+
+    Callers arriving while a call with the same key is in flight wait for it and
+    receive its result, or its exception, instead of executing the call again.
+    The result object is shared between all callers and must not be mutated.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+
+    def in_flight(self, key: Hashable) -> int:
+        """Gets the number of callers waiting for the in-flight call of key
+
+        Args:
+            key (Hashable): Call key
+
+        Returns:
+            int: Number of waiting callers, -1 if no call is in flight
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            return -1 if call is None else call.waiters
+
+    def do(self, key: Hashable, func: Callable[[], any]) -> any:
+        """Executes func or joins the in-flight call of key
+
+        Args:
+            key (Hashable): Call key
+            func (Callable[[], any]): Call to execute
+
+        Returns:
+            any: Result of the call
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+            else:
+                call.waiters += 1
+
+        if not leader:
+            call.done.wait()
+
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+        return call.result
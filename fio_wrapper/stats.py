@@ -0,0 +1,68 @@
+"""Counters of adapter activity
+"""
+import threading
+from typing import Dict
+
+
+class AdapterStats:
+    """Thread-safe counters of an adapter
+
+    Counters:
+        requests: Requests sent, including retries
+        retries: Requests repeated after a transient failure
+        retries_exhausted: Failures returned after all retry attempts
+        retries_denied: Retries skipped, the retry budget was spent
+        rate_limited: Requests delayed by the rate limiter
+        bulk_hits: Single item lookups answered from a bulk result
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counts: Dict[str, int] = dict.fromkeys(
+            [
+                "requests",
+                "retries",
+                "retries_exhausted",
+                "retries_denied",
+                "rate_limited",
+                "bulk_hits",
+            ],
+            0,
+        )
+
+    def increment(self, name: str, value: int = 1) -> None:
+        """Increments a counter
+
+        Args:
+            name (str): Counter name
+            value (int, optional): Increment. Defaults to 1.
+        """
+        with self._lock:
+            self._counts[name] = self._counts.get(name, 0) + value
+
+    def __getitem__(self, name: str) -> int:
+        with self._lock:
+            return self._counts.get(name, 0)
+
+    def snapshot(self) -> Dict[str, int]:
+        """Gets all counters
+
+        Returns:
+            Dict[str, int]: Counter values by name
+        """
+        with self._lock:
+            return dict(self._counts)
+
+    def reset(self) -> None:
+        """Sets all counters to zero"""
+        with self._lock:
+            for name in self._counts:
+                self._counts[name] = 0
+
+    def after_fork(self) -> None:
+        """Replaces the lock, which a thread of the parent process may hold"""
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        counts = ", ".join(f"{name}={value}" for name, value in self.snapshot().items())
+        return f"AdapterStats({counts})"
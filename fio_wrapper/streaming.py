@@ -0,0 +1,146 @@
+"""Incremental parsing of JSON array response bodies
+"""
+import codecs
+import json
+from typing import Iterable, Iterator, List
+
+
+class JSONArrayParser:
+    """Incrementally parses the elements of a top-level JSON array
+
+    Chunks of the response body are fed as they arrive. Every completely received
+    array element is decoded and returned, so only the elements of the current
+    chunk and one partially received element are held in memory.
+    """
+
+    _WHITESPACE = " \t\n\r"
+
+    def __init__(self) -> None:
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer: str = ""
+        self._started: bool = False
+        self._finished: bool = False
+
+    @property
+    def finished(self) -> bool:
+        """Checks if the closing bracket of the array was parsed
+
+        Returns:
+            bool: Array complete
+        """
+        return self._finished
+
+    def feed(self, chunk: bytes) -> List[any]:
+        """Feeds a chunk of the body and returns all elements completed by it
+
+        Args:
+            chunk (bytes): Next chunk of the response body
+
+        Raises:
+            ValueError: Body is not a JSON array
+
+        Returns:
+            List[any]: Decoded array elements
+        """
+        if self._finished:
+            return []
+
+        self._buffer += self._text_decoder.decode(chunk)
+        return self._parse(final=False)
+
+    def close(self) -> List[any]:
+        """Signals the end of the body and returns the remaining elements
+
+        Raises:
+            ValueError: Body ended before the array was complete
+
+        Returns:
+            List[any]: Decoded array elements
+        """
+        if self._finished:
+            return []
+
+        self._buffer += self._text_decoder.decode(b"", final=True)
+        items = self._parse(final=True)
+
+        if not self._finished:
+            raise ValueError("Incomplete JSON array")
+
+        return items
+
+    def _parse(self, final: bool) -> List[any]:
+        items: List[any] = []
+        buffer = self._buffer
+        pos = 0
+        length = len(buffer)
+
+        while True:
+            while pos < length and buffer[pos] in self._WHITESPACE:
+                pos += 1
+
+            if pos >= length:
+                break
+
+            if not self._started:
+                if buffer[pos] != "[":
+                    raise ValueError("Response body is not a JSON array")
+                self._started = True
+                pos += 1
+                continue
+
+            if buffer[pos] == ",":
+                pos += 1
+                continue
+
+            if buffer[pos] == "]":
+                self._finished = True
+                pos = length
+                break
+
+            try:
+                item, end = self._decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError as exc:
+                if final:
+                    raise ValueError("Invalid JSON array element") from exc
+                # element not completely received yet
+                break
+
+            # numbers are complete once followed by a delimiter, they might
+            # continue in the next chunk otherwise
+            if not final and not isinstance(item, (dict, list)):
+                delimiter = end
+                while delimiter < length and buffer[delimiter] in self._WHITESPACE:
+                    delimiter += 1
+
+                if delimiter >= length or buffer[delimiter] not in ",]":
+                    break
+
+            items.append(item)
+            pos = end
+
+        self._buffer = buffer[pos:]
+        return items
+
+
+def iter_json_array(chunks: Iterable[bytes]) -> Iterator[any]:
+    """Yields the elements of a JSON array from an iterable of body chunks
+
+    Args:
+        chunks (Iterable[bytes]): Chunks of the response body
+
+    Raises:
+        ValueError: Body is not a complete JSON array
+
+    Yields:
+        Iterator[any]: Decoded array elements
+    """
+    parser = JSONArrayParser()
+
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+
+        if parser.finished:
+            return
+
+    yield from parser.close()
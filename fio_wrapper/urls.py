@@ -1,4 +1,7 @@
+from typing import Dict
+
 from fio_wrapper.config import Config
+from fio_wrapper.exceptions import UnknownConfig
 
 
 class URLs:
@@ -13,55 +16,61 @@ class URLs:
 
         self.base_url = config.base_url
 
+        # one lookup of the version's table instead of one per option
+        urls = config.url_table()
+        try:
+            self._assign(urls)
+        except KeyError as exc:
+            raise UnknownConfig() from exc
+
+    def _assign(self, urls: Dict[str, str]) -> None:
         # material
-        self.material_base = config.get_url("material_base")
-        self.material_allmaterials = config.get_url("material_all")
+        self.material_base = urls["material_base"]
+        self.material_allmaterials = urls["material_all"]
 
         # exchange
-        self.exchange_base = config.get_url("exchange_base")
-        self.exchange_orders = config.get_url("exchange_orders")
-        self.exchange_all = config.get_url("exchange_all")
-        self.exchange_full = config.get_url("exchange_full")
+        self.exchange_base = urls["exchange_base"]
+        self.exchange_orders = urls["exchange_orders"]
+        self.exchange_all = urls["exchange_all"]
+        self.exchange_full = urls["exchange_full"]
 
         # building
-        self.building_base = config.get_url("building_base")
-        self.building_all = config.get_url("building_all")
+        self.building_base = urls["building_base"]
+        self.building_all = urls["building_all"]
 
         # recipe
-        self.recipe_base = config.get_url("recipe_base")
-        self.recipe_all = config.get_url("recipe_all")
+        self.recipe_base = urls["recipe_base"]
+        self.recipe_all = urls["recipe_all"]
 
         # planet
-        self.planet_base = config.get_url("planet_base")
-        self.planet_all = config.get_url("planet_all")
-        self.planet_full = config.get_url("planet_full")
-        self.planet_sites = config.get_url("planet_sites")
-        self.planet_search = config.get_url("planet_search")
+        self.planet_base = urls["planet_base"]
+        self.planet_all = urls["planet_all"]
+        self.planet_full = urls["planet_full"]
+        self.planet_sites = urls["planet_sites"]
+        self.planet_search = urls["planet_search"]
 
         # localmarket
-        self.localmarket_base = config.get_url("localmarket_base")
-        self.localmarket_planet = config.get_url("localmarket_planet")
-        self.localmarket_shipping_source = config.get_url("localmarket_shipping_source")
-        self.localmarket_shipping_destination = config.get_url(
-            "localmarket_shipping_destination"
-        )
-        self.localmarket_company = config.get_url("localmarket_company")
+        self.localmarket_base = urls["localmarket_base"]
+        self.localmarket_planet = urls["localmarket_planet"]
+        self.localmarket_shipping_source = urls["localmarket_shipping_source"]
+        self.localmarket_shipping_destination = urls["localmarket_shipping_destination"]
+        self.localmarket_company = urls["localmarket_company"]
 
         # sites
-        self.sites_base = config.get_url("sites_base")
-        self.sites_planets = config.get_url("sites_planets")
-        self.sites_warehouses = config.get_url("sites_warehouses")
+        self.sites_base = urls["sites_base"]
+        self.sites_planets = urls["sites_planets"]
+        self.sites_warehouses = urls["sites_warehouses"]
 
         # storage
-        self.storage_base = config.get_url("storage_base")
-        self.storage_planets = config.get_url("storage_planets")
+        self.storage_base = urls["storage_base"]
+        self.storage_planets = urls["storage_planets"]
 
         # groups
-        self.groups = config.get_url("groups")
-        self.groups_group = config.get_url("groups_group")
-        self.groups_groupmemberships = config.get_url("groups_groupmemberships")
-        self.groups_hub = config.get_url("groups_hub")
-        self.groups_burn = config.get_url("groups_burn")
+        self.groups = urls["groups"]
+        self.groups_group = urls["groups_group"]
+        self.groups_groupmemberships = urls["groups_groupmemberships"]
+        self.groups_hub = urls["groups_hub"]
+        self.groups_burn = urls["groups_burn"]
 
     # Material
     def material_url(self) -> str:
@@ -53,6 +53,45 @@ def validate_exchange_code(exchange_code: str) -> None:
     # last character must be int
 
 
+def validate_exchange_ticker(exchange_ticker: str) -> None:
+    """Validates an exchange ticker
+
+    Args:
+        exchange_ticker (str): Exchange ticker
+
+    Raises:
+        ExchangeTickerInvalid: Exchange ticker can't be None type
+        ExchangeTickerInvalid: Exchange ticker too short or long. Must be 5 to 7 characters
+        ExchangeTickerInvalid: Exchange ticker must be of form MaterialTicker.ExchangeCode
+        ExchangeTickerInvalid: Material ticker part of Exchange ticker invalid
+    """
+    if exchange_ticker is None:
+        raise ExchangeTickerInvalid("Exchange ticker can't be None type")
+
+    # min length: 5, max length: 7
+    if len(exchange_ticker) < 5 or len(exchange_ticker) > 7:
+        raise ExchangeTickerInvalid(
+            "Exchange ticker to short or long. Must be 5 to 7 characters"
+        )
+
+    # must contain .
+    if "." not in exchange_ticker:
+        raise ExchangeTickerInvalid(
+            "Exchange ticker must be of form MaterialTicker.ExchangeCode"
+        )
+
+    splitted = exchange_ticker.split(".")
+
+    # validate Material part
+    try:
+        validate_ticker(material_ticker=splitted[0])
+    except MaterialTickerInvalid as e:
+        raise ExchangeTickerInvalid() from e
+
+    # validate Exchange code
+    validate_exchange_code(exchange_code=splitted[1])
+
+
 def validate_company_code(company_code: str) -> None:
     if company_code == "" or company_code is None:
         raise CompanyCodeInvalid("Invalid company code. Can't be empty or None type")
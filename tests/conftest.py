@@ -0,0 +1,7 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def no_retry_backoff(monkeypatch) -> None:
+    # retried requests in tests do not wait
+    monkeypatch.setattr("fio_wrapper.retry.full_jitter", lambda *args: 0.0)
@@ -0,0 +1,68 @@
+import sys
+import numpy as np
+import pytest
+from fio_wrapper import ExchangeTickerFullList, ExchangeTickerList
+from fio_wrapper.exceptions import MissingDependency
+
+from .test_exchange_v1 import exchangeticker_full
+
+
+@pytest.fixture()
+def tickers(exchangeticker_full) -> ExchangeTickerFullList:
+    second = dict(exchangeticker_full)
+    second.update(
+        {"MaterialTicker": "DW", "ExchangeCode": "AI1", "Ask": None, "Supply": None}
+    )
+    return ExchangeTickerFullList.model_validate([exchangeticker_full, second])
+
+
+def test_to_columns(tickers) -> None:
+    columns = tickers.to_columns()
+
+    assert len(columns) == 2
+    assert "WidePriceBandHigh" in columns
+    assert columns.values["Ask"].dtype == np.float64
+    assert columns.values["Supply"].dtype == np.int64
+    assert columns.values["Ask"].flags["C_CONTIGUOUS"]
+
+    assert columns["Ask"][0] == 400.0
+    assert columns.masks["Ask"].tolist() == [False, True]
+    assert np.isnan(columns.values["Ask"][1])
+    assert columns["Supply"].sum() == 4472
+
+    spread = columns["Ask"] - columns["Bid"]
+    assert spread.tolist() == [200.0, None]
+
+
+def test_to_columns_dictionary_encoded(tickers) -> None:
+    columns = tickers.to_columns()
+
+    assert columns.ticker_categories == ["DW", "ZIR"]
+    assert columns.ticker_codes.dtype == np.int32
+    assert columns.ticker_labels.tolist() == ["ZIR", "DW"]
+    assert columns.exchange_labels.tolist() == ["NC1", "AI1"]
+    assert columns.row("DW", "AI1") == 1
+
+    with pytest.raises(KeyError):
+        columns.row("DW", "NC1")
+
+    with pytest.raises(KeyError):
+        columns.row("FOO", "NC1")
+
+
+def test_to_columns_simple(tickers) -> None:
+    simple = ExchangeTickerList.model_validate(tickers.model_dump())
+    columns = simple.to_columns()
+
+    assert "Ask" in columns
+    assert "Price" not in columns
+    assert len(ExchangeTickerList.model_validate([]).to_columns()) == 0
+
+
+def test_to_columns_missing_numpy(tickers, monkeypatch) -> None:
+    monkeypatch.setattr("importlib.util.find_spec", lambda x: None)
+    for module in [m for m in sys.modules if m.startswith("fio_wrapper.analytics")]:
+        monkeypatch.delitem(sys.modules, module)
+
+    with pytest.raises(MissingDependency):
+        tickers.to_columns()
@@ -0,0 +1,127 @@
+from typing import Dict
+import numpy as np
+import pytest
+from fio_wrapper import ExchangeTickerFullList
+from fio_wrapper.analytics import Arbitrage
+
+from .test_exchange_v1 import exchangeticker_full, order_1, order_2
+
+
+def order(count, cost: float) -> Dict:
+    return {
+        "OrderId": "a" * 32,
+        "CompanyId": "b" * 32,
+        "CompanyName": None,
+        "CompanyCode": None,
+        "ItemCount": count,
+        "ItemCost": cost,
+    }
+
+
+@pytest.fixture()
+def tickers(exchangeticker_full) -> ExchangeTickerFullList:
+    # ZIR.NC1 asks 1358x400, 3000x4500, 114x5000, bids 200x200, 211x100, 50x50
+    ai1 = dict(
+        exchangeticker_full,
+        ExchangeCode="AI1",
+        BuyingOrders=[order(100, 500.0), order(None, 410.0)],
+        SellingOrders=[],
+    )
+    ci1 = dict(
+        exchangeticker_full,
+        ExchangeCode="CI1",
+        Currency="CIS",
+        BuyingOrders=[order(1000, 450.0), order(500, 600.0)],
+        SellingOrders=[order(10, 700.0)],
+    )
+    other = dict(exchangeticker_full, MaterialTicker="DW", ExchangeCode="IC1")
+    return ExchangeTickerFullList.model_validate([exchangeticker_full, ai1, ci1, other])
+
+
+def test_arbitrage_same_currency(tickers) -> None:
+    arbitrage = tickers.to_arbitrage()
+
+    assert len(arbitrage) == 1
+    assert arbitrage[0].material_ticker == "ZIR"
+    assert arbitrage[0].buy_exchange == "NC1"
+    assert arbitrage[0].sell_exchange == "AI1"
+    assert arbitrage[0].ask == 400.0
+    assert arbitrage[0].bid == 500.0
+
+    # 100 at 500, then the ask level runs out against the market maker at 410
+    assert arbitrage[0].quantity == 1358.0
+    assert arbitrage[0].cost == 1358 * 400.0
+    assert arbitrage[0].profit == 100 * 100.0 + 1258 * 10.0
+    assert arbitrage[0].margin == pytest.approx(22580.0 / 543200.0)
+
+
+def test_arbitrage_rates(tickers) -> None:
+    arbitrage = tickers.to_arbitrage(rates={"NCC": 1.0, "CIS": 1.0})
+
+    assert [(o.buy_exchange, o.sell_exchange) for o in arbitrage] == [
+        ("NC1", "CI1"),
+        ("NC1", "AI1"),
+    ]
+    assert arbitrage[0].sell_currency == "CIS"
+    assert arbitrage[0].profit == 500 * 200.0 + 858 * 50.0
+    assert arbitrage.profits.tolist() == sorted(arbitrage.profits, reverse=True)
+
+    # converted, the CIS bids are below the NCC asks and the CIS ask is below 500
+    arbitrage = tickers.to_arbitrage(rates={"NCC": 1.0, "CIS": 0.5})
+    assert [(o.buy_exchange, o.sell_exchange) for o in arbitrage] == [
+        ("NC1", "AI1"),
+        ("CI1", "AI1"),
+    ]
+    assert arbitrage[1].ask == 700.0
+    assert arbitrage[1].cost == 10 * 350.0
+    assert arbitrage[1].profit == 10 * 150.0
+
+    # exchanges without a rate are skipped
+    arbitrage = tickers.to_arbitrage(rates={"NCC": 1.0})
+    assert [o.sell_exchange for o in arbitrage] == ["AI1"]
+
+
+def test_arbitrage_limit(tickers) -> None:
+    arbitrage = tickers.to_arbitrage(rates={"NCC": 1.0, "CIS": 1.0}, limit=100)
+
+    assert arbitrage.quantities.tolist() == [100.0, 100.0]
+    assert arbitrage.profits.tolist() == [20000.0, 10000.0]
+
+    arbitrage = tickers.to_arbitrage(
+        rates={"NCC": 1.0, "CIS": 1.0}, limit=100, min_profit=15000
+    )
+    assert arbitrage.top(5) == [arbitrage[0]]
+
+
+def test_arbitrage_market_makers(exchangeticker_full) -> None:
+    ai1 = dict(
+        exchangeticker_full,
+        ExchangeCode="AI1",
+        BuyingOrders=[order(None, 450.0)],
+        SellingOrders=[],
+    )
+    nc1 = dict(exchangeticker_full, SellingOrders=[order(None, 400.0)])
+    tickers = ExchangeTickerFullList.model_validate([nc1, ai1])
+
+    assert tickers.to_arbitrage()[0].profit == np.inf
+    assert tickers.to_arbitrage(limit=10)[0].profit == 500.0
+
+
+def test_arbitrage_empty() -> None:
+    books = ExchangeTickerFullList.model_validate([]).to_order_books()
+
+    assert len(Arbitrage.scan(books)) == 0
+    assert len(Arbitrage.scan(books, rates={"NCC": 1.0})) == 0
+
+
+@pytest.mark.parametrize("side", ["BuyingOrders", "SellingOrders"])
+def test_arbitrage_side_empty(exchangeticker_full, side) -> None:
+    tickers = ExchangeTickerFullList.model_validate(
+        [
+            dict(exchangeticker_full, **{side: []}),
+            dict(exchangeticker_full, ExchangeCode="AI1", **{side: None}),
+        ]
+    )
+
+    assert len(tickers.to_arbitrage()) == 0
+    assert len(tickers.to_arbitrage(rates={"NCC": 1.0}, limit=10)) == 0
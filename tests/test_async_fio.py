@@ -0,0 +1,188 @@
+import asyncio
+import ssl
+from typing import Dict
+import httpx
+import pytest
+from fio_wrapper import (
+    AsyncFIO,
+    AsyncFIOAdapter,
+    EndpointNotImplemented,
+    ExchangeTickerFull,
+    MaterialTicker,
+    MaterialTickerList,
+    PlanetFullList,
+)
+from fio_wrapper.exceptions import (
+    MaterialTickerNotFound,
+    MissingDependency,
+    NoAPIKeyProvided,
+    NoSiteData,
+    PlanetOrAdsNotFound,
+    UnknownFIOResponse,
+)
+
+from .test_exchange_v1 import exchangeticker_full
+from .test_material_v1 import material_1, material_2
+from .test_planet_v1 import planet_full_1
+
+
+def mock_fio(routes: Dict, api_key: str = None) -> AsyncFIO:
+    """Creates an AsyncFIO whose client answers from routes
+
+    Args:
+        routes (Dict): (method, url) -> (status, json)
+        api_key (str, optional): FIO API key. Defaults to None.
+    """
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        status, payload = routes[(request.method, str(request.url))]
+        return httpx.Response(status, json=payload)
+
+    fio = AsyncFIO(api_key=api_key)
+    fio.adapter._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return fio
+
+
+def test_async_fio_version_notimplemented() -> None:
+    with pytest.raises(EndpointNotImplemented):
+        AsyncFIO(version="0.0.0")
+
+
+def test_async_fio_missing_httpx(monkeypatch) -> None:
+    monkeypatch.setattr("importlib.util.find_spec", lambda x: None)
+
+    with pytest.raises(MissingDependency):
+        AsyncFIO()
+
+
+def test_async_fio_adapter_type() -> None:
+    fio = AsyncFIO()
+
+    assert type(fio.adapter) == AsyncFIOAdapter
+    assert fio.Material.adapter is fio.adapter
+
+
+def test_async_fio_shared_ssl_context(monkeypatch) -> None:
+    verify = []
+    client = httpx.AsyncClient
+
+    def recording_client(*args, **kwargs):
+        verify.append(kwargs["verify"])
+        return client(*args, **kwargs)
+
+    monkeypatch.setattr("httpx.AsyncClient", recording_client)
+
+    AsyncFIO()
+    AsyncFIO()
+    AsyncFIO(ssl_verify=False)
+
+    assert verify[0] is verify[1]
+    assert verify[0].verify_mode == ssl.CERT_REQUIRED
+    assert verify[2] is False
+
+
+def test_async_material_get(material_1) -> None:
+    urls = AsyncFIO().urls
+    fio = mock_fio({("GET", urls.material_get_url("DW")): (200, material_1)})
+
+    async def run():
+        async with fio:
+            return await fio.Material.get("DW")
+
+    data = asyncio.run(run())
+
+    assert type(data) == MaterialTicker
+    assert data.Ticker == "DW"
+
+
+def test_async_material_notfound() -> None:
+    urls = AsyncFIO().urls
+    fio = mock_fio({("GET", urls.material_get_url("xyz")): (204, None)})
+
+    with pytest.raises(MaterialTickerNotFound):
+        asyncio.run(fio.Material.get("xyz"))
+
+
+def test_async_concurrent(material_1, material_2, exchangeticker_full) -> None:
+    urls = AsyncFIO().urls
+    fio = mock_fio(
+        {
+            ("GET", urls.material_allmaterials_url()): (200, [material_1, material_2]),
+            ("GET", urls.exchange_get_url("ZIR.NC1")): (200, exchangeticker_full),
+        }
+    )
+
+    async def run():
+        return await asyncio.gather(
+            fio.Material.all(), fio.Exchange.get("ZIR.NC1"), fio.Material.all()
+        )
+
+    materials, exchange, materials_again = asyncio.run(run())
+
+    assert type(materials) == MaterialTickerList
+    assert type(materials_again) == MaterialTickerList
+    assert type(exchange) == ExchangeTickerFull
+
+
+def test_async_planet_search(planet_full_1) -> None:
+    urls = AsyncFIO().urls
+    fio = mock_fio({("POST", urls.planet_search_url()): (200, [planet_full_1])})
+
+    data = asyncio.run(fio.Planet.search(materials=["FEO"]))
+
+    assert type(data) == PlanetFullList
+
+
+def test_async_localmarket_planet_type() -> None:
+    urls = AsyncFIO().urls
+    fio = mock_fio(
+        {("GET", urls.localmarket_planet_type_url("foo", "BUY")): (204, None)}
+    )
+
+    with pytest.raises(PlanetOrAdsNotFound):
+        asyncio.run(fio.LocalMarket.planet_buy(planet="foo"))
+
+
+def test_async_apikey_required() -> None:
+    with pytest.raises(NoAPIKeyProvided):
+        asyncio.run(AsyncFIO().Sites.get(username="foo"))
+
+    urls = AsyncFIO().urls
+    fio = mock_fio(
+        {("GET", urls.sites_get_url(username="foo")): (204, None)}, api_key="abc"
+    )
+
+    with pytest.raises(NoSiteData):
+        asyncio.run(fio.Sites.get(username="foo"))
+
+
+def test_async_adapter_otherstatus() -> None:
+    fio = mock_fio({("GET", "https://foo.foo"): (500, None)})
+
+    with pytest.raises(UnknownFIOResponse):
+        asyncio.run(fio.adapter.get("https://foo.foo"))
+
+
+def test_async_adapter_request_exceptions() -> None:
+    def raise_for(exc):
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise exc("failed", request=request)
+
+        fio = AsyncFIO()
+        fio.adapter._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return fio
+
+    with pytest.raises(httpx.TimeoutException):
+        asyncio.run(raise_for(httpx.ReadTimeout).adapter.get("https://foo.foo"))
+
+    with pytest.raises(SystemExit):
+        asyncio.run(raise_for(httpx.ConnectError).adapter.get("https://foo.foo"))
+
+
+def test_async_adapter_raw() -> None:
+    fio = mock_fio({("GET", "https://foo.foo"): (200, {"foo": "moo"})})
+
+    status, data = asyncio.run(fio.adapter.get("https://foo.foo", raw=True))
+
+    assert status == 200
+    assert type(data) == bytes
@@ -0,0 +1,124 @@
+import asyncio
+import threading
+import httpx
+import pytest
+from fio_wrapper import (
+    FIO,
+    AsyncFIO,
+    BatchResult,
+    MaterialTicker,
+    PlanetFull,
+    PlanetSiteList,
+    run_batch,
+)
+from fio_wrapper.exceptions import (
+    MaterialTickerInvalid,
+    MaterialTickerNotFound,
+    PlanetNotFound,
+)
+
+from .fixtures import ftx_fio
+from .test_material_v1 import material_1
+from .test_planet_v1 import planet_full_1, planet_site_1
+
+
+def test_batch_result() -> None:
+    batch = BatchResult()
+    batch.results["a"] = 1
+    batch.errors["b"] = KeyError("b")
+
+    assert len(batch) == 2
+    assert "a" in batch and "b" in batch and "c" not in batch
+    assert list(batch) == ["a", "b"]
+    assert len(list(batch)) == len(batch)
+    assert all(key in batch for key in batch)
+    assert batch["a"] == 1
+    assert not batch.ok
+
+    with pytest.raises(KeyError):
+        batch["b"]
+
+
+def test_run_batch_bounded_and_deduplicated() -> None:
+    lock = threading.Lock()
+    running = {"now": 0, "max": 0, "calls": 0}
+    barrier = threading.Barrier(3, timeout=5)
+
+    def func(key: str) -> str:
+        with lock:
+            running["now"] += 1
+            running["calls"] += 1
+            running["max"] = max(running["max"], running["now"])
+        try:
+            barrier.wait()
+        except threading.BrokenBarrierError:
+            pass
+        with lock:
+            running["now"] -= 1
+        return key.lower()
+
+    batch = run_batch(func, ["A", "B", "C", "A", "D", "E", "F"], max_workers=3)
+
+    assert batch.ok
+    assert batch.results == {k: k.lower() for k in "ABCDEF"}
+    assert running["calls"] == 6
+    assert running["max"] == 3
+
+
+def test_run_batch_empty() -> None:
+    assert len(run_batch(lambda key: key, [], max_workers=4)) == 0
+
+
+def test_material_get_many(requests_mock, material_1, ftx_fio: FIO) -> None:
+    requests_mock.get(ftx_fio.urls.material_get_url("DW"), json=material_1)
+    requests_mock.get(ftx_fio.urls.material_get_url("XYZ"), status_code=204)
+
+    batch = ftx_fio.Material.get_many(["DW", "XYZ", "TOOLONG"])
+
+    assert type(batch["DW"]) == MaterialTicker
+    assert type(batch.errors["XYZ"]) == MaterialTickerNotFound
+    assert type(batch.errors["TOOLONG"]) == MaterialTickerInvalid
+
+
+def test_material_get_many_connection_error(requests_mock, ftx_fio: FIO) -> None:
+    import requests.exceptions
+
+    requests_mock.get(
+        ftx_fio.urls.material_get_url("DW"), exc=requests.exceptions.ConnectionError
+    )
+
+    batch = ftx_fio.Material.get_many(["DW"], max_workers=1)
+
+    assert type(batch.errors["DW"]) == SystemExit
+
+
+def test_planet_get_many(
+    requests_mock, planet_full_1, planet_site_1, ftx_fio: FIO
+) -> None:
+    requests_mock.get(ftx_fio.urls.planet_get_url("Montem"), json=planet_full_1)
+    requests_mock.get(ftx_fio.urls.planet_get_url("foo"), status_code=204)
+    requests_mock.get(ftx_fio.urls.planet_sites_url("Montem"), json=[planet_site_1])
+
+    batch = ftx_fio.Planet.get_many(["Montem", "foo"])
+    sites = ftx_fio.Planet.sites_many(["Montem"])
+
+    assert type(batch["Montem"]) == PlanetFull
+    assert type(batch.errors["foo"]) == PlanetNotFound
+    assert type(sites["Montem"]) == PlanetSiteList
+
+
+def test_async_material_get_many(material_1) -> None:
+    fio = AsyncFIO()
+    found = fio.urls.material_get_url("DW")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if str(request.url) == found:
+            return httpx.Response(200, json=material_1)
+        return httpx.Response(204)
+
+    fio.adapter._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    batch = asyncio.run(fio.Material.get_many(["DW", "XYZ"], max_workers=2))
+
+    assert type(batch["DW"]) == MaterialTicker
+    assert type(batch.errors["XYZ"]) == MaterialTickerNotFound
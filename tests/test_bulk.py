@@ -0,0 +1,196 @@
+import asyncio
+import time
+import httpx
+import pytest
+from fio_wrapper import FIO, AsyncFIO
+from fio_wrapper.bulk import BulkStore
+from fio_wrapper.exceptions import (
+    BuildingTickerNotFound,
+    ExchangeTickerNotFound,
+    MaterialCategoryNotFound,
+    MaterialTickerInvalid,
+    MaterialTickerNotFound,
+    PlanetNotFound,
+)
+
+from .test_building_v1 import building_1
+from .test_exchange_v1 import exchangeticker_full, order_1, order_2
+from .test_material_v1 import material_1, material_2
+from .test_planet_v1 import planet_full_1
+
+
+@pytest.fixture()
+def bulk_fio(tmp_path) -> FIO:
+    config = tmp_path / "config.yml"
+    config.write_text("bulk:\n  enabled: true\n  max_age: 60\n")
+    return FIO(config=str(config))
+
+
+def test_bulk_disabled(requests_mock, material_1, material_2) -> None:
+    fio = FIO()
+    requests_mock.get(fio.urls.material_allmaterials_url(), json=[material_1])
+    requests_mock.get(fio.urls.material_get_url("DW"), json=material_1)
+
+    fio.Material.all()
+    fio.Material.get("DW")
+
+    assert fio.adapter.bulk is None
+    assert requests_mock.call_count == 2
+
+
+def test_bulk_material(requests_mock, bulk_fio: FIO, material_1, material_2) -> None:
+    requests_mock.get(
+        bulk_fio.urls.material_allmaterials_url(), json=[material_1, material_2]
+    )
+
+    materials = bulk_fio.Material.all()
+
+    assert bulk_fio.Material.get("DW") is materials.root[0]
+    assert bulk_fio.Material.get("alg").Ticker == "ALG"
+    with pytest.raises(MaterialTickerNotFound):
+        bulk_fio.Material.get("FOO")
+    with pytest.raises(MaterialTickerInvalid):
+        bulk_fio.Material.get("FOOO")
+
+    assert requests_mock.call_count == 1
+    assert bulk_fio.adapter.stats["bulk_hits"] == 3
+
+
+def test_bulk_exchange(requests_mock, bulk_fio: FIO, exchangeticker_full) -> None:
+    requests_mock.get(bulk_fio.urls.exchange_get_full_url(), json=[exchangeticker_full])
+
+    bulk_fio.Exchange.full()
+
+    assert bulk_fio.Exchange.get("ZIR.NC1").MaterialTicker == "ZIR"
+    with pytest.raises(ExchangeTickerNotFound):
+        bulk_fio.Exchange.get("ZIR.AI1")
+    assert requests_mock.call_count == 1
+
+
+def test_bulk_planet(requests_mock, bulk_fio: FIO, planet_full_1) -> None:
+    requests_mock.get(bulk_fio.urls.planet_full_url(), json=[planet_full_1])
+
+    bulk_fio.Planet.full()
+
+    for planet in ["a09f3bf153025929b2fb266e4119931a", "UV-351a", "katoa"]:
+        assert bulk_fio.Planet.get(planet).PlanetNaturalId == "UV-351a"
+    with pytest.raises(PlanetNotFound):
+        bulk_fio.Planet.get("Montem")
+    assert requests_mock.call_count == 1
+
+
+def test_bulk_building(requests_mock, bulk_fio: FIO, building_1) -> None:
+    requests_mock.get(bulk_fio.urls.building_get_all_url(), json=[building_1])
+
+    bulk_fio.Building.all()
+
+    assert bulk_fio.Building.get("RIG").Ticker == "RIG"
+    with pytest.raises(BuildingTickerNotFound):
+        bulk_fio.Building.get("FOO")
+    assert requests_mock.call_count == 1
+
+
+def test_bulk_lazy_not_stored(requests_mock, bulk_fio: FIO, material_1) -> None:
+    requests_mock.get(bulk_fio.urls.material_allmaterials_url(), json=[material_1])
+    requests_mock.get(bulk_fio.urls.material_get_url("DW"), json=material_1)
+
+    bulk_fio.Material.all(lazy=True)
+    bulk_fio.Material.get("DW")
+
+    assert requests_mock.call_count == 2
+
+
+def test_bulk_get_many(requests_mock, bulk_fio: FIO, material_1, material_2) -> None:
+    requests_mock.get(
+        bulk_fio.urls.material_allmaterials_url(), json=[material_1, material_2]
+    )
+
+    bulk_fio.Material.all()
+    result = bulk_fio.Material.get_many(["DW", "ALG", "FOO"])
+
+    assert sorted(result.results) == ["ALG", "DW"]
+    assert type(result.errors["FOO"]) == MaterialTickerNotFound
+    assert requests_mock.call_count == 1
+
+
+def test_bulk_store_expiry(monkeypatch) -> None:
+    store = BulkStore(max_age=60)
+    now = time.monotonic()
+    monkeypatch.setattr("time.monotonic", lambda: now)
+
+    store.put("buildings", [])
+    assert store.index("buildings") == {}
+    assert store.index("materials") is None
+
+    monkeypatch.setattr("time.monotonic", lambda: now + 61)
+    assert store.index("buildings") is None
+    assert "buildings" not in store._datasets
+
+    # dropped, not answered again even if the clock went back
+    monkeypatch.setattr("time.monotonic", lambda: now)
+    assert store.index("buildings") is None
+
+
+def test_bulk_store_clear() -> None:
+    store = BulkStore(max_age=60)
+    store.put("buildings", [])
+    store.put("exchange", [])
+
+    store.clear("buildings")
+    assert store.index("buildings") is None
+    assert store.index("exchange") == {}
+
+    store.clear()
+    assert store.index("materials") is None
+
+
+def test_bulk_async(tmp_path, material_1, material_2) -> None:
+    config = tmp_path / "config.yml"
+    config.write_text("bulk:\n  enabled: true\n")
+    fio = AsyncFIO(config=str(config))
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        return httpx.Response(200, json=[material_1, material_2])
+
+    fio.adapter._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async def run():
+        await fio.Material.all()
+        return await fio.Material.get("ALG")
+
+    assert asyncio.run(run()).Ticker == "ALG"
+    assert calls == ["/material/allmaterials"]
+
+
+def test_bulk_material_category(
+    requests_mock, bulk_fio: FIO, material_1, material_2
+) -> None:
+    requests_mock.get(
+        bulk_fio.urls.material_allmaterials_url(), json=[material_1, material_2]
+    )
+
+    bulk_fio.Material.all()
+
+    assert [m.Ticker for m in bulk_fio.Material.category("Agricultural Products")] == [
+        "ALG"
+    ]
+    with pytest.raises(MaterialCategoryNotFound):
+        bulk_fio.Material.category("foo")
+    assert requests_mock.call_count == 1
+
+
+def test_endpoint_helpers_shared() -> None:
+    from fio_wrapper.endpoints.abstracts.abstract_async_endpoint import (
+        AbstractAsyncEndpoint,
+    )
+    from fio_wrapper.endpoints.abstracts.abstract_base_endpoint import (
+        AbstractBaseEndpoint,
+    )
+    from fio_wrapper.endpoints.abstracts.abstract_endpoint import AbstractEndpoint
+
+    for name in ["_pause_gc", "_bulk_put", "_bulk_index", "_bulk_get"]:
+        helper = getattr(AbstractBaseEndpoint, name)
+        assert getattr(AbstractEndpoint, name) is helper
+        assert getattr(AbstractAsyncEndpoint, name) is helper
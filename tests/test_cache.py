@@ -139,3 +139,22 @@ def test_cache_url_expirations_with_cache_disabled(standard_config, monkeypatch)
     result = standard_config.cache_url_expirations()
 
     assert result == {}
+
+
+def test_cache_backend(standard_config: Config) -> None:
+    standard_config.data = {"cache": {"enabled": True}}
+
+    assert standard_config.cache_backend == "memory"
+    assert standard_config.cache_path == "fio_wrapper"
+
+    standard_config.data["cache"]["backend"] = "sqlite"
+    standard_config.data["cache"]["path"] = "~/fio_cache"
+
+    assert standard_config.cache_backend == "sqlite"
+    assert standard_config.cache_path.endswith("fio_cache")
+    assert not standard_config.cache_path.startswith("~")
+
+    standard_config.data["cache"]["backend"] = "redis"
+
+    with pytest.raises(UnknownConfig):
+        standard_config.cache_backend
@@ -0,0 +1,89 @@
+import os
+import yaml
+import pytest
+from fio_wrapper import FIO, Config
+from fio_wrapper import config as config_module
+from fio_wrapper.config import YAML_LOADER, load_yaml
+from fio_wrapper.exceptions import UnknownConfig
+
+
+def test_yaml_loader() -> None:
+    if yaml.__with_libyaml__:
+        assert YAML_LOADER is yaml.CSafeLoader
+    else:
+        assert YAML_LOADER is yaml.SafeLoader
+
+
+def test_load_yaml_parsed_once(tmp_path, monkeypatch) -> None:
+    path = tmp_path / "config.yml"
+    path.write_text("fio:\n  timeout: 5\n  versions: [1.0.0]\n")
+    calls = []
+    load = yaml.load
+
+    def counting_load(*args, **kwargs):
+        calls.append(args)
+        return load(*args, **kwargs)
+
+    monkeypatch.setattr("yaml.load", counting_load)
+
+    first = load_yaml(str(path))
+    second = load_yaml(str(path))
+
+    assert first == second == {"fio": {"timeout": 5, "versions": ["1.0.0"]}}
+    assert len(calls) == 1
+
+    # every call returns its own copy
+    first["fio"]["versions"].append("2.0.0")
+    assert load_yaml(str(path))["fio"]["versions"] == ["1.0.0"]
+
+
+def test_load_yaml_modified(tmp_path) -> None:
+    path = tmp_path / "config.yml"
+    path.write_text("fio:\n  timeout: 5\n")
+    assert load_yaml(str(path)) == {"fio": {"timeout": 5}}
+
+    path.write_text("fio:\n  timeout: 50\n")
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000))
+
+    assert load_yaml(str(path)) == {"fio": {"timeout": 50}}
+
+
+def test_load_yaml_unmarshallable(tmp_path) -> None:
+    path = tmp_path / "config.yml"
+    path.write_text("updated: 2024-01-01\n")
+
+    assert str(load_yaml(str(path))["updated"]) == "2024-01-01"
+    assert str(path) not in config_module._parsed
+
+
+def test_config_copies_independent(tmp_path) -> None:
+    path = tmp_path / "config.yml"
+    path.write_text("fio:\n  versions: [2.0.0]\n")
+
+    merged = Config(user_config=str(path))
+    merged.data["cache"]["enabled"] = True
+    plain = Config()
+
+    assert merged.versions == ["1.0.0", "2.0.0"]
+    assert plain.versions == ["1.0.0"]
+    assert plain.cache is False
+
+
+def test_url_table() -> None:
+    config = Config()
+
+    assert config.url_table()["material_base"] == "/material"
+
+    with pytest.raises(UnknownConfig):
+        Config(version="0.0.1").url_table()
+
+
+def test_urls_missing_option(tmp_path) -> None:
+    path = tmp_path / "config.yml"
+    path.write_text(
+        "fio:\n  versions: [2.0.0]\nfio_urls:\n  2.0.0:\n    material_base: /m\n"
+    )
+
+    with pytest.raises(UnknownConfig):
+        FIO(version="2.0.0", config=str(path))
@@ -0,0 +1,79 @@
+import asyncio
+import importlib.util
+import json
+import httpx
+import pytest
+from fio_wrapper import FIO, AsyncFIO
+from fio_wrapper.decoder import available_decoders, get_decoder
+from fio_wrapper.exceptions import (
+    MissingDependency,
+    UnknownConfig,
+    UnknownFIOResponse,
+)
+
+BODY = b'[{"Ticker": "DW", "Weight": 0.1, "Volume": 0.1, "Tags": null}]'
+
+
+def test_available_decoders() -> None:
+    decoders = available_decoders()
+
+    assert decoders[-1] == "json"
+    assert ("orjson" in decoders) == (importlib.util.find_spec("orjson") is not None)
+
+
+@pytest.mark.parametrize("name", ["auto", *available_decoders()])
+def test_decoders_decode(name: str) -> None:
+    assert get_decoder(name)(BODY) == json.loads(BODY)
+
+
+@pytest.mark.parametrize("name", ["auto", *available_decoders()])
+def test_decoders_invalid(name: str) -> None:
+    with pytest.raises(ValueError):
+        get_decoder(name)(b'{"foo": ')
+
+
+def test_decoder_auto_fallback(monkeypatch) -> None:
+    monkeypatch.setattr("importlib.util.find_spec", lambda x: None)
+
+    assert get_decoder("auto") is json.loads
+
+
+def test_decoder_missing(monkeypatch) -> None:
+    monkeypatch.setattr("importlib.util.find_spec", lambda x: None)
+
+    with pytest.raises(MissingDependency):
+        get_decoder("orjson")
+
+
+def test_decoder_unknown() -> None:
+    with pytest.raises(UnknownConfig):
+        get_decoder("foo")
+
+
+def test_adapter_decoder_config(requests_mock, tmp_path) -> None:
+    config = tmp_path / "config.yml"
+    config.write_text("fio:\n  json_decoder: json\n")
+    adapter = FIO(config=str(config)).adapter
+
+    assert adapter._decode is json.loads
+
+    requests_mock.get("https://foo.foo/bar", content=BODY)
+    assert adapter.get("https://foo.foo/bar") == (200, json.loads(BODY))
+
+
+def test_adapter_invalid_json(requests_mock) -> None:
+    adapter = FIO().adapter
+    requests_mock.get("https://foo.foo/bar", text="<html>")
+
+    with pytest.raises(UnknownFIOResponse):
+        adapter.get("https://foo.foo/bar")
+
+
+def test_async_adapter_invalid_json() -> None:
+    fio = AsyncFIO()
+    fio.adapter._client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, text="foo"))
+    )
+
+    with pytest.raises(UnknownFIOResponse):
+        asyncio.run(fio.adapter.get("https://foo.foo/bar"))
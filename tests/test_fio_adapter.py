@@ -66,3 +66,97 @@ def test_fio_adapter_request_exceptions(requests_mock) -> None:
     with pytest.raises(SystemExit):
         requests_mock.get(url, exc=requests.exceptions.RequestException)
         adapter._do("get", url)
+
+
+def write_cache_config(tmp_path, backend: str) -> str:
+    config = tmp_path / "config.yml"
+    config.write_text(
+        "cache:\n"
+        "  enabled: true\n"
+        f"  backend: {backend}\n"
+        f"  path: {tmp_path / 'fio_cache'}\n"
+        "  urls:\n"
+        '    "*/exchange/full": DO_NOT_CACHE\n'
+    )
+    return str(config)
+
+
+@pytest.mark.parametrize("backend", ["sqlite", "filesystem"])
+def test_fio_adapter_requests_cache_persistent(tmp_path, backend) -> None:
+    from requests_cache import DO_NOT_CACHE
+
+    adapter = FIO(config=write_cache_config(tmp_path, backend)).adapter
+
+    assert adapter.config.cache_backend == backend
+    assert type(adapter._session) == CachedSession
+    assert adapter._session.settings.urls_expire_after == {
+        "*/exchange/full": DO_NOT_CACHE
+    }
+    assert str(tmp_path) in str(adapter._session.cache.cache_name)
+
+
+def test_fio_adapter_requests_cache_shared(tmp_path, requests_mock) -> None:
+    config = write_cache_config(tmp_path, "sqlite")
+    url = "https://foo.foo/material/DW"
+    requests_mock.get(url, json={"foo": "moo"})
+
+    FIO(config=config).adapter.get(url)
+    cached = FIO(config=config).adapter._session.cache
+
+    assert cached.contains(url=url)
+
+
+def test_fio_adapter_raw(requests_mock) -> None:
+    adapter = FIO().adapter
+    url = "https://foo.foo/material/DW"
+    requests_mock.get(url, json={"foo": "moo"})
+
+    assert adapter.get(url) == (200, {"foo": "moo"})
+    assert adapter.get(url, raw=True) == (200, b'{"foo": "moo"}')
+    assert adapter._request_key(url, None, None) != adapter._request_key(
+        url, None, None, raw=True
+    )
+
+
+def test_fio_adapter_pool_default() -> None:
+    adapter = FIO().adapter
+    http_adapter = adapter._session.get_adapter("https://rest.fnar.net")
+
+    assert http_adapter._pool_connections == 10
+    assert http_adapter._pool_maxsize == 10
+    assert http_adapter._pool_block == False
+    assert adapter._session.headers["Connection"] == "keep-alive"
+
+
+def test_fio_adapter_pool_config(tmp_path) -> None:
+    config = tmp_path / "config.yml"
+    config.write_text(
+        "fio:\n  pool:\n    connections: 2\n    maxsize: 32\n    block: true\n"
+        "    keep_alive: false\ncache:\n  enabled: true\n"
+    )
+    adapter = FIO(config=str(config)).adapter
+
+    assert type(adapter._session) == CachedSession
+    for url in ["https://rest.fnar.net", "http://localhost"]:
+        http_adapter = adapter._session.get_adapter(url)
+        assert http_adapter._pool_connections == 2
+        assert http_adapter._pool_maxsize == 32
+        assert http_adapter._pool_block == True
+
+    assert adapter._session.headers["Connection"] == "close"
+
+
+def test_async_adapter_pool_config(tmp_path) -> None:
+    from fio_wrapper import AsyncFIO
+
+    config = tmp_path / "config.yml"
+    config.write_text("fio:\n  pool:\n    maxsize: 32\n    block: true\n")
+    pool = AsyncFIO(config=str(config)).adapter._client._transport._pool
+
+    assert pool._max_connections == 32
+    assert pool._max_keepalive_connections == 32
+
+    config.write_text("fio:\n  pool:\n    keep_alive: false\n")
+    pool = AsyncFIO(config=str(config)).adapter._client._transport._pool
+
+    assert pool._max_keepalive_connections == 0
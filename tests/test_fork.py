@@ -0,0 +1,176 @@
+import gc
+import json
+import os
+import threading
+import pytest
+from fio_wrapper import FIO, prefork
+from fio_wrapper import fork, gc_pause, ratelimit
+from benchmarks.standin import StandInServer
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+
+
+@pytest.fixture()
+def server() -> StandInServer:
+    with StandInServer() as server:
+        server.add("GET", "/material/DW", b'{"Ticker": "DW"}')
+        server.add("GET", "/material/RAT", b'{"Ticker": "RAT"}')
+        yield server
+
+
+@pytest.fixture()
+def fio(server, tmp_path) -> FIO:
+    config = tmp_path / "config.yml"
+    config.write_text("cache:\n  enabled: true\n  default_expire: 60\n")
+    return FIO(base_url=server.base_url, config=str(config))
+
+
+def in_child(func) -> dict:
+    read, write = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        try:
+            os.close(read)
+            os.write(write, json.dumps(func()).encode())
+        finally:
+            os._exit(0)
+
+    os.close(write)
+    with os.fdopen(read) as result:
+        output = result.read()
+    os.waitpid(pid, 0)
+    return json.loads(output)
+
+
+def test_fork_resets_adapter(server, fio) -> None:
+    adapter = fio.adapter
+    url = server.base_url + "/material/"
+    assert adapter.get(url + "DW") == (200, {"Ticker": "DW"})
+    pool, session = id(adapter._pool), id(adapter._session)
+
+    def child() -> dict:
+        return {
+            "pool": id(adapter._pool) != pool,
+            "session": id(adapter._session) != session,
+            "cached": adapter.get(url + "DW"),
+            "fetched": adapter.get(url + "RAT"),
+        }
+
+    result = in_child(child)
+
+    assert result == {
+        "pool": True,
+        "session": True,
+        "cached": [200, {"Ticker": "DW"}],
+        "fetched": [200, {"Ticker": "RAT"}],
+    }
+    # the child was served the warm entry from the inherited cache
+    assert server.hits[("GET", "/material/DW")] == 1
+    assert server.hits[("GET", "/material/RAT")] == 1
+
+    # the parent keeps its pool and session
+    assert id(adapter._pool) == pool
+    assert id(adapter._session) == session
+
+
+def test_fork_without_hooks(fio) -> None:
+    adapter = fio.adapter
+    pool, session = adapter._pool, adapter._session
+
+    # a fork bypassing os.register_at_fork is detected by the process id
+    adapter._pid = -1
+
+    assert adapter._session is not session
+    assert adapter._pool is not pool
+    assert adapter._pid == os.getpid()
+
+
+def test_prefork(server, fio) -> None:
+    url = server.base_url + "/material/DW"
+    fio.adapter.get(url)
+    assert fio.adapter in set(fork._adapters)
+
+    try:
+        prefork()
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc.unfreeze()
+
+    # connections were closed, the next uncached call opens a new one
+    connections = server.connections
+    assert fio.adapter.get(url.replace("DW", "RAT")) == (200, {"Ticker": "RAT"})
+    assert server.connections == connections + 1
+
+    prefork(freeze=False)
+    assert gc.get_freeze_count() == 0
+
+
+def test_fork_during_gc_pause() -> None:
+    paused = threading.Event()
+    release = threading.Event()
+
+    def pause():
+        with gc_pause.gc_paused():
+            paused.set()
+            release.wait(5)
+
+    thread = threading.Thread(target=pause)
+    thread.start()
+    paused.wait(5)
+
+    try:
+
+        def child() -> dict:
+            enabled = gc.isenabled()
+            with gc_pause.gc_paused():
+                inside = gc.isenabled()
+
+            return {
+                "enabled": enabled,
+                "pauses": gc_pause._gc_pauses,
+                "inside": inside,
+                "after": gc.isenabled(),
+            }
+
+        result = in_child(child)
+    finally:
+        release.set()
+        thread.join()
+
+    # the pausing thread does not exist in the child
+    assert result == {"enabled": True, "pauses": 0, "inside": False, "after": True}
+    assert gc.isenabled()
+
+
+def test_fork_replaces_held_locks(server, fio) -> None:
+    adapter = fio.adapter
+    url = server.base_url + "/material/DW"
+    bucket = ratelimit.shared_bucket("fork", "foo.foo", "", rate=1, burst=1)
+    locks = {
+        "stats": lambda: adapter.stats._lock,
+        "budget": lambda: adapter._retry.budget._lock,
+        "buckets": lambda: ratelimit._buckets_lock,
+        "bucket": lambda: bucket._lock,
+    }
+
+    # held by a thread of the parent while it forks
+    held = [lock() for lock in locks.values()]
+    for lock in held:
+        lock.acquire()
+
+    try:
+
+        def child() -> dict:
+            locked = {name: lock().locked() for name, lock in locks.items()}
+            if any(locked.values()):
+                return locked
+
+            return {"response": adapter.get(url), "token": bucket.acquire()}
+
+        result = in_child(child)
+    finally:
+        for lock in held:
+            lock.release()
+        ratelimit._buckets.pop(("fork", "foo.foo", ""), None)
+
+    assert result == {"response": [200, {"Ticker": "DW"}], "token": 0.0}
@@ -0,0 +1,120 @@
+import gc
+import threading
+import pytest
+from pydantic import ValidationError
+from fio_wrapper import (
+    FIO,
+    Config,
+    ExchangeTickerFullList,
+    MaterialTickerList,
+    PlanetFullList,
+)
+from fio_wrapper.gc_pause import gc_paused, validate_json
+
+from .test_exchange_v1 import exchangeticker_full
+from .test_material_v1 import material_1, material_2
+from .test_planet_v1 import planet_full_1
+
+
+def test_config_pause_gc() -> None:
+    assert Config().pause_gc == False
+    assert Config(pause_gc=True).pause_gc == True
+    assert FIO(pause_gc=True).config.pause_gc == True
+
+
+def test_gc_paused() -> None:
+    assert gc.isenabled()
+
+    with gc_paused():
+        assert not gc.isenabled()
+
+        with gc_paused():
+            assert not gc.isenabled()
+
+        assert not gc.isenabled()
+
+    assert gc.isenabled()
+
+
+def test_gc_paused_disabled() -> None:
+    gc.disable()
+    try:
+        with gc_paused():
+            pass
+
+        assert not gc.isenabled()
+    finally:
+        gc.enable()
+
+
+def test_gc_paused_threads() -> None:
+    inside = threading.Barrier(2)
+    release = threading.Event()
+
+    def pause():
+        with gc_paused():
+            inside.wait()
+            release.wait()
+
+    thread = threading.Thread(target=pause)
+    thread.start()
+
+    with gc_paused():
+        inside.wait()
+
+    # the other thread still builds
+    assert not gc.isenabled()
+
+    release.set()
+    thread.join()
+
+    assert gc.isenabled()
+
+
+def test_validate_json_pause_gc(exchangeticker_full) -> None:
+    body = ExchangeTickerFullList.model_validate(
+        [exchangeticker_full]
+    ).model_dump_json()
+
+    assert validate_json(ExchangeTickerFullList, body, pause_gc=True) == validate_json(
+        ExchangeTickerFullList, body
+    )
+    assert gc.isenabled()
+
+    with pytest.raises(ValidationError):
+        validate_json(ExchangeTickerFullList, b'[{"foo": 1}]', pause_gc=True)
+
+    assert gc.isenabled()
+
+
+def test_planet_full_pause_gc(requests_mock, planet_full_1) -> None:
+    fio = FIO(pause_gc=True)
+    requests_mock.get(fio.urls.planet_full_url(), json=[planet_full_1])
+
+    data = fio.Planet.full()
+
+    assert type(data) == PlanetFullList
+    assert data == FIO().Planet.full()
+
+
+def test_material_all_pause_gc_per_call(
+    requests_mock, material_1, material_2, monkeypatch
+) -> None:
+    fio = FIO()
+    requests_mock.get(
+        fio.urls.material_allmaterials_url(), json=[material_1, material_2]
+    )
+
+    calls = []
+
+    def paused():
+        calls.append(True)
+        return gc_paused()
+
+    monkeypatch.setattr("fio_wrapper.gc_pause.gc_paused", paused)
+
+    assert type(fio.Material.all()) == MaterialTickerList
+    assert calls == []
+
+    assert type(fio.Material.all(pause_gc=True)) == MaterialTickerList
+    assert calls == [True]
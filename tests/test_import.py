@@ -0,0 +1,73 @@
+import subprocess
+import sys
+import pytest
+import fio_wrapper
+from fio_wrapper import FIO
+
+HEAVY = ["requests", "requests_cache", "pydantic", "httpx", "fio_wrapper.models"]
+LAZY = [
+    "fio_wrapper.endpoints.endpoints_v1.planet",
+    "fio_wrapper.models.material_models",
+    "fio_wrapper.models.planet_models",
+]
+
+
+def run(code: str) -> str:
+    return subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+
+
+def test_import_lazy() -> None:
+    loaded = run(
+        f"import sys, fio_wrapper\nprint([m for m in {HEAVY} if m in sys.modules])"
+    )
+
+    assert loaded.strip() == "[]"
+
+
+def test_fio_lazy_endpoints() -> None:
+    loaded = run(
+        "import sys, fio_wrapper\n"
+        "fio = fio_wrapper.FIO()\n"
+        "print('fio_wrapper.models' in sys.modules, 'fio_wrapper.endpoints' in sys.modules)\n"
+        "fio.Material\n"
+        "print('fio_wrapper.models.material_models' in sys.modules, 'fio_wrapper.models.planet_models' in sys.modules)"
+    )
+
+    assert loaded.split() == ["False", "False", "True", "False"]
+
+
+def test_import_on_access() -> None:
+    loaded = run(
+        "import sys, fio_wrapper\n"
+        f"modules = {LAZY}\n"
+        "print(any(m in sys.modules for m in modules))\n"
+        "fio_wrapper.MaterialTicker, fio_wrapper.PlanetFull, fio_wrapper.FIO().Planet\n"
+        "print(all(m in sys.modules for m in modules))"
+    )
+
+    assert loaded.split() == ["False", "True"]
+
+
+def test_public_names() -> None:
+    assert "FIO" in dir(fio_wrapper)
+    assert all(hasattr(fio_wrapper, name) for name in fio_wrapper.__all__)
+
+    assert fio_wrapper.config.Config is fio_wrapper.Config
+    assert fio_wrapper.ExchangeTickerNotFound.__module__ == "fio_wrapper.exceptions"
+
+    with pytest.raises(AttributeError):
+        fio_wrapper.does_not_exist
+
+
+def test_fio_endpoints() -> None:
+    fio = FIO()
+
+    assert "Material" not in vars(fio)
+    assert fio.Material is fio.Material
+    assert fio.Material.adapter is fio.adapter
+    assert fio.Material.urls is fio.urls
+
+    with pytest.raises(AttributeError):
+        fio.NotAnEndpoint
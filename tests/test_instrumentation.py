@@ -0,0 +1,183 @@
+import asyncio
+import logging
+import threading
+import httpx
+import pytest
+from fio_wrapper import FIO, AsyncFIO
+from fio_wrapper.exceptions import PlanetNotFound
+from fio_wrapper.instrumentation import RequestEvent, current_event
+
+from .fixtures import ftx_fio
+from .test_planet_v1 import planet_full_1
+from .test_singleflight import release_when_waiting, run_concurrently
+
+
+@pytest.fixture()
+def events() -> list:
+    return []
+
+
+def test_no_hooks(requests_mock, ftx_fio: FIO, planet_full_1) -> None:
+    requests_mock.get(ftx_fio.urls.planet_get_url("KW-688c"), json=planet_full_1)
+
+    assert ftx_fio.adapter._hooks == []
+    assert ftx_fio.Planet.get("KW-688c").PlanetNaturalId == "UV-351a"
+    assert current_event() is None
+
+
+def test_endpoint_event(requests_mock, ftx_fio: FIO, planet_full_1, events) -> None:
+    url = ftx_fio.urls.planet_get_url("KW-688c")
+    requests_mock.get(url, json=planet_full_1)
+    ftx_fio.adapter.add_hook(events.append)
+
+    ftx_fio.Planet.get("KW-688c")
+
+    assert len(events) == 1
+    event: RequestEvent = events[0]
+    assert event.endpoint == "Planet.get"
+    assert event.url == url
+    assert event.url_template == ftx_fio.urls.planet_url() + "/{planet}"
+    assert event.method == "GET"
+    assert event.status == 200
+    assert event.requests == 1
+    assert event.bytes_received > 0
+    assert event.cache_hit is None
+    assert event.coalesced is False
+    assert event.error is None
+    assert event.total_time >= event.network_time > 0
+    assert event.validation_time >= 0
+    assert "Planet.get" in repr(event)
+    assert current_event() is None
+
+
+def test_endpoint_event_error(requests_mock, ftx_fio: FIO, events) -> None:
+    requests_mock.get(ftx_fio.urls.planet_get_url("foo"), status_code=204)
+    ftx_fio.adapter.add_hook(events.append)
+
+    with pytest.raises(PlanetNotFound):
+        ftx_fio.Planet.get("foo")
+
+    assert len(events) == 1
+    assert events[0].status == 204
+    assert type(events[0].error) == PlanetNotFound
+
+
+def test_endpoint_event_template_params(requests_mock, ftx_fio: FIO, events) -> None:
+    url = ftx_fio.urls.exchange_get_url("DW.NC1")
+    requests_mock.get(url, status_code=204)
+    ftx_fio.adapter.add_hook(events.append)
+
+    with pytest.raises(Exception):
+        ftx_fio.Exchange.get("DW.NC1")
+
+    assert events[0].endpoint == "Exchange.get"
+    assert events[0].url_template == url.replace("DW.NC1", "{exchange_ticker}")
+
+
+def test_adapter_event(requests_mock, ftx_fio: FIO, events) -> None:
+    requests_mock.get("https://foo.foo/bar", json={"foo": "moo"})
+    ftx_fio.adapter.add_hook(events.append)
+
+    assert ftx_fio.adapter.get("https://foo.foo/bar") == (200, {"foo": "moo"})
+
+    assert len(events) == 1
+    assert events[0].endpoint is None
+    assert events[0].url_template is None
+    assert events[0].url == "https://foo.foo/bar"
+    assert events[0].bytes_received == len(b'{"foo": "moo"}')
+    assert events[0].decode_time > 0
+    assert events[0].total_time > 0
+
+
+def test_batch_events(requests_mock, ftx_fio: FIO, planet_full_1, events) -> None:
+    requests_mock.get(ftx_fio.urls.planet_get_url("KW-688c"), json=planet_full_1)
+    requests_mock.get(ftx_fio.urls.planet_get_url("foo"), status_code=204)
+    ftx_fio.adapter.add_hook(events.append)
+
+    ftx_fio.Planet.get_many(["KW-688c", "foo"])
+
+    assert (
+        sorted(event.url_template for event in events)
+        == [ftx_fio.urls.planet_url() + "/{planet}"] * 2
+    )
+    assert sum(1 for event in events if event.error is not None) == 1
+
+
+def test_coalesced_event(requests_mock, events) -> None:
+    adapter = FIO().adapter
+    url = "https://foo.foo/exchange/all"
+    release = threading.Event()
+
+    def respond(request, context):
+        release.wait(5)
+        return []
+
+    requests_mock.get(url, json=respond)
+    adapter.add_hook(events.append)
+
+    threads, _ = run_concurrently(4, lambda: adapter.get(url))
+    key = adapter._request_key(url, None, None)
+    release_when_waiting(adapter._singleflight, key, 3, release)
+    for thread in threads:
+        thread.join()
+
+    assert len(events) == 4
+    assert sum(1 for event in events if event.coalesced) == 3
+    assert sum(event.requests for event in events) == 1
+    assert all(event.status == 200 for event in events)
+
+
+def test_failing_hook(requests_mock, ftx_fio: FIO, events, caplog) -> None:
+    requests_mock.get("https://foo.foo/bar", json=[])
+
+    def broken(event: RequestEvent) -> None:
+        raise RuntimeError("foo")
+
+    ftx_fio.adapter.add_hook(broken)
+    ftx_fio.adapter.add_hook(events.append)
+
+    with caplog.at_level(logging.WARNING, logger="fio_wrapper.instrumentation"):
+        assert ftx_fio.adapter.get("https://foo.foo/bar") == (200, [])
+
+    assert len(events) == 1
+    assert "Instrumentation hook" in caplog.text
+
+
+def test_remove_hook(requests_mock, ftx_fio: FIO, events) -> None:
+    requests_mock.get("https://foo.foo/bar", json=[])
+    ftx_fio.adapter.add_hook(events.append)
+    ftx_fio.adapter.remove_hook(events.append)
+
+    ftx_fio.adapter.get("https://foo.foo/bar")
+
+    assert events == []
+
+    with pytest.raises(ValueError):
+        ftx_fio.adapter.remove_hook(events.append)
+
+
+def test_async_endpoint_event(planet_full_1, events) -> None:
+    fio = AsyncFIO()
+    url = fio.urls.planet_get_url("KW-688c")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/allplanets"):
+            return httpx.Response(200, json=[])
+        return httpx.Response(200, json=planet_full_1)
+
+    fio.adapter._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    fio.adapter.add_hook(events.append)
+
+    async def run():
+        return await asyncio.gather(fio.Planet.get("KW-688c"), fio.Planet.all())
+
+    asyncio.run(run())
+
+    assert sorted(event.endpoint for event in events) == ["Planet.all", "Planet.get"]
+    event = next(event for event in events if event.endpoint == "Planet.get")
+    assert event.url == url
+    assert event.url_template == fio.urls.planet_url() + "/{planet}"
+    assert event.status == 200
+    assert event.requests == 1
+    assert event.bytes_received > 0
+    assert event.total_time >= event.network_time > 0
@@ -0,0 +1,86 @@
+import asyncio
+import httpx
+import pytest
+from pydantic import ValidationError
+from fio_wrapper import (
+    FIO,
+    AsyncFIO,
+    LazyList,
+    MaterialTicker,
+    MaterialTickerList,
+    PlanetFull,
+    PlanetFullList,
+)
+
+from .fixtures import ftx_fio
+from .test_material_v1 import material_1, material_2
+from .test_planet_v1 import planet_full_1
+
+
+def test_lazylist_access(material_1, material_2) -> None:
+    records = [material_1, material_2]
+    data = LazyList(MaterialTickerList, records)
+
+    assert data.item_model == MaterialTicker
+    assert len(data) == 2
+    assert data.validated == 0
+
+    assert data[1].Ticker == "ALG"
+    assert data[-1] is data[1]
+    assert data.validated == 1
+
+    # records passed in are left untouched
+    assert records == [material_1, material_2]
+
+    with pytest.raises(IndexError):
+        data[2]
+
+
+def test_lazylist_iter(material_1, material_2) -> None:
+    data = LazyList(MaterialTickerList, [material_1, material_2])
+
+    assert [material.Ticker for material in data] == ["DW", "ALG"]
+    assert [material.Ticker for material in data[:1]] == ["DW"]
+    assert data.validated == 2
+    assert "2/2 validated" in repr(data)
+
+
+def test_lazylist_materialize(material_1, material_2) -> None:
+    data = LazyList(MaterialTickerList, [material_1, material_2])
+
+    assert data.materialize() == MaterialTickerList.model_validate(
+        [material_1, material_2]
+    )
+
+
+def test_lazylist_invalid(material_1) -> None:
+    data = LazyList(MaterialTickerList, [material_1, {"Ticker": "FOO"}])
+
+    assert data[0].Ticker == "DW"
+
+    with pytest.raises(ValidationError):
+        data[1]
+
+
+def test_planet_full_lazy(requests_mock, planet_full_1, ftx_fio: FIO) -> None:
+    requests_mock.get(ftx_fio.urls.planet_full_url(), json=[planet_full_1])
+
+    data = ftx_fio.Planet.full(lazy=True)
+
+    assert type(data) == LazyList
+    assert type(data[0]) == PlanetFull
+    assert type(ftx_fio.Planet.full()) == PlanetFullList
+
+
+def test_async_material_all_lazy(material_1, material_2) -> None:
+    fio = AsyncFIO()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=[material_1, material_2])
+
+    fio.adapter._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    data = asyncio.run(fio.Material.all(lazy=True))
+
+    assert type(data) == LazyList
+    assert data[0].Ticker == "DW"
@@ -0,0 +1,67 @@
+import pytest
+from fio_wrapper import MaterialTickerList
+from fio_wrapper.exceptions import MaterialCategoryNotFound, MaterialTickerNotFound
+from fio_wrapper.material_index import MaterialIndex
+
+from .test_material_v1 import material_1, material_2
+
+
+@pytest.fixture()
+def index(material_1, material_2) -> MaterialIndex:
+    return MaterialTickerList.model_validate([material_1, material_2]).index()
+
+
+def test_index_ticker(index: MaterialIndex) -> None:
+    assert len(index) == 2
+    assert [m.Ticker for m in index] == ["DW", "ALG"]
+    assert "dw" in index
+    assert "FOO" not in index
+    assert index.by_ticker("alg").Name == "proteinAlgae"
+    assert index.get("Dw").Ticker == "DW"
+    assert index.get("FOO") is None
+    assert index.row("ALG") == 1
+
+    with pytest.raises(MaterialTickerNotFound):
+        index.by_ticker("FOO")
+
+
+def test_index_id_name(index: MaterialIndex) -> None:
+    assert index.by_id("4fca6f5b5e6c3b8a1b887c6dc99db146").Ticker == "DW"
+    assert index.ticker("ec6fe0efa83e52fd59f248a069aee9bb") == "ALG"
+    assert index.material_id("DW") == "4fca6f5b5e6c3b8a1b887c6dc99db146"
+    assert index.by_name("DRINKINGWATER").Ticker == "DW"
+
+    with pytest.raises(MaterialTickerNotFound):
+        index.by_id("foo")
+    with pytest.raises(MaterialTickerNotFound):
+        index.by_name("foo")
+
+
+def test_index_category(index: MaterialIndex) -> None:
+    assert index.categories == ["agricultural products", "consumables (basic)"]
+
+    materials = index.category("Consumables (Basic)")
+    assert type(materials) == MaterialTickerList
+    assert [m.Ticker for m in materials] == ["DW"]
+
+    with pytest.raises(MaterialCategoryNotFound):
+        index.category("foo")
+
+
+def test_index_load(index: MaterialIndex) -> None:
+    assert list(index.volumes) == [pytest.approx(0.1), 1.0]
+
+    weight, volume = index.load({"DW": 10, "alg": 2})
+    assert weight == pytest.approx(1.0 + 1.4)
+    assert volume == pytest.approx(1.0 + 2.0)
+
+    with pytest.raises(MaterialTickerNotFound):
+        index.load({"FOO": 1})
+
+
+def test_index_empty() -> None:
+    index = MaterialIndex([])
+
+    assert len(index) == 0
+    assert index.categories == []
+    assert index.get("DW") is None
@@ -0,0 +1,185 @@
+from typing import Dict
+import numpy as np
+import pytest
+from fio_wrapper import ExchangeTickerFullList
+from fio_wrapper.analytics import OrderBook, OrderBooks
+from fio_wrapper.exceptions import ExchangeTickerNotFound
+
+from .test_exchange_v1 import exchangeticker_full, order_1, order_2
+
+
+def order(count, cost: float) -> Dict:
+    return {
+        "OrderId": "a" * 32,
+        "CompanyId": "b" * 32,
+        "CompanyName": None,
+        "CompanyCode": None,
+        "ItemCount": count,
+        "ItemCost": cost,
+    }
+
+
+@pytest.fixture()
+def tickers(exchangeticker_full) -> ExchangeTickerFullList:
+    # ZIR.NC1 bids 200x200, 211x100, 50x50, asks 1358x400, 3000x4500, 114x5000
+    # plus a market maker bid at 20 and a second ask at 400
+    zir = dict(exchangeticker_full)
+    zir["BuyingOrders"] = zir["BuyingOrders"] + [order(None, 20.0)]
+    zir["SellingOrders"] = zir["SellingOrders"] + [order(42, 400.0)]
+    empty = dict(
+        exchangeticker_full,
+        MaterialTicker="DW",
+        ExchangeCode="AI1",
+        BuyingOrders=[],
+        SellingOrders=None,
+    )
+    return ExchangeTickerFullList.model_validate([zir, empty])
+
+
+def test_order_book_levels(tickers) -> None:
+    book = tickers.root[0].to_order_book()
+
+    assert book.ticker == "ZIR.NC1"
+    assert book.currency == "NCC"
+    assert book.best_bid == 200.0
+    assert book.best_ask == 400.0
+    assert book.spread == 200.0
+
+    assert book.asks.prices.tolist() == [400.0, 4500.0, 5000.0]
+    assert book.asks.quantities.tolist() == [1400.0, 3000.0, 114.0]
+    assert book.asks.cumulative.tolist() == [1400.0, 4400.0, 4514.0]
+    assert book.bids.prices.tolist() == [200.0, 100.0, 50.0, 20.0]
+    assert book.bids.cumulative.tolist() == [200.0, 411.0, 461.0, np.inf]
+
+
+def test_order_book_depth(tickers) -> None:
+    book = OrderBook.from_ticker(tickers.root[0])
+
+    assert book.asks.depth(399) == 0.0
+    assert book.asks.depth(400) == 1400.0
+    assert book.asks.depth(4999) == 4400.0
+    assert book.asks.depth([400, 1e9]).tolist() == [1400.0, 4514.0]
+    assert book.bids.depth(100) == 411.0
+    assert book.bids.depth(20) == np.inf
+
+
+def test_order_book_vwap(tickers) -> None:
+    book = tickers.root[0].to_order_book()
+
+    assert book.asks.total(1000) == 400000.0
+    assert book.asks.total(2000) == 1400 * 400.0 + 600 * 4500.0
+    assert book.asks.vwap(2000) == pytest.approx(1630.0)
+    assert book.asks.slippage(2000) == pytest.approx(1630.0 / 400.0 - 1)
+    assert np.isnan(book.asks.total(5000))
+    assert book.asks.total([0, 1400, 4514]).tolist() == [
+        0.0,
+        560000.0,
+        560000.0 + 13500000.0 + 570000.0,
+    ]
+
+    # the market maker fills everything beyond 461
+    assert book.bids.total(1000) == 40000.0 + 21100.0 + 2500.0 + 539 * 20.0
+    assert book.bids.vwap(1e6) == pytest.approx((63600.0 + (1e6 - 461) * 20.0) / 1e6)
+    assert book.bids.slippage(200) == 0.0
+    assert book.bids.slippage(411) > 0
+
+
+def test_order_book_empty(tickers) -> None:
+    book = tickers.root[1].to_order_book()
+
+    assert len(book.bids) == 0
+    assert book.best_bid is None
+    assert book.best_ask is None
+    assert book.spread is None
+    assert book.asks.depth(100) == 0.0
+    assert np.isnan(book.asks.vwap(1))
+
+
+def test_order_books(tickers) -> None:
+    books = tickers.to_order_books()
+
+    assert len(books) == 2
+    assert books.tickers == ["ZIR.NC1", "DW.AI1"]
+    assert "dw.ai1" in books
+    assert books.row("DW.AI1") == 1
+    assert books["zir.nc1"].asks.cumulative.tolist() == [1400.0, 4400.0, 4514.0]
+    assert [book.ticker for book in books] == ["ZIR.NC1", "DW.AI1"]
+
+    with pytest.raises(ExchangeTickerNotFound):
+        books["ZIR.AI1"]
+
+
+def test_order_books_batch(tickers) -> None:
+    books = OrderBooks.from_list(tickers)
+    single = tickers.root[0].to_order_book()
+
+    np.testing.assert_array_equal(books.asks.best(), [400.0, np.nan])
+    np.testing.assert_array_equal(books.spreads(), [200.0, np.nan])
+    np.testing.assert_array_equal(books.bids.depth(100), [411.0, 0.0])
+    np.testing.assert_array_equal(books.asks.depth([4500, 1]), [4400.0, 0.0])
+
+    for quantity in [1, 1400, 1401, 4514, 4515]:
+        np.testing.assert_array_equal(
+            books.asks.total(quantity), [single.asks.total(quantity), np.nan]
+        )
+        np.testing.assert_array_equal(
+            books.bids.vwap(quantity), [single.bids.vwap(quantity), np.nan]
+        )
+    np.testing.assert_array_equal(
+        books.asks.slippage([2000, 1]), [single.asks.slippage(2000), np.nan]
+    )
+
+
+def test_order_books_empty() -> None:
+    books = ExchangeTickerFullList.model_validate([]).to_order_books()
+
+    assert len(books) == 0
+    assert books.asks.total(100).tolist() == []
+    assert books.spreads().tolist() == []
+
+
+def test_order_books_batch_levels(exchangeticker_full) -> None:
+    # every book after the first fills from its own first level
+    first = dict(exchangeticker_full, SellingOrders=[order(5, 3.0)])
+    second = dict(
+        exchangeticker_full,
+        ExchangeCode="AI1",
+        SellingOrders=[
+            order(12, 16.0),
+            order(35, 16.0),
+            order(9, 8.0),
+            order(33, 13.0),
+        ],
+    )
+    maker = dict(
+        exchangeticker_full, ExchangeCode="CI1", SellingOrders=[order(None, 3.0)]
+    )
+    tickers = ExchangeTickerFullList.model_validate([first, second, maker, second])
+    books = tickers.to_order_books()
+
+    np.testing.assert_array_equal(books.asks.total(0.5), [1.5, 4.0, 1.5, 4.0])
+    for quantity in [0.5, 9, 10, 60, 89, 90]:
+        np.testing.assert_array_equal(
+            books.asks.total(quantity),
+            [book.asks.total(quantity) for book in books],
+        )
+        np.testing.assert_array_equal(
+            books.asks.vwap(quantity),
+            [book.asks.vwap(quantity) for book in books],
+        )
+
+
+def test_order_books_side_empty(exchangeticker_full) -> None:
+    tickers = ExchangeTickerFullList.model_validate(
+        [
+            dict(exchangeticker_full, BuyingOrders=[]),
+            dict(exchangeticker_full, ExchangeCode="AI1", BuyingOrders=None),
+        ]
+    )
+    books = tickers.to_order_books()
+
+    np.testing.assert_array_equal(books.bids.best(), [np.nan, np.nan])
+    np.testing.assert_array_equal(books.bids.depth(100), [0.0, 0.0])
+    np.testing.assert_array_equal(books.bids.total(1), [np.nan, np.nan])
+    np.testing.assert_array_equal(books.spreads(), [np.nan, np.nan])
+    np.testing.assert_array_equal(books.asks.best(), [400.0, 400.0])
@@ -0,0 +1,158 @@
+import numpy as np
+import pytest
+from fio_wrapper import MaterialTickerList, PlanetFullList
+from fio_wrapper.analytics import PlanetSearch
+from fio_wrapper.exceptions import MaterialTickerNotFound
+from fio_wrapper.material_index import MaterialIndex
+
+from .test_material_v1 import material_1
+from .test_planet_v1 import planet_full_1
+
+FEO = "bcf4a2029e461cf76d29de8c66ec2ff9"
+LST = "c5236c5b79b9e75ddbce16887aeda338"
+
+
+@pytest.fixture()
+def materials(material_1) -> MaterialIndex:
+    def material(ticker: str, material_id: str) -> dict:
+        return dict(material_1, Ticker=ticker, MaterialId=material_id, Name=ticker)
+
+    return MaterialTickerList.model_validate(
+        [material("FEO", FEO), material("LST", LST), material_1]
+    ).index()
+
+
+@pytest.fixture()
+def planets(planet_full_1) -> PlanetFullList:
+    # UV-351a: rocky, all environment values normal, fertile, FEO and LST
+    gaseous = dict(
+        planet_full_1,
+        PlanetNaturalId="AB-123a",
+        PlanetName="Gas",
+        Surface=False,
+        Gravity=0.2,
+        Pressure=2.5,
+        Fertility=-1.0,
+        HasLocalMarket=False,
+        HasChamberOfCommerce=False,
+        Resources=[{"MaterialId": FEO, "ResourceType": "GASEOUS", "Factor": 0.3}],
+    )
+    hot = dict(
+        planet_full_1,
+        PlanetNaturalId="AB-123b",
+        PlanetName="Hot",
+        Temperature=80.0,
+        Gravity=3.0,
+        Resources=[],
+    )
+    return PlanetFullList.model_validate([planet_full_1, gaseous, hot])
+
+
+def names(planets: PlanetFullList) -> list:
+    return [planet.PlanetNaturalId for planet in planets]
+
+
+def test_planet_search_columns(planets, materials) -> None:
+    search = planets.to_search(materials)
+
+    assert len(search) == 3
+    assert search.values["Gravity"].dtype == np.float64
+    assert search.flags["Surface"].tolist() == [True, False, True]
+    assert search.factors.shape == (3, 4)
+    assert search.factor("FEO").tolist() == pytest.approx([0.11, 0.3, 0.0])
+    assert search.factor("DW").tolist() == [0.0, 0.0, 0.0]
+
+
+def test_planet_search_surface(planets, materials) -> None:
+    search = PlanetSearch.from_planets(planets, materials)
+    extremes = dict(
+        include_low_gravity=True,
+        include_high_gravity=True,
+        include_low_pressure=True,
+        include_high_pressure=True,
+        include_low_temperature=True,
+        include_high_temperature=True,
+    )
+
+    assert names(search.search(**extremes)) == []
+    assert names(search.search(include_rocky=True, **extremes)) == [
+        "UV-351a",
+        "AB-123b",
+    ]
+    assert names(search.search(include_gaseous=True, **extremes)) == ["AB-123a"]
+
+
+def test_planet_search_environment(planets, materials) -> None:
+    search = planets.to_search(materials)
+
+    assert names(search.search(include_rocky=True, include_gaseous=True)) == ["UV-351a"]
+    assert names(
+        search.search(
+            include_rocky=True,
+            include_high_gravity=True,
+            include_high_temperature=True,
+        )
+    ) == ["UV-351a", "AB-123b"]
+    assert names(
+        search.search(
+            include_gaseous=True,
+            include_low_gravity=True,
+            include_high_pressure=True,
+        )
+    ) == ["AB-123a"]
+
+
+def test_planet_search_fertile_facilities(planets, materials) -> None:
+    search = planets.to_search(materials)
+    everything = dict(
+        include_rocky=True,
+        include_gaseous=True,
+        include_low_gravity=True,
+        include_high_gravity=True,
+        include_high_pressure=True,
+        include_high_temperature=True,
+    )
+
+    assert names(search.search(must_be_fertile=True, **everything)) == [
+        "UV-351a",
+        "AB-123b",
+    ]
+    assert names(search.search(must_have_localmarket=True, **everything)) == [
+        "UV-351a",
+        "AB-123b",
+    ]
+    assert names(search.search(must_have_shy=True, **everything)) == []
+    assert search.mask(must_have_cogc=True, **everything).tolist() == [
+        True,
+        False,
+        True,
+    ]
+
+
+def test_planet_search_materials(planets, materials) -> None:
+    search = planets.to_search(materials)
+    everything = dict(
+        include_rocky=True,
+        include_gaseous=True,
+        include_low_gravity=True,
+        include_high_gravity=True,
+        include_high_pressure=True,
+        include_high_temperature=True,
+    )
+
+    assert names(search.search(materials=["FEO"], **everything)) == [
+        "UV-351a",
+        "AB-123a",
+    ]
+    assert names(search.search(materials=["feo", "LST"], **everything)) == ["UV-351a"]
+    assert names(search.search(materials=["FEO", "LST", "DW"], **everything)) == []
+
+    with pytest.raises(MaterialTickerNotFound):
+        search.search(materials=["FOO"], **everything)
+
+
+def test_planet_search_empty(materials) -> None:
+    search = PlanetFullList.model_validate([]).to_search(materials)
+
+    assert len(search) == 0
+    assert names(search.search(include_rocky=True, materials=["FEO"])) == []
@@ -0,0 +1,163 @@
+from typing import Dict
+import pytest
+from fio_wrapper import BuildingTickerList, RecipeList
+from fio_wrapper.exceptions import (
+    BuildingTickerNotFound,
+    MaterialTickerNotFound,
+    ProductionCycleError,
+    RecipeNotFound,
+)
+from fio_wrapper.production import strongly_connected
+
+from .test_building_v1 import building_1
+
+
+def recipe(
+    building: str, inputs: Dict[str, int], outputs: Dict[str, int], hours: float
+) -> Dict:
+    name = "%s=>%s" % (
+        " ".join(f"{amount}x{ticker}" for ticker, amount in inputs.items()),
+        " ".join(f"{amount}x{ticker}" for ticker, amount in outputs.items()),
+    )
+    return {
+        "Inputs": [{"Ticker": t, "Amount": a} for t, a in inputs.items()],
+        "Outputs": [{"Ticker": t, "Amount": a} for t, a in outputs.items()],
+        "BuildingTicker": building,
+        "RecipeName": name,
+        "StandardRecipeName": f"{building}:{name}",
+        "TimeMs": int(hours * 3600000),
+    }
+
+
+@pytest.fixture()
+def recipes() -> RecipeList:
+    return RecipeList.model_validate(
+        [
+            recipe("EXT", {}, {"FEO": 2}, 1),
+            recipe("SME", {"FEO": 3, "C": 1}, {"FE": 3}, 6),
+            recipe("FRM", {"H2O": 2}, {"FE": 1}, 24),
+            recipe("PP1", {"FE": 2, "O": 1}, {"BSE": 1, "SLG": 1}, 1),
+            recipe("CHP", {"B": 1, "H2O": 1}, {"A": 1}, 1),
+            recipe("CHP", {"A": 1}, {"B": 2}, 1),
+        ]
+    )
+
+
+def test_strongly_connected() -> None:
+    edges = {"a": ["b"], "b": ["c", "d"], "c": ["b"], "d": []}
+
+    components = strongly_connected(["a", "b", "c", "d"], edges)
+
+    assert [sorted(c) for c in components] == [["d"], ["b", "c"], ["a"]]
+    assert strongly_connected([], {}) == []
+
+
+def test_strongly_connected_deep() -> None:
+    count = 5000
+    edges = {str(n): [str(n + 1)] for n in range(count)}
+
+    components = strongly_connected(["0"], edges)
+
+    assert len(components) == count + 1
+    assert components[0] == [str(count)]
+
+
+def test_graph_indexes(recipes: RecipeList) -> None:
+    graph = recipes.to_graph()
+
+    assert [r.BuildingTicker for r in graph.producers["FE"]] == ["SME", "FRM"]
+    assert [r.BuildingTicker for r in graph.consumers["FE"]] == ["PP1"]
+    assert graph.producers["C"] == []
+    assert graph.chosen["FE"].BuildingTicker == "SME"
+    assert len(graph.recipes_of("CHP")) == 2
+    assert graph.recipes_of("FOO") == []
+    assert graph.materials == {"FEO", "FE", "C", "H2O", "O", "BSE", "SLG", "A", "B"}
+
+
+def test_graph_order(recipes: RecipeList) -> None:
+    graph = recipes.to_graph()
+    position = {
+        ticker: index for index, group in enumerate(graph.order()) for ticker in group
+    }
+
+    assert position["FEO"] < position["FE"] < position["BSE"]
+    assert position["H2O"] < position["FE"]
+    assert position["A"] == position["B"]
+    assert [sorted(cycle) for cycle in graph.cycles()] == [["A", "B"]]
+
+
+def test_graph_bill(recipes: RecipeList) -> None:
+    graph = recipes.to_graph()
+
+    assert graph.is_raw("FEO")
+    assert graph.is_raw("C")
+    assert not graph.is_raw("FE")
+
+    assert graph.bill("C").inputs == {"C": 1.0}
+    assert graph.bill("C").time == {}
+    assert graph.bill("FEO").inputs == {"FEO": 1.0}
+    assert graph.bill("FEO").time == {"EXT": 1800000.0}
+
+    fe = graph.bill("FE")
+    assert fe.inputs == pytest.approx({"FEO": 1.0, "C": 1 / 3})
+    assert fe.time == pytest.approx({"SME": 7200000.0, "EXT": 1800000.0})
+
+    bse = graph.bill("BSE")
+    assert bse.inputs == pytest.approx({"FEO": 2.0, "C": 2 / 3, "O": 1.0})
+    assert bse.time == pytest.approx(
+        {"PP1": 3600000.0, "SME": 14400000.0, "EXT": 3600000.0}
+    )
+    assert graph.bill("SLG").inputs == bse.inputs
+
+    with pytest.raises(MaterialTickerNotFound):
+        graph.bill("FOO")
+
+
+def test_graph_bill_memoized(recipes: RecipeList) -> None:
+    graph = recipes.to_graph()
+
+    assert graph.bills() is graph.bills()
+    assert graph.bill("FE") is graph.bills()["FE"]
+
+
+def test_graph_choose_raw(recipes: RecipeList) -> None:
+    graph = recipes.to_graph(choose={"FE": "FRM:2xH2O=>1xFE"}, raw=["FEO"])
+
+    assert graph.bill("FE").inputs == {"H2O": 2.0}
+    assert graph.bill("FE").time == {"FRM": 86400000.0}
+    assert graph.bill("FEO").time == {}
+
+    with pytest.raises(RecipeNotFound):
+        recipes.to_graph(choose={"FE": "foo"})
+    with pytest.raises(RecipeNotFound):
+        recipes.to_graph(choose={"C": "EXT:=>2xFEO"})
+
+
+def test_graph_cycle(recipes: RecipeList) -> None:
+    graph = recipes.to_graph()
+
+    # A = B + H2O, B = A / 2
+    assert graph.bill("A").inputs == pytest.approx({"H2O": 2.0})
+    assert graph.bill("B").inputs == pytest.approx({"H2O": 1.0})
+    assert graph.bill("A").time == pytest.approx({"CHP": 3 * 3600000.0})
+    assert graph.bill("B").time == pytest.approx({"CHP": 2 * 3600000.0})
+
+
+def test_graph_cycle_unbounded() -> None:
+    recipes = RecipeList.model_validate(
+        [recipe("CHP", {"X": 1}, {"Y": 1}, 1), recipe("CHP", {"Y": 1}, {"X": 1}, 1)]
+    )
+
+    with pytest.raises(ProductionCycleError):
+        recipes.to_graph().bills()
+
+    # buying X breaks the cycle
+    assert recipes.to_graph(raw=["X"]).bill("Y").inputs == {"X": 1.0}
+
+
+def test_graph_buildings(recipes: RecipeList, building_1) -> None:
+    graph = recipes.to_graph(buildings=BuildingTickerList.model_validate([building_1]))
+
+    assert graph.building("RIG").Ticker == "RIG"
+    with pytest.raises(BuildingTickerNotFound):
+        graph.building("FOO")
@@ -0,0 +1,214 @@
+import asyncio
+import threading
+import time
+import httpx
+import pytest
+from fio_wrapper import FIO, AsyncFIO, Config
+from fio_wrapper.exceptions import RateLimitTimeout, UnknownConfig
+from fio_wrapper.ratelimit import RateLimiter, TokenBucket, _buckets, shared_bucket
+
+
+@pytest.fixture(autouse=True)
+def clear_buckets():
+    _buckets.clear()
+    yield
+    _buckets.clear()
+
+
+@pytest.fixture()
+def config(tmp_path):
+    def write(content: str) -> str:
+        path = tmp_path / "config.yml"
+        path.write_text("fio:\n  rate_limit:\n    enabled: true\n" + content)
+        return str(path)
+
+    return write
+
+
+def test_config_rate_limit() -> None:
+    config = Config()
+
+    assert config.rate_limit == False
+    assert config.rate_limit_rate == 10
+    assert config.rate_limit_burst == 20
+    assert config.rate_limit_max_wait is None
+    assert config.rate_limit_routes["/allplanets/full"] == {"rate": 0.2, "burst": 2}
+    assert FIO().adapter._rate_limiter is None
+
+
+def test_token_bucket() -> None:
+    bucket = TokenBucket(rate=100, burst=2)
+
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == 0
+
+    start = time.monotonic()
+    assert bucket.acquire() > 0
+    assert time.monotonic() - start >= 0.005
+
+
+def test_token_bucket_deadline() -> None:
+    bucket = TokenBucket(rate=0.1, burst=1)
+    bucket.acquire()
+
+    start = time.monotonic()
+    with pytest.raises(RateLimitTimeout):
+        bucket.acquire(deadline=time.monotonic() + 1)
+
+    # fails right away instead of waiting until the deadline
+    assert time.monotonic() - start < 0.5
+
+
+def test_token_bucket_threads() -> None:
+    bucket = TokenBucket(rate=0.001, burst=50)
+    acquired = []
+
+    def take() -> None:
+        try:
+            bucket.acquire(deadline=time.monotonic())
+            acquired.append(1)
+        except RateLimitTimeout:
+            pass
+
+    threads = [threading.Thread(target=take) for _ in range(200)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(acquired) == 50
+
+
+def test_token_bucket_async() -> None:
+    bucket = TokenBucket(rate=100, burst=1)
+
+    async def take_two() -> float:
+        await bucket.acquire_async()
+        return await bucket.acquire_async()
+
+    assert asyncio.run(take_two()) > 0
+
+
+def test_shared_bucket() -> None:
+    bucket = shared_bucket("foo", "rest.fnar.net", "", rate=1, burst=1)
+
+    assert shared_bucket("foo", "rest.fnar.net", "", rate=5, burst=5) is bucket
+    assert shared_bucket("moo", "rest.fnar.net", "", rate=1, burst=1) is not bucket
+    assert shared_bucket("foo", "foo.foo", "", rate=1, burst=1) is not bucket
+    assert shared_bucket("foo", "rest.fnar.net", "/x", rate=1, burst=1) is not bucket
+
+
+def test_adapter_rate_limit(requests_mock, config) -> None:
+    path = config("    rate: 50\n    burst: 1\n")
+    first = FIO(api_key="foo", config=path).adapter
+    second = FIO(api_key="foo", config=path).adapter
+    requests_mock.get("https://foo.foo/bar", json=[])
+    events = []
+    second.add_hook(events.append)
+
+    start = time.monotonic()
+    first.get("https://foo.foo/bar")
+    # same API key and host share the bucket
+    second.get("https://foo.foo/bar")
+
+    assert time.monotonic() - start >= 0.015
+    assert first.stats["rate_limited"] == 0
+    assert second.stats["rate_limited"] == 1
+    assert events[0].wait_time > 0
+
+
+def test_adapter_rate_limit_route(requests_mock, config) -> None:
+    adapter = FIO(
+        config=config(
+            "    max_wait: 0\n    routes:\n      /heavy:\n        rate: 0.01\n        burst: 1\n"
+        )
+    ).adapter
+    requests_mock.get("https://foo.foo/heavy", json=[])
+    requests_mock.get("https://foo.foo/light", json=[])
+
+    adapter.get("https://foo.foo/heavy")
+
+    with pytest.raises(RateLimitTimeout):
+        adapter.get("https://foo.foo/heavy")
+
+    assert adapter.get("https://foo.foo/light") == (200, [])
+    assert requests_mock.call_count == 2
+
+
+def test_adapter_rate_limit_timeout(requests_mock, config) -> None:
+    adapter = FIO(config=config("    rate: 0.01\n    burst: 1\n")).adapter
+    requests_mock.get("https://foo.foo/bar", json=[])
+
+    adapter.get("https://foo.foo/bar")
+
+    # waits no longer than the request timeout
+    with pytest.raises(RateLimitTimeout):
+        adapter.get("https://foo.foo/bar", timeout=0.5)
+
+
+def test_async_adapter_rate_limit(config) -> None:
+    fio = AsyncFIO(config=config("    rate: 0.01\n    burst: 1\n    max_wait: 0\n"))
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=[])
+
+    fio.adapter._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async def run():
+        await fio.adapter.get("https://foo.foo/bar")
+        await fio.adapter.get("https://foo.foo/bar")
+
+    with pytest.raises(RateLimitTimeout):
+        asyncio.run(run())
+
+
+def test_token_bucket_rate() -> None:
+    for rate in [0, -1]:
+        with pytest.raises(UnknownConfig):
+            TokenBucket(rate=rate, burst=1)
+
+
+def test_token_bucket_release() -> None:
+    bucket = TokenBucket(rate=0.01, burst=1)
+
+    bucket.acquire()
+    bucket.release()
+    assert bucket.acquire(deadline=time.monotonic()) == 0
+
+    # never above burst
+    bucket.release()
+    bucket.release()
+    bucket.acquire()
+    with pytest.raises(RateLimitTimeout):
+        bucket.acquire(deadline=time.monotonic())
+
+
+def route_limiter(config) -> RateLimiter:
+    path = config(
+        "    rate: 0.01\n    burst: 1\n    max_wait: 0\n"
+        "    routes:\n      /heavy:\n        rate: 0.01\n        burst: 1\n"
+    )
+    return RateLimiter(Config(user_config=path), api_key="foo")
+
+
+def test_rate_limiter_route_token_returned(config) -> None:
+    limiter = route_limiter(config)
+    # empties the global bucket
+    limiter.acquire("https://foo.foo/light")
+
+    with pytest.raises(RateLimitTimeout):
+        limiter.acquire("https://foo.foo/heavy")
+
+    route = shared_bucket("foo", "foo.foo", "/heavy", rate=0.01, burst=1)
+    assert route.acquire(deadline=time.monotonic()) == 0
+
+
+def test_rate_limiter_route_token_returned_async(config) -> None:
+    limiter = route_limiter(config)
+    limiter.acquire("https://foo.foo/light")
+
+    with pytest.raises(RateLimitTimeout):
+        asyncio.run(limiter.acquire_async("https://foo.foo/heavy"))
+
+    route = shared_bucket("foo", "foo.foo", "/heavy", rate=0.01, burst=1)
+    assert route.acquire(deadline=time.monotonic()) == 0
@@ -0,0 +1,256 @@
+import asyncio
+import httpx
+import pytest
+import requests
+import ssl
+import time
+from email.utils import formatdate
+from fio_wrapper import FIO, AsyncFIO, Config
+from fio_wrapper.exceptions import UnknownFIOResponse
+from fio_wrapper.retry import RetryBudget, full_jitter, parse_retry_after
+
+from .fixtures import ftx_fio
+
+
+@pytest.fixture()
+def config(tmp_path):
+    def write(content: str) -> str:
+        path = tmp_path / "config.yml"
+        path.write_text(content)
+        return str(path)
+
+    return write
+
+
+def test_config_retry() -> None:
+    config = Config()
+
+    assert config.retry_attempts == 3
+    assert config.retry_backoff == 0.5
+    assert config.retry_max_backoff == 30
+    assert config.retry_statuses == [429, 500, 502, 503, 504]
+    assert config.retry_budget_ratio == 0.1
+    assert config.retry_budget_reserve == 10
+
+
+def test_config_retry_statuses(config) -> None:
+    narrowed = Config(user_config=config("retry:\n  statuses:\n    - 503\n"))
+    assert narrowed.retry_statuses == [503]
+
+    assert Config(user_config=config("retry:\n  statuses: []\n")).retry_statuses == []
+    assert Config(user_config=config("retry:\n  attempts: 1\n")).retry_statuses == [
+        429,
+        500,
+        502,
+        503,
+        504,
+    ]
+    # other lists are still extended
+    assert Config(user_config=config("fio:\n  versions:\n    - 2.0.0\n")).versions == [
+        "1.0.0",
+        "2.0.0",
+    ]
+
+
+def test_retry_budget() -> None:
+    budget = RetryBudget(ratio=0.5, reserve=2)
+
+    assert budget.withdraw()
+    assert budget.withdraw()
+    assert not budget.withdraw()
+
+    budget.deposit()
+    assert not budget.withdraw()
+    budget.deposit()
+    assert budget.withdraw()
+
+    # balance is capped at the reserve
+    for _ in range(10):
+        budget.deposit()
+    assert budget.balance == 2
+
+
+def test_full_jitter() -> None:
+    for attempt in range(10):
+        assert 0 <= full_jitter(attempt, 0.5, 4) <= min(4, 0.5 * 2**attempt)
+
+
+def test_parse_retry_after() -> None:
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("foo") is None
+    assert parse_retry_after("2") == 2
+    assert parse_retry_after("-1") == 0
+    assert 50 < parse_retry_after(formatdate(time.time() + 60, usegmt=True)) <= 60
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+
+
+def test_adapter_retries_status(requests_mock, ftx_fio: FIO) -> None:
+    url = "https://foo.foo/bar"
+    requests_mock.get(
+        url,
+        [{"status_code": 502}, {"status_code": 503}, {"json": {"foo": "moo"}}],
+    )
+    events = []
+    ftx_fio.adapter.add_hook(events.append)
+
+    assert ftx_fio.adapter.get(url) == (200, {"foo": "moo"})
+
+    assert requests_mock.call_count == 3
+    assert ftx_fio.adapter.stats["requests"] == 3
+    assert ftx_fio.adapter.stats["retries"] == 2
+    assert events[0].requests == 3
+    assert events[0].retries == 2
+
+
+def test_adapter_retries_exhausted(requests_mock, ftx_fio: FIO) -> None:
+    url = "https://foo.foo/bar"
+    requests_mock.get(url, status_code=500)
+
+    with pytest.raises(UnknownFIOResponse):
+        ftx_fio.adapter.get(url)
+
+    assert requests_mock.call_count == 4
+    assert ftx_fio.adapter.stats.snapshot() == {
+        "requests": 4,
+        "retries": 3,
+        "retries_exhausted": 1,
+        "retries_denied": 0,
+        "rate_limited": 0,
+        "bulk_hits": 0,
+    }
+
+
+def test_adapter_retries_connection_error(requests_mock, ftx_fio: FIO) -> None:
+    url = "https://foo.foo/bar"
+    requests_mock.get(url, [{"exc": requests.exceptions.ConnectionError}, {"json": []}])
+
+    assert ftx_fio.adapter.get(url) == (200, [])
+    assert ftx_fio.adapter.stats["retries"] == 1
+
+
+def test_adapter_no_retry(requests_mock, ftx_fio: FIO) -> None:
+    url = "https://foo.foo/bar"
+
+    # status handled by the caller
+    requests_mock.get(url, status_code=503)
+    assert ftx_fio.adapter.get(url, err_codes=[503]) == (503, None)
+
+    # not idempotent
+    requests_mock.post(url, status_code=503)
+    with pytest.raises(UnknownFIOResponse):
+        ftx_fio.adapter.post(url)
+
+    # read timeouts are not transient
+    requests_mock.get(url, exc=requests.exceptions.ReadTimeout)
+    with pytest.raises(requests.exceptions.Timeout):
+        ftx_fio.adapter.get(url)
+
+    assert requests_mock.call_count == 3
+    assert ftx_fio.adapter.stats["retries"] == 0
+
+
+def test_adapter_retry_after(requests_mock, ftx_fio: FIO) -> None:
+    url = "https://foo.foo/bar"
+    requests_mock.get(
+        url,
+        [{"status_code": 429, "headers": {"Retry-After": "0.01"}}, {"json": []}],
+    )
+    events = []
+    ftx_fio.adapter.add_hook(events.append)
+
+    assert ftx_fio.adapter.get(url) == (200, [])
+    assert events[0].wait_time == 0.01
+
+    # waiting longer than max_backoff fails right away
+    requests_mock.get(url, status_code=429, headers={"Retry-After": "3600"})
+    with pytest.raises(UnknownFIOResponse):
+        ftx_fio.adapter.get(url)
+
+    assert requests_mock.call_count == 3
+    assert ftx_fio.adapter.stats["retries_exhausted"] == 1
+
+
+def test_adapter_retry_budget(requests_mock, config) -> None:
+    adapter = FIO(
+        config=config("retry:\n  budget_ratio: 0.5\n  budget_reserve: 1\n")
+    ).adapter
+    url = "https://foo.foo/bar"
+    requests_mock.get(url, status_code=502)
+
+    with pytest.raises(UnknownFIOResponse):
+        adapter.get(url)
+
+    # reserve spent by the first retry, the deposit of the next call is not enough
+    with pytest.raises(UnknownFIOResponse):
+        adapter.get(url)
+
+    assert requests_mock.call_count == 3
+    assert adapter.stats["retries"] == 1
+    assert adapter.stats["retries_denied"] == 2
+
+
+def test_adapter_retries_disabled(requests_mock, config) -> None:
+    adapter = FIO(config=config("retry:\n  attempts: 0\n")).adapter
+    requests_mock.get("https://foo.foo/bar", status_code=502)
+
+    with pytest.raises(UnknownFIOResponse):
+        adapter.get("https://foo.foo/bar")
+
+    assert requests_mock.call_count == 1
+    assert adapter.stats["retries_exhausted"] == 0
+
+
+def test_async_adapter_retries() -> None:
+    fio = AsyncFIO()
+    responses = [
+        httpx.Response(503),
+        httpx.Response(200, json={"foo": "moo"}),
+    ]
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return responses[len(calls) - 1]
+
+    fio.adapter._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    assert asyncio.run(fio.adapter.get("https://foo.foo")) == (200, {"foo": "moo"})
+    assert len(calls) == 2
+    assert fio.adapter.stats["retries"] == 1
+
+
+def test_async_adapter_retries_connect_error() -> None:
+    fio = AsyncFIO()
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        raise httpx.ConnectError("foo", request=request)
+
+    fio.adapter._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    with pytest.raises(SystemExit):
+        asyncio.run(fio.adapter.get("https://foo.foo"))
+
+    assert len(calls) == 4
+    assert fio.adapter.stats["retries_exhausted"] == 1
+
+
+def test_async_adapter_no_retry_tls_error() -> None:
+    fio = AsyncFIO()
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        try:
+            raise ssl.SSLCertVerificationError("certificate verify failed")
+        except ssl.SSLError as exc:
+            raise httpx.ConnectError("foo", request=request) from exc
+
+    fio.adapter._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    with pytest.raises(SystemExit):
+        asyncio.run(fio.adapter.get("https://foo.foo"))
+
+    assert len(calls) == 1
+    assert fio.adapter.stats["retries"] == 0
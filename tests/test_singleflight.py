@@ -0,0 +1,159 @@
+import threading
+import time
+import pytest
+from fio_wrapper import FIO
+from fio_wrapper.exceptions import UnknownFIOResponse
+from fio_wrapper.singleflight import SingleFlight
+
+
+def run_concurrently(count: int, func) -> list:
+    results = [None] * count
+
+    def target(index: int) -> None:
+        try:
+            results[index] = func()
+        except Exception as exc:
+            results[index] = exc
+
+    threads = [threading.Thread(target=target, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads, results
+
+
+def release_when_waiting(flight: SingleFlight, key, waiters: int, release) -> None:
+    deadline = time.monotonic() + 5
+    while flight.in_flight(key) < waiters and time.monotonic() < deadline:
+        time.sleep(0.001)
+    release.set()
+
+
+def test_singleflight_shares_result() -> None:
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def func():
+        calls.append(1)
+        release.wait(5)
+        return {"foo": "moo"}
+
+    threads, results = run_concurrently(8, lambda: flight.do("key", func))
+    release_when_waiting(flight, "key", 7, release)
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert flight.in_flight("key") == -1
+
+
+def test_singleflight_shares_error() -> None:
+    flight = SingleFlight()
+    release = threading.Event()
+
+    def func():
+        release.wait(5)
+        raise UnknownFIOResponse()
+
+    threads, results = run_concurrently(4, lambda: flight.do("key", func))
+    release_when_waiting(flight, "key", 3, release)
+    for thread in threads:
+        thread.join()
+
+    assert all(type(result) == UnknownFIOResponse for result in results)
+
+    # failed call is not remembered
+    assert flight.do("key", lambda: 1) == 1
+
+
+def test_adapter_coalesces_get(requests_mock) -> None:
+    adapter = FIO().adapter
+    url = "https://foo.foo/exchange/all"
+    release = threading.Event()
+    calls = []
+
+    def respond(request, context):
+        calls.append(1)
+        release.wait(5)
+        return [{"foo": "moo"}]
+
+    requests_mock.get(url, json=respond)
+
+    threads, results = run_concurrently(10, lambda: adapter.get(url))
+    key = adapter._request_key(url, None, None)
+    release_when_waiting(adapter._singleflight, key, 9, release)
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert all(result == (200, [{"foo": "moo"}]) for result in results)
+
+    # sequential calls are not coalesced
+    release.set()
+    adapter.get(url)
+    assert len(calls) == 2
+
+
+def test_adapter_request_key() -> None:
+    adapter = FIO(api_key="foo").adapter
+
+    assert adapter._request_key(
+        "url", {"b": 1, "a": [1]}, [204]
+    ) == adapter._request_key("url", {"a": [1], "b": 1}, [204])
+    assert adapter._request_key("url", None, None) != adapter._request_key(
+        "url", None, [204]
+    )
+
+    other = FIO(api_key="moo").adapter
+    assert adapter._request_key("url", None, None) != other._request_key(
+        "url", None, None
+    )
+
+
+def test_adapter_coalesce_disabled(tmp_path) -> None:
+    config = tmp_path / "config.yml"
+    config.write_text("fio:\n  coalesce: false\n")
+
+    assert FIO(config=str(config)).adapter._singleflight is None
+
+
+@pytest.mark.parametrize("config", [None, "tests/config_cache.yml"])
+def test_adapter_coalesce_sessions(requests_mock, config) -> None:
+    adapter = FIO(config=config).adapter
+    url = "https://foo.foo/material/DW"
+    requests_mock.get(url, json={"foo": "moo"})
+
+    assert adapter.get(url) == (200, {"foo": "moo"})
+
+
+@pytest.mark.parametrize("endpoint", ["Sites", "Storage"])
+def test_adapter_coalesced_planets_copied(requests_mock, endpoint) -> None:
+    fio = FIO(api_key="foo")
+    planets = getattr(fio, endpoint).planets
+    url = (
+        fio.urls.sites_planets_get_url(username="foo")
+        if endpoint == "Sites"
+        else fio.urls.storage_planets_get_url(username="foo")
+    )
+    release = threading.Event()
+    calls = []
+
+    def respond(request, context):
+        calls.append(1)
+        release.wait(5)
+        return ["foo", "moo"]
+
+    requests_mock.get(url, json=respond)
+
+    threads, results = run_concurrently(2, lambda: planets("foo"))
+    key = fio.adapter._request_key(url, None, [204, 401])
+    release_when_waiting(fio.adapter._singleflight, key, 1, release)
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    results[0].append("boo")
+    results[0].remove("foo")
+
+    assert results[1] == ["foo", "moo"]
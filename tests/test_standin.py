@@ -0,0 +1,26 @@
+from fio_wrapper import FIO
+from benchmarks.standin import StandInServer, serve
+
+
+def test_standin_serves_all_routes() -> None:
+    with StandInServer() as server:
+        fio = FIO(api_key="foo", base_url=server.base_url)
+        routes = serve(server, fio, planets=10, tickers=10, recipes=10)
+
+        for route in routes:
+            assert route.call(fio) is not None, route.name
+
+        assert all(hits == 1 for hits in server.hits.values())
+        assert len(server.hits) == len(routes)
+
+    # every configured url is benchmarked
+    paths = fio.config.data["fio_urls"][fio.config.version].values()
+    for path in paths:
+        assert any(path in route.url for route in routes), path
+
+
+def test_standin_unknown_route() -> None:
+    with StandInServer() as server:
+        fio = FIO(base_url=server.base_url)
+
+        assert fio.adapter.get(server.base_url + "/foo", err_codes=[404]) == (404, None)
@@ -0,0 +1,150 @@
+import asyncio
+import json
+import httpx
+import pytest
+import requests
+from fio_wrapper import (
+    FIO,
+    AsyncFIO,
+    ExchangeTickerFull,
+    MaterialTicker,
+    PlanetFull,
+)
+from fio_wrapper.exceptions import UnknownFIOResponse
+from fio_wrapper.streaming import JSONArrayParser, iter_json_array
+
+from .fixtures import ftx_fio
+from .test_exchange_v1 import exchangeticker_full
+from .test_material_v1 import material_1, material_2
+from .test_planet_v1 import planet_full_1
+
+
+def chunked(data: bytes, size: int):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 4096])
+def test_iter_json_array_chunks(size: int) -> None:
+    payload = [{"a": "ü€", "b": [1, 2, {"c": None}]}, 1.5, -3, "x,]", True, None, []]
+    body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+    assert list(iter_json_array(chunked(body, size))) == payload
+
+
+def test_iter_json_array_empty() -> None:
+    assert list(iter_json_array([b" [ ", b" ] "])) == []
+
+
+def test_json_array_parser_feed() -> None:
+    parser = JSONArrayParser()
+
+    assert parser.feed(b'[{"a": 1}, {"b"') == [{"a": 1}]
+    assert parser.feed(b": 2}, 12") == [{"b": 2}]
+    assert parser.feed(b"3") == []
+    assert parser.feed(b"]") == [123]
+    assert parser.finished
+    assert parser.close() == []
+
+
+def test_iter_json_array_invalid() -> None:
+    with pytest.raises(ValueError):
+        list(iter_json_array([b'{"a": 1}']))
+
+    with pytest.raises(ValueError):
+        list(iter_json_array([b'[{"a": 1}, {"b"']))
+
+    with pytest.raises(ValueError):
+        list(iter_json_array([b"[1, foo]"]))
+
+
+def test_material_iter_all(requests_mock, material_1, material_2, ftx_fio: FIO) -> None:
+    requests_mock.get(
+        ftx_fio.urls.material_allmaterials_url(),
+        status_code=200,
+        json=[material_1, material_2],
+    )
+
+    data = list(ftx_fio.Material.iter_all())
+
+    assert len(data) == 2
+    assert all(type(item) == MaterialTicker for item in data)
+    assert data[0].Ticker == "DW"
+
+
+def test_exchange_iter_full(requests_mock, exchangeticker_full, ftx_fio: FIO) -> None:
+    requests_mock.get(
+        ftx_fio.urls.exchange_get_full_url(),
+        status_code=200,
+        json=[exchangeticker_full],
+    )
+
+    data = list(ftx_fio.Exchange.iter_full())
+
+    assert len(data) == 1
+    assert type(data[0]) == ExchangeTickerFull
+
+
+def test_planet_iter_full(requests_mock, planet_full_1, ftx_fio: FIO) -> None:
+    requests_mock.get(
+        ftx_fio.urls.planet_full_url(),
+        status_code=200,
+        json=[planet_full_1, planet_full_1],
+    )
+
+    data = ftx_fio.Planet.iter_full()
+
+    assert type(next(data)) == PlanetFull
+    assert type(next(data)) == PlanetFull
+
+    with pytest.raises(StopIteration):
+        next(data)
+
+
+def test_stream_otherstatus(requests_mock, ftx_fio: FIO) -> None:
+    requests_mock.get(ftx_fio.urls.planet_full_url(), status_code=500)
+
+    with pytest.raises(UnknownFIOResponse):
+        list(ftx_fio.Planet.iter_full())
+
+
+def test_stream_request_exceptions(requests_mock, ftx_fio: FIO) -> None:
+    url = ftx_fio.urls.planet_full_url()
+
+    requests_mock.get(url, exc=requests.exceptions.ConnectTimeout)
+    with pytest.raises(requests.exceptions.Timeout):
+        list(ftx_fio.Planet.iter_full())
+
+    requests_mock.get(url, exc=requests.exceptions.ConnectionError)
+    with pytest.raises(SystemExit):
+        list(ftx_fio.Planet.iter_full())
+
+
+def test_async_material_iter_all(material_1, material_2) -> None:
+    fio = AsyncFIO()
+    body = json.dumps([material_1, material_2]).encode("utf-8")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert str(request.url) == fio.urls.material_allmaterials_url()
+        return httpx.Response(200, content=body)
+
+    fio.adapter._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async def run():
+        return [item async for item in fio.Material.iter_all()]
+
+    data = asyncio.run(run())
+
+    assert [item.Ticker for item in data] == ["DW", "ALG"]
+
+
+def test_async_stream_otherstatus() -> None:
+    fio = AsyncFIO()
+    fio.adapter._client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(500))
+    )
+
+    async def run():
+        return [item async for item in fio.Planet.iter_full()]
+
+    with pytest.raises(UnknownFIOResponse):
+        asyncio.run(run())
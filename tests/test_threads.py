@@ -0,0 +1,87 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from requests_cache import CachedResponse
+from fio_wrapper import FIO
+from fio_wrapper.memory_cache import LockedDictStorage, MemoryCache
+from benchmarks.standin import StandInServer
+
+PATHS = 50
+
+
+def body(index: int) -> list:
+    return [{"Index": index, "Padding": "x" * index * 20}]
+
+
+@pytest.fixture(scope="module")
+def server() -> StandInServer:
+    with StandInServer() as server:
+        for index in range(PATHS):
+            server.add("GET", f"/material/M{index}", json.dumps(body(index)).encode())
+        yield server
+
+
+def shared_fio(server: StandInServer, tmp_path, cache: bool) -> FIO:
+    config = tmp_path / "config.yml"
+    config.write_text(
+        f"cache:\n  enabled: {str(cache).lower()}\n  default_expire: 60\n"
+    )
+
+    return FIO(base_url=server.base_url, config=str(config))
+
+
+def hammer(fio: FIO, server: StandInServer, threads: int, calls: int) -> set:
+    def call(number: int) -> int:
+        index = number % PATHS
+        url = f"{server.base_url}/material/M{index}"
+
+        assert fio.adapter.get(url) == (200, body(index))
+        assert list(fio.adapter.stream(url, chunk_size=16)) == body(index)
+        return id(fio.adapter._session)
+
+    with ThreadPoolExecutor(threads) as executor:
+        return set(executor.map(call, range(threads * calls)))
+
+
+@pytest.mark.parametrize("threads", [1, 4, 16, 64])
+@pytest.mark.parametrize("cache", [False, True])
+def test_shared_fio(server, tmp_path, threads, cache) -> None:
+    fio = shared_fio(server, tmp_path, cache)
+
+    sessions = hammer(fio, server, threads, calls=8)
+    assert 1 <= len(sessions) <= threads
+
+    if cache:
+        # everything is cached, a second round does not reach the server
+        hits = dict(server.hits)
+        hammer(fio, server, threads, calls=8)
+        assert server.hits == hits
+
+
+def test_sessions_share_pool_and_cache(server, tmp_path) -> None:
+    adapter = shared_fio(server, tmp_path, cache=True).adapter
+    with ThreadPoolExecutor(1) as executor:
+        other = executor.submit(lambda: adapter._session).result()
+
+    assert other is not adapter._session
+    assert other.get_adapter(server.base_url) is adapter._session.get_adapter(
+        server.base_url
+    )
+    assert other.cache is adapter._session.cache
+    assert isinstance(other.cache, MemoryCache)
+
+
+def test_locked_storage_copies() -> None:
+    storage = LockedDictStorage()
+    storage["key"] = CachedResponse(status_code=200, content=b"[1, 2, 3]")
+
+    first, second = storage["key"], storage["key"]
+    assert first is not second
+    assert first.raw is not second.raw
+    assert first.raw.read(3) == b"[1,"
+    assert second.raw.read() == b"[1, 2, 3]"
+    assert first.cache_key == "key"
+
+    assert "key" in storage and len(storage) == 1 and list(storage) == ["key"]
+    del storage["key"]
+    assert len(storage) == 0